@@ -0,0 +1,105 @@
+"""Measure the cost of building & discarding large component trees
+
+Trees of many parts are built with & without `component.building`, & the time
+taken to build them, their peak memory (as traced by `tracemalloc`), the time
+taken by a full garbage collection afterwards & the time taken to discard them
+are reported for each.
+
+Run with `sccm` installed, e.g. `python benchmarks/building.py`.
+"""
+
+import contextlib
+import gc
+import time
+import tracemalloc
+import typing
+
+import solid
+
+from sccm.components import component, cylinder
+
+# The number of parts in each tree, in assemblies of `ASSEMBLY_SIZE`
+COUNT = 100000
+ASSEMBLY_SIZE = 100
+
+
+def build(count: int = COUNT) -> component.Component:
+    """Build a tree of parts
+
+    Args:
+        count: The number of parts
+    """
+    root = component.Component()
+
+    for assembly_index in range(count // ASSEMBLY_SIZE):
+        assembly = component.Component(parent=root).transform(
+            solid.translate([assembly_index * 10.0, 0.0, 0.0])
+        )
+
+        for part_index in range(ASSEMBLY_SIZE):
+            cylinder.Cylinder(diameter=1.0, height=2.0, parent=assembly).transform(
+                solid.translate([0.0, part_index * 2.0, 0.0])
+            )
+
+    return root
+
+
+def measure(
+    name: str, context: typing.Callable[[], typing.ContextManager], count: int = COUNT
+) -> None:
+    """Report the costs of a tree built within a context
+
+    Args:
+        name: A description of the context
+        context: Creates the context to build within
+        count: The number of parts in the tree
+    """
+    gc.collect()
+
+    start = time.perf_counter()
+    with context():
+        root = build(count)
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    gc.collect()
+    collected = time.perf_counter() - start
+
+    start = time.perf_counter()
+    del root
+    gc.collect()
+    discarded = time.perf_counter() - start
+
+    gc.unfreeze()
+
+    # Tracing slows everything down, so the memory is measured separately
+    gc.collect()
+    tracemalloc.start()
+    with context():
+        root = build(count)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del root
+    gc.collect()
+    gc.unfreeze()
+
+    print(
+        f"{name:<32}{built:>10.2f} s{peak / 2 ** 20:>10.1f} MiB"
+        f"{collected * 1e3:>10.1f} ms{discarded * 1e3:>10.1f} ms"
+    )
+
+
+def main() -> None:
+    print(f"{'':<32}{'build':>12}{'peak':>14}{'collect':>13}{'discard':>13}")
+    measure("default", contextlib.nullcontext)
+    measure("building", component.building)
+    measure("building, weak parents", lambda: component.building(weak_parents=True))
+    measure(
+        "building, weak parents, frozen",
+        lambda: component.building(weak_parents=True, freeze=True),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Measure the memory & allocations of vectors, connectors & components
+
+For each kind of object, many are constructed & kept alive, & the memory they
+occupy (as traced by `tracemalloc`) & the number of blocks allocated for them
+are reported per object, along with the time taken. Common operations are
+timed in the same way.
+
+Run with `sccm` installed, e.g. `python benchmarks/layout.py`.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+import typing
+
+import numpy
+import solid
+
+from sccm import connector, vector
+from sccm.components import component, cylinder, sphere
+
+# The number of objects constructed for each measurement
+COUNT = 20000
+
+
+def measure(
+    name: str, construct: typing.Callable[[int], typing.Any], count: int = COUNT
+) -> None:
+    """Report the memory, allocations & time taken to construct many objects
+
+    Args:
+        name: What's being constructed
+        construct: Constructs an object, given its index
+        count: The number of objects to construct
+    """
+    # Tracing slows everything down, so the objects are timed separately
+    start = time.perf_counter()
+    kept = [construct(index) for index in range(count)]
+    elapsed = time.perf_counter() - start
+    del kept
+
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    blocks = sys.getallocatedblocks()
+
+    kept = [construct(index) for index in range(count)]
+
+    blocks = sys.getallocatedblocks() - blocks
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.enable()
+
+    print(
+        f"{name:<24}{size / count:>10.0f} B{blocks / count:>10.1f} blocks"
+        f"{elapsed / count * 1e6:>10.2f} us"
+    )
+
+    del kept
+
+
+def main() -> None:
+    vectors = [vector.Vector.from_raw((index, 1.0, 2.0)) for index in range(COUNT)]
+    translation = solid.translate([1.0, 2.0, 3.0])
+    rotation = solid.rotate([10.0, 20.0, 30.0])
+
+    print(f"{'':<24}{'memory':>12}{'allocations':>16}{'time':>13}")
+    measure("Vector", lambda index: vector.Vector(numpy.array([index, 1.0, 2.0])))
+    measure("Vector.from_raw", lambda index: vector.Vector.from_raw((index, 1.0, 2.0)))
+    measure("Vector addition", lambda index: vectors[index] + vectors[index - 1])
+    measure("Vector negation", lambda index: -vectors[index])
+    measure("Connector", lambda index: connector.Connector(vectors[index]))
+    measure(
+        "Connector.transform",
+        lambda index: connector.Connector(vectors[index]).transform(rotation),
+    )
+    measure("Component", lambda index: component.Component(), count=COUNT // 10)
+    measure("Sphere", lambda index: sphere.Sphere(diameter=1.0), count=COUNT // 10)
+    measure(
+        "Cylinder (transformed)",
+        lambda index: cylinder.Cylinder(diameter=1.0, height=2.0).transform(
+            translation
+        ),
+        count=COUNT // 10,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Measure the cost of rotation matrices, with & without `vector.RotationCache`
+
+A recurring rotation is looked up in a cache which already holds it, & the
+time taken per lookup is reported alongside that of computing the matrix
+directly; a lookup is only worthwhile if it's the quicker of the two.
+
+Run with `sccm` installed, e.g. `python benchmarks/rotation.py`.
+"""
+
+import time
+import typing
+
+import numpy
+
+from sccm import vector
+
+# The number of times each operation is repeated
+COUNT = 100000
+
+ANGLE = 30.0
+AXIS = (1.0, 1.0, 0.0)
+
+
+def measure(name: str, operation: typing.Callable[[], typing.Any]) -> None:
+    """Report the time taken by an operation
+
+    Args:
+        name: What's being measured
+        operation: The operation
+    """
+    start = time.perf_counter()
+    for _ in range(COUNT):
+        operation()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<32}{elapsed / COUNT * 1e6:>10.2f} us")
+
+
+def main() -> None:
+    cache = vector.RotationCache()
+    array_axis = numpy.array(AXIS)
+    cache.matrix(ANGLE, AXIS)
+    cache.matrix(ANGLE, array_axis)
+
+    normalized_axis = array_axis / numpy.linalg.norm(array_axis)
+
+    measure("compute", lambda: vector._general_rotation_matrix(ANGLE, normalized_axis))
+    measure("cache hit, tuple axis", lambda: cache.matrix(ANGLE, AXIS))
+    measure("cache hit, array axis", lambda: cache.matrix(ANGLE, array_axis))
+    measure(
+        "cache miss",
+        lambda: cache.matrix(ANGLE + numpy.random.random(), AXIS),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Measure the cost of saving & loading large component trees
+
+A tree of many parts is serialized with `serialization` & with `pickle`, & the
+time taken to save & load it & the size of the saved data are reported for
+each; loading a memory-mapped file's table, without reconstructing the tree, is
+timed separately.
+
+Run with `sccm` installed, e.g. `python benchmarks/serialization.py`.
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+import time
+import typing
+
+from building import build
+
+from sccm import serialization
+
+# The number of parts in the tree
+COUNT = 20000
+
+
+def timed(function: typing.Callable[[], typing.Any]) -> typing.Tuple[typing.Any, float]:
+    """Call a function, & measure the time it takes
+
+    Args:
+        function: The function
+
+    Returns:
+        The function's result & the time taken, in seconds
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def report(name: str, saved: float, loaded: float, size: int) -> None:
+    """Print one line of the report"""
+    print(f"{name:<24}{saved:>10.3f} s{loaded:>10.3f} s{size / 2 ** 20:>10.2f} MiB")
+
+
+def main() -> None:
+    # Pickling recurses through the tree
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * COUNT))
+
+    root = build(COUNT)
+
+    print(f"{'':<24}{'save':>12}{'load':>12}{'size':>14}")
+
+    data, saved = timed(lambda: serialization.dumps(root))
+    _, loaded = timed(lambda: serialization.loads(data))
+    report("serialization", saved, loaded, len(data))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.sccm")
+        serialization.save(root, path)
+
+        _, loaded = timed(lambda: serialization.load(path))
+        report("serialization, mapped", saved, loaded, len(data))
+
+        _, loaded = timed(lambda: serialization.NodeTable.read(path))
+        report("table only, mapped", saved, loaded, len(data))
+
+    data, saved = timed(lambda: pickle.dumps(root))
+    _, loaded = timed(lambda: pickle.loads(data))
+    report("pickle", saved, loaded, len(data))
+
+
+if __name__ == "__main__":
+    main()
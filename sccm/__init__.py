@@ -1,3 +1,37 @@
-from . import affinables, components, connector, vector
+from . import (
+    affinables,
+    analysis,
+    bounding,
+    components,
+    connector,
+    constraints,
+    emission,
+    mating,
+    optimization,
+    parametric,
+    resolution,
+    scene,
+    serialization,
+    snapshot,
+    traversal,
+    vector,
+)
 
-__all__ = ["connector", "vector", "affinables", "components"]
+__all__ = [
+    "connector",
+    "vector",
+    "affinables",
+    "components",
+    "analysis",
+    "emission",
+    "resolution",
+    "optimization",
+    "bounding",
+    "mating",
+    "constraints",
+    "parametric",
+    "scene",
+    "serialization",
+    "snapshot",
+    "traversal",
+]
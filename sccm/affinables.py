@@ -3,17 +3,96 @@ import functools
 import itertools
 import typing
 
+import numpy
 import solid
 
+from sccm import vector
+
 # The subset of OpenSCAD transformations which are linear & which we support
-AffineTransformation = typing.Union[solid.translate, solid.rotate, solid.scale]
+AffineTransformation = typing.Union[
+    solid.translate, solid.rotate, solid.scale, solid.multmatrix
+]
 
 GenericAffinable = typing.TypeVar("GenericAffinable", bound="Affinable")
 
 
+def matrix(transformation: AffineTransformation) -> numpy.ndarray:
+    """The 4x4 homogeneous matrix of a transformation
+
+    Args:
+        transformation: The transformation
+
+    Raises:
+        NotImplementedError: If the transformation isn't of a supported type
+    """
+    result = numpy.identity(4)
+
+    if isinstance(transformation, solid.translate):
+        result[:3, 3] = transformation.params["v"]
+    elif isinstance(transformation, solid.scale):
+        result[:3, :3] = numpy.diag(
+            numpy.broadcast_to(numpy.asarray(transformation.params["v"], float), 3)
+        )
+    elif isinstance(transformation, solid.rotate):
+        angle = transformation.params["a"]
+        axis = transformation.params["v"]
+
+        if isinstance(angle, (float, int)):
+            result[:3, :3] = vector.rotation_matrix(angle, axis if axis else (0, 0, 1))
+        else:
+            # Successive rotations about X, then Y, then Z
+            result[:3, :3] = (
+                vector.rotation_matrix(angle[2], (0, 0, 1))
+                @ vector.rotation_matrix(angle[1], (0, 1, 0))
+                @ vector.rotation_matrix(angle[0], (1, 0, 0))
+            )
+    elif isinstance(transformation, solid.multmatrix):
+        rows = numpy.asarray(transformation.params["m"], dtype=float)
+        result[: rows.shape[0], : rows.shape[1]] = rows
+    else:
+        raise NotImplementedError
+
+    return result
+
+
+def compose(transformations: typing.Iterable[AffineTransformation]) -> numpy.ndarray:
+    """The 4x4 homogeneous matrix of a sequence of transformations
+
+    Args:
+        transformations: The transformations, in the order they are applied
+    """
+    return functools.reduce(
+        lambda composed, transformation: matrix(transformation) @ composed,
+        transformations,
+        numpy.identity(4),
+    )
+
+
+def stretch(transformation: AffineTransformation) -> float:
+    """The largest factor by which a transformation can lengthen a distance
+
+    Args:
+        transformation: The transformation to measure
+
+    Returns:
+        1.0 for rigid transformations; otherwise the largest singular value of
+        the transformation's linear part, e.g. the largest absolute scaling
+        factor for scalings
+
+    Raises:
+        NotImplementedError: If the transformation isn't of a supported type
+    """
+    if isinstance(transformation, (solid.translate, solid.rotate)):
+        return 1.0
+
+    return float(numpy.linalg.norm(matrix(transformation)[:3, :3], 2))
+
+
 class Affinable(abc.ABC):
     """An object capable of undergoing affine OpenSCAD transformations"""
 
+    __slots__ = ()
+
     def transform(
         self: GenericAffinable,
         transform: typing.Union[
@@ -90,6 +169,8 @@ GenericHolonomicTransformable = typing.TypeVar(
 class HolonomicTransformable(Affinable, abc.ABC):
     """A transformable object which doesn't keep track of its history"""
 
+    __slots__ = ()
+
     def _transform(
         self: GenericHolonomicTransformable, transform: AffineTransformation
     ) -> GenericHolonomicTransformable:
@@ -111,6 +192,8 @@ class HolonomicTransformable(Affinable, abc.ABC):
             return self.translate(transform)
         elif isinstance(transform, solid.scale):
             return self.scale(transform)
+        elif isinstance(transform, solid.multmatrix):
+            return self.multmatrix(transform)
         else:
             raise NotImplementedError
 
@@ -144,6 +227,20 @@ class HolonomicTransformable(Affinable, abc.ABC):
             scaling: The scaling
         """
 
+    def multmatrix(
+        self: GenericHolonomicTransformable, transformation: solid.multmatrix
+    ) -> GenericHolonomicTransformable:
+        """Transform this object to account for an arbitrary affine transformation
+
+        Args:
+            transformation: The transformation
+
+        Raises:
+            NotImplementedError: If this object doesn't support matrix
+                transformations
+        """
+        raise NotImplementedError
+
 
 GenericHistoricalTransformable = typing.TypeVar(
     "GenericHistoricalTransformable", bound="HistoricalTransformable"
@@ -157,6 +254,8 @@ HistoricalTransformablePropertyMethod = typing.Callable[
 class HistoricalTransformable(Affinable, abc.ABC):
     """A transformable object which keeps track of its history"""
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def transformations(self) -> typing.Iterator[AffineTransformation]:
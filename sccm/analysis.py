@@ -0,0 +1,459 @@
+import collections
+import typing
+
+import solid
+
+from sccm import emission, optimization, resolution, traversal
+from sccm.components import component, instance, pattern
+
+# The relative expense, per operand facet, of each kind of `OpenSCAD` CSG
+# operation; CGAL's unions of mostly-disjoint operands are considerably cheaper
+# than differences & intersections, which have to intersect every pair of faces
+COMPOSITION_WEIGHTS: typing.Dict[str, float] = {
+    solid.union.__name__: 0.5,
+    solid.difference.__name__: 1.0,
+    solid.intersection.__name__: 1.0,
+}
+
+
+class SubtreeCost:
+    """The estimated render cost of a component & everything embodied within it"""
+
+    def __init__(self, subtree_component: component.Component, path: str) -> None:
+        """
+        Args:
+            subtree_component: The component at the root of the subtree
+            path: A description of where the subtree is within the analysed tree
+        """
+        self.component = subtree_component
+        self.path = path
+
+        # The number of facets of every primitive in the subtree
+        self.facets = 0
+        # The cost of the operations performed at the root of the subtree
+        # alone, excluding that of its children & operands
+        self.own_cost = 0.0
+        # The cost of the entire subtree
+        self.cost = 0.0
+        # The depth of the emitted tree of CSG operations, excluding
+        # transformations, before optimization
+        self.depth = 0
+        # A skeleton of the emitted body: its operations, transformations &
+        # colors, with placeholders for primitives & module calls
+        self.outline: typing.Optional[solid.OpenSCADObject] = None
+
+    def __repr__(self) -> str:
+        return f"<{self.path}: {self.cost:.0f} ({self.own_cost:.0f} own)>"
+
+
+class PrimitiveCost:
+    """The estimated size of a single emitted primitive"""
+
+    def __init__(
+        self,
+        primitive_component: component.Component,
+        path: str,
+        fragments: typing.Optional[int],
+        facets: int,
+        transformations: int,
+    ) -> None:
+        """
+        Args:
+            primitive_component: The component embodied by the primitive
+            path: A description of where the primitive is within the analysed
+                tree
+            fragments: The number of fragments the primitive's circles will be
+                approximated with, if any
+            facets: The estimated number of facets the primitive will have
+            transformations: The length of the chain of transformations
+                emitted around the primitive, before optimization
+        """
+        self.component = primitive_component
+        self.path = path
+        self.fragments = fragments
+        self.facets = facets
+        self.transformations = transformations
+
+    def __repr__(self) -> str:
+        return f"<{self.path}: {self.facets} facets>"
+
+
+class Report:
+    """The result of statically analysing a component tree's render cost"""
+
+    def __init__(self) -> None:
+        # The number of emitted `OpenSCAD` nodes, by node type (or the name of
+        # the module called)
+        self.node_counts: typing.Counter[str] = collections.Counter()
+        self.primitives: typing.List[PrimitiveCost] = []
+        self.subtrees: typing.List[SubtreeCost] = []
+        # Structurally identical subtrees, keyed by their fingerprint
+        self.duplicates: typing.Dict[str, typing.List[SubtreeCost]] = {}
+        # The cost of a single placement of each instantiated template, keyed
+        # by the template's `id`; each is only analysed once
+        self.templates: typing.Dict[int, SubtreeCost] = {}
+        # The same costs, keyed by the name of the `OpenSCAD` module each
+        # template is emitted as
+        self.modules: typing.Dict[str, SubtreeCost] = {}
+        # The depth of the emitted tree of CSG operations
+        self.depth = 0
+        # The most transformations emitted directly around one another
+        self.longest_transformation_chain = 0
+
+    @property
+    def root(self) -> SubtreeCost:
+        """The cost of the entire analysed tree"""
+        return self.subtrees[0]
+
+    @property
+    def facets(self) -> int:
+        """The estimated total number of facets of every primitive"""
+        return self.root.facets
+
+    @property
+    def cost(self) -> float:
+        """The estimated total render cost"""
+        return self.root.cost
+
+    @property
+    def ranked(self) -> typing.List[SubtreeCost]:
+        """Every subtree, in descending order of the cost of its own operations"""
+        return sorted(
+            self.subtrees,
+            key=lambda subtree: (subtree.own_cost, subtree.cost),
+            reverse=True,
+        )
+
+    def explain(self, limit: int = 10) -> str:
+        """Describe where the render cost of the analysed tree lies
+
+        Args:
+            limit: The number of the most expensive subtrees to describe
+        """
+        total = self.cost or 1.0
+
+        lines = [
+            f"Estimated cost {self.cost:.0f} over {self.facets} facets; "
+            f"CSG depth {self.depth}, "
+            f"longest transformation chain {self.longest_transformation_chain}",
+            "Nodes: "
+            + ", ".join(
+                f"{name} {count}" for name, count in sorted(self.node_counts.items())
+            ),
+            "Most expensive subtrees:",
+        ]
+
+        for subtree in self.ranked[:limit]:
+            lines.append(
+                f"  {subtree.own_cost / total:6.1%} own, {subtree.cost / total:6.1%} "
+                f"total: {subtree.path} "
+                f"({subtree.component.__class__.__name__}, {subtree.facets} facets)"
+            )
+
+        if self.duplicates:
+            lines.append("Duplicated subtrees:")
+
+            for copies in sorted(
+                self.duplicates.values(),
+                key=lambda copies: copies[0].cost * len(copies),
+                reverse=True,
+            )[:limit]:
+                lines.append(
+                    f"  {len(copies)}x {copies[0].component.__class__.__name__} "
+                    f"({copies[0].cost:.0f} each): "
+                    + ", ".join(copy.path for copy in copies)
+                )
+
+        return "\n".join(lines)
+
+
+# A subtree to analyse: its root & where it is within the analysed tree
+Location = typing.Tuple[component.Component, str]
+
+
+def _analysis(
+    report: Report, subtree_component: component.Component, path: str
+) -> traversal.Evaluation[Location, SubtreeCost]:
+    """Analyse a subtree, recording its cost & those of its own subtrees
+
+    This is a step of an evaluation of the whole tree, so deep trees can be
+    analysed without recursion.
+
+    Args:
+        report: The report in which to record the analysis
+        subtree_component: The component at the root of the subtree
+        path: A description of where the subtree is within the analysed tree
+
+    Yields:
+        Each of the subtrees within this one, whose costs must be sent back
+
+    Returns:
+        The cost of the subtree
+    """
+    subtree = SubtreeCost(subtree_component, path)
+    report.subtrees.append(subtree)
+
+    children = []
+    for index, child in enumerate(subtree_component.children):
+        children.append((yield (child, f"{path}.children[{index}]")))
+    composed_components = {
+        id(operand) for operand in subtree_component.composed_components
+    }
+    uncomposed_children = [
+        child for child in children if id(child.component) not in composed_components
+    ]
+
+    # The cost & depth of the body that compositions are applied to
+    base_facets = 0
+    base_depth = 0
+
+    # Instances render their template at every placement
+    placements = 0
+    if isinstance(subtree_component, instance.Instance):
+        template = subtree_component.template
+        template_cost = report.templates.get(id(template))
+        if template_cost is None:
+            template_cost = yield (template, f"{path}.template")
+            report.templates[id(template)] = template_cost
+
+        report.modules.setdefault(subtree_component.module_name, template_cost)
+
+        placements = subtree_component.count
+        base_facets = placements * template_cost.facets
+        base_depth = template_cost.depth + 1
+
+    if subtree_component.primitive:
+        fragments = subtree_component.fragments
+        facets = subtree_component.facets(fragments)
+        transformations = len(list(subtree_component.transformations))
+
+        report.primitives.append(
+            PrimitiveCost(subtree_component, path, fragments, facets, transformations)
+        )
+
+        base_facets = facets
+        base_depth = 1
+        subtree.own_cost += facets
+
+    if uncomposed_children:
+        base_facets += sum(child.facets for child in uncomposed_children)
+        base_depth = max(
+            base_depth, *(child.depth + 1 for child in uncomposed_children)
+        )
+        subtree.own_cost += COMPOSITION_WEIGHTS[solid.union.__name__] * sum(
+            child.facets for child in uncomposed_children
+        )
+
+    # The body that compositions are applied to, as `Component._composition`
+    # emits it; primitives & instances leave out their uncomposed children
+    outline: typing.Optional[solid.OpenSCADObject] = None
+    if subtree_component.primitive:
+        outline = subtree_component.transformed(
+            solid.OpenSCADObject(subtree_component.primitive, {})
+        )
+    elif isinstance(subtree_component, instance.Instance):
+        outline = solid.OpenSCADObject(subtree_component.module_name, {})
+        if isinstance(subtree_component, pattern.Pattern):
+            outline = (
+                subtree_component._loop(outline)
+                if subtree_component.count
+                else solid.union()
+            )
+
+        outline = subtree_component.transformed(outline)
+    elif uncomposed_children:
+        outline = solid.union()([child.outline for child in uncomposed_children])
+
+    subtree.cost = subtree.own_cost + sum(child.cost for child in children)
+    if placements:
+        subtree.cost += placements * template_cost.cost
+
+    for composition_index, (composition, operands) in enumerate(
+        subtree_component.compositions
+    ):
+        name = type(composition).__name__
+
+        operand_costs = []
+        for operand_index, operand in enumerate(operands):
+            # Operands that are also children have already been analysed
+            child_costs = [child for child in children if child.component is operand]
+            if child_costs:
+                operand_costs.append(child_costs[0])
+            else:
+                operand_cost = yield (
+                    operand,
+                    f"{path}.compositions[{composition_index}][{operand_index}]",
+                )
+                operand_costs.append(operand_cost)
+                subtree.cost += operand_cost.cost
+
+        base_facets += sum(operand.facets for operand in operand_costs)
+        base_depth = (
+            max([base_depth] + [operand.depth for operand in operand_costs]) + 1
+        )
+
+        composition_cost = COMPOSITION_WEIGHTS.get(name, 1.0) * base_facets
+        subtree.own_cost += composition_cost
+        subtree.cost += composition_cost
+
+        outline = composition.copy()(
+            ([outline] if outline is not None else [])
+            + [operand.outline for operand in operand_costs]
+        )
+
+    # Emission can leave a component without any body at all
+    if outline is None:
+        outline = solid.union()
+
+    if subtree_component.color:
+        outline = solid.color(subtree_component.color)(outline)
+        base_depth += 1
+
+    subtree.facets = base_facets
+    subtree.depth = base_depth
+    subtree.outline = outline
+
+    return subtree
+
+
+# The depth of an emitted tree of CSG operations, the length of the chain of
+# transformations at its root, & the longest such chain within it
+Measurement = typing.Tuple[int, int, int]
+
+
+def _measurement(
+    node: solid.OpenSCADObject,
+    node_counts: typing.Counter[str],
+    modules: typing.Dict[str, Measurement],
+) -> traversal.Evaluation[solid.OpenSCADObject, Measurement]:
+    """Measure an emitted tree & count its nodes, as a step of an evaluation
+
+    Args:
+        node: The root of the emitted tree
+        node_counts: Where to count the tree's nodes, by node type
+        modules: The measurements of the module bodies the tree may call
+
+    Yields:
+        Each of the node's children, whose measurements must be sent back
+
+    Returns:
+        The measurement of the tree
+    """
+    node_counts[node.name] += 1
+
+    measurements = []
+    for child in node.children:
+        measurements.append((yield child))
+
+    depth = max((measurement[0] for measurement in measurements), default=0)
+    chain = max((measurement[1] for measurement in measurements), default=0)
+    longest_chain = max((measurement[2] for measurement in measurements), default=0)
+
+    if node.name in modules:
+        depth = modules[node.name][0]
+
+    if node.name in optimization.TRANSFORMATIONS:
+        chain += 1
+    else:
+        chain = 0
+        # Loops place their children much like transformations do
+        if not isinstance(node, pattern.Loop):
+            depth += 1
+
+    return depth, chain, max(longest_chain, chain)
+
+
+def _measured(
+    subtree: SubtreeCost,
+    optimize: bool,
+    node_counts: typing.Counter[str],
+    modules: typing.Dict[str, Measurement],
+) -> Measurement:
+    """Measure the emitted tree of an analysed subtree & count its nodes
+
+    Args:
+        subtree: The analysed subtree
+        optimize: Would the emitted tree be optimized?
+        node_counts: Where to count the tree's nodes, by node type
+        modules: The measurements of the module bodies the tree may call
+
+    Returns:
+        The measurement of the tree
+    """
+    outline = subtree.outline
+    if optimize:
+        outline = optimization.optimize(outline)
+
+    return traversal.evaluate(
+        outline, lambda node: _measurement(node, node_counts, modules)
+    )
+
+
+def analyse(
+    root: component.Component,
+    fn: int = None,
+    default_resolution: resolution.Resolution = None,
+    facet_budget: int = None,
+    optimize: bool = True,
+) -> Report:
+    """Statically estimate the cost of rendering a component tree
+
+    Only a skeleton of the emitted tree is constructed, with placeholders for
+    its primitives, so this is cheap compared to emission (let alone
+    rendering). Costs are estimated from the facets of each primitive, as given
+    by the resolution settings, & the number of facets involved in each CSG
+    operation; node counts, depth & transformation chains are measured from the
+    skeleton, optimized as it would be emitted.
+
+    Args:
+        root: The component at the root of the tree
+        fn: The global number of fragments the tree would be emitted with
+        default_resolution: The resolution the tree would be emitted with for
+            components which don't have one of their own
+        facet_budget: The total number of facets the tree would be emitted
+            with, if limited
+        optimize: Would the emitted tree of CSG operations be optimized? As
+            with `Component.scad_source`, this flattens operations & merges
+            chains of transformations
+
+    Returns:
+        The analysis
+    """
+    report = Report()
+
+    with emission.configured(root, fn, default_resolution, facet_budget):
+        traversal.evaluate(
+            (root, root.__class__.__name__),
+            lambda location: _analysis(report, *location),
+        )
+
+    # Each module body is emitted, & so measured, once; templates are analysed
+    # before anything that instantiates them
+    modules: typing.Dict[str, Measurement] = {}
+    for name, template_cost in report.modules.items():
+        modules[name] = _measured(template_cost, optimize, report.node_counts, modules)
+
+    report.depth, _, longest_chain = _measured(
+        report.root, optimize, report.node_counts, modules
+    )
+    report.longest_transformation_chain = max(
+        [longest_chain] + [measurement[2] for measurement in modules.values()]
+    )
+
+    fingerprints: typing.Dict[int, str] = {}
+    fingerprinted: typing.Dict[str, typing.List[SubtreeCost]] = {}
+    for subtree in report.subtrees:
+        # Trivial subtrees aren't worth reporting as duplicates, & instances
+        # already share their templates
+        if subtree.facets and not isinstance(subtree.component, instance.Instance):
+            fingerprinted.setdefault(
+                subtree.component._fingerprint(fingerprints), []
+            ).append(subtree)
+
+    report.duplicates = {
+        fingerprint: copies
+        for fingerprint, copies in fingerprinted.items()
+        if len(copies) > 1
+    }
+
+    return report
@@ -0,0 +1,156 @@
+import itertools
+import typing
+
+import numpy
+
+
+class Bounds:
+    """An axis-aligned bounding box
+
+    Bounds are conservative: everything they bound is within them, but they may
+    also include empty space. Empty bounds (bounding nothing) are represented
+    by a minimum greater than the maximum.
+    """
+
+    def __init__(
+        self,
+        minimum: typing.Sequence[float] = (numpy.inf, numpy.inf, numpy.inf),
+        maximum: typing.Sequence[float] = (-numpy.inf, -numpy.inf, -numpy.inf),
+    ) -> None:
+        """
+        Args:
+            minimum: The minimum corner of the box; if not provided, the bounds
+                will be empty
+            maximum: The maximum corner of the box; if not provided, the bounds
+                will be empty
+        """
+        self.minimum = numpy.asarray(minimum, dtype=float)
+        self.maximum = numpy.asarray(maximum, dtype=float)
+
+    @classmethod
+    def from_points(cls, points: numpy.ndarray) -> "Bounds":
+        """Construct the smallest bounds containing a set of points
+
+        Args:
+            points: The points, as an Nx3 array
+        """
+        if not len(points):
+            return cls()
+
+        return cls(points.min(axis=0), points.max(axis=0))
+
+    @classmethod
+    def unbounded(cls) -> "Bounds":
+        """Construct bounds containing all of space"""
+        return cls(
+            (-numpy.inf, -numpy.inf, -numpy.inf), (numpy.inf, numpy.inf, numpy.inf)
+        )
+
+    @property
+    def finite(self) -> bool:
+        """Do these bounds have a finite extent?"""
+        return self.empty or bool(
+            numpy.all(numpy.isfinite(self.minimum))
+            and numpy.all(numpy.isfinite(self.maximum))
+        )
+
+    @property
+    def empty(self) -> bool:
+        """Do these bounds bound nothing?"""
+        return bool(numpy.any(self.minimum > self.maximum))
+
+    @property
+    def corners(self) -> numpy.ndarray:
+        """The eight corners of the box, as an 8x3 array"""
+        return numpy.array(
+            list(itertools.product(*zip(self.minimum, self.maximum))), dtype=float
+        )
+
+    def transformed(self, matrix: numpy.ndarray) -> "Bounds":
+        """The bounds of this box after an affine transformation
+
+        Args:
+            matrix: The 4x4 homogeneous matrix of the transformation
+        """
+        if self.empty:
+            return self
+        if not self.finite:
+            return self.unbounded()
+
+        return self.from_points(self.corners @ matrix[:3, :3].T + matrix[:3, 3])
+
+    def union(self, other: "Bounds") -> "Bounds":
+        """The smallest bounds containing both these bounds & another
+
+        Args:
+            other: The other bounds
+        """
+        if self.empty:
+            return other
+        if other.empty:
+            return self
+
+        return Bounds(
+            numpy.minimum(self.minimum, other.minimum),
+            numpy.maximum(self.maximum, other.maximum),
+        )
+
+    def intersection(self, other: "Bounds") -> "Bounds":
+        """The bounds of the space within both these bounds & another
+
+        Args:
+            other: The other bounds
+        """
+        intersection = Bounds(
+            numpy.maximum(self.minimum, other.minimum),
+            numpy.minimum(self.maximum, other.maximum),
+        )
+
+        return intersection if not intersection.empty else Bounds()
+
+    def overlaps(self, other: "Bounds") -> bool:
+        """Do these bounds share any space with another's?
+
+        Bounds which only touch are considered to overlap.
+
+        Args:
+            other: The other bounds
+        """
+        return not self.intersection(other).empty
+
+    def contains(self, other: "Bounds") -> bool:
+        """Is everything within another set of bounds within these bounds?
+
+        Args:
+            other: The other bounds
+        """
+        return other.empty or bool(
+            numpy.all(self.minimum <= other.minimum)
+            and numpy.all(other.maximum <= self.maximum)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Are these bounds equal to another's?
+
+        Args:
+            other: The other bounds
+
+        Raises:
+            NotImplementedError: If the other object is not bounds
+        """
+        if not isinstance(other, Bounds):
+            raise NotImplementedError
+
+        if self.empty or other.empty:
+            return self.empty and other.empty
+
+        return bool(
+            numpy.allclose(self.minimum, other.minimum)
+            and numpy.allclose(self.maximum, other.maximum)
+        )
+
+    def __repr__(self) -> str:
+        if self.empty:
+            return "[empty]"
+
+        return f"[{self.minimum.tolist()} - {self.maximum.tolist()}]"
@@ -1,3 +1,21 @@
-from . import component, cone, cylinder, frustum, reference_frame, sphere
+from . import (
+    component,
+    cone,
+    cylinder,
+    frustum,
+    instance,
+    pattern,
+    reference_frame,
+    sphere,
+)
 
-__all__ = ["component", "cone", "cylinder", "frustum", "reference_frame", "sphere"]
+__all__ = [
+    "component",
+    "cone",
+    "cylinder",
+    "frustum",
+    "instance",
+    "pattern",
+    "reference_frame",
+    "sphere",
+]
@@ -1,14 +1,72 @@
+import abc
+import contextlib
+import contextvars
 import functools
+import gc
+import hashlib
 import itertools
 import typing
+import weakref
 
+import numpy
 import solid
 
-from sccm import affinables
+from sccm import (
+    affinables,
+    bounding,
+    connector,
+    emission,
+    optimization,
+    resolution,
+    traversal,
+)
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from sccm import snapshot
+    from sccm.components import instance
 
 Composition = typing.Union[solid.union, solid.difference, solid.intersection]
 CompositionAndOperands = typing.Tuple[Composition, typing.List["Component"]]
 
+# Every change to a component's direct transformations is given a new version
+# from this sequence, so a chain of versions identifies a transformation history
+_transformation_versions = itertools.count()
+
+# Every change to any component is given a new version from this sequence
+_versions = itertools.count(1)
+
+# Copies whose structure hasn't been copied yet, by their `id`
+_deferred_copies: "weakref.WeakValueDictionary[int, Component]" = (
+    weakref.WeakValueDictionary()
+)
+
+# Components with observers, which must be notified of every change, by their `id`
+_observed_components: "weakref.WeakValueDictionary[int, Component]" = (
+    weakref.WeakValueDictionary()
+)
+
+# Components of snapshots, which mustn't change, by their `id`
+_frozen_components: "weakref.WeakValueDictionary[int, Component]" = (
+    weakref.WeakValueDictionary()
+)
+
+# Set while components are modified in ways which aren't changes to any
+# existing component, e.g. while a copy's deferred structure is being copied
+_silenced: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "silenced", default=False
+)
+
+# Set while parents assigned to components should be referenced weakly
+_weak_parents: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "weak_parents", default=False
+)
+
+# A component's parent, which may be referenced weakly
+ParentReference = typing.Union["Component", "weakref.ReferenceType[Component]", None]
+
+# A function notified of changes to components, given the component changed
+Observer = typing.Callable[["Component"], None]
+
 # Colors are specified as RBG and an optional alpha channel; each channel
 # should be a value in [0.0, 1.0].
 Color = typing.Union[
@@ -35,7 +93,102 @@ class DisembodiedComponent(Exception):
         self.component = component
 
 
-class Component(affinables.HistoricalTransformable):
+class FrozenComponent(Exception):
+    """Raised when a component of a snapshot would be changed"""
+
+    def __init__(self, component: "Component") -> None:
+        """
+        Args:
+            component: The frozen component
+        """
+        self.component = component
+
+
+class _TrackedList(list):
+    """A list of a component's structure, which notifies it of modifications
+
+    The list refers to its owner weakly, so they don't form a reference cycle.
+    """
+
+    __slots__ = ("_owner", "name")
+
+    def __init__(
+        self, owner: "Component", name: str, items: typing.Iterable = ()
+    ) -> None:
+        """
+        Args:
+            owner: The component whose structure the list holds
+            name: The name of the owner's attribute holding the list
+            items: The initial items
+        """
+        super().__init__(items)
+
+        self._owner = weakref.ref(owner)
+        self.name = name
+
+    @property
+    def owner(self) -> typing.Optional["Component"]:
+        """The component whose structure the list holds, if it still exists"""
+        return self._owner()
+
+    def __reduce__(self) -> typing.Tuple[type, typing.Tuple[list]]:
+        # The owner tracks the list again once it's unpickled
+        return list, (list(self),)
+
+
+def _notifying(name: str) -> typing.Callable:
+    """Wrap a mutating `list` method so it notifies the list's owner
+
+    Args:
+        name: The name of the method
+    """
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def notifying_method(
+        self: _TrackedList, *args: typing.Any, **kwargs: typing.Any
+    ) -> typing.Any:
+        owner = self.owner
+        if owner is None:
+            return method(self, *args, **kwargs)
+
+        owner._changing()
+        result = method(self, *args, **kwargs)
+        owner._structure_changed(self)
+
+        return result
+
+    return notifying_method
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(_TrackedList, _name, _notifying(_name))
+
+
+class _ComponentType(abc.ABCMeta):
+    """The type of components, which tracks changes to each once it's initialized"""
+
+    def __call__(cls, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        created = super().__call__(*args, **kwargs)
+        created._initialized()
+
+        return created
+
+
+class Component(affinables.HistoricalTransformable, metaclass=_ComponentType):
     """A component part
 
     Components form the basic structure of an `sccm` design: they can represent
@@ -43,12 +196,117 @@ class Component(affinables.HistoricalTransformable):
     together.
     """
 
+    # The name of the `OpenSCAD` primitive embodying this component, if its body
+    # is a single primitive
+    primitive: typing.Optional[str] = None
+
+    # Untransformed anchors, keyed by the class, the anchor's name & the
+    # parameters of the component they were computed for
+    _untransformed_anchors: typing.Dict[typing.Hashable, connector.Connector] = {}
+    _maximum_untransformed_anchors = 4096
+    # The names of each class's anchor properties, found on first use
+    _anchor_names: typing.Tuple[str, ...]
+
+    # The transformations that affect a component & its children, but not its
+    # parents
+    direct_transformations: typing.List[affinables.AffineTransformation]
+    # Transformed anchors, by name, with the keys they were computed for
+    _anchors: typing.Dict[str, typing.Tuple[typing.Hashable, connector.Connector]]
+    children: typing.List["Component"]
+    compositions: typing.List[CompositionAndOperands]
+    color: typing.Optional[Color]
+    resolution: typing.Optional["resolution.Resolution"]
+    # The component's node in parametric models, if any, which lives as long as
+    # the component does, along with everything depending on it
+    _parametric_state: typing.Any
+
+    # Attributes holding a component's structure, which are kept in lists that
+    # track their own modifications
+    _tracked_lists = frozenset(["direct_transformations", "children", "compositions"])
+    # Those whose copying can be deferred, when copying a component
+    _deferred_lists = frozenset(["children", "compositions"])
+    # Attributes which are derived from a component's state, rather than part
+    # of it, so don't count as changes to it
+    _untracked_attributes = frozenset(
+        [
+            "_anchors",
+            "_transformation_version",
+            "_version",
+            "_subtree_version",
+            "_observers",
+            "_embedders",
+            "_deferral",
+            "_copies",
+            "_parametric_state",
+        ]
+    )
+
+    # Bookkeeping of a component's relationships with others in the current
+    # process, which isn't pickled
+    _unpickled_attributes = frozenset(
+        [
+            "_observers",
+            "_embedders",
+            "_deferral",
+            "_copies",
+            "_parametric_state",
+            "__weakref__",
+        ]
+    )
+
+    # Instances' attributes are kept in slots, rather than dictionaries; those
+    # of subclasses without slots of their own are kept in dictionaries too
+    __slots__ = (
+        "direct_transformations",
+        "_transformation_version",
+        "_anchors",
+        "_parent",
+        "children",
+        "compositions",
+        "color",
+        "resolution",
+        "_version",
+        "_subtree_version",
+        "_observers",
+        "_embedders",
+        # The original whose structure a copy has yet to copy, if any, with the
+        # copy's own children & compositions set aside until then
+        "_deferral",
+        "_copies",
+        "_parametric_state",
+        "__weakref__",
+    )
+
+    def __new__(cls, *args: typing.Any, **kwargs: typing.Any) -> "Component":
+        """Create a component, without any history of changes
+
+        Subclasses may set attributes before initializing the component, so
+        this is done before initialization. Until the component is initialized,
+        it has no version, & changes to it aren't recorded.
+        """
+        created = super().__new__(cls)
+
+        for name, value in (
+            ("_version", None),
+            ("_subtree_version", None),
+            ("_observers", ()),
+            ("_embedders", ()),
+            ("_parent", None),
+            ("_deferral", None),
+            ("_copies", ()),
+            ("_parametric_state", None),
+        ):
+            object.__setattr__(created, name, value)
+
+        return created
+
     def __init__(
         self,
         parent: "Component" = None,
         children: typing.List["Component"] = None,
         compositions: typing.List[CompositionAndOperands] = None,
         color: Color = None,
+        resolution: "resolution.Resolution" = None,
     ) -> None:
         """
         Args:
@@ -59,26 +317,38 @@ class Component(affinables.HistoricalTransformable):
             compositions: The component's compositions, if any
             color: The color to use for this component, if any; this will override
                 any coloring on children.
+            resolution: The resolution with which to approximate the curved
+                surfaces of this component & its children, if any; this will
+                override any resolution set on parents
         """
-        # The transformations that affect this component & its children, but not
-        # its parents
-        self.direct_transformations: typing.List[affinables.AffineTransformation] = []
-
-        self._parent: typing.Optional["Component"] = None
-        self.children: typing.List["Component"] = []
-
-        if parent:
-            self.parent = parent
+        # Nothing can refer to a component being initialized, so its attributes
+        # are set directly, rather than as changes to it
+        set_attribute = object.__setattr__
+
+        set_attribute(
+            self,
+            "direct_transformations",
+            _TrackedList(self, "direct_transformations"),
+        )
+        set_attribute(self, "_transformation_version", next(_transformation_versions))
+        set_attribute(self, "_anchors", {})
+        set_attribute(self, "_parent", None)
+        set_attribute(self, "children", _TrackedList(self, "children"))
+        set_attribute(self, "compositions", _TrackedList(self, "compositions"))
+        set_attribute(self, "color", color)
+        set_attribute(self, "resolution", resolution)
 
         if children is not None:
             for child in children:
                 self.add_child(child)
 
-        self.compositions: typing.List[CompositionAndOperands] = []
         if compositions:
             self.compositions = compositions
 
-        self.color: typing.Optional[Color] = color
+        # Until the component has a parent, its changes only affect itself, so
+        # it's attached last
+        if parent:
+            self.parent = parent
 
     def add_child(
         self, children: typing.Union["Component", typing.List["Component"]]
@@ -99,10 +369,333 @@ class Component(affinables.HistoricalTransformable):
             if child.parent is not self:
                 child.parent = self
 
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        """Set an attribute, recording the change to this component
+
+        Args:
+            name: The name of the attribute
+            value: The attribute's new value
+        """
+        # Nothing can refer to a component being initialized, so setting its
+        # attributes isn't a change to prepare for
+        if self._version is not None and name not in self._untracked_attributes:
+            self._changing()
+            # Replacing a copy's structure would be undone by copying it later
+            if name in self._deferred_lists:
+                self._materialize()
+
+        if name in self._tracked_lists and not (
+            isinstance(value, _TrackedList)
+            and value.owner is self
+            and value.name == name
+        ):
+            value = _TrackedList(self, name, value)
+
+        super().__setattr__(name, value)
+
+        if name in self._tracked_lists:
+            self._structure_changed(value)
+        elif name not in self._untracked_attributes:
+            self._changed()
+
+    def __getattr__(self, name: str) -> typing.Any:
+        """Copy a copy's deferred structure, when it's first accessed
+
+        Args:
+            name: The name of the missing attribute
+
+        Raises:
+            AttributeError: If the attribute isn't part of a deferred structure
+        """
+        if name in self._deferred_lists and self._deferral is not None:
+            self._materialize()
+            return getattr(self, name)
+
+        raise AttributeError(
+            f"{self.__class__.__name__!r} object has no attribute {name!r}"
+        )
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        """The component's attributes, for pickling
+
+        Any deferred structure is copied first. Observers & other references to
+        components outside of the pickled tree aren't pickled, & a weakly
+        referenced parent is pickled as an ordinary reference.
+        """
+        self._materialize()
+        # The subtree version is pickled up to date
+        self.subtree_version
+
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            for name in [slots] if isinstance(slots, str) else slots:
+                if name not in self._unpickled_attributes and hasattr(self, name):
+                    state[name] = getattr(self, name)
+
+        state["_parent"] = self.parent
+
+        return state
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+        """Restore a pickled component's attributes
+
+        Args:
+            state: The attributes
+        """
+        for name, value in state.items():
+            if name in self._tracked_lists:
+                value = _TrackedList(self, name, value)
+
+            object.__setattr__(self, name, value)
+
+        for operand in self.composed_components:
+            operand._embedded_by(self)
+
+    def _changing(self) -> None:
+        """Prepare for a change to this component
+
+        Any copies of this component, or of those embodying it, which have yet
+        to copy their structure do so before it changes.
+
+        Raises:
+            FrozenComponent: If this component is part of a snapshot
+        """
+        if _frozen_components and id(self) in _frozen_components:
+            raise FrozenComponent(self)
+
+        if self._version is None or not _deferred_copies or _silenced.get():
+            return
+
+        changing: typing.List[Component] = []
+        seen: typing.Set[int] = set()
+        stack: typing.List[Component] = [self]
+        while stack:
+            changing_component = stack.pop()
+            if id(changing_component) in seen:
+                continue
+
+            seen.add(id(changing_component))
+            changing.append(changing_component)
+
+            parent = changing_component.parent
+            if parent is not None:
+                stack.append(parent)
+            for reference in changing_component._embedders:
+                embedder = reference()
+                if embedder is not None:
+                    stack.append(embedder)
+
+        # Copying an outer component's structure defers copies of its inner
+        # components, so outer components are handled first, until none remain
+        materialized = True
+        while materialized:
+            materialized = False
+            for changing_component in reversed(changing):
+                if not changing_component._copies:
+                    continue
+
+                copies, changing_component._copies = changing_component._copies, ()
+                for reference in copies:
+                    copy = reference()
+                    if copy is not None:
+                        copy._materialize()
+                        materialized = True
+
+    def _structure_changed(self, structure: _TrackedList) -> None:
+        """Record a change to one of this component's structural lists
+
+        Args:
+            structure: The list which was changed
+        """
+        if structure.name == "compositions":
+            for _, operands in structure:
+                for operand in operands if isinstance(operands, list) else [operands]:
+                    operand._embedded_by(self)
+
+        self._changed()
+
+    def _embedded_by(self, embedder: "Component") -> None:
+        """Record that this component is embodied by another, other than as a child
+
+        Changes to this component are then also changes to the other's subtree.
+
+        Args:
+            embedder: The component embodying this one, e.g. by composition
+        """
+        if not any(reference() is embedder for reference in self._embedders):
+            self._embedders = tuple(
+                reference for reference in self._embedders if reference() is not None
+            ) + (weakref.ref(embedder),)
+
+    def _initialized(self) -> None:
+        """Start recording changes to this component, once it's initialized
+
+        Its initialization is recorded as a single change.
+        """
+        object.__setattr__(self, "_version", 0 if _silenced.get() else next(_versions))
+
+        # Unless its subtree version was read while it was being initialized,
+        # it's still stale, as are those of the components embodying it
+        if self._subtree_version is not None:
+            self._invalidate()
+
+    def _changed(self) -> None:
+        """Record a change to this component, notifying any observers
+
+        The component's version is advanced, & the subtree versions of it &
+        every component embodying it are found again when they're next read.
+        """
+        if self._version is None:
+            return
+
+        silenced = _silenced.get()
+        if not silenced:
+            object.__setattr__(self, "_version", next(_versions))
+
+        # Even a change which isn't recorded may change which components are
+        # embodied, so subtree versions must still be found again
+        self._invalidate(notify=not silenced)
+
+    def _invalidate(self, notify: bool = False) -> None:
+        """Mark the subtree versions of this component & those embodying it stale
+
+        Marking stops at components whose subtree versions are already stale,
+        as those of every component embodying them must be too; so a series of
+        changes within a subtree costs as much as the first, rather than one
+        walk up the tree per change. Every embodying component's observers
+        must be notified of each change though, so while any component has
+        observers, each embodying component is visited once per change.
+
+        Args:
+            notify: Should observers be notified of the change to this component?
+        """
+        notify = notify and len(_observed_components) > 0
+        seen: typing.Set[int] = set()
+
+        # This is bookkeeping, not a change to be recorded in turn
+        set_attribute = object.__setattr__
+
+        stack: typing.List[Component] = [self]
+        while stack:
+            stale: typing.Optional[Component] = stack.pop()
+
+            # Each chain of parents is followed directly; only embedders, which
+            # are rare, are put on the stack
+            while stale is not None:
+                if stale._subtree_version is not None:
+                    set_attribute(stale, "_subtree_version", None)
+                elif not notify or id(stale) in seen:
+                    break
+
+                if notify:
+                    seen.add(id(stale))
+                    for observer in stale._observers:
+                        observer(self)
+
+                for reference in stale._embedders:
+                    embedder = reference()
+                    if embedder is not None:
+                        stack.append(embedder)
+
+                parent = stale._parent
+                stale = parent() if type(parent) is weakref.ref else parent
+
+    @staticmethod
+    def _versioned(component: "Component") -> typing.Iterator["Component"]:
+        """The components whose versions a component's subtree version includes
+
+        These are the components it embodies directly; a copy whose structure
+        hasn't been copied yet isn't made to copy it, as every component of the
+        original's structure is older than the copy.
+
+        Args:
+            component: The embodying component
+        """
+        if component._deferral is None:
+            return Component._embodied(component)
+
+        _, _, children, compositions = component._deferral
+        return itertools.chain(children, *(operands for _, operands in compositions))
+
+    @property
+    def version(self) -> int:
+        """Identifies the current state of this component alone
+
+        This increases whenever the component's attributes, transformations,
+        children or compositions change.
+        """
+        return self._version
+
+    @property
+    def subtree_version(self) -> int:
+        """Identifies the current state of this component & everything it embodies
+
+        This increases whenever this component, or any of its children or
+        composed components (at any depth), change. It's the latest version of
+        any of them, which is only found again, for stale parts of the
+        subtree, when it's read.
+        """
+        if self._subtree_version is None:
+            for stale in traversal.postorder(
+                self,
+                lambda component: (
+                    versioned
+                    for versioned in Component._versioned(component)
+                    if versioned._subtree_version is None
+                ),
+            ):
+                object.__setattr__(
+                    stale,
+                    "_subtree_version",
+                    max(
+                        [
+                            stale._version or 0,
+                            *(
+                                versioned._subtree_version
+                                for versioned in Component._versioned(stale)
+                            ),
+                        ]
+                    ),
+                )
+
+        return self._subtree_version
+
+    def observe(self, observer: Observer) -> None:
+        """Notify a function of changes to this component & everything it embodies
+
+        Args:
+            observer: The function to notify; it's called with the component
+                which changed, each time one does
+        """
+        self._observers = self._observers + (observer,)
+        _observed_components[id(self)] = self
+
+    def unobserve(self, observer: Observer) -> None:
+        """Stop notifying a function of changes
+
+        Args:
+            observer: The function to stop notifying
+        """
+        self._observers = tuple(
+            existing for existing in self._observers if existing != observer
+        )
+        if not self._observers:
+            _observed_components.pop(id(self), None)
+
     @property
     def parent(self) -> typing.Optional["Component"]:
-        """This component's parent"""
-        return self._parent
+        """This component's parent
+
+        Note:
+            If the parent was assigned while `building` with weak parent
+            references, this is `None` once nothing else refers to the parent
+        """
+        parent = self._parent
+        if type(parent) is weakref.ref:
+            return parent()
+
+        return parent
 
     @parent.setter
     def parent(self, parent: "Component") -> None:
@@ -118,9 +711,16 @@ class Component(affinables.HistoricalTransformable):
         if self.parent and self.parent is not parent:
             raise ReparentException(self, parent)
 
-        self._parent = parent
-        if not any(self is child for child in parent.children):
-            parent.add_child(self)
+        self._parent = weakref.ref(parent) if _weak_parents.get() else parent
+        # Children are usually assigned parents just after being added to them,
+        # & a component being initialized can't have been added to any other way
+        children = parent.children
+        if children and children[-1] is self:
+            return
+        if self._version is not None and any(self is child for child in children):
+            return
+
+        parent.add_child(self)
 
     @property
     def parents(self) -> typing.Iterator["Component"]:
@@ -129,9 +729,10 @@ class Component(affinables.HistoricalTransformable):
         The component's direct parent (if any) will be yielded first, then that
         component's parent, and so on.
         """
-        if self.parent:
-            yield self.parent
-            yield from self.parent.parents
+        parent = self.parent
+        while parent is not None:
+            yield parent
+            parent = parent.parent
 
     @property
     def transformations(self) -> typing.Iterator[affinables.AffineTransformation]:
@@ -141,10 +742,8 @@ class Component(affinables.HistoricalTransformable):
             This includes the transformations applied to all parents and also
             those applied directly to this component
         """
-        yield from self.direct_transformations
-
-        if self.parent:
-            yield from self.parent.transformations
+        for component in itertools.chain([self], self.parents):
+            yield from component.direct_transformations
 
     def _transform(self, transform: affinables.AffineTransformation) -> "Component":
         """Apply a transformation to this object
@@ -156,9 +755,147 @@ class Component(affinables.HistoricalTransformable):
             This object, appropriately transformed
         """
         self.direct_transformations.append(transform)
+        self._transformation_version = next(_transformation_versions)
 
         return self
 
+    def remove_transformations(
+        self, transformations: typing.Iterable[affinables.AffineTransformation]
+    ) -> int:
+        """Remove some of the transformations applied directly to this component
+
+        Args:
+            transformations: The transformations to remove; these are matched
+                by identity, not equality
+
+        Returns:
+            The position the first removed transformation had among the direct
+            transformations, or the number of direct transformations if none
+            were removed
+        """
+        removed = {id(transformation) for transformation in transformations}
+        positions = [
+            position
+            for position, transformation in enumerate(self.direct_transformations)
+            if id(transformation) in removed
+        ]
+
+        if not positions:
+            return len(self.direct_transformations)
+
+        self.direct_transformations = [
+            transformation
+            for transformation in self.direct_transformations
+            if id(transformation) not in removed
+        ]
+        self._transformation_version = next(_transformation_versions)
+
+        return positions[0]
+
+    def insert_transformations(
+        self,
+        position: int,
+        transformations: typing.Iterable[affinables.AffineTransformation],
+    ) -> None:
+        """Apply transformations to this component, before some existing ones
+
+        Args:
+            position: The position, among the direct transformations, at which
+                to insert the new transformations
+            transformations: The transformations to insert
+        """
+        self.direct_transformations[position:position] = list(transformations)
+        self._transformation_version = next(_transformation_versions)
+
+    @property
+    def _transformation_key(self) -> typing.Tuple[typing.Tuple[int, int], ...]:
+        """Identifies the current state of this component's transformations
+
+        This changes whenever a transformation is applied to this component or
+        one of its parents, or when it's given a parent.
+
+        Note:
+            Transformations modified in place, after they're applied, aren't
+            detected
+        """
+        return tuple(
+            (component._transformation_version, len(component.direct_transformations))
+            for component in itertools.chain([self], self.parents)
+        )
+
+    @staticmethod
+    def anchor_property(
+        anchor_property: typing.Callable[["Component"], connector.Connector],
+    ) -> connector.Connector:
+        """Decorate anchor properties so they transform in sync & are memoized
+
+        Like `transformed_property`, the result property has all of the
+        component's transformations applied to it. Untransformed anchors are
+        shared by every component of the same class with the same parameters,
+        and transformed anchors are reused until the component's (or one of its
+        parents') transformations or parameters change.
+
+        Note:
+            The `property` decoration is applied within this decorator, so it
+            should not be applied independently to target methods; anchors are
+            shared, so they should not be modified in place.
+        """
+        name = anchor_property.__name__
+
+        @functools.wraps(anchor_property)
+        def cached_anchor_property(self: "Component") -> connector.Connector:
+            parameters = self._parameters
+            key = (parameters, self._transformation_key)
+
+            cached = self._anchors.get(name)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+            untransformed_key = (type(self), name, parameters)
+            anchor = Component._untransformed_anchors.get(untransformed_key)
+
+            if anchor is None:
+                if (
+                    len(Component._untransformed_anchors)
+                    >= Component._maximum_untransformed_anchors
+                ):
+                    Component._untransformed_anchors.clear()
+
+                anchor = anchor_property(self)
+                Component._untransformed_anchors[untransformed_key] = anchor
+
+            anchor = self.transformed(anchor)
+            self._anchors[name] = (key, anchor)
+
+            return anchor
+
+        # Marks the property for discovery by `anchor_names`
+        cached_anchor_property.is_anchor = True  # type: ignore
+
+        # `mypy` cannot properly check decorated properties
+        return property(cached_anchor_property)  # type: ignore
+
+    @classmethod
+    def anchor_names(cls) -> typing.Tuple[str, ...]:
+        """The names of this class's anchor properties"""
+        names = cls.__dict__.get("_anchor_names")
+
+        if names is None:
+            names = tuple(
+                name
+                for name in dir(cls)
+                if isinstance(getattr(cls, name), property)
+                and getattr(getattr(cls, name).fget, "is_anchor", False)
+            )
+            cls._anchor_names = names
+
+        return names
+
+    @property
+    def anchors(self) -> typing.Dict[str, connector.Connector]:
+        """Every one of this component's anchors, by name"""
+        return {name: getattr(self, name) for name in self.anchor_names()}
+
     def same_children(self, other: "Component") -> bool:
         """Does this component have the same children as another?
 
@@ -214,6 +951,78 @@ class Component(affinables.HistoricalTransformable):
             and self.same_compositions(other)
         )
 
+    @property
+    def _parameters(self) -> typing.Tuple:
+        """The parameters which define this component's own body
+
+        Subclasses with parameters (e.g. dimensions) should include them all
+        here, so that structurally identical components can be recognized.
+        """
+        return ()
+
+    @property
+    def fingerprint(self) -> str:
+        """A digest of this component's structure
+
+        Two components have the same fingerprint if they are of the same type,
+        have the same parameters, direct transformations, color & resolution, and
+        their children & compositions have the same fingerprints, in the same
+        order; transformations inherited from parents are not included.
+        """
+        return self._fingerprint({})
+
+    def _fingerprint(self, fingerprints: typing.Dict[int, str]) -> str:
+        """Compute this component's fingerprint, reusing any already computed
+
+        Args:
+            fingerprints: Previously computed fingerprints, keyed by the `id` of
+                their components; this will be updated with those computed here
+        """
+        if id(self) not in fingerprints:
+            # The embodied components are fingerprinted first, from the bottom up
+            for component in traversal.postorder(
+                self,
+                lambda component: (
+                    embodied
+                    for embodied in Component._embodied(component)
+                    if id(embodied) not in fingerprints
+                ),
+            ):
+                fingerprints[id(component)] = component._own_fingerprint(fingerprints)
+
+        return fingerprints[id(self)]
+
+    def _own_fingerprint(self, fingerprints: typing.Dict[int, str]) -> str:
+        """Compute this component's fingerprint from those of its embodied components
+
+        Args:
+            fingerprints: The fingerprints of (at least) every component embodied
+                directly within this one, keyed by their `id`
+        """
+        digest = hashlib.blake2b(digest_size=16)
+
+        for part in (
+            self.__class__.__qualname__,
+            self._parameters,
+            [
+                (type(transformation).__name__, sorted(transformation.params.items()))
+                for transformation in self.direct_transformations
+            ],
+            self.color,
+            self.resolution,
+            [fingerprints[id(child)] for child in self.uncomposed_children],
+            [
+                (
+                    type(composition).__name__,
+                    [fingerprints[id(operand)] for operand in operands],
+                )
+                for composition, operands in self.compositions
+            ],
+        ):
+            digest.update(repr(part).encode())
+
+        return digest.hexdigest()
+
     @property
     def _copy(self) -> "Component":
         """Create a new, orphan copy of this component
@@ -247,14 +1056,83 @@ class Component(affinables.HistoricalTransformable):
         if self.parent and not isolate:
             copy.parent = self.parent
 
+        # The children & compositions are only copied once they're needed; a
+        # copy of a copy whose structure hasn't been needed yet can be made
+        # from the same original (isolated from it if the first copy is)
+        if self._deferral is not None:
+            original, isolated, _, _ = self._deferral
+            copy._defer(original, isolate or isolated)
+        elif self.children or self.compositions:
+            copy._defer(self, isolate)
+
+        if with_color:
+            copy.color = self.color
+
+        copy.resolution = self.resolution
+
+        return copy
+
+    def _defer(self, original: "Component", isolate: bool) -> None:
+        """Defer copying another component's children & compositions to this one
+
+        The structure is copied when it's first accessed, or just before the
+        original (or anything embodied within it) changes, whichever happens
+        first; until then, a copy costs the same regardless of the size of the
+        original's subtree.
+
+        Args:
+            original: The component whose structure is to be copied
+            isolate: Should the copied structure be isolated from the original?
+        """
+        # Any children of the copy (e.g. those fulfilling specific roles) are
+        # set aside until the rest of the structure is copied
+        children, compositions = self.children, self.compositions
+        del self.children, self.compositions
+        self._deferral = (original, isolate, children, compositions)
+
+        original._copies = tuple(
+            reference for reference in original._copies if reference() is not None
+        ) + (weakref.ref(self),)
+        _deferred_copies[id(self)] = self
+
+    def _materialize(self) -> None:
+        """Copy the structure whose copying was deferred, if any"""
+        if self._deferral is None:
+            return
+
+        original, isolate, children, compositions = self._deferral
+        self._deferral = None
+        _deferred_copies.pop(id(self), None)
+
+        # The structure is restored as it was, so this isn't a change
+        object.__setattr__(self, "children", _TrackedList(self, "children", children))
+        object.__setattr__(
+            self, "compositions", _TrackedList(self, "compositions", compositions)
+        )
+
+        # The copy's structure is only being made concrete
+        with _silently():
+            self._copy_structure(original, isolate)
+
+    def _copy_structure(self, original: "Component", isolate: bool) -> None:
+        """Copy another component's children & compositions to this one
+
+        Args:
+            original: The component whose structure is to be copied
+            isolate: Should the copied structure be isolated from the original?
+        """
+        # Children fulfilling specific roles in the component should already
+        # have been copied by `_copy`
+        role_children = list(self.children)
+
         # Copy components involved in composition
-        for composition, operands in self.compositions:
+        for composition, operands in original.compositions:
             copied_child_operands = []
             all_operands = []
 
             # Operands that are children must be copied to avoid reparenting
             for operand in operands:
-                if operand in self.children:
+                if any(operand is child for child in original.children):
                     operand = operand.copy(isolate=True)
                     copied_child_operands.append(operand)
                 elif isolate:
@@ -262,7 +1140,7 @@ class Component(affinables.HistoricalTransformable):
 
                 all_operands.append(operand)
 
-            copy.compose(
+            self.compose(
                 composition,
                 all_operands,
                 # To avoid double-copying child operands, we have to do the copy
@@ -275,20 +1153,68 @@ class Component(affinables.HistoricalTransformable):
             )
 
             for copied_child_operand in copied_child_operands:
-                copy.add_child(copied_child_operand)
+                self.add_child(copied_child_operand)
 
         # All children are copied, because we can't reparent
-        for child in self.uncomposed_children:
-            # Children fulfilling specific roles in the component should be
-            # copied by `_copy`, so they shouldn't be copied here
-            if child not in copy.children:
+        for child in original.uncomposed_children:
+            # Children fulfilling specific roles shouldn't be copied again
+            if child not in role_children:
                 # Isolate and reparent any non-specific children
-                copy.add_child(child.copy(isolate=True))
+                self.add_child(child.copy(isolate=True))
 
-        if with_color:
-            copy.color = self.color
+    def freeze(self) -> "snapshot.Snapshot":
+        """Take an immutable snapshot of this component & everything it embodies
 
-        return copy
+        The snapshot is independent of this component, which can go on changing
+        while the snapshot is read (& emitted) from any number of threads.
+        """
+        # Snapshots contain components, so can't be imported up front
+        from sccm import snapshot
+
+        return snapshot.Snapshot(self)
+
+    def place(
+        self,
+        template: "Component",
+        anchor: connector.Connector,
+        targets: typing.Union[
+            connector.ConnectorArray, typing.Iterable[connector.Connector]
+        ],
+        color: Color = None,
+    ) -> typing.List["instance.Instance"]:
+        """Place instances of a template component onto many connectors
+
+        Each instance is equivalent to a copy of the template transformed to
+        align the anchor with one of the targets, then made a child of this
+        component; the alignments are computed together, and the instances
+        share the template's body rather than copying its structure.
+
+        Args:
+            template: The component to place
+            anchor: The template's connector to align with each target,
+                e.g. one of its anchors
+            targets: The connectors at which to place the template
+            color: The color to use for the instances, if any
+
+        Returns:
+            The instances, in the order of their targets
+        """
+        # Instances are components themselves, so can't be imported up front
+        from sccm.components import instance
+
+        if not isinstance(targets, connector.ConnectorArray):
+            targets = connector.ConnectorArray.from_connectors(targets)
+
+        alignments = connector.ConnectorArray.from_connectors(
+            [anchor]
+        ).alignment_matrices(targets)
+
+        return [
+            instance.Instance(template, parent=self, color=color).transform(
+                solid.multmatrix(alignment.tolist())
+            )
+            for alignment in alignments
+        ]
 
     def compose(
         self,
@@ -354,11 +1280,258 @@ class Component(affinables.HistoricalTransformable):
     @property
     def uncomposed_children(self) -> typing.Iterator["Component"]:
         """All of the children of this component not composed with it"""
-        composed_components = list(self.composed_components)
+        # Operands are matched by identity, as comparing structurally would
+        # walk the children's entire subtrees
+        composed_components = {id(operand) for operand in self.composed_components}
         for child in self.children:
-            if child not in composed_components:
+            if id(child) not in composed_components:
                 yield child
 
+    @property
+    def subtree(self) -> typing.Iterator["Component"]:
+        """This component & every component embodied within it, each only once
+
+        This includes children & composed components (whether or not they are
+        children), in pre-order.
+        """
+        return traversal.preorder(self, Component._embodied)
+
+    @staticmethod
+    def _embodied(component: "Component") -> typing.Iterator["Component"]:
+        """The components directly embodied within a component
+
+        These are its children & composed components (some of which may be both).
+
+        Args:
+            component: The embodying component
+        """
+        return itertools.chain(component.children, component.composed_components)
+
+    @property
+    def world_matrix(self) -> numpy.ndarray:
+        """The 4x4 homogeneous matrix of all of this component's transformations"""
+        return affinables.compose(self.transformations)
+
+    @property
+    def _local_bounds(self) -> typing.Optional[bounding.Bounds]:
+        """The untransformed bounds of this component's own body, if it has one
+
+        This excludes children & composed components. Subclasses defining their
+        own `_body` should override this; otherwise, their bodies are treated
+        as unbounded.
+        """
+        if type(self)._body is Component._body:
+            return None
+
+        return bounding.Bounds.unbounded()
+
+    @property
+    def _base_bounds(self) -> bounding.Bounds:
+        """The world-space bounds of the base of this component
+
+        This is the body that compositions are applied to: this component's own
+        body (if any) & its uncomposed children.
+        """
+        return self._bounded_base(
+            {id(child): child.bounds for child in self.uncomposed_children}
+        )
+
+    def _bounded_base(
+        self, bounds: typing.Dict[int, bounding.Bounds]
+    ) -> bounding.Bounds:
+        """Compute the bounds of the base of this component
+
+        Args:
+            bounds: The bounds of (at least) every component embodied directly
+                within this one, keyed by their `id`
+        """
+        local_bounds = self._local_bounds
+        base_bounds = (
+            local_bounds.transformed(self.world_matrix)
+            if local_bounds is not None
+            else bounding.Bounds()
+        )
+
+        for child in self.uncomposed_children:
+            base_bounds = base_bounds.union(bounds[id(child)])
+
+        return base_bounds
+
+    @staticmethod
+    def _composed_bounds(
+        composition: Composition,
+        base_bounds: bounding.Bounds,
+        operand_bounds: typing.Iterable[bounding.Bounds],
+    ) -> bounding.Bounds:
+        """The bounds of the result of a composition
+
+        Args:
+            composition: The composition
+            base_bounds: The bounds of the body being composed onto
+            operand_bounds: The bounds of each of the composition's operands
+        """
+        if isinstance(composition, solid.union):
+            return functools.reduce(bounding.Bounds.union, operand_bounds, base_bounds)
+        elif isinstance(composition, solid.intersection):
+            return functools.reduce(
+                bounding.Bounds.intersection, operand_bounds, base_bounds
+            )
+
+        # Subtraction can only remove from the base
+        return base_bounds
+
+    @property
+    def bounds(self) -> bounding.Bounds:
+        """The world-space, axis-aligned bounds of this component's body
+
+        These are analytic & conservative: the body is guaranteed to be within
+        them, but they may not be the smallest possible.
+        """
+        # The embodied components are bounded first, from the bottom up
+        bounds: typing.Dict[int, bounding.Bounds] = {}
+        for component in traversal.postorder(self, Component._embodied):
+            bounds[id(component)] = component._bounded(bounds)
+
+        return bounds[id(self)]
+
+    def _bounded(self, bounds: typing.Dict[int, bounding.Bounds]) -> bounding.Bounds:
+        """Compute the bounds of this component from those of its embodied components
+
+        Args:
+            bounds: The bounds of (at least) every component embodied directly
+                within this one, keyed by their `id`
+        """
+        compositions = self.compositions
+        base_bounds = self._bounded_base(bounds)
+
+        # As in `body`, pure containers use the first operand of their first
+        # composition as the base
+        if (
+            base_bounds.empty
+            and self._local_bounds is None
+            and compositions
+            and compositions[0][1]
+        ):
+            first_composition, (base_operand, *first_operands) = compositions[0]
+            base_bounds = bounds[id(base_operand)]
+            compositions = [(first_composition, first_operands)] + compositions[1:]
+
+        return functools.reduce(
+            lambda composed_bounds, composition_and_operands: self._composed_bounds(
+                composition_and_operands[0],
+                composed_bounds,
+                (bounds[id(operand)] for operand in composition_and_operands[1]),
+            ),
+            compositions,
+            base_bounds,
+        )
+
+    @property
+    def world_scale(self) -> float:
+        """The largest factor by which this component's transformations stretch it"""
+        return functools.reduce(
+            lambda scale, transformation: scale * affinables.stretch(transformation),
+            self.transformations,
+            1.0,
+        )
+
+    @property
+    def _assigned_resolution(self) -> typing.Optional[resolution.Resolution]:
+        """The resolution assigned to this component, its parents, or the emission
+
+        The closest assignment takes precedence.
+        """
+        for component in itertools.chain([self], self.parents):
+            if component.resolution is not None:
+                return component.resolution
+
+        return emission.current().default_resolution
+
+    @property
+    def effective_resolution(self) -> resolution.Resolution:
+        """The resolution governing this component's curved surfaces
+
+        If no resolution has been assigned, this reflects the emission's global
+        settings (or `OpenSCAD`'s defaults, if there are none).
+        """
+        assigned_resolution = self._assigned_resolution
+        if assigned_resolution is not None:
+            return assigned_resolution
+
+        return resolution.Resolution(fn=emission.current().fn)
+
+    @property
+    def curvature_radius(self) -> typing.Optional[float]:
+        """The world-space radius of this component's largest approximated circle
+
+        Components without curved surfaces of their own, or whose faceting is
+        fixed, have none.
+        """
+        return None
+
+    @property
+    def fragments(self) -> typing.Optional[int]:
+        """The number of fragments this component's circles will be emitted with
+
+        Components without approximated curved surfaces have none.
+        """
+        radius = self.curvature_radius
+        if radius is None:
+            return None
+
+        override = emission.current().fragments.get(id(self))
+        if override is not None:
+            return override
+
+        return self.effective_resolution.fragments(radius)
+
+    def facets(self, fragments: typing.Optional[int]) -> int:
+        """Estimate the number of facets this component's own body will have
+
+        This does not include the facets of children or composed components.
+
+        Args:
+            fragments: The number of fragments curved surfaces are approximated
+                with, if any
+        """
+        return 0
+
+    @property
+    def _resolution_parameters(self) -> resolution.ResolutionParameters:
+        """The special variables to set on this component's curved primitive"""
+        radius = self.curvature_radius
+        if radius is None:
+            return {}
+
+        override = emission.current().fragments.get(id(self))
+        if override is not None:
+            return {"$fn": override}
+
+        # Unassigned resolutions are left to the emission's global settings
+        assigned_resolution = self._assigned_resolution
+        if assigned_resolution is None:
+            return {}
+
+        return assigned_resolution.parameters(radius)
+
+    @staticmethod
+    def _resolved(
+        primitive: solid.OpenSCADObject, parameters: resolution.ResolutionParameters
+    ) -> solid.OpenSCADObject:
+        """Set circle-approximation special variables on a primitive
+
+        Args:
+            primitive: The primitive to modify
+            parameters: The special variables to set
+
+        Returns:
+            The primitive
+        """
+        for name, value in parameters.items():
+            primitive.add_param(name, value)
+
+        return primitive
+
     @property
     def _body(self) -> typing.Optional[solid.OpenSCADObject]:
         """The transformed object that embodies the base of this component
@@ -389,54 +1562,271 @@ class Component(affinables.HistoricalTransformable):
         # composition object
         return composition.copy()(operands)
 
+    def _pruned_operands(
+        self,
+        composition: Composition,
+        base_bounds: bounding.Bounds,
+        operands: typing.List["Component"],
+    ) -> typing.Tuple[typing.List["Component"], bounding.Bounds]:
+        """Leave out composition operands which can't contribute to the result
+
+        Args:
+            composition: The composition
+            base_bounds: The bounds of the body being composed onto
+            operands: The composition's operands
+
+        Returns:
+            The operands which must be kept & the bounds of the result
+        """
+        options = emission.current()
+
+        def prune(operand: "Component", reason: str) -> None:
+            options.pruned.append(
+                emission.PrunedOperand(self, composition, operand, reason)
+            )
+
+        if isinstance(composition, solid.union):
+            return (
+                operands,
+                self._composed_bounds(
+                    composition,
+                    base_bounds,
+                    (options.bounds_of(operand) for operand in operands),
+                ),
+            )
+
+        if base_bounds.empty:
+            for operand in operands:
+                prune(operand, "the body being composed onto is empty")
+
+            return [], base_bounds
+
+        if isinstance(composition, solid.difference):
+            kept_operands = []
+
+            for operand in operands:
+                if base_bounds.overlaps(options.bounds_of(operand)):
+                    kept_operands.append(operand)
+                else:
+                    prune(operand, "it doesn't overlap the body being subtracted from")
+
+            return kept_operands, base_bounds
+
+        composed_bounds = self._composed_bounds(
+            composition,
+            base_bounds,
+            (options.bounds_of(operand) for operand in operands),
+        )
+
+        if isinstance(composition, solid.intersection) and composed_bounds.empty:
+            for operand in operands:
+                prune(operand, "the intersection is empty")
+
+        return operands if not composed_bounds.empty else [], composed_bounds
+
+    @property
+    def _cache_key(self) -> typing.Hashable:
+        """The key of this component's rendered body in a fragment cache
+
+        Besides this component's own structure, the body depends on the
+        transformations & resolution inherited from its parents and on the
+        emission options.
+        """
+        options = emission.current()
+
+        return (
+            self._fingerprint(options.fingerprints),
+            tuple(
+                (type(transformation).__name__, repr(transformation.params))
+                for transformation in (
+                    self.parent.transformations if self.parent else ()
+                )
+            ),
+            repr(self.parent._assigned_resolution if self.parent else None),
+            options.signature,
+        )
+
     @property
     def body(self) -> solid.OpenSCADObject:
         """The fully transformed, composed, and colored embodiment of this component
 
+        Note:
+            If the emission options call for pruning, composition operands which
+            can't contribute to the body (judging by their bounds) are left out;
+            if they provide a fragment cache, the body is emitted as its rendered
+            source, which is reused if this component hasn't changed
+
         Raises:
             DisembodiedComponent:
                 If this component cannot be rendered as a body
         """
-        body_reduction = functools.partial(
-            functools.reduce,
-            lambda body, composition_and_operands: self._apply_composition(
-                composition_and_operands[0],
-                [body] + [operand.body for operand in composition_and_operands[1]],
-            ),
-        )
+        return traversal.evaluate(self, Component._embodiment)
+
+    def _embodiment(
+        self,
+    ) -> traversal.Evaluation["Component", solid.OpenSCADObject]:
+        """Compute this component's body, as a step of the evaluation of `body`
+
+        Yields:
+            Each component whose body is needed, which must be sent back
+
+        Returns:
+            The body
+        """
+        options = emission.current()
+
+        if not options.caching:
+            return (yield from self._composition())
 
-        if self._body:
-            composed_body = body_reduction(self.compositions, self._body)
+        key = self._cache_key
+        fragment = options.cache.get(key)
+
+        if fragment is None:
+            with options.recording_modules() as modules:
+                composed_body = yield from self._composition()
+                if options.optimize:
+                    composed_body = optimization.optimize(composed_body)
+
+                text = composed_body._render()
+
+            options.cache.put(key, text, modules)
         else:
-            if not self.compositions:
+            # The modules the fragment calls must still be defined
+            text, modules = fragment
+            for name, module_body in modules.items():
+                options.define_module(name, module_body)
+
+        return emission.RenderedFragment(text)
+
+    def _composition(
+        self,
+    ) -> traversal.Evaluation["Component", solid.OpenSCADObject]:
+        """Compose this component's body, without consulting any fragment cache
+
+        Yields:
+            Each component whose body is needed, which must be sent back
+
+        Returns:
+            The fully transformed, composed, and colored body
+
+        Raises:
+            DisembodiedComponent:
+                If this component cannot be rendered as a body
+        """
+        options = emission.current()
+
+        if type(self)._body is Component._body:
+            # The bodies of pure containers' children are requested rather than
+            # built by `_body`, so they aren't built recursively
+            child_bodies = []
+            for child in list(self.uncomposed_children):
+                child_bodies.append((yield child))
+
+            composed_body = solid.union()(child_bodies) if child_bodies else None
+        else:
+            composed_body = self._body
+
+        compositions = self.compositions
+        composed_bounds = None
+
+        if composed_body is not None:
+            if options.prune:
+                composed_bounds = self._base_bounds
+        else:
+            if not compositions:
                 raise DisembodiedComponent(self)
 
             # If this component is a pure container (without a defined `_body`),
             # we must extract an initial body to compose onto from the first
             # composition & its operands - otherwise, there would be nothing at
             # the "root" of the compositions
-            first_composition, first_operands = self.compositions[0]
-            composed_body = body_reduction(
-                self.compositions[1:],
-                self._apply_composition(
-                    first_composition, [operand.body for operand in first_operands]
-                ),
-            )
+            first_composition, first_operands = compositions[0]
+            if first_operands:
+                base_operand, *first_operands = first_operands
+                compositions = [(first_composition, first_operands)] + compositions[1:]
+
+                composed_body = yield base_operand
+                if options.prune:
+                    composed_bounds = options.bounds_of(base_operand)
+
+        for composition, operands in compositions:
+            if composed_bounds is not None:
+                operands, composed_bounds = self._pruned_operands(
+                    composition, composed_bounds, operands
+                )
+
+                # Nothing is left to compose onto, or to subtract
+                if composed_bounds.empty:
+                    composed_body = None
+                    continue
+                elif not operands:
+                    continue
+
+            operand_bodies = [composed_body] if composed_body is not None else []
+            for operand in operands:
+                operand_bodies.append((yield operand))
+
+            composed_body = self._apply_composition(composition, operand_bodies)
+
+        # Pruning can leave a component without any body at all
+        if composed_body is None:
+            composed_body = solid.union()
 
         if self.color:
             return solid.color(self.color)(composed_body)
         else:
             return composed_body
 
-    def scad_source(self, fn: int = None) -> str:  # pragma: no cover
-        """The OpenSCAD source code that this component corresponds to"""
+    def scad_source(
+        self,
+        fn: int = None,
+        default_resolution: resolution.Resolution = None,
+        facet_budget: int = None,
+        optimize: bool = True,
+        prune: bool = False,
+        cache: emission.FragmentCache = None,
+    ) -> str:  # pragma: no cover
+        """The OpenSCAD source code that this component corresponds to
+
+        Args:
+            fn: The global number of facets to render curved surfaces with
+            default_resolution: The resolution to use for components that don't
+                have one of their own
+            facet_budget: The total number of facets the emitted model may
+                have; if provided, each curved primitive will be emitted with
+                an explicit fragment count fitting the budget
+            optimize: Should the emitted tree of CSG operations be optimized?
+            prune: Should composition operands which can't contribute to the
+                emitted model (judging by their bounds) be left out? To see
+                which were, emit within `emission.configured` instead
+            cache: Where to look up & store the rendered source of each
+                component's body, if anywhere; unchanged subtrees are then
+                spliced into the source without being rendered again
+        """
         header = ""
         if fn:
             header = f"$fn = {fn};"
 
-        return solid.scad_render(self.body, header)
+        with emission.configured(
+            self, fn, default_resolution, facet_budget, prune, cache, optimize
+        ) as options:
+            body = self.body
 
-    def compile(self, filename: str = None, fn: int = None) -> None:  # pragma: no cover
+        if optimize:
+            body = optimization.optimize(body)
+
+        return solid.scad_render(body, header + options.module_definitions)
+
+    def compile(
+        self,
+        filename: str = None,
+        fn: int = None,
+        default_resolution: resolution.Resolution = None,
+        facet_budget: int = None,
+        optimize: bool = True,
+        prune: bool = False,
+        cache: emission.FragmentCache = None,
+    ) -> None:  # pragma: no cover
         """Write OpenSCAD source corresponding to this component
 
         Args:
@@ -445,9 +1835,75 @@ class Component(affinables.HistoricalTransformable):
                 name as this class
             fn: The number of facets to render curved surfaces with; if not
                 provided, the `OpenSCAD` default will be used
+            default_resolution: The resolution to use for components that
+                don't have one of their own
+            facet_budget: The total number of facets the emitted model may
+                have, if limited
+            optimize: Should the emitted tree of CSG operations be optimized?
+            prune: Should composition operands which can't contribute to the
+                emitted model be left out?
+            cache: Where to look up & store the rendered source of each
+                component's body, if anywhere
         """
         if filename is None:
             filename = f"{self.__class__.__name__}.scad"
 
         with open(filename, "w") as file_contents:
-            file_contents.write(self.scad_source(fn))
+            file_contents.write(
+                self.scad_source(
+                    fn, default_resolution, facet_budget, optimize, prune, cache
+                )
+            )
+
+
+@contextlib.contextmanager
+def _silently() -> typing.Iterator[None]:
+    """Modify components without recording the changes
+
+    This is only valid for modifications which don't change any existing
+    component as seen from outside the context, e.g. constructing a new tree;
+    the components' versions aren't advanced & no copies of them are made
+    concrete.
+    """
+    token = _silenced.set(True)
+
+    try:
+        yield
+    finally:
+        _silenced.reset(token)
+
+
+@contextlib.contextmanager
+def building(weak_parents: bool = False, freeze: bool = False) -> typing.Iterator[None]:
+    """Build a large component tree without pausing for garbage collection
+
+    Each object allocated counts towards triggering the cyclic garbage collector,
+    which then examines every object allocated since; building a tree of many
+    components would trigger it repeatedly, so it's suspended for the duration
+    of the context instead.
+
+    Args:
+        weak_parents: Should the parents assigned to components within the
+            context be referenced weakly? Parents & children then don't form
+            reference cycles, so a discarded tree is freed as soon as it's no
+            longer referenced, without the collector; but each component is
+            then only kept alive by references from outside the tree or by its
+            own parent, so the root of the tree must be kept
+        freeze: Should every existing object (including the built tree) be moved
+            to the collector's permanent generation once the context exits?
+            Subsequent collections then won't examine them, until
+            `gc.unfreeze` is called
+    """
+    token = _weak_parents.set(weak_parents)
+    enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        _weak_parents.reset(token)
+
+        if freeze:
+            gc.freeze()
+        if enabled:
+            gc.enable()
@@ -1,9 +1,12 @@
+from sccm import resolution
 from sccm.components import component, frustum
 
 
 class Cone(frustum.CircularFrustum):
     """A cone"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         bottom_diameter: float,
@@ -11,6 +14,7 @@ class Cone(frustum.CircularFrustum):
         center: bool = False,
         parent: component.Component = None,
         color: component.Color = None,
+        resolution: resolution.Resolution = None,
     ) -> None:
         """
         Args:
@@ -21,6 +25,8 @@ class Cone(frustum.CircularFrustum):
             parent: The cone's parent, if any; this component will be set as
                 one of the parent's children
             color: The color to use for this component, if any
+            resolution: The resolution with which to approximate the cone's
+                circular faces, if any
         """
         super().__init__(
             bottom_diameter=bottom_diameter,
@@ -29,6 +35,7 @@ class Cone(frustum.CircularFrustum):
             center=center,
             parent=parent,
             color=color,
+            resolution=resolution,
         )
 
     @property
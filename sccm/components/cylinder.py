@@ -1,9 +1,12 @@
+from sccm import resolution
 from sccm.components import component, frustum
 
 
 class Cylinder(frustum.CircularFrustum):
     """A cylinder"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         diameter: float,
@@ -11,6 +14,7 @@ class Cylinder(frustum.CircularFrustum):
         center: bool = False,
         parent: component.Component = None,
         color: component.Color = None,
+        resolution: resolution.Resolution = None,
     ) -> None:
         """
         Args:
@@ -21,6 +25,8 @@ class Cylinder(frustum.CircularFrustum):
             parent: The cylinder's parent, if any; this component will be set as
                 one of the parent's children
             color: The color to use for this component, if any
+            resolution: The resolution with which to approximate the cylinder's
+                circular faces, if any
         """
         super().__init__(
             bottom_diameter=diameter,
@@ -28,6 +34,7 @@ class Cylinder(frustum.CircularFrustum):
             center=center,
             parent=parent,
             color=color,
+            resolution=resolution,
         )
 
     @property
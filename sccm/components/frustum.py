@@ -1,7 +1,9 @@
+import typing
+
 import solid
 import solid.utils
 
-from sccm import connector
+from sccm import bounding, connector, resolution
 from sccm.components import component
 
 
@@ -16,6 +18,16 @@ class Frustum(component.Component):
         will be on the X axis
     """
 
+    primitive = "cylinder"
+
+    __slots__ = (
+        "bottom_circumscribed_circle_diameter",
+        "top_circumscribed_circle_diameter",
+        "height",
+        "segments",
+        "center",
+    )
+
     def __init__(
         self,
         bottom_circumscribed_circle_diameter: float,
@@ -25,6 +37,7 @@ class Frustum(component.Component):
         segments: int = None,
         parent: component.Component = None,
         color: component.Color = None,
+        resolution: resolution.Resolution = None,
     ) -> None:
         """
         Args:
@@ -44,8 +57,10 @@ class Frustum(component.Component):
             parent: The frustum's parent, if any; this component will be set as
                 one of the parent's children
             color: The color to use for this component, if any
+            resolution: The resolution with which to approximate the frustum's
+                circular faces, if any; this is ignored if segments are given
         """
-        super().__init__(parent=parent, color=color)
+        super().__init__(parent=parent, color=color, resolution=resolution)
 
         self.bottom_circumscribed_circle_diameter = bottom_circumscribed_circle_diameter
         # `OpenSCAD`'s rendering works stangely if `d1` is passed in but `d2`
@@ -68,17 +83,17 @@ class Frustum(component.Component):
         """The distance from the middle plane to a top or bottom face"""
         return self.height / 2.0
 
-    @component.Component.transformed_property
+    @component.Component.anchor_property
     def top_anchor(self) -> connector.Connector:
         """A connector in the center of the top face"""
         return self._center_anchor.transform(solid.utils.up(self._end_distance))
 
-    @component.Component.transformed_property
+    @component.Component.anchor_property
     def bottom_anchor(self) -> connector.Connector:
         """A connector in the center of the bottom face"""
         return self._center_anchor.transform(solid.utils.down(self._end_distance))
 
-    @component.Component.transformed_property
+    @component.Component.anchor_property
     def center_anchor(self) -> connector.Connector:
         """A connector in the center of the middle plane"""
         return self._center_anchor
@@ -96,6 +111,16 @@ class Frustum(component.Component):
             point_z=0.0 if self.center else self._end_distance
         )
 
+    @property
+    def _parameters(self) -> typing.Tuple:
+        return (
+            self.bottom_circumscribed_circle_diameter,
+            self.top_circumscribed_circle_diameter,
+            self.height,
+            self.center,
+            self.segments,
+        )
+
     @property
     def _copy(self) -> "Frustum":
         return self.__class__(
@@ -119,14 +144,69 @@ class Frustum(component.Component):
             and self.segments == other.segments
         )
 
+    @property
+    def _local_bounds(self) -> typing.Optional[bounding.Bounds]:
+        radius = (
+            max(
+                self.bottom_circumscribed_circle_diameter,
+                self.top_circumscribed_circle_diameter,
+            )
+            / 2.0
+        )
+        bottom = -self._end_distance if self.center else 0.0
+
+        return bounding.Bounds(
+            (-radius, -radius, bottom), (radius, radius, bottom + self.height)
+        )
+
+    @property
+    def curvature_radius(self) -> typing.Optional[float]:
+        # Frustums with explicit segments are true polygonal prisms, rather than
+        # approximations of circular ones
+        if self.segments is not None:
+            return None
+
+        return (
+            max(
+                self.bottom_circumscribed_circle_diameter,
+                self.top_circumscribed_circle_diameter,
+            )
+            / 2.0
+            * self.world_scale
+        )
+
+    def facets(self, fragments: typing.Optional[int]) -> int:
+        if self.segments is not None:
+            fragments = self.segments
+
+        if not fragments:
+            return 0
+
+        # Each capped end is a fan of triangles, & each side is a quad (or, if
+        # one of the ends is a point, a triangle)
+        ends = [
+            diameter
+            for diameter in (
+                self.bottom_circumscribed_circle_diameter,
+                self.top_circumscribed_circle_diameter,
+            )
+            if diameter
+        ]
+        sides = fragments * len(ends)
+
+        return sides + len(ends) * (fragments - 2)
+
     @component.Component.transformed_property
     def _body(self) -> solid.OpenSCADObject:
-        return solid.cylinder(
-            d1=self.bottom_circumscribed_circle_diameter,
-            d2=self.top_circumscribed_circle_diameter,
-            h=self.height,
-            center=self.center,
-            segments=self.segments,
+        return self._resolved(
+            solid.cylinder(
+                d1=self.bottom_circumscribed_circle_diameter,
+                d2=self.top_circumscribed_circle_diameter,
+                h=self.height,
+                center=self.center,
+                segments=self.segments,
+            ),
+            self._resolution_parameters,
         )
 
 
@@ -138,6 +218,8 @@ class CircularFrustum(Frustum):
         on the global circle-approximation properties set (e.g. `$fn`), if any.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         bottom_diameter: float,
@@ -146,6 +228,7 @@ class CircularFrustum(Frustum):
         center: bool = False,
         parent: component.Component = None,
         color: component.Color = None,
+        resolution: resolution.Resolution = None,
     ) -> None:
         """
         Args:
@@ -159,6 +242,8 @@ class CircularFrustum(Frustum):
             parent: The frustum's parent, if any; this component will be set as
                 one of the parent's children
             color: The color to use for this component, if any
+            resolution: The resolution with which to approximate the frustum's
+                circular faces, if any
         """
         super().__init__(
             bottom_circumscribed_circle_diameter=bottom_diameter,
@@ -167,6 +252,7 @@ class CircularFrustum(Frustum):
             center=center,
             parent=parent,
             color=color,
+            resolution=resolution,
         )
 
     @property
@@ -0,0 +1,119 @@
+import re
+import typing
+
+import solid
+
+from sccm import bounding, emission, optimization
+from sccm.components import component
+
+
+class Instance(component.Component):
+    """A lightweight placement of a template component
+
+    An instance has no structure of its own: its body is its template's body,
+    transformed by the instance's transformations. When emitted with module
+    definitions enabled (as `Component.scad_source` does), the template's body
+    is rendered once, as an `OpenSCAD` module, and each instance becomes a call
+    of that module.
+
+    Note:
+        The template's body includes the template's own transformations, so
+        an instance's transformations are applied after them
+    """
+
+    __slots__ = ("template",)
+
+    def __init__(
+        self,
+        template: component.Component,
+        parent: component.Component = None,
+        color: component.Color = None,
+    ) -> None:
+        """
+        Args:
+            template: The component to instantiate; changes to it are
+                reflected by every one of its instances
+            parent: The instance's parent, if any; this component will be set
+                as one of the parent's children
+            color: The color to use for this instance, if any; this will
+                override any coloring of the template
+        """
+        super().__init__(parent=parent, color=color)
+
+        self.template = template
+        # Changes to the template are changes to every instance of it
+        template._embedded_by(self)
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+        super().__setstate__(state)
+
+        # Changes to the template are changes to every instance of it
+        self.template._embedded_by(self)
+
+    @property
+    def count(self) -> int:
+        """The number of times the template is placed"""
+        return 1
+
+    @property
+    def _template_fingerprint(self) -> str:
+        """The fingerprint of the template, computed once per emission"""
+        return self.template._fingerprint(emission.current().fingerprints)
+
+    @property
+    def module_name(self) -> str:
+        """The name of the `OpenSCAD` module embodying the template"""
+        class_name = re.sub(
+            r"(?<!^)(?=[A-Z])", "_", self.template.__class__.__name__
+        ).lower()
+
+        return f"{class_name}_{self._template_fingerprint[:12]}"
+
+    @property
+    def _parameters(self) -> typing.Tuple:
+        return (self._template_fingerprint,)
+
+    @property
+    def _copy(self) -> "Instance":
+        return self.__class__(self.template)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            super().__eq__(other)
+            and isinstance(other, Instance)
+            and self.template == other.template
+        )
+
+    @property
+    def _local_bounds(self) -> typing.Optional[bounding.Bounds]:
+        return self.template.bounds
+
+    @property
+    def _template_body(self) -> solid.OpenSCADObject:
+        """The untransformed embodiment of the template
+
+        This is either a call of the template's module, or the template's body
+        itself if modules aren't being defined.
+        """
+        options = emission.current()
+
+        if options.modules is None:
+            return self.template.body
+
+        name = self.module_name
+        module_body = options.modules.get(name)
+
+        if module_body is None:
+            template_body = self.template.body
+            if options.optimize:
+                template_body = optimization.optimize(template_body)
+
+            module_body = template_body._render()
+
+        options.define_module(name, module_body)
+
+        return solid.OpenSCADObject(name, {})
+
+    @component.Component.transformed_property
+    def _body(self) -> solid.OpenSCADObject:
+        return self._template_body
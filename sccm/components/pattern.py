@@ -0,0 +1,341 @@
+import abc
+import functools
+import typing
+
+import numpy
+import solid
+from solid.solidpython import indent, py2openscad
+
+from sccm import bounding, connector, vector
+from sccm.components import component, instance
+
+
+class Loop(solid.OpenSCADObject):
+    """An `OpenSCAD` `for` loop, repeating its children under a transformation"""
+
+    def __init__(self, variables: str, transformation: str) -> None:
+        """
+        Args:
+            variables: The loop's variable assignments, e.g. `i = [0 : 3]`
+            transformation: The transformation applied to the children on each
+                iteration, in terms of the loop's variables
+        """
+        super().__init__("for", {})
+
+        self.variables = variables
+        self.transformation = transformation
+
+    def _render_str_no_children(self) -> str:
+        return f"\n{self.modifier}for ({self.variables}) {self.transformation}"
+
+    def _render(self, render_holes: bool = False) -> str:
+        children = "".join(child._render(render_holes) for child in self.children)
+
+        return f"{self._render_str_no_children()} {{{indent(children)}\n}}"
+
+
+class Pattern(instance.Instance, abc.ABC):
+    """A regular pattern of instances of a template component
+
+    The pattern is a single component, defined by its parameters; it's emitted
+    as a `for` loop over the template's module (or body), and its individual
+    instances are only computed when they're asked for.
+    """
+
+    __slots__ = ()
+
+    @property
+    @abc.abstractmethod
+    def count(self) -> int:
+        """The number of instances in the pattern"""
+
+    @property
+    @abc.abstractmethod
+    def placements(self) -> numpy.ndarray:
+        """The Nx4x4 homogeneous matrices placing each instance
+
+        These are relative to the pattern, i.e. they're applied before the
+        pattern's own transformations.
+        """
+
+    @property
+    @abc.abstractmethod
+    def _loop(self) -> Loop:
+        """The loop repeating the template"""
+
+    @property
+    def instance_matrices(self) -> numpy.ndarray:
+        """The Nx4x4 homogeneous matrices of each instance's transformations
+
+        These include the pattern's own transformations.
+        """
+        return self.world_matrix @ self.placements
+
+    def instance_at(self, index: int) -> instance.Instance:
+        """Construct a standalone instance equivalent to one in the pattern
+
+        Args:
+            index: The index of the instance
+        """
+        return instance.Instance(self.template, color=self.color).transform(
+            solid.multmatrix(self.instance_matrices[index].tolist())
+        )
+
+    @property
+    def instances(self) -> typing.Iterator[instance.Instance]:
+        """Standalone instances equivalent to those in the pattern"""
+        for index in range(self.count):
+            yield self.instance_at(index)
+
+    def connectors(self, anchor: connector.Connector) -> connector.ConnectorArray:
+        """A connector of the template, at every instance in the pattern
+
+        Args:
+            anchor: The template's connector, e.g. one of its anchors
+        """
+        matrices = self.instance_matrices
+
+        return connector.ConnectorArray.from_frames(
+            matrices[:, :3, :3] @ anchor.point.array + matrices[:, :3, 3],
+            matrices[:, :3, :3] @ anchor.frame,
+        )
+
+    @property
+    def _local_bounds(self) -> typing.Optional[bounding.Bounds]:
+        template_bounds = self.template.bounds
+
+        return functools.reduce(
+            bounding.Bounds.union,
+            (template_bounds.transformed(placement) for placement in self.placements),
+            bounding.Bounds(),
+        )
+
+    @component.Component.transformed_property
+    def _body(self) -> solid.OpenSCADObject:
+        # `OpenSCAD` would iterate over an empty range backwards
+        if not self.count:
+            return solid.union()
+
+        return self._loop(self._template_body)
+
+
+class LinearPattern(Pattern):
+    """Instances of a template repeated at even steps along a line"""
+
+    __slots__ = ("_count", "step")
+
+    def __init__(
+        self,
+        template: component.Component,
+        count: int,
+        step: vector.RawVector,
+        parent: component.Component = None,
+        color: component.Color = None,
+    ) -> None:
+        """
+        Args:
+            template: The component to repeat
+            count: The number of instances
+            step: The offset between successive instances
+            parent: The pattern's parent, if any; this component will be set as
+                one of the parent's children
+            color: The color to use for the instances, if any
+        """
+        super().__init__(template, parent=parent, color=color)
+
+        self._count = count
+        self.step = tuple(step)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def placements(self) -> numpy.ndarray:
+        placements = numpy.tile(numpy.identity(4), (self.count, 1, 1))
+        placements[:, :3, 3] = numpy.outer(numpy.arange(self.count), self.step)
+
+        return placements
+
+    @property
+    def _loop(self) -> Loop:
+        return Loop(
+            f"i = [0 : {self.count - 1}]",
+            f"translate(i * {py2openscad(list(self.step))})",
+        )
+
+    @property
+    def _parameters(self) -> typing.Tuple:
+        return super()._parameters + (self.count, self.step)
+
+    @property
+    def _copy(self) -> "LinearPattern":
+        return self.__class__(self.template, self.count, self.step)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            super().__eq__(other)
+            and isinstance(other, LinearPattern)
+            and (self.count, self.step) == (other.count, other.step)
+        )
+
+
+class CircularPattern(Pattern):
+    """Instances of a template repeated at even angles about an axis
+
+    The axis runs through the origin (before the pattern's transformations).
+    """
+
+    __slots__ = ("_count", "step", "axis")
+
+    def __init__(
+        self,
+        template: component.Component,
+        count: int,
+        step: float = None,
+        axis: vector.RawVector = (0.0, 0.0, 1.0),
+        parent: component.Component = None,
+        color: component.Color = None,
+    ) -> None:
+        """
+        Args:
+            template: The component to repeat
+            count: The number of instances
+            step: The angle, in degrees, between successive instances; if not
+                provided, the instances (if any) will be spread evenly around a
+                circle
+            axis: The axis about which to repeat the template
+            parent: The pattern's parent, if any; this component will be set as
+                one of the parent's children
+            color: The color to use for the instances, if any
+        """
+        super().__init__(template, parent=parent, color=color)
+
+        self._count = count
+        # An empty pattern has no instances to spread around the circle
+        if step is None:
+            step = 360.0 / count if count else 360.0
+        self.step = step
+        self.axis = tuple(axis)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def placements(self) -> numpy.ndarray:
+        placements = numpy.tile(numpy.identity(4), (self.count, 1, 1))
+
+        for index in range(self.count):
+            placements[index, :3, :3] = vector.rotation_matrix(
+                index * self.step, self.axis
+            )
+
+        return placements
+
+    @property
+    def _loop(self) -> Loop:
+        return Loop(
+            f"i = [0 : {self.count - 1}]",
+            f"rotate(a = i * {py2openscad(self.step)}, "
+            f"v = {py2openscad(list(self.axis))})",
+        )
+
+    @property
+    def _parameters(self) -> typing.Tuple:
+        return super()._parameters + (self.count, self.step, self.axis)
+
+    @property
+    def _copy(self) -> "CircularPattern":
+        return self.__class__(self.template, self.count, self.step, self.axis)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            super().__eq__(other)
+            and isinstance(other, CircularPattern)
+            and (self.count, self.step, self.axis)
+            == (other.count, other.step, other.axis)
+        )
+
+
+class GridPattern(Pattern):
+    """Instances of a template repeated in rows & columns
+
+    Instances are ordered row by row.
+    """
+
+    __slots__ = ("rows", "columns", "row_step", "column_step")
+
+    def __init__(
+        self,
+        template: component.Component,
+        rows: int,
+        columns: int,
+        row_step: vector.RawVector,
+        column_step: vector.RawVector,
+        parent: component.Component = None,
+        color: component.Color = None,
+    ) -> None:
+        """
+        Args:
+            template: The component to repeat
+            rows: The number of rows
+            columns: The number of instances in each row
+            row_step: The offset between successive rows
+            column_step: The offset between successive instances in a row
+            parent: The pattern's parent, if any; this component will be set as
+                one of the parent's children
+            color: The color to use for the instances, if any
+        """
+        super().__init__(template, parent=parent, color=color)
+
+        self.rows = rows
+        self.columns = columns
+        self.row_step = tuple(row_step)
+        self.column_step = tuple(column_step)
+
+    @property
+    def count(self) -> int:
+        return self.rows * self.columns
+
+    @property
+    def placements(self) -> numpy.ndarray:
+        rows, columns = numpy.divmod(numpy.arange(self.count), self.columns)
+
+        placements = numpy.tile(numpy.identity(4), (self.count, 1, 1))
+        placements[:, :3, 3] = numpy.outer(rows, self.row_step) + numpy.outer(
+            columns, self.column_step
+        )
+
+        return placements
+
+    @property
+    def _loop(self) -> Loop:
+        return Loop(
+            f"i = [0 : {self.rows - 1}], j = [0 : {self.columns - 1}]",
+            f"translate(i * {py2openscad(list(self.row_step))} "
+            f"+ j * {py2openscad(list(self.column_step))})",
+        )
+
+    @property
+    def _parameters(self) -> typing.Tuple:
+        return super()._parameters + (
+            self.rows,
+            self.columns,
+            self.row_step,
+            self.column_step,
+        )
+
+    @property
+    def _copy(self) -> "GridPattern":
+        return self.__class__(
+            self.template, self.rows, self.columns, self.row_step, self.column_step
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            super().__eq__(other)
+            and isinstance(other, GridPattern)
+            and (self.rows, self.columns, self.row_step, self.column_step)
+            == (other.rows, other.columns, other.row_step, other.column_step)
+        )
@@ -5,6 +5,8 @@ from sccm.components import component, cone, cylinder, sphere
 class ReferenceFrame(component.Component):
     """A visualization of a Connector's internal frame of reference"""
 
+    __slots__ = ("origin", "x_arm", "y_arm", "z_arm")
+
     def __init__(self, parent: component.Component = None) -> None:
         """
         Args:
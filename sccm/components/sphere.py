@@ -1,7 +1,9 @@
+import typing
+
 import solid
 import solid.utils
 
-from sccm import connector
+from sccm import bounding, connector, resolution
 from sccm.components import component
 
 
@@ -12,11 +14,16 @@ class Sphere(component.Component):
         Until transformed, the sphere's center will be at the origin
     """
 
+    primitive = "sphere"
+
+    __slots__ = ("diameter",)
+
     def __init__(
         self,
         diameter: float,
         parent: component.Component = None,
         color: component.Color = None,
+        resolution: resolution.Resolution = None,
     ) -> None:
         """
         Args:
@@ -24,8 +31,10 @@ class Sphere(component.Component):
             parent: The sphere's parent, if any; this component will be set as
                 one of the parent's children
             color: The color to use for this component, if any
+            resolution: The resolution with which to approximate the sphere's
+                surface, if any
         """
-        super().__init__(parent=parent, color=color)
+        super().__init__(parent=parent, color=color, resolution=resolution)
 
         self.diameter = diameter
 
@@ -34,11 +43,15 @@ class Sphere(component.Component):
         """The radius of the sphere"""
         return self.diameter / 2.0
 
-    @component.Component.transformed_property
+    @component.Component.anchor_property
     def center_anchor(self) -> connector.Connector:
         """A connector in the center of the sphere"""
         return connector.Connector()
 
+    @property
+    def _parameters(self) -> typing.Tuple:
+        return (self.diameter,)
+
     @property
     def _copy(self) -> "Sphere":
         return self.__class__(self.diameter)
@@ -50,6 +63,29 @@ class Sphere(component.Component):
             and self.diameter == other.diameter
         )
 
+    @property
+    def _local_bounds(self) -> typing.Optional[bounding.Bounds]:
+        return bounding.Bounds(
+            (-self.radius, -self.radius, -self.radius),
+            (self.radius, self.radius, self.radius),
+        )
+
+    @property
+    def curvature_radius(self) -> typing.Optional[float]:
+        return self.radius * self.world_scale
+
+    def facets(self, fragments: typing.Optional[int]) -> int:
+        if not fragments:
+            return 0
+
+        # `OpenSCAD` builds spheres from rings of fragments, joined by quads
+        # and capped by fans of triangles
+        rings = (fragments + 1) // 2
+
+        return 2 * fragments * (rings - 1) + 2 * (fragments - 2)
+
     @component.Component.transformed_property
     def _body(self) -> solid.OpenSCADObject:
-        return solid.sphere(d=self.diameter)
+        return self._resolved(
+            solid.sphere(d=self.diameter), self._resolution_parameters
+        )
@@ -1,10 +1,19 @@
+import math
 import typing
 
+import numpy
 import solid
+import vg
 
 from sccm import affinables, vector
 
-Transformation = typing.Union[solid.translate, solid.rotate, solid.scale]
+Transformation = typing.Union[
+    solid.translate, solid.rotate, solid.scale, solid.multmatrix
+]
+
+# Angles (in degrees) & distances below this are treated as zero when deciding
+# which alignment transformations are necessary
+TOLERANCE = 1e-9
 
 
 class MalformedRotation(Exception):
@@ -24,8 +33,177 @@ class MalformedRotation(Exception):
         self.axis = axis
 
 
+def _orthonormal_frames(axes: numpy.ndarray, normals: numpy.ndarray) -> numpy.ndarray:
+    """The orthonormal frames defined by pairs of alignment axes
+
+    Args:
+        axes: The Nx3 primary alignment axes, which become the frames' Z axes
+        normals: The Nx3 secondary alignment axes, which become the frames' X
+            axes once any component along the primary axes is removed
+
+    Returns:
+        The Nx3x3 matrices whose columns are each frame's X, Y & Z axes
+    """
+    z = axes / numpy.linalg.norm(axes, axis=-1, keepdims=True)
+    x = normals - numpy.sum(normals * z, axis=-1, keepdims=True) * z
+    x = x / numpy.linalg.norm(x, axis=-1, keepdims=True)
+
+    return numpy.stack((x, numpy.cross(z, x), z), axis=-1)
+
+
+def _alignment_matrices(
+    inclined: numpy.ndarray, reference: numpy.ndarray
+) -> numpy.ndarray:
+    """The smallest rotations aligning directions with others
+
+    Note:
+        If a pair of directions is antiparallel, the rotation is a half turn
+        about an arbitrary normal of the inclined direction (the first of its
+        cross products with the X, Y & Z axes that isn't zero, as with
+        `vector.Vector.arbitrary_normal`); this rotation is its own inverse, so
+        the alignment is symmetric
+
+    Args:
+        inclined: The Nx3 directions to rotate
+        reference: The Nx3 directions with which to align them
+
+    Returns:
+        The Nx3x3 rotation matrices
+    """
+    a = inclined / numpy.linalg.norm(inclined, axis=-1, keepdims=True)
+    b = reference / numpy.linalg.norm(reference, axis=-1, keepdims=True)
+    a, b = numpy.broadcast_arrays(a, b)
+
+    cross = numpy.cross(a, b)
+    cosine = numpy.sum(a * b, axis=-1)
+    antiparallel = cosine < TOLERANCE - 1.0
+
+    skew = numpy.zeros(cross.shape + (3,))
+    skew[..., 0, 1], skew[..., 0, 2] = -cross[..., 2], cross[..., 1]
+    skew[..., 1, 0], skew[..., 1, 2] = cross[..., 2], -cross[..., 0]
+    skew[..., 2, 0], skew[..., 2, 1] = -cross[..., 1], cross[..., 0]
+
+    # The antiparallel rows are replaced below, so their divisor is irrelevant
+    divisor = numpy.where(antiparallel, 1.0, 1.0 + cosine)[..., None, None]
+    result = numpy.identity(3) + skew + skew @ skew / divisor
+
+    if numpy.any(antiparallel):
+        flipped = a[antiparallel]
+        candidates = numpy.cross(flipped[:, None, :], numpy.identity(3)[None])
+        lengths = numpy.linalg.norm(candidates, axis=-1)
+        chosen = numpy.argmax(lengths > TOLERANCE, axis=-1)
+        rows = numpy.arange(len(flipped))
+        poles = candidates[rows, chosen] / lengths[rows, chosen, None]
+
+        result[antiparallel] = 2.0 * poles[:, :, None] * poles[:, None, :] - (
+            numpy.identity(3)
+        )
+
+    return result
+
+
+def _rotation_parameters(
+    rotation: numpy.ndarray,
+) -> typing.Tuple[float, numpy.ndarray]:
+    """The angle & axis of a rotation matrix
+
+    Args:
+        rotation: The 3x3 rotation matrix
+
+    Returns:
+        The angle, in degrees, and the (normalized) axis of the rotation
+    """
+    axis = numpy.array(
+        [
+            rotation[2, 1] - rotation[1, 2],
+            rotation[0, 2] - rotation[2, 0],
+            rotation[1, 0] - rotation[0, 1],
+        ]
+    )
+    magnitude = numpy.linalg.norm(axis)
+
+    # The antisymmetric part gives the sine, which (unlike the cosine) is
+    # accurate for small angles
+    angle = math.degrees(
+        math.atan2(magnitude / 2.0, (numpy.trace(rotation) - 1.0) / 2.0)
+    )
+
+    if not magnitude and angle < 90.0:
+        return 0.0, vector.AXIS_Z.array
+
+    # Close to a half turn, the antisymmetric part vanishes; the axis is then
+    # the dominant column of the symmetric part instead
+    if magnitude < 1e-6 and angle >= 90.0:
+        symmetric = (rotation + numpy.identity(3)) / 2.0
+        axis = symmetric[:, numpy.argmax(numpy.diag(symmetric))]
+        magnitude = numpy.linalg.norm(axis)
+
+    return angle, axis / magnitude
+
+
+def _rigid_alignments(
+    points: numpy.ndarray,
+    frames: numpy.ndarray,
+    other_points: numpy.ndarray,
+    other_frames: numpy.ndarray,
+) -> numpy.ndarray:
+    """The rigid transformations aligning connectors with others
+
+    Args:
+        points: The Nx3 points of the connectors to align
+        frames: The Nx3x3 frames of the connectors to align
+        other_points: The Nx3 points of the connectors to align with
+        other_frames: The Nx3x3 frames of the connectors to align with
+
+    Returns:
+        The Nx4x4 homogeneous matrices of the transformations
+    """
+    rotations = other_frames @ numpy.swapaxes(frames, -1, -2)
+    translations = other_points - (rotations @ points[..., None])[..., 0]
+
+    result = numpy.zeros(rotations.shape[:-2] + (4, 4))
+    result[..., :3, :3] = rotations
+    result[..., :3, 3] = translations
+    result[..., 3, 3] = 1.0
+
+    return result
+
+
+def _alignment_transformations(
+    alignment: numpy.ndarray, as_matrix: bool
+) -> typing.Iterator[Transformation]:
+    """Emit a rigid transformation as `solid` transformations
+
+    Args:
+        alignment: The 4x4 homogeneous matrix of the transformation
+        as_matrix: Should it be emitted as a single matrix transformation? If
+            not, it will be emitted as a rotation about the origin followed by
+            a translation, leaving out either if unnecessary
+
+    Yields:
+        The transformations
+    """
+    if as_matrix:
+        yield solid.multmatrix(alignment.tolist())
+        return
+
+    angle, axis = _rotation_parameters(alignment[:3, :3])
+    if angle > TOLERANCE:
+        yield solid.rotate(a=angle, v=tuple(axis))
+
+    if numpy.linalg.norm(alignment[:3, 3]) > TOLERANCE:
+        yield solid.translate(tuple(alignment[:3, 3]))
+
+
 class Connector(affinables.HolonomicTransformable):
-    """A connector, for aligning components"""
+    """A connector, for aligning components
+
+    A connector is an orthonormal frame located at a point: the frame's Z axis
+    is the connector's primary alignment axis, and its X axis is the secondary
+    alignment axis.
+    """
+
+    __slots__ = ("point", "frame")
 
     def __init__(
         self,
@@ -41,8 +219,23 @@ class Connector(affinables.HolonomicTransformable):
                 perpendicular to the primary axis
         """
         self.point = point
-        self.axis = axis
-        self.normal = normal
+        self.frame = _orthonormal_frames(axis.array, normal.array)
+
+    @classmethod
+    def from_frame(cls, point: vector.Vector, frame: numpy.ndarray) -> "Connector":
+        """Construct a connector from its frame
+
+        Args:
+            point: The location of the attachment point
+            frame: The 3x3 matrix whose columns are the connector's secondary
+                alignment axis, the axis perpendicular to both alignment axes,
+                and its primary alignment axis
+        """
+        connector = cls.__new__(cls)
+        connector.point = point
+        connector.frame = frame
+
+        return connector
 
     @classmethod
     def from_vectors(
@@ -60,6 +253,16 @@ class Connector(affinables.HolonomicTransformable):
         """
         return cls(point, axis, normal)
 
+    @property
+    def axis(self) -> vector.Vector:
+        """The primary alignment axis of the attachment point"""
+        return vector.Vector.from_valid_components(self.frame[:, 2].copy())
+
+    @property
+    def normal(self) -> vector.Vector:
+        """The secondary alignment axis of the attachment point"""
+        return vector.Vector.from_valid_components(self.frame[:, 0].copy())
+
     def copy(
         self,
         point: vector.Vector = None,
@@ -77,6 +280,9 @@ class Connector(affinables.HolonomicTransformable):
                 perpendicular to the primary axis; if not provided, this
                 connector's secondary alignment axis will be used
         """
+        if axis is None and normal is None:
+            return self.from_frame(point or self.point, self.frame)
+
         return self.from_vectors(
             point or self.point, axis or self.axis, normal or self.normal
         )
@@ -104,14 +310,12 @@ class Connector(affinables.HolonomicTransformable):
             roll: The angle between the X axis and the connector's secondary
                 alignment axis, when the primary axis is aligned with Z
         """
-        axis = vector.Vector.from_raw([axis_x, axis_y, axis_z]).normalized
+        axis = vector.Vector.from_raw([axis_x, axis_y, axis_z])
 
-        return cls(
+        return cls.from_frame(
             vector.Vector.from_raw([point_x, point_y, point_z]),
-            axis,
-            vector.AXIS_X.rotate(roll, vector.AXIS_Z).rotate_to_alignment(
-                vector.AXIS_Z, axis
-            ),
+            _alignment_matrices(vector.AXIS_Z.array, axis.array)
+            @ vector.rotation_matrix(roll, vector.AXIS_Z.raw),
         )
 
     @property
@@ -121,9 +325,22 @@ class Connector(affinables.HolonomicTransformable):
         The roll is the angle between the X axis and the secondary alignment
         axis, when the primary alignment axis is aligned with Z
         """
-        return vector.AXIS_X.angle_between(
-            self.normal.rotate_to_alignment(self.axis, vector.AXIS_Z),
-            normal=vector.AXIS_Z,
+        x, y, _ = (
+            _alignment_matrices(self.frame[:, 2], vector.AXIS_Z.array)
+            @ self.frame[:, 0]
+        )
+
+        return math.degrees(math.atan2(y, x))
+
+    def _rotated(self, rotation: numpy.ndarray) -> "Connector":
+        """Rotate this connector about the origin
+
+        Args:
+            rotation: The 3x3 rotation matrix
+        """
+        return self.from_frame(
+            vector.Vector.from_valid_components(rotation @ self.point.array),
+            rotation @ self.frame,
         )
 
     def translate(self, translation: solid.translate) -> "Connector":
@@ -143,11 +360,7 @@ class Connector(affinables.HolonomicTransformable):
             angle: The signed angle through which to rotate
             axis: The axis about which to rotate
         """
-        return self.from_vectors(
-            point=self.point.rotate(angle, axis),
-            axis=self.axis.rotate(angle, axis),
-            normal=self.normal.rotate(angle, axis),
-        )
+        return self._rotated(vector.rotation_matrix(angle, axis.raw))
 
     def rotate(self, rotation: solid.rotate) -> "Connector":
         """Transform this connector to account for a rotation
@@ -160,24 +373,11 @@ class Connector(affinables.HolonomicTransformable):
                 expected structure
         """
         angle = rotation.params["a"]
-        pole = rotation.params["v"]
 
-        if isinstance(angle, (float, int)):
-            if not pole:
-                pole = vector.AXIS_Z
-            else:
-                pole = vector.Vector.from_raw(pole).normalized
+        if isinstance(angle, (float, int)) or angle:
+            return self._rotated(affinables.matrix(rotation)[:3, :3])
 
-            return self.rotate_about(angle, pole)
-
-        elif angle:
-            return (
-                self.rotate_about(angle[0], vector.AXIS_X)
-                .rotate_about(angle[1], vector.AXIS_Y)
-                .rotate_about(angle[2], vector.AXIS_Z)
-            )
-
-        raise MalformedRotation(angle, pole)
+        raise MalformedRotation(angle, rotation.params["v"])
 
     def scale(self, scaling: solid.scale) -> "Connector":
         """Transform this connector to account for a scaling
@@ -187,48 +387,62 @@ class Connector(affinables.HolonomicTransformable):
         """
         return self.copy(self.point * vector.Vector.from_raw(scaling.params["v"]))
 
-    def align(self, other: "Connector" = None) -> typing.Iterator[Transformation]:
-        """Emit the transformations necessary to align this connector with another
+    def multmatrix(self, transformation: solid.multmatrix) -> "Connector":
+        """Transform this connector to account for a matrix transformation
+
+        Note:
+            The alignment axes are transformed by the matrix's linear part, then
+            made orthonormal again
+
+        Args:
+            transformation: The matrix transformation object
+        """
+        transformation_matrix = affinables.matrix(transformation)
+        frame = transformation_matrix[:3, :3] @ self.frame
+
+        return self.from_frame(
+            vector.Vector(
+                transformation_matrix[:3, :3] @ self.point.array
+                + transformation_matrix[:3, 3]
+            ),
+            _orthonormal_frames(frame[:, 2], frame[:, 0]),
+        )
+
+    def alignment_matrix(self, other: "Connector" = None) -> numpy.ndarray:
+        """The rigid transformation aligning this connector with another
 
         Args:
             other: The other connector; if not supplied, it defaults to the
                 default connector (see the initializer)
 
-        Yields:
-            The necessary transformations for alignment
+        Returns:
+            The 4x4 homogeneous matrix of the transformation
         """
         if other is None:
             other = self.from_vectors()
 
-        working_connector = self.copy()
-
-        # Cancel axis alignment, if necessary
-        if working_connector.axis != other.axis:
-            angle, axis = working_connector.axis.alignment_rotation_parameters(
-                other.axis
-            )
+        return _rigid_alignments(
+            self.point.array, self.frame, other.point.array, other.frame
+        )
 
-            transformation = solid.rotate(a=-angle, v=axis.raw)
-            working_connector = working_connector.transform(transformation)
-            yield transformation
+    def align(
+        self, other: "Connector" = None, as_matrix: bool = False
+    ) -> typing.Iterator[Transformation]:
+        """Emit the transformations necessary to align this connector with another
 
-        # Cancel roll, if necessary
-        if working_connector.normal != other.normal:
-            angle, axis = working_connector.normal.alignment_rotation_parameters(
-                other.normal
-            )
+        The alignment is computed directly from the two connectors' frames: a
+        single rotation about the origin, followed by a translation.
 
-            transformation = solid.rotate(a=-angle, v=axis.raw)
-            working_connector = working_connector.transform(transformation)
-            yield transformation
+        Args:
+            other: The other connector; if not supplied, it defaults to the
+                default connector (see the initializer)
+            as_matrix: Should the alignment be emitted as a single matrix
+                transformation instead?
 
-        # Move to the origin, if necessary
-        if working_connector.point != other.point:
-            transformation = solid.translate(
-                (-(working_connector.point - other.point)).raw
-            )
-            working_connector = working_connector.transform(transformation)
-            yield transformation
+        Yields:
+            The necessary transformations for alignment
+        """
+        return _alignment_transformations(self.alignment_matrix(other), as_matrix)
 
     def __repr__(self) -> str:
         return f"{{{self.point}; {self.axis}; {self.normal}}}"
@@ -236,6 +450,8 @@ class Connector(affinables.HolonomicTransformable):
     def __eq__(self, other: object) -> bool:
         """Is this connector equal to another?
 
+        As with vectors, connectors aren't hashable.
+
         Args:
             other: The other connector
 
@@ -245,8 +461,321 @@ class Connector(affinables.HolonomicTransformable):
         if not isinstance(other, Connector):
             raise NotImplementedError
 
+        return self.point == other.point and vg.almost_equal(
+            self.frame, other.frame, atol=vector.EQUALITY_TOLERANCE
+        )
+
+
+class ConnectorArray(affinables.HolonomicTransformable):
+    """Many connectors, stored & transformed together
+
+    The connectors' points are held in an Nx3 array and their frames in an
+    Nx3x3 array, so transformations & alignments apply to every connector at
+    once; individual connectors can be extracted by indexing.
+    """
+
+    __slots__ = ("points", "frames")
+
+    def __init__(
+        self,
+        points: numpy.ndarray,
+        axes: numpy.ndarray = None,
+        normals: numpy.ndarray = None,
+    ) -> None:
+        """
+        Args:
+            points: The Nx3 locations of the attachment points
+            axes: The Nx3 primary alignment axes of the attachment points; if
+                not provided, all will be aligned with Z
+            normals: The Nx3 secondary alignment axes of the attachment points;
+                if not provided, all will be aligned with X
+        """
+        self.points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+
+        if axes is None:
+            axes = vector.AXIS_Z.array
+        if normals is None:
+            normals = vector.AXIS_X.array
+
+        self.frames = _orthonormal_frames(
+            numpy.broadcast_to(numpy.asarray(axes, dtype=float), self.points.shape),
+            numpy.broadcast_to(numpy.asarray(normals, dtype=float), self.points.shape),
+        )
+
+    @classmethod
+    def from_frames(
+        cls, points: numpy.ndarray, frames: numpy.ndarray
+    ) -> "ConnectorArray":
+        """Construct connectors from their frames
+
+        Args:
+            points: The Nx3 locations of the attachment points
+            frames: The Nx3x3 frames of the connectors; see
+                `Connector.from_frame`
+        """
+        connectors = cls.__new__(cls)
+        connectors.points = points
+        connectors.frames = frames
+
+        return connectors
+
+    @classmethod
+    def from_connectors(
+        cls, connectors: typing.Iterable[Connector]
+    ) -> "ConnectorArray":
+        """Gather individual connectors together
+
+        Args:
+            connectors: The connectors
+        """
+        connectors = list(connectors)
+
+        return cls.from_frames(
+            numpy.array([connector.point.array for connector in connectors]).reshape(
+                -1, 3
+            ),
+            numpy.array([connector.frame for connector in connectors]).reshape(
+                -1, 3, 3
+            ),
+        )
+
+    @classmethod
+    def from_components(
+        cls,
+        point_x: numpy.ndarray = 0.0,
+        point_y: numpy.ndarray = 0.0,
+        point_z: numpy.ndarray = 0.0,
+        axis_x: numpy.ndarray = 0.0,
+        axis_y: numpy.ndarray = 0.0,
+        axis_z: numpy.ndarray = 1.0,
+        roll: numpy.ndarray = 0.0,
+    ) -> "ConnectorArray":
+        """Construct connectors from arrays of vector components
+
+        The arrays are broadcast against each other, so any may be given as a
+        single value shared by every connector. See `Connector.from_components`
+        for the meaning of each component.
+
+        Args:
+            point_x: The X components of the connectors' positions
+            point_y: The Y components of the connectors' positions
+            point_z: The Z components of the connectors' positions
+            axis_x: The X components of the connectors' primary alignment axes
+            axis_y: The Y components of the connectors' primary alignment axes
+            axis_z: The Z components of the connectors' primary alignment axes
+            roll: The connectors' rolls
+        """
+        *components, roll = numpy.broadcast_arrays(
+            *(
+                numpy.atleast_1d(numpy.asarray(component, dtype=float))
+                for component in (
+                    point_x,
+                    point_y,
+                    point_z,
+                    axis_x,
+                    axis_y,
+                    axis_z,
+                    roll,
+                )
+            )
+        )
+        points = numpy.stack(components[:3], axis=-1)
+        axes = numpy.stack(components[3:], axis=-1)
+
+        radians = numpy.radians(roll)
+        rolls = numpy.zeros(roll.shape + (3, 3))
+        rolls[:, 0, 0], rolls[:, 0, 1] = numpy.cos(radians), -numpy.sin(radians)
+        rolls[:, 1, 0], rolls[:, 1, 1] = numpy.sin(radians), numpy.cos(radians)
+        rolls[:, 2, 2] = 1.0
+
+        return cls.from_frames(
+            points, _alignment_matrices(vector.AXIS_Z.array, axes) @ rolls
+        )
+
+    @property
+    def axes(self) -> numpy.ndarray:
+        """The Nx3 primary alignment axes of the connectors"""
+        return self.frames[:, :, 2]
+
+    @property
+    def normals(self) -> numpy.ndarray:
+        """The Nx3 secondary alignment axes of the connectors"""
+        return self.frames[:, :, 0]
+
+    @property
+    def rolls(self) -> numpy.ndarray:
+        """The rolls of the connectors; see `Connector.roll`"""
+        unrolled = _alignment_matrices(self.axes, vector.AXIS_Z.array) @ (
+            self.normals[..., None]
+        )
+
+        return numpy.degrees(numpy.arctan2(unrolled[:, 1, 0], unrolled[:, 0, 0]))
+
+    def _transformed(self, transformation_matrix: numpy.ndarray) -> "ConnectorArray":
+        """Apply a rigid transformation to every connector
+
+        Args:
+            transformation_matrix: The 4x4 homogeneous matrix of the
+                transformation
+        """
+        linear = transformation_matrix[:3, :3]
+
+        return self.from_frames(
+            self.points @ linear.T + transformation_matrix[:3, 3], linear @ self.frames
+        )
+
+    def translate(self, translation: solid.translate) -> "ConnectorArray":
+        """Transform these connectors to account for a translation
+
+        Args:
+            translation: The translation object
+        """
+        return self.from_frames(
+            self.points + numpy.asarray(translation.params["v"], dtype=float),
+            self.frames,
+        )
+
+    def rotate(self, rotation: solid.rotate) -> "ConnectorArray":
+        """Transform these connectors to account for a rotation
+
+        Args:
+            rotation: The rotation object
+
+        Raises:
+            MalformedRotation: If the rotation's arguments do not have the
+                expected structure
+        """
+        angle = rotation.params["a"]
+
+        if isinstance(angle, (float, int)) or angle:
+            return self._transformed(affinables.matrix(rotation))
+
+        raise MalformedRotation(angle, rotation.params["v"])
+
+    def scale(self, scaling: solid.scale) -> "ConnectorArray":
+        """Transform these connectors to account for a scaling
+
+        As with `Connector.scale`, only the points are scaled.
+
+        Args:
+            scaling: The scaling object
+        """
+        return self.from_frames(
+            self.points * numpy.asarray(scaling.params["v"], dtype=float),
+            self.frames,
+        )
+
+    def multmatrix(self, transformation: solid.multmatrix) -> "ConnectorArray":
+        """Transform these connectors to account for a matrix transformation
+
+        See `Connector.multmatrix`.
+
+        Args:
+            transformation: The matrix transformation object
+        """
+        transformation_matrix = affinables.matrix(transformation)
+        frames = transformation_matrix[:3, :3] @ self.frames
+
+        return self.from_frames(
+            self.points @ transformation_matrix[:3, :3].T
+            + transformation_matrix[:3, 3],
+            _orthonormal_frames(frames[:, :, 2], frames[:, :, 0]),
+        )
+
+    def alignment_matrices(
+        self, other: typing.Union[Connector, "ConnectorArray"] = None
+    ) -> numpy.ndarray:
+        """The rigid transformations aligning these connectors with others
+
+        Args:
+            other: The connector(s) to align with; a single connector (or an
+                array of one) is aligned with every connector in this array,
+                while an array of connectors is aligned pairwise. Similarly, an
+                array of one connector is aligned with every connector in the
+                other array. If not supplied, it defaults to the default
+                connector.
+
+        Returns:
+            The Nx4x4 homogeneous matrices of the transformations
+        """
+        if other is None:
+            other = Connector()
+
+        if isinstance(other, Connector):
+            other = self.from_connectors([other])
+
+        return _rigid_alignments(self.points, self.frames, other.points, other.frames)
+
+    def align(
+        self,
+        other: typing.Union[Connector, "ConnectorArray"] = None,
+        as_matrix: bool = False,
+    ) -> typing.List[typing.List[Transformation]]:
+        """Emit the transformations necessary to align these connectors with others
+
+        Args:
+            other: The connector(s) to align with; see `alignment_matrices`
+            as_matrix: Should each alignment be emitted as a single matrix
+                transformation?
+
+        Returns:
+            The necessary transformations for each alignment; see
+            `Connector.align`
+        """
+        return [
+            list(_alignment_transformations(alignment, as_matrix))
+            for alignment in self.alignment_matrices(other)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> Connector:
+        ...  # pragma: no cover
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> "ConnectorArray":
+        ...  # pragma: no cover
+
+    def __getitem__(
+        self, index: typing.Union[int, slice]
+    ) -> typing.Union[Connector, "ConnectorArray"]:
+        """Extract one connector, or an array of some of these connectors
+
+        Args:
+            index: The index of the connector, or a slice (or array of indices
+                or mask) selecting several
+        """
+        if isinstance(index, (int, numpy.integer)):
+            return Connector.from_frame(
+                vector.Vector(self.points[index]), self.frames[index]
+            )
+
+        return self.from_frames(self.points[index], self.frames[index])
+
+    def __iter__(self) -> typing.Iterator[Connector]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"[{', '.join(repr(connector) for connector in self)}]"
+
+    def __eq__(self, other: object) -> bool:
+        """Are these connectors equal to others?
+
+        Args:
+            other: The other connectors
+
+        Raises:
+            NotImplementedError: If the other object is not an array of
+                connectors
+        """
+        if not isinstance(other, ConnectorArray):
+            raise NotImplementedError
+
         return (
-            self.point == other.point
-            and self.axis == other.axis
-            and self.normal == other.normal
+            len(self) == len(other)
+            and vg.almost_equal(self.points, other.points)
+            and vg.almost_equal(self.frames, other.frames)
         )
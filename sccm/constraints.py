@@ -0,0 +1,1358 @@
+import abc
+import heapq
+import typing
+
+import numpy
+import solid
+
+from sccm import connector
+from sccm.components import component
+
+# A connector of a component, as placed by the component's current
+# transformations
+Reference = typing.Tuple[component.Component, connector.Connector]
+
+# The residual & the Jacobians, with respect to the rigid motions of the first
+# & second components, of every constraint of a single type
+Evaluation = typing.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+
+
+class Unsolvable(Exception):
+    """Raised when constraints cannot all be satisfied"""
+
+    def __init__(self, residual: float) -> None:
+        """
+        Args:
+            residual: The largest violation of any constraint at the closest
+                solution found
+        """
+        self.residual = residual
+
+
+def _skew(vectors: numpy.ndarray) -> numpy.ndarray:
+    """The matrices of cross products with each of a set of vectors
+
+    Args:
+        vectors: The Nx3 vectors
+
+    Returns:
+        The Nx3x3 matrices `M` for which `M @ w` is `v x w`
+    """
+    x, y, z = vectors.T
+    zeros = numpy.zeros_like(x)
+
+    return numpy.stack(
+        [
+            numpy.stack([zeros, -z, y], axis=-1),
+            numpy.stack([z, zeros, -x], axis=-1),
+            numpy.stack([-y, x, zeros], axis=-1),
+        ],
+        axis=-2,
+    )
+
+
+class _Placements:
+    """The current placements of one side of a set of constraints' connectors"""
+
+    def __init__(
+        self, points: numpy.ndarray, pivots: numpy.ndarray, axes: numpy.ndarray
+    ) -> None:
+        """
+        Args:
+            points: The Nx3 points of the connectors
+            pivots: The Nx3 pivots of the connectors' components, about which
+                the components' rotations are parametrized
+            axes: The Nx3 axes of the connectors
+        """
+        self.points = points
+        self.pivots = pivots
+        self.axes = axes
+
+    @property
+    def point_jacobians(self) -> numpy.ndarray:
+        """The Nx3x6 Jacobians of the points
+
+        These are with respect to the components' rigid motions: rotation
+        vectors, about the components' pivots, followed by translations.
+        """
+        offsets = self.points - self.pivots
+
+        return numpy.concatenate(
+            [
+                -_skew(offsets),
+                numpy.broadcast_to(numpy.identity(3), offsets.shape + (3,)),
+            ],
+            axis=-1,
+        )
+
+    @property
+    def axis_jacobians(self) -> numpy.ndarray:
+        """The Nx3x6 Jacobians of the axes
+
+        These are with respect to the components' rigid motions.
+        """
+        return numpy.concatenate(
+            [-_skew(self.axes), numpy.zeros(self.axes.shape + (3,))], axis=-1
+        )
+
+
+def _rotations(rotation_vectors: numpy.ndarray) -> numpy.ndarray:
+    """The matrices of rotations given as rotation vectors
+
+    Args:
+        rotation_vectors: The Nx3 vectors, along the axes of the rotations &
+            with the angles of the rotations (in radians) as their magnitudes
+
+    Returns:
+        The Nx3x3 rotation matrices
+    """
+    angles = numpy.linalg.norm(rotation_vectors, axis=-1)
+    axes = rotation_vectors / numpy.where(angles > 0.0, angles, 1.0)[:, None]
+    cross = _skew(axes)
+
+    return (
+        numpy.identity(3)
+        + numpy.sin(angles)[:, None, None] * cross
+        + (1.0 - numpy.cos(angles))[:, None, None] * (cross @ cross)
+    )
+
+
+def _localized(
+    constrained_component: component.Component,
+    constrained_connector: connector.Connector,
+) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+    """The point & axis of a connector, before its component's transformations
+
+    Args:
+        constrained_component: The component
+        constrained_connector: The connector, as placed by the component's
+            transformations
+    """
+    inverse = numpy.linalg.inv(constrained_component.world_matrix)
+    axis = inverse[:3, :3] @ constrained_connector.axis.array
+
+    return (
+        inverse[:3, :3] @ constrained_connector.point.array + inverse[:3, 3],
+        axis / numpy.linalg.norm(axis),
+    )
+
+
+class Constraint(abc.ABC):
+    """A geometric relationship between the connectors of two components
+
+    The connectors are attached to their components, so the constraint follows
+    the components' subsequent transformations (including those applied by
+    `solve`).
+    """
+
+    # The number of degrees of freedom the constraint removes, which may be
+    # fewer than its number of residuals
+    equations: int
+
+    def __init__(self, first: Reference, second: Reference) -> None:
+        """
+        Args:
+            first: The first constrained connector & its component
+            second: The second constrained connector & its component
+        """
+        self.first = first
+        self.second = second
+
+        # The connectors relative to their components, so the constraint
+        # follows the components' subsequent transformations
+        self._local_connectors = (_localized(*first), _localized(*second))
+
+    @property
+    def value(self) -> float:
+        """The dimension of the constraint, if it has one"""
+        return 0.0
+
+    @staticmethod
+    @abc.abstractmethod
+    def _evaluate(
+        first: _Placements, second: _Placements, values: numpy.ndarray
+    ) -> Evaluation:
+        """Evaluate every constraint of this type at once
+
+        Args:
+            first: The placements of the first connectors
+            second: The placements of the second connectors
+            values: The constraints' dimensions
+
+        Returns:
+            The NxK residuals, which are zero when the constraints are met,
+            and their NxKx6 Jacobians with respect to the rigid motions of the
+            first & second components
+        """
+
+
+class Coincident(Constraint):
+    """The connectors' points coincide"""
+
+    equations = 3
+
+    @staticmethod
+    def _evaluate(
+        first: _Placements, second: _Placements, values: numpy.ndarray
+    ) -> Evaluation:
+        return (
+            first.points - second.points,
+            first.point_jacobians,
+            -second.point_jacobians,
+        )
+
+
+class Offset(Constraint):
+    """The second connector's point is a distance along the first's axis"""
+
+    equations = 3
+
+    def __init__(self, first: Reference, second: Reference, distance: float) -> None:
+        """
+        Args:
+            first: The first constrained connector & its component
+            second: The second constrained connector & its component
+            distance: The signed distance along the first connector's axis
+        """
+        super().__init__(first, second)
+
+        self.distance = distance
+
+    @property
+    def value(self) -> float:
+        return self.distance
+
+    @staticmethod
+    def _evaluate(
+        first: _Placements, second: _Placements, values: numpy.ndarray
+    ) -> Evaluation:
+        return (
+            second.points - first.points - values[:, None] * first.axes,
+            -first.point_jacobians - values[:, None, None] * first.axis_jacobians,
+            second.point_jacobians,
+        )
+
+
+class Parallel(Constraint):
+    """The connectors' axes are parallel (or antiparallel)"""
+
+    equations = 2
+
+    @staticmethod
+    def _evaluate(
+        first: _Placements, second: _Placements, values: numpy.ndarray
+    ) -> Evaluation:
+        return (
+            numpy.cross(first.axes, second.axes),
+            -_skew(second.axes) @ first.axis_jacobians,
+            _skew(first.axes) @ second.axis_jacobians,
+        )
+
+
+class Concentric(Constraint):
+    """The connectors' axes lie along the same line"""
+
+    equations = 4
+
+    @staticmethod
+    def _evaluate(
+        first: _Placements, second: _Placements, values: numpy.ndarray
+    ) -> Evaluation:
+        parallel_residuals, parallel_first, parallel_second = Parallel._evaluate(
+            first, second, values
+        )
+
+        # The separation of the points, across the first axis
+        separations = second.points - first.points
+        first_cross = _skew(first.axes)
+
+        return (
+            numpy.concatenate(
+                [parallel_residuals, numpy.cross(separations, first.axes)], axis=1
+            ),
+            numpy.concatenate(
+                [
+                    parallel_first,
+                    first_cross @ first.point_jacobians
+                    + _skew(separations) @ first.axis_jacobians,
+                ],
+                axis=1,
+            ),
+            numpy.concatenate(
+                [parallel_second, -first_cross @ second.point_jacobians], axis=1
+            ),
+        )
+
+
+class Angle(Constraint):
+    """The connectors' axes are at an angle to one another"""
+
+    equations = 1
+
+    def __init__(self, first: Reference, second: Reference, angle: float) -> None:
+        """
+        Args:
+            first: The first constrained connector & its component
+            second: The second constrained connector & its component
+            angle: The angle between the connectors' axes, in degrees
+        """
+        super().__init__(first, second)
+
+        self.angle = angle
+
+    @property
+    def value(self) -> float:
+        return self.angle
+
+    @staticmethod
+    def _evaluate(
+        first: _Placements, second: _Placements, values: numpy.ndarray
+    ) -> Evaluation:
+        return (
+            (
+                numpy.einsum("ij,ij->i", first.axes, second.axes)
+                - numpy.cos(numpy.radians(values))
+            )[:, None],
+            second.axes[:, None, :] @ first.axis_jacobians,
+            first.axes[:, None, :] @ second.axis_jacobians,
+        )
+
+
+class Solution:
+    """The outcome of solving a set of constraints"""
+
+    def __init__(self, iterations: int, residual: float) -> None:
+        """
+        Args:
+            iterations: The number of iterations taken to reach the solution
+            residual: The largest violation of any constraint at the solution
+        """
+        self.iterations = iterations
+        self.residual = residual
+
+    def __repr__(self) -> str:
+        return f"<{self.iterations} iterations; residual {self.residual:.3}>"
+
+
+class _ConstraintGroup:
+    """Every constraint of a single type, with their connectors in arrays"""
+
+    def __init__(
+        self,
+        constraint_type: typing.Type[Constraint],
+        constraints: typing.List[Constraint],
+        indices: typing.Dict[int, int],
+        fixed_index: int,
+        world_matrices: typing.Dict[int, numpy.ndarray],
+    ) -> None:
+        """
+        Args:
+            constraint_type: The type of the constraints
+            constraints: The constraints
+            indices: The index of each solved component, by its `id`
+            fixed_index: The index used for components which aren't solved
+            world_matrices: The current matrices of the components'
+                transformations, by the components' `id`s
+        """
+        self.constraints = constraints
+        self.equations = constraint_type.equations
+        self.evaluate = constraint_type._evaluate
+        self.values = numpy.array([constraint.value for constraint in constraints])
+
+        self.first_indices, self.first_points, self.first_axes = self._references(
+            constraints, 0, indices, fixed_index, world_matrices
+        )
+        self.second_indices, self.second_points, self.second_axes = self._references(
+            constraints, 1, indices, fixed_index, world_matrices
+        )
+
+    @staticmethod
+    def _references(
+        constraints: typing.List[Constraint],
+        side: int,
+        indices: typing.Dict[int, int],
+        fixed_index: int,
+        world_matrices: typing.Dict[int, numpy.ndarray],
+    ) -> typing.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """The components' indices & connectors' points & axes of one side
+
+        Args:
+            constraints: The constraints
+            side: The side of the constraints; 0 for their first connectors, 1
+                for their second
+            indices: The index of each solved component, by its `id`
+            fixed_index: The index used for components which aren't solved
+            world_matrices: The current matrices of the components'
+                transformations, by the components' `id`s; this is added to
+        """
+        components = [
+            (constraint.first, constraint.second)[side][0] for constraint in constraints
+        ]
+        for constrained_component in components:
+            if id(constrained_component) not in world_matrices:
+                world_matrices[id(constrained_component)] = (
+                    constrained_component.world_matrix
+                )
+
+        matrices = numpy.array(
+            [
+                world_matrices[id(constrained_component)]
+                for constrained_component in components
+            ]
+        ).reshape(-1, 4, 4)
+        local_points, local_axes = (
+            numpy.array(
+                [constraint._local_connectors[side][part] for constraint in constraints]
+            )
+            for part in (0, 1)
+        )
+
+        axes = numpy.einsum("nij,nj->ni", matrices[:, :3, :3], local_axes)
+
+        return (
+            numpy.array(
+                [
+                    indices.get(id(constrained_component), fixed_index)
+                    for constrained_component in components
+                ],
+                dtype=int,
+            ),
+            numpy.einsum("nij,nj->ni", matrices[:, :3, :3], local_points)
+            + matrices[:, :3, 3],
+            axes / numpy.linalg.norm(axes, axis=1)[:, None],
+        )
+
+
+class _System:
+    """The constraints on a set of components' rigid motions"""
+
+    def __init__(
+        self,
+        constraints: typing.Iterable[Constraint],
+        fixed: typing.Iterable[component.Component],
+    ) -> None:
+        """
+        Args:
+            constraints: The constraints to satisfy
+            fixed: The components which should not be moved
+        """
+        constraints = list(constraints)
+        fixed_ids = {id(fixed_component) for fixed_component in fixed}
+
+        self.components: typing.List[component.Component] = []
+        indices: typing.Dict[int, int] = {}
+        for constraint in constraints:
+            for constrained_component, _ in (constraint.first, constraint.second):
+                if (
+                    id(constrained_component) not in fixed_ids
+                    and id(constrained_component) not in indices
+                ):
+                    indices[id(constrained_component)] = len(self.components)
+                    self.components.append(constrained_component)
+
+        # Fixed components share a final slot, which is never moved
+        self.size = len(self.components)
+
+        by_type: typing.Dict[typing.Type[Constraint], typing.List[Constraint]] = {}
+        for constraint in constraints:
+            by_type.setdefault(type(constraint), []).append(constraint)
+
+        world_matrices: typing.Dict[int, numpy.ndarray] = {}
+        self.groups = [
+            _ConstraintGroup(
+                constraint_type, typed_constraints, indices, self.size, world_matrices
+            )
+            for constraint_type, typed_constraints in by_type.items()
+        ]
+
+        # The rigid motion of each component (& the fixed slot) so far
+        self.rotations = numpy.tile(numpy.identity(3), (self.size + 1, 1, 1))
+        self.translations = numpy.zeros((self.size + 1, 3))
+
+        # Components are rotated about the centroids of their constrained
+        # points, which keeps rotations & translations from being coupled
+        totals = numpy.zeros((self.size + 1, 3))
+        counts = numpy.zeros(self.size + 1)
+        for group in self.groups:
+            for group_indices, points in (
+                (group.first_indices, group.first_points),
+                (group.second_indices, group.second_points),
+            ):
+                numpy.add.at(totals, group_indices, points)
+                numpy.add.at(counts, group_indices, 1.0)
+        self.pivots = totals / numpy.maximum(counts, 1.0)[:, None]
+
+    def _placements(
+        self,
+        indices: numpy.ndarray,
+        points: numpy.ndarray,
+        axes: numpy.ndarray,
+        rotations: numpy.ndarray,
+        translations: numpy.ndarray,
+    ) -> _Placements:
+        """The placements of connectors after their components' motions
+
+        Args:
+            indices: The indices of the connectors' components
+            points: The Nx3 original points of the connectors
+            axes: The Nx3 original axes of the connectors
+            rotations: The rotations of every component
+            translations: The translations of every component
+        """
+        component_rotations = rotations[indices]
+
+        return _Placements(
+            numpy.einsum("nij,nj->ni", component_rotations, points)
+            + translations[indices],
+            numpy.einsum("nij,nj->ni", component_rotations, self.pivots[indices])
+            + translations[indices],
+            numpy.einsum("nij,nj->ni", component_rotations, axes),
+        )
+
+    def evaluate(
+        self, rotations: numpy.ndarray, translations: numpy.ndarray
+    ) -> typing.List[typing.Tuple["_ConstraintGroup", Evaluation]]:
+        """Evaluate every constraint after the components' motions
+
+        Args:
+            rotations: The rotations of every component
+            translations: The translations of every component
+        """
+        return [
+            (
+                group,
+                group.evaluate(
+                    self._placements(
+                        group.first_indices,
+                        group.first_points,
+                        group.first_axes,
+                        rotations,
+                        translations,
+                    ),
+                    self._placements(
+                        group.second_indices,
+                        group.second_points,
+                        group.second_axes,
+                        rotations,
+                        translations,
+                    ),
+                    group.values,
+                ),
+            )
+            for group in self.groups
+        ]
+
+    def step(
+        self,
+        evaluations: typing.List[typing.Tuple["_ConstraintGroup", Evaluation]],
+        damping: float,
+    ) -> numpy.ndarray:
+        """Find a damped Gauss-Newton step towards satisfying the constraints
+
+        The damped Gauss-Newton equations, `(J^T J + damping I) step = -J^T r`,
+        are solved directly. Their matrix is assembled from 6x6 blocks, one for
+        each component & one for each pair of constrained components, & each
+        component's motion is eliminated in turn, those with the fewest
+        remaining neighbours first. Constraints only couple the components they
+        relate, so a chain or tree of mated components is eliminated without
+        creating any new blocks, in time proportional to the number of
+        constraints; the step is exact however the components are linked.
+
+        Args:
+            evaluations: The evaluated constraints
+            damping: The Levenberg damping factor
+
+        Returns:
+            The (N+1)x6 steps of each component's motion
+        """
+        gradients = numpy.zeros((self.size + 1, 6))
+        diagonal = numpy.zeros((self.size + 1, 6, 6))
+
+        first_indices = []
+        second_indices = []
+        couplings = []
+        for group, (residuals, first_jacobians, second_jacobians) in evaluations:
+            for indices, jacobians in (
+                (group.first_indices, first_jacobians),
+                (group.second_indices, second_jacobians),
+            ):
+                numpy.add.at(
+                    gradients, indices, numpy.einsum("nkj,nk->nj", jacobians, residuals)
+                )
+                numpy.add.at(
+                    diagonal,
+                    indices,
+                    numpy.einsum("nki,nkj->nij", jacobians, jacobians),
+                )
+
+            first_indices.append(group.first_indices)
+            second_indices.append(group.second_indices)
+            couplings.append(
+                numpy.einsum("nki,nkj->nij", first_jacobians, second_jacobians)
+            )
+
+        first = numpy.concatenate(first_indices)
+        second = numpy.concatenate(second_indices)
+        coupling = numpy.concatenate(couplings)
+
+        # A constraint between two connectors of the same component couples
+        # its motion with itself
+        same = first == second
+        numpy.add.at(
+            diagonal, first[same], coupling[same] + coupling[same].transpose(0, 2, 1)
+        )
+
+        # The couplings of each pair of moving components, summed over their
+        # constraints, with the lower index first
+        linked = ~same & (first != self.size) & (second != self.size)
+        first, second, coupling = first[linked], second[linked], coupling[linked]
+        swapped = first > second
+        coupling[swapped] = coupling[swapped].transpose(0, 2, 1)
+        pairs, pair_indices = numpy.unique(
+            numpy.minimum(first, second) * (self.size + 1)
+            + numpy.maximum(first, second),
+            return_inverse=True,
+        )
+        pair_couplings = numpy.zeros((len(pairs), 6, 6))
+        numpy.add.at(pair_couplings, pair_indices.reshape(-1), coupling)
+
+        # The nonzero blocks of each row of the matrix, by their column
+        matrix: typing.List[typing.Dict[int, numpy.ndarray]] = [
+            {index: block}
+            for index, block in enumerate(
+                diagonal[: self.size] + damping * numpy.identity(6)
+            )
+        ]
+        for pair, block in zip(pairs.tolist(), pair_couplings):
+            row, column = divmod(pair, self.size + 1)
+            matrix[row][column] = block
+            matrix[column][row] = block.T
+
+        # Each component's motion is eliminated from the rows of its remaining
+        # neighbours, updating their blocks (& creating any new ones) & their
+        # right-hand sides
+        right = -gradients
+        eliminated: typing.List[
+            typing.Tuple[
+                int, numpy.ndarray, typing.List[typing.Tuple[int, numpy.ndarray]]
+            ]
+        ] = []
+        remaining = [(len(row), index) for index, row in enumerate(matrix)]
+        heapq.heapify(remaining)
+        done = numpy.zeros(self.size, dtype=bool)
+
+        while remaining:
+            degree, index = heapq.heappop(remaining)
+            # Neighbours are queued again whenever their number changes
+            if done[index] or degree != len(matrix[index]):
+                continue
+            done[index] = True
+
+            row = matrix[index]
+            inverse = numpy.linalg.inv(row.pop(index))
+            neighbours = list(row.items())
+
+            for neighbour, _ in neighbours:
+                del matrix[neighbour][index]
+
+            for neighbour, block in neighbours:
+                scaled = block.T @ inverse
+                neighbour_row = matrix[neighbour]
+                for other, other_block in neighbours:
+                    update = scaled @ other_block
+                    if other in neighbour_row:
+                        neighbour_row[other] = neighbour_row[other] - update
+                    else:
+                        neighbour_row[other] = -update
+
+                right[neighbour] -= scaled @ right[index]
+                heapq.heappush(remaining, (len(neighbour_row), neighbour))
+
+            eliminated.append((index, inverse, neighbours))
+
+        # Each motion is then found from those of the neighbours eliminated
+        # after it
+        steps = numpy.zeros_like(gradients)
+        for index, inverse, neighbours in reversed(eliminated):
+            remainder = right[index]
+            for neighbour, block in neighbours:
+                remainder = remainder - block @ steps[neighbour]
+
+            steps[index] = inverse @ remainder
+
+        return steps
+
+    def moved(self, steps: numpy.ndarray) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        """The components' motions after taking a step
+
+        Args:
+            steps: The (N+1)x6 steps of each component's motion
+
+        Returns:
+            The new rotations & translations of every component
+        """
+        step_rotations = _rotations(steps[:, :3])
+        pivots = (
+            numpy.einsum("nij,nj->ni", self.rotations, self.pivots) + self.translations
+        )
+
+        return (
+            step_rotations @ self.rotations,
+            numpy.einsum("nij,nj->ni", step_rotations, self.translations - pivots)
+            + pivots
+            + steps[:, 3:],
+        )
+
+
+def _parent_matrix(constrained_component: component.Component) -> numpy.ndarray:
+    """The 4x4 matrix of the transformations a component inherits
+
+    Args:
+        constrained_component: The component
+    """
+    if constrained_component.parent is None:
+        return numpy.identity(4)
+
+    return constrained_component.parent.world_matrix
+
+
+def _apply(system: _System) -> None:
+    """Transform each solved component by its motion
+
+    Args:
+        system: The solved system
+    """
+    motions = numpy.tile(numpy.identity(4), (system.size, 1, 1))
+    motions[:, :3, :3] = system.rotations[: system.size]
+    motions[:, :3, 3] = system.translations[: system.size]
+
+    moved = [
+        index
+        for index in range(system.size)
+        if not numpy.allclose(motions[index], numpy.identity(4), rtol=0.0, atol=1e-15)
+    ]
+    moved_ids = {id(system.components[index]) for index in moved}
+
+    # The original placements of the components' parents, before any of them
+    # are moved, by the parent's `id`
+    parent_matrices: typing.Dict[int, numpy.ndarray] = {}
+    for index in moved:
+        parent = system.components[index].parent
+        if id(parent) not in parent_matrices:
+            parent_matrices[id(parent)] = _parent_matrix(system.components[index])
+
+    # Parents are moved before their children, which compensate for them
+    for index in sorted(
+        moved, key=lambda index: len(list(system.components[index].parents))
+    ):
+        constrained_component = system.components[index]
+        original_parent_matrix = parent_matrices[id(constrained_component.parent)]
+
+        current_parent_matrix = original_parent_matrix
+        if any(id(parent) in moved_ids for parent in constrained_component.parents):
+            current_parent_matrix = _parent_matrix(constrained_component)
+
+        constrained_component.transform(
+            solid.multmatrix(
+                numpy.linalg.solve(
+                    current_parent_matrix, motions[index] @ original_parent_matrix
+                ).tolist()
+            )
+        )
+
+
+def _residual(
+    evaluations: typing.List[typing.Tuple[_ConstraintGroup, Evaluation]],
+) -> typing.Tuple[float, float]:
+    """The sum of squares & the largest magnitude of the constraints' residuals
+
+    Args:
+        evaluations: The evaluated constraints
+    """
+    residuals = [residuals for _, (residuals, _, _) in evaluations]
+
+    return (
+        sum(float(numpy.sum(group_residuals**2)) for group_residuals in residuals),
+        max(
+            (
+                float(numpy.max(numpy.abs(group_residuals), initial=0.0))
+                for group_residuals in residuals
+            ),
+            default=0.0,
+        ),
+    )
+
+
+def solve(
+    constraints: typing.Iterable[Constraint],
+    fixed: typing.Iterable[component.Component] = (),
+    tolerance: float = 1e-9,
+    maximum_iterations: int = 100,
+) -> Solution:
+    """Move components so that constraints between their connectors are met
+
+    The components' rigid motions are found by the Levenberg-Marquardt method,
+    using the constraints' analytic Jacobians, & are then applied to each
+    moved component as a single additional transformation.
+
+    Args:
+        constraints: The constraints to satisfy
+        fixed: The components which should not be moved; if none are given,
+            the solution is the smallest motion meeting the constraints
+        tolerance: The largest acceptable violation of any constraint
+        maximum_iterations: The most iterations to run
+
+    Returns:
+        The outcome of solving the constraints
+
+    Raises:
+        Unsolvable: If the constraints couldn't be satisfied; no components
+            are moved
+
+    Note:
+        Each component's motion is solved independently of its parents', so
+        a constrained component with a constrained parent is placed as solved
+        regardless of its parent's motion
+    """
+    system = _System(constraints, fixed)
+
+    evaluations = system.evaluate(system.rotations, system.translations)
+    cost, residual = _residual(evaluations)
+    damping = 1e-3
+
+    iterations = 0
+    while residual > tolerance and iterations < maximum_iterations:
+        iterations += 1
+
+        rotations, translations = system.moved(system.step(evaluations, damping))
+        trial_evaluations = system.evaluate(rotations, translations)
+        trial_cost, trial_residual = _residual(trial_evaluations)
+
+        if trial_cost < cost:
+            system.rotations, system.translations = rotations, translations
+            evaluations, cost, residual = trial_evaluations, trial_cost, trial_residual
+            damping = max(damping / 3.0, 1e-12)
+        else:
+            damping *= 4.0
+            if damping > 1e12:
+                break
+
+    if residual > tolerance:
+        raise Unsolvable(residual)
+
+    _apply(system)
+
+    return Solution(iterations, residual)
+
+
+class Freedom:
+    """The extent to which a single component is constrained"""
+
+    def __init__(
+        self,
+        constrained_component: component.Component,
+        free: int,
+        redundant: typing.List[Constraint],
+    ) -> None:
+        """
+        Args:
+            constrained_component: The component
+            free: The number of independent motions of the component which
+                the constraints allow
+            redundant: The constraints on the component which conflict with,
+                or duplicate, other constraints
+        """
+        self.component = constrained_component
+        self.free = free
+        self.redundant = redundant
+
+    @property
+    def under_constrained(self) -> bool:
+        """Can the component move without violating the constraints?"""
+        return self.free > 0
+
+    @property
+    def over_constrained(self) -> bool:
+        """Are any of the component's constraints redundant?"""
+        return bool(self.redundant)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.component.__class__.__name__}: {self.free} free, "
+            f"{len(self.redundant)} redundant>"
+        )
+
+
+class FreedomAnalysis:
+    """The extent to which every component of an assembly is constrained"""
+
+    def __init__(
+        self, components: typing.List[Freedom], redundant: typing.List[Constraint]
+    ) -> None:
+        """
+        Args:
+            components: The freedom of each constrained component
+            redundant: Every constraint which conflicts with, or duplicates,
+                other constraints
+        """
+        self.components = components
+        self.redundant = redundant
+
+    @property
+    def free(self) -> int:
+        """The total number of independent motions the constraints allow"""
+        return sum(freedom.free for freedom in self.components)
+
+    @property
+    def under_constrained(self) -> typing.List[Freedom]:
+        """The components which can move without violating the constraints"""
+        return [freedom for freedom in self.components if freedom.under_constrained]
+
+    @property
+    def over_constrained(self) -> typing.List[Freedom]:
+        """The components with redundant constraints"""
+        return [freedom for freedom in self.components if freedom.over_constrained]
+
+
+def _reduced_rows(
+    system: _System,
+) -> typing.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, typing.List[Constraint]]:
+    """Every constraint's independent Jacobian rows
+
+    Some constraints have more residuals than the degrees of freedom they
+    remove, e.g. the three components of a cross product constrain only two
+    angles; their Jacobians are reduced to their most significant rows so that
+    they aren't mistaken for redundancies.
+
+    Args:
+        system: The constraints, with their connectors as currently placed
+
+    Returns:
+        The Rx12 rows, with respect to the rigid motions of each constraint's
+        first & second components; the indices of those components for each
+        row; and the constraints, with the index of each row's constraint
+        following the component indices
+    """
+    rows = []
+    first_indices = []
+    second_indices = []
+    owners = []
+    constraints: typing.List[Constraint] = []
+
+    for group, (_, first_jacobians, second_jacobians) in system.evaluate(
+        system.rotations, system.translations
+    ):
+        _, singular_values, bases = numpy.linalg.svd(
+            numpy.concatenate([first_jacobians, second_jacobians], axis=-1)
+        )
+        count = len(group.constraints)
+        equations = group.equations
+
+        rows.append(
+            (singular_values[:, :equations, None] * bases[:, :equations, :]).reshape(
+                -1, 12
+            )
+        )
+        first_indices.append(numpy.repeat(group.first_indices, equations))
+        second_indices.append(numpy.repeat(group.second_indices, equations))
+        owners.append(numpy.repeat(numpy.arange(count) + len(constraints), equations))
+        constraints.extend(group.constraints)
+
+    return (
+        numpy.concatenate(rows),
+        numpy.stack(
+            [numpy.concatenate(first_indices), numpy.concatenate(second_indices)]
+        ),
+        numpy.concatenate(owners),
+        constraints,
+    )
+
+
+# The number of combinations of rows with no effect whose coefficients are
+# found at once, when analysing constraints
+_REDUNDANCY_BATCH = 256
+
+
+def _row_span(rows: numpy.ndarray, threshold: float) -> numpy.ndarray:
+    """Independent rows spanning the same space as some rows
+
+    Args:
+        rows: The rows
+        threshold: The singular value below which rows are considered
+            dependent
+
+    Returns:
+        The rows' right singular vectors, scaled by their singular values
+    """
+    if not len(rows):
+        return rows
+
+    _, singular_values, bases = numpy.linalg.svd(rows, full_matrices=False)
+    independent = singular_values > threshold
+    return singular_values[independent, None] * bases[independent]
+
+
+def _eliminated(
+    rows: numpy.ndarray, columns: typing.Sequence[int], threshold: float
+) -> numpy.ndarray:
+    """The combinations of some rows which are zero in some of their columns
+
+    Args:
+        rows: The rows
+        columns: The columns to eliminate
+        threshold: The singular value below which rows are considered
+            dependent
+
+    Returns:
+        The combinations, without the eliminated columns
+    """
+    remaining = numpy.delete(rows, columns, axis=1)
+    if not len(columns) or not len(rows):
+        return remaining
+
+    left, singular_values, _ = numpy.linalg.svd(rows[:, columns])
+    rank = int(numpy.sum(singular_values > threshold))
+    return (left.T @ remaining)[rank:]
+
+
+def _block_freedom(
+    rows: numpy.ndarray,
+    columns: numpy.ndarray,
+    count: int,
+    threshold: float,
+    tolerance: float,
+) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+    """The free motions & redundant rows of one block of a Jacobian
+
+    Components are eliminated one at a time, fewest neighbours first, by
+    orthogonal transformations of the rows involving them; this is a sparse QR
+    factorization of the block, & a row is redundant if it's part of any
+    combination of rows left with no effect on any motion. Then, in the reverse
+    order, every component gathers the combinations of all of the rows which
+    involve only it & the components it was eliminated alongside; those which
+    involve only it fix its motions, & the rest are passed on to the components
+    eliminated before it.
+
+    Args:
+        rows: The Rx12 rows, with respect to the rigid motions of each row's
+            first & second components
+        columns: The Rx2 positions of each row's components within the
+            block, or -1 for fixed components
+        count: The number of components in the block
+        threshold: The singular value below which rows are considered
+            dependent
+        tolerance: The sum of the squares of a row's coefficients, in the
+            combinations of rows with no effect, above which it's redundant
+
+    Returns:
+        The number of free motions of each component, & whether each row is
+        redundant
+    """
+    # The 6 columns of each row for each of its components; the rows are the
+    # original rows followed by their combinations
+    entries: typing.List[typing.Dict[int, numpy.ndarray]] = []
+    involving: typing.List[typing.Set[int]] = [set() for _ in range(count)]
+    # The rows involving no components
+    dead: typing.List[int] = []
+
+    def add(row_entries: typing.Dict[int, numpy.ndarray]) -> int:
+        for position in row_entries:
+            involving[position].add(len(entries))
+        if not row_entries:
+            dead.append(len(entries))
+        entries.append(row_entries)
+        return len(entries) - 1
+
+    for row, row_columns in zip(rows, columns.tolist()):
+        row_entries: typing.Dict[int, numpy.ndarray] = {}
+        for side, position in enumerate(row_columns):
+            if position >= 0:
+                row_entries[position] = (
+                    row_entries.get(position, 0) + row[6 * side : 6 * side + 6]
+                )
+        add(row_entries)
+
+    def neighbours(position: int) -> typing.List[int]:
+        return sorted(
+            {
+                neighbour
+                for row_index in involving[position]
+                for neighbour in entries[row_index]
+            }
+            - {position}
+        )
+
+    queue = [(len(neighbours(position)), position) for position in range(count)]
+    heapq.heapify(queue)
+    eliminated = numpy.zeros(count, dtype=bool)
+
+    # The order of elimination, & the combinations of rows involving each
+    # component when it's eliminated, with the components they also involve
+    order: typing.List[int] = []
+    fronts: typing.List[typing.Tuple[typing.List[int], numpy.ndarray]] = [
+        ([], numpy.zeros((0, 6)))
+    ] * count
+    # The rows combined by each elimination, the combinations which remain, &
+    # the coefficients of the combinations
+    combinations: typing.List[
+        typing.Tuple[typing.List[int], typing.List[int], numpy.ndarray]
+    ] = []
+
+    while queue:
+        degree, position = heapq.heappop(queue)
+        if eliminated[position]:
+            continue
+        front_neighbours = neighbours(position)
+        # Stale entries are skipped, their components having been queued again
+        if degree != len(front_neighbours):
+            continue
+
+        eliminated[position] = True
+        order.append(position)
+        row_indices = sorted(involving[position])
+        front_columns = [position, *front_neighbours]
+
+        front = numpy.zeros((len(row_indices), 6 * len(front_columns)))
+        for row, row_index in enumerate(row_indices):
+            for column, column_position in enumerate(front_columns):
+                if column_position in entries[row_index]:
+                    front[row, 6 * column : 6 * column + 6] = entries[row_index][
+                        column_position
+                    ]
+        fronts[position] = (front_neighbours, _row_span(front, threshold))
+
+        for row_index in row_indices:
+            for row_position in entries[row_index]:
+                involving[row_position].discard(row_index)
+
+        left, singular_values, _ = numpy.linalg.svd(front[:, :6])
+        rank = int(numpy.sum(singular_values > threshold))
+
+        # The remaining combinations don't involve the component; they're
+        # reduced to those independent in its neighbours' motions, & the rest,
+        # with no effect on them, are dropped. Its neighbours are linked even if
+        # none remain, so each component's neighbours are all eliminated
+        # alongside the first of them
+        coefficients = left.T[rank:]
+        remaining = coefficients @ front[:, 6:]
+        if remaining.size:
+            outer, _, _ = numpy.linalg.svd(remaining)
+            coefficients = outer.T @ coefficients
+            remaining = outer.T @ remaining
+        effective = numpy.linalg.norm(remaining, axis=1) > threshold
+        if not numpy.any(effective) and front_neighbours:
+            coefficients = numpy.concatenate(
+                [coefficients, numpy.zeros((1, len(row_indices)))]
+            )
+            remaining = numpy.concatenate(
+                [remaining, numpy.zeros((1, remaining.shape[1]))]
+            )
+            effective = numpy.append(effective, True)
+
+        combinations.append(
+            (
+                row_indices,
+                [
+                    add(
+                        {
+                            neighbour: row[6 * column : 6 * column + 6]
+                            for column, neighbour in enumerate(front_neighbours)
+                        }
+                        if row_effective
+                        else {}
+                    )
+                    for row, row_effective in zip(remaining, effective)
+                ],
+                coefficients,
+            )
+        )
+
+        for neighbour in front_neighbours:
+            heapq.heappush(queue, (len(neighbours(neighbour)), neighbour))
+
+    # The coefficients of the original rows in the combinations with no effect
+    # are found by undoing each elimination in turn
+    redundancy = numpy.zeros(len(rows))
+    for start in range(0, len(dead), _REDUNDANCY_BATCH):
+        batch = dead[start : start + _REDUNDANCY_BATCH]
+        weights = dict(zip(batch, numpy.eye(len(batch))))
+
+        for row_indices, remaining, coefficients in reversed(combinations):
+            if any(row_index in weights for row_index in remaining):
+                weights.update(
+                    zip(
+                        row_indices,
+                        coefficients.T
+                        @ numpy.array(
+                            [
+                                weights.pop(row_index, numpy.zeros(len(batch)))
+                                for row_index in remaining
+                            ]
+                        ),
+                    )
+                )
+
+        for row_index, row_weights in weights.items():
+            redundancy[row_index] += row_weights @ row_weights
+
+    free = numpy.zeros(count, dtype=int)
+    positions = numpy.argsort(order)
+    spans: typing.Dict[int, numpy.ndarray] = {}
+
+    for position in reversed(order):
+        front_neighbours, span = fronts[position]
+
+        # The combinations of all rows involving only the component's
+        # neighbours are gathered from the first of them eliminated
+        if front_neighbours:
+            parent = min(front_neighbours, key=lambda neighbour: positions[neighbour])
+            parent_columns = [parent, *fronts[parent][0]]
+            parent_span = spans[parent].reshape(
+                len(spans[parent]), len(parent_columns), 6
+            )
+
+            gathered = _eliminated(
+                parent_span[
+                    :,
+                    [parent_columns.index(neighbour) for neighbour in front_neighbours]
+                    + [
+                        column
+                        for column, column_position in enumerate(parent_columns)
+                        if column_position not in front_neighbours
+                    ],
+                ].reshape(len(parent_span), 6 * len(parent_columns)),
+                list(range(6 * len(front_neighbours), 6 * len(parent_columns))),
+                threshold,
+            )
+            span = _row_span(
+                numpy.concatenate(
+                    [
+                        span,
+                        numpy.concatenate(
+                            [numpy.zeros((len(gathered), 6)), gathered], axis=1
+                        ),
+                    ]
+                ),
+                threshold,
+            )
+
+        spans[position] = span
+        fixing = _row_span(
+            _eliminated(span, list(range(6, span.shape[1])), threshold), threshold
+        )
+        free[position] = 6 - len(fixing)
+
+    return free, redundancy > tolerance
+
+
+def analyse(
+    constraints: typing.Iterable[Constraint],
+    fixed: typing.Iterable[component.Component] = (),
+    tolerance: float = 1e-9,
+) -> FreedomAnalysis:
+    """Find the free motions & redundant constraints of constrained components
+
+    The constraints' Jacobian is split into the independent blocks of
+    components linked (other than via fixed components) by constraints, & each
+    block is factorized one component at a time, so this stays fast for
+    thousands of parts, however many are linked together.
+
+    Args:
+        constraints: The constraints to analyse; these are linearized about
+            the components' current placements, so they should ideally be
+            satisfied
+        fixed: The components which should not be moved
+        tolerance: The singular value, relative to the length of the longest
+            row of the Jacobian, below which its rows are considered dependent
+
+    Returns:
+        The analysis
+    """
+    system = _System(constraints, fixed)
+    if not system.groups:
+        return FreedomAnalysis([], [])
+
+    rows, (first_indices, second_indices), owners, ordered = _reduced_rows(system)
+
+    # Components are linked into blocks by the constraints between them
+    blocks = list(range(system.size + 1))
+
+    def root(index: int) -> int:
+        while blocks[index] != index:
+            blocks[index] = blocks[blocks[index]]
+            index = blocks[index]
+
+        return index
+
+    for first_index, second_index in zip(
+        first_indices.tolist(), second_indices.tolist()
+    ):
+        if first_index != system.size and second_index != system.size:
+            blocks[root(second_index)] = root(first_index)
+
+    row_blocks = numpy.array(
+        [
+            root(first_index if first_index != system.size else second_index)
+            for first_index, second_index in zip(
+                first_indices.tolist(), second_indices.tolist()
+            )
+        ],
+        dtype=int,
+    )
+
+    threshold = tolerance * float(numpy.max(numpy.linalg.norm(rows, axis=1)))
+    free = numpy.zeros(system.size, dtype=int)
+    redundant_rows = numpy.zeros(len(rows), dtype=bool)
+
+    members: typing.Dict[int, typing.List[int]] = {}
+    for index in range(system.size):
+        members.setdefault(root(index), []).append(index)
+    # Constraints only between fixed components form a block of their own
+    members.setdefault(root(system.size), [])
+
+    for block, block_components in members.items():
+        block_rows = numpy.flatnonzero(row_blocks == block)
+
+        # Constraints only between fixed components can't affect anything
+        if not block_components:
+            redundant_rows[block_rows] = True
+            continue
+
+        columns = numpy.full(system.size + 1, -1)
+        columns[block_components] = numpy.arange(len(block_components))
+
+        free[block_components], redundant_rows[block_rows] = _block_freedom(
+            rows[block_rows],
+            numpy.stack(
+                [
+                    columns[first_indices[block_rows]],
+                    columns[second_indices[block_rows]],
+                ],
+                axis=1,
+            ),
+            len(block_components),
+            threshold,
+            tolerance,
+        )
+
+    redundant_constraints = [
+        ordered[index] for index in sorted(set(owners[redundant_rows].tolist()))
+    ]
+
+    # The redundant constraints on each component, by the component's `id`
+    component_redundancies: typing.Dict[int, typing.List[Constraint]] = {}
+    for constraint in redundant_constraints:
+        for component_id in {id(constraint.first[0]), id(constraint.second[0])}:
+            component_redundancies.setdefault(component_id, []).append(constraint)
+
+    return FreedomAnalysis(
+        [
+            Freedom(
+                constrained_component,
+                int(free[index]),
+                component_redundancies.get(id(constrained_component), []),
+            )
+            for index, constrained_component in enumerate(system.components)
+        ],
+        redundant_constraints,
+    )
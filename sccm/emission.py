@@ -0,0 +1,346 @@
+import collections
+import contextlib
+import contextvars
+import typing
+
+import solid
+from solid.solidpython import indent
+
+from sccm import bounding, resolution
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from sccm.components import component
+
+
+class PrunedOperand:
+    """A composition operand left out of an emitted body"""
+
+    def __init__(
+        self,
+        composer: "component.Component",
+        composition: solid.OpenSCADObject,
+        operand: "component.Component",
+        reason: str,
+    ) -> None:
+        """
+        Args:
+            composer: The component whose composition the operand was part of
+            composition: The composition the operand was part of
+            operand: The operand
+            reason: Why the operand could be left out
+        """
+        self.composer = composer
+        self.composition = composition
+        self.operand = operand
+        self.reason = reason
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self.operand).__name__} pruned from "
+            f"{type(self.composition).__name__} of {type(self.composer).__name__}: "
+            f"{self.reason}>"
+        )
+
+
+# A rendered fragment of `OpenSCAD` source, with the rendered bodies of the
+# modules it calls (keyed by their names)
+CachedFragment = typing.Tuple[str, typing.Dict[str, str]]
+
+
+class RenderedFragment(solid.OpenSCADObject):
+    """An already-rendered subtree, spliced verbatim into the emitted source"""
+
+    def __init__(self, text: str) -> None:
+        """
+        Args:
+            text: The rendered `OpenSCAD` source of the subtree
+        """
+        super().__init__("rendered_fragment", {})
+
+        self.text = text
+
+    def _render(self, render_holes: bool = False) -> str:
+        return self.text
+
+
+class FragmentCache:
+    """Rendered `OpenSCAD` source for component subtrees, reused across emissions
+
+    Fragments are keyed by the structural fingerprint of each subtree, the
+    transformations & resolution it inherits, and the emission options, so an
+    edit to one part of an assembly only invalidates the fragments of that part
+    and of the components containing it.
+    """
+
+    def __init__(self, maximum_size: int = None) -> None:
+        """
+        Args:
+            maximum_size: The most fragments to keep, if limited; the least
+                recently used are discarded first
+        """
+        self.maximum_size = maximum_size
+
+        self._fragments: typing.OrderedDict[typing.Hashable, str] = (
+            collections.OrderedDict()
+        )
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: typing.Hashable) -> typing.Optional[CachedFragment]:
+        """Look up a rendered fragment
+
+        Args:
+            key: The key of the fragment
+
+        Returns:
+            The fragment & the modules it uses, if it has been cached
+        """
+        fragment = self._fragments.get(key)
+
+        if fragment is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._fragments.move_to_end(key)
+
+        return fragment
+
+    def put(
+        self, key: typing.Hashable, text: str, modules: typing.Dict[str, str] = None
+    ) -> None:
+        """Cache a rendered fragment
+
+        Args:
+            key: The key of the fragment
+            text: The fragment
+            modules: The rendered bodies of the modules called by the fragment,
+                keyed by their names
+        """
+        self._fragments[key] = (text, modules if modules is not None else {})
+        self._fragments.move_to_end(key)
+
+        if self.maximum_size is not None:
+            while len(self._fragments) > self.maximum_size:
+                self._fragments.popitem(last=False)
+
+    def clear(self) -> None:
+        """Discard every cached fragment"""
+        self._fragments.clear()
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+
+class Emission:
+    """The options in effect while `OpenSCAD` objects are being emitted
+
+    Emission options are held in a context variable rather than passed through
+    the `body` properties of each component, so they apply to an entire
+    component tree (and each thread can emit with its own options).
+    """
+
+    def __init__(
+        self,
+        default_resolution: resolution.Resolution = None,
+        fn: int = None,
+        fragments: typing.Dict[int, int] = None,
+        prune: bool = False,
+        cache: FragmentCache = None,
+        optimize: bool = False,
+        modules: typing.Dict[str, str] = None,
+    ) -> None:
+        """
+        Args:
+            default_resolution: The resolution to use for components which
+                don't have one of their own (or inherit one from a parent)
+            fn: The global number of fragments set in the emitted source's
+                header, if any
+            fragments: Per-primitive fragment counts which override any
+                resolution, keyed by the `id` of the primitive
+            prune: Should composition operands which can't contribute to the
+                composed body (judging by their bounds) be left out?
+            cache: Where to look up & store the rendered source of each
+                component's body, if anywhere; bodies are then emitted as
+                already-rendered fragments
+            optimize: Should cached fragments (& module definitions) be
+                optimized before they're rendered?
+            modules: The rendered bodies of the `OpenSCAD` modules defined for
+                the emitted source, keyed by their names; if provided, instances
+                of template components are emitted as calls to these modules,
+                rather than as copies of their templates' bodies
+        """
+        self.default_resolution = default_resolution
+        self.fn = fn
+        self.fragments = fragments if fragments is not None else {}
+        self.prune = prune
+        self.cache = cache
+        self.optimize = optimize
+        self.modules = modules
+
+        # The modules used by each subtree currently being rendered into a
+        # cached fragment, innermost last
+        self._module_frames: typing.List[typing.Dict[str, str]] = []
+
+        # Every operand left out by pruning, in the order they were pruned
+        self.pruned: typing.List[PrunedOperand] = []
+
+        # Components aren't modified during emission, so their bounds can be
+        # reused, keyed by their `id`
+        self._bounds: typing.Dict[int, bounding.Bounds] = {}
+        # Likewise for fingerprints
+        self.fingerprints: typing.Dict[int, str] = {}
+
+    @property
+    def caching(self) -> bool:
+        """Can bodies be looked up in & stored in the fragment cache?
+
+        Per-primitive fragment overrides aren't part of any subtree's
+        fingerprint, and pruning must see every operand to report it, so
+        neither can be combined with caching.
+        """
+        return self.cache is not None and not self.fragments and not self.prune
+
+    @property
+    def signature(self) -> typing.Tuple[str, typing.Optional[int], bool, bool]:
+        """The options which affect rendered fragments, for use in cache keys"""
+        return (
+            repr(self.default_resolution),
+            self.fn,
+            self.optimize,
+            self.modules is not None,
+        )
+
+    def define_module(self, name: str, body: str) -> None:
+        """Define a module for the emitted source, if it isn't already
+
+        Args:
+            name: The name of the module
+            body: The rendered body of the module
+        """
+        self.modules.setdefault(name, body)
+
+        for frame in self._module_frames:
+            frame.setdefault(name, body)
+
+    @contextlib.contextmanager
+    def recording_modules(self) -> typing.Iterator[typing.Dict[str, str]]:
+        """Record the modules used while rendering a subtree
+
+        Yields:
+            The rendered bodies of the modules used, keyed by their names
+        """
+        frame: typing.Dict[str, str] = {}
+        self._module_frames.append(frame)
+
+        try:
+            yield frame
+        finally:
+            self._module_frames.pop()
+
+    @property
+    def module_definitions(self) -> str:
+        """The `OpenSCAD` source defining every module used"""
+        return "".join(
+            f"module {name}() {{{indent(body)}\n}}\n"
+            for name, body in (self.modules or {}).items()
+        )
+
+    def bounds_of(self, bounded: "component.Component") -> bounding.Bounds:
+        """The bounds of a component, computed only once per emission
+
+        Args:
+            bounded: The component
+        """
+        if id(bounded) not in self._bounds:
+            self._bounds[id(bounded)] = bounded.bounds
+
+        return self._bounds[id(bounded)]
+
+
+_current: contextvars.ContextVar[typing.Optional[Emission]] = contextvars.ContextVar(
+    "emission", default=None
+)
+
+
+def current() -> Emission:
+    """The emission options currently in effect
+
+    Outside of any emission, these are the defaults; they're constructed anew
+    each time, so nothing memoized during one emission leaks into another.
+    """
+    options = _current.get()
+
+    if options is None:
+        return Emission()
+
+    return options
+
+
+@contextlib.contextmanager
+def emitting(options: Emission) -> typing.Iterator[Emission]:
+    """Put a set of emission options into effect for the duration of a context
+
+    Args:
+        options: The emission options
+
+    Yields:
+        The emission options
+    """
+    token = _current.set(options)
+
+    try:
+        yield options
+    finally:
+        _current.reset(token)
+
+
+@contextlib.contextmanager
+def configured(
+    root: "component.Component",
+    fn: int = None,
+    default_resolution: resolution.Resolution = None,
+    facet_budget: int = None,
+    prune: bool = False,
+    cache: FragmentCache = None,
+    optimize: bool = False,
+    modules: bool = True,
+) -> typing.Iterator[Emission]:
+    """Put emission options for a component tree into effect
+
+    Args:
+        root: The component at the root of the tree to be emitted
+        fn: The global number of fragments set in the emitted source's header
+        default_resolution: The resolution to use for components which don't
+            have one of their own
+        facet_budget: The total number of facets the emitted tree may have; if
+            provided, each curved primitive will be given a fragment override
+            fitting the budget
+        prune: Should composition operands which can't contribute to composed
+            bodies be left out? If so, they will be listed in the emission
+            options' `pruned` attribute as bodies are emitted
+        cache: Where to look up & store the rendered source of each
+            component's body, if anywhere
+        optimize: Should cached fragments (& module definitions) be optimized
+            before they're rendered?
+        modules: Should instances of template components be emitted as module
+            calls? If so, the modules' definitions are collected in the emission
+            options' `modules` attribute as bodies are emitted
+
+    Yields:
+        The emission options
+    """
+    with emitting(
+        Emission(
+            default_resolution=default_resolution,
+            fn=fn,
+            prune=prune,
+            cache=cache,
+            optimize=optimize,
+            modules={} if modules else None,
+        )
+    ) as options:
+        if facet_budget is not None:
+            options.fragments = resolution.budget(root, facet_budget)
+
+        yield options
@@ -0,0 +1,108 @@
+import typing
+
+import numpy
+
+from sccm import connector, vector
+from sccm.components import component
+
+# The largest angle, in degrees, between the axes of connectors considered to
+# be aligned (or anti-aligned)
+ANGULAR_TOLERANCE = 1e-6
+
+
+class Mate:
+    """A pair of coincident, axis-aligned anchors of different components"""
+
+    def __init__(
+        self,
+        first_component: component.Component,
+        first_anchor: str,
+        second_component: component.Component,
+        second_anchor: str,
+        opposed: bool,
+    ) -> None:
+        """
+        Args:
+            first_component: The component with one of the anchors
+            first_anchor: The name of the first component's anchor
+            second_component: The component with the other anchor
+            second_anchor: The name of the second component's anchor
+            opposed: Are the anchors' axes anti-aligned, i.e. do they face one
+                another, rather than pointing the same way?
+        """
+        self.first_component = first_component
+        self.first_anchor = first_anchor
+        self.second_component = second_component
+        self.second_anchor = second_anchor
+        self.opposed = opposed
+
+    @property
+    def connectors(self) -> typing.Tuple[connector.Connector, connector.Connector]:
+        """The mating anchors"""
+        return (
+            getattr(self.first_component, self.first_anchor),
+            getattr(self.second_component, self.second_anchor),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.first_component.__class__.__name__}.{self.first_anchor} "
+            f"{'<->' if self.opposed else '=='} "
+            f"{self.second_component.__class__.__name__}.{self.second_anchor}>"
+        )
+
+
+def mates(
+    root: component.Component,
+    tolerance: float = vector.EQUALITY_TOLERANCE,
+    angular_tolerance: float = ANGULAR_TOLERANCE,
+) -> typing.List[Mate]:
+    """Find every pair of mating anchors in a component tree
+
+    Every anchor of every component in the tree is indexed by its location, so
+    only anchors at the same point are compared, rather than every pair.
+
+    Args:
+        root: The component at the root of the tree
+        tolerance: The largest difference in any component of the points of
+            coincident anchors
+        angular_tolerance: The largest angle, in degrees, between the axes of
+            aligned (or anti-aligned) anchors
+
+    Returns:
+        The mates, ordered by the position of their anchors within the tree
+    """
+    owners: typing.List[typing.Tuple[component.Component, str]] = []
+    anchors: typing.List[connector.Connector] = []
+
+    for subtree_component in root.subtree:
+        for name, anchor in subtree_component.anchors.items():
+            owners.append((subtree_component, name))
+            anchors.append(anchor)
+
+    if not anchors:
+        return []
+
+    array = connector.ConnectorArray.from_connectors(anchors)
+
+    index: vector.SpatialHash[int] = vector.SpatialHash()
+    index.insert_many(array.points, range(len(anchors)))
+
+    pairs = numpy.array(
+        [
+            (first, second)
+            for first, second in index.coincident_pairs(tolerance)
+            if owners[first][0] is not owners[second][0]
+        ],
+        dtype=int,
+    ).reshape(-1, 2)
+
+    axes = array.axes
+    cosines = numpy.einsum("ij,ij->i", axes[pairs[:, 0]], axes[pairs[:, 1]])
+    threshold = numpy.cos(numpy.radians(angular_tolerance))
+
+    return [
+        Mate(*owners[first], *owners[second], opposed=bool(cosine < 0))
+        for (first, second), cosine in zip(pairs.tolist(), cosines)
+        if abs(cosine) >= threshold
+    ]
@@ -0,0 +1,251 @@
+import copy
+import typing
+
+import solid
+
+from sccm import affinables, traversal
+
+# Wrappers which apply the same affine transformation to all of their children;
+# since these transformations are bijective (for non-degenerate parameters), they
+# distribute over every CSG operation
+TRANSFORMATIONS = frozenset(
+    cls.__name__
+    for cls in (
+        solid.translate,
+        solid.rotate,
+        solid.scale,
+        solid.mirror,
+        solid.multmatrix,
+    )
+)
+
+COLOR = solid.color.__name__
+UNION = solid.union.__name__
+DIFFERENCE = solid.difference.__name__
+INTERSECTION = solid.intersection.__name__
+
+
+def _plain(node: solid.OpenSCADObject) -> bool:
+    """Can this node be freely restructured?
+
+    Nodes with modifiers (e.g. `%` or `#`), and those participating in
+    `SolidPython`'s hole & part mechanisms, are left as they are.
+
+    Args:
+        node: The node to check
+    """
+    return not (node.modifier or node.is_hole or node.is_part_root)
+
+
+def _same_wrapper(left: solid.OpenSCADObject, right: solid.OpenSCADObject) -> bool:
+    """Are two nodes the same, ignoring their children?
+
+    Args:
+        left: One of the nodes to compare
+        right: The other node to compare
+    """
+    return type(left) is type(right) and left.params == right.params
+
+
+def _rebuilt(
+    node: solid.OpenSCADObject, children: typing.List[solid.OpenSCADObject]
+) -> solid.OpenSCADObject:
+    """Construct a copy of a node with different children
+
+    Args:
+        node: The node to copy; this is not modified
+        children: The children the copy should have
+
+    Returns:
+        The copy
+    """
+    rebuilt_node = copy.copy(node)
+    rebuilt_node.params = dict(node.params)
+    rebuilt_node.parent = None
+    rebuilt_node.children = []
+
+    for child in children:
+        rebuilt_node.add(child)
+
+    return rebuilt_node
+
+
+def _hoistable(
+    children: typing.List[solid.OpenSCADObject], hoist_color: bool
+) -> typing.Optional[solid.OpenSCADObject]:
+    """Find a wrapper shared by all of a set of children, if any
+
+    Args:
+        children: The children to check
+        hoist_color: Can a shared color be hoisted?
+
+    Returns:
+        One of the shared wrappers, if the children all have one
+    """
+    if not children:
+        return None
+
+    first = children[0]
+    if (
+        first.name not in TRANSFORMATIONS and not (hoist_color and first.name == COLOR)
+    ) or len(first.children) != 1:
+        return None
+
+    if all(
+        _plain(child) and len(child.children) == 1 and _same_wrapper(child, first)
+        for child in children
+    ):
+        return first
+
+    return None
+
+
+def _flattened(
+    name: str, children: typing.List[solid.OpenSCADObject], leading_only: bool
+) -> typing.List[solid.OpenSCADObject]:
+    """Splice the children of nested operations of the same type into a parent
+
+    Args:
+        name: The name of the parent operation
+        children: The parent's children
+        leading_only: Should only the first child be spliced? This is the case
+            for differences, where only the first operand is added to
+
+    Returns:
+        The flattened children
+    """
+    flattened_children: typing.List[solid.OpenSCADObject] = []
+
+    for index, child in enumerate(children):
+        if (
+            child.name == name
+            and _plain(child)
+            and child.children
+            and (index == 0 or not leading_only)
+        ):
+            flattened_children.extend(child.children)
+        else:
+            flattened_children.append(child)
+
+    return flattened_children
+
+
+def _optimized_operation(
+    node: solid.OpenSCADObject, children: typing.List[solid.OpenSCADObject]
+) -> solid.OpenSCADObject:
+    """Optimize a CSG operation whose children have already been optimized
+
+    Args:
+        node: The operation
+        children: The operation's optimized children
+
+    Returns:
+        The optimized operation
+    """
+    if node.name == DIFFERENCE:
+        children = _flattened(DIFFERENCE, children, leading_only=True)
+    else:
+        children = _flattened(node.name, children, leading_only=False)
+
+    # An operation on a single operand is that operand
+    if len(children) == 1:
+        return children[0]
+
+    # Colors only distribute over unions; in a difference or intersection,
+    # each operand's color is visible on a different part of the result
+    wrapper = _hoistable(children, hoist_color=node.name == UNION)
+    if wrapper is None:
+        return _rebuilt(node, children)
+
+    # The shared wrapper is applied once, around the operation, instead
+    return _rebuilt(
+        wrapper,
+        [_optimized_operation(node, [child.children[0] for child in children])],
+    )
+
+
+def _merged_transformations(
+    outer: solid.OpenSCADObject, inner: solid.OpenSCADObject
+) -> typing.Optional[solid.OpenSCADObject]:
+    """Merge a transformation applied to a single transformation into one
+
+    Translations merge into a single translation; any other pair into a
+    transformation matrix.
+
+    Args:
+        outer: The transformation applied to the other; this is not modified
+        inner: The transformation applied first; this is not modified
+
+    Returns:
+        The merged transformation, applied to the inner one's children, if both
+        transformations' parameters are numeric
+    """
+    try:
+        merged = affinables.matrix(outer) @ affinables.matrix(inner)
+    except (NotImplementedError, TypeError, ValueError):
+        # Parameters given as `OpenSCAD` expressions can't be evaluated here
+        return None
+
+    if outer.name == inner.name == solid.translate.__name__:
+        return _rebuilt(solid.translate(merged[:3, 3].tolist()), inner.children)
+
+    return _rebuilt(solid.multmatrix(merged.tolist()), inner.children)
+
+
+def _optimization(
+    node: solid.OpenSCADObject,
+) -> traversal.Evaluation[solid.OpenSCADObject, solid.OpenSCADObject]:
+    """Optimize a node & its children, as a step of the evaluation of `optimize`
+
+    Args:
+        node: The node to optimize; this is not modified
+
+    Yields:
+        Each of the node's children, whose optimized forms must be sent back
+
+    Returns:
+        The optimized node
+    """
+    children = []
+    for child in node.children:
+        children.append((yield child))
+
+    if _plain(node) and node.name in (UNION, DIFFERENCE, INTERSECTION) and children:
+        return _optimized_operation(node, children)
+
+    # Chains of transformations (e.g. from deeply nested components) are merged
+    # as they're found, so the optimized tree is no deeper than its geometry
+    if (
+        _plain(node)
+        and node.name in TRANSFORMATIONS
+        and len(children) == 1
+        and _plain(children[0])
+        and children[0].name in TRANSFORMATIONS
+    ):
+        merged = _merged_transformations(node, children[0])
+        if merged is not None:
+            return merged
+
+    return _rebuilt(node, children)
+
+
+def optimize(tree: solid.OpenSCADObject) -> solid.OpenSCADObject:
+    """Restructure an `OpenSCAD` tree so it's quicker to evaluate
+
+    The optimized tree is geometrically identical, but shallower:
+        * nested unions (& intersections) are flattened into single operations
+        * chained differences are merged into a single difference, subtracting
+          every operand from the first
+        * operations on a single operand are replaced by that operand
+        * transformations applied directly to other transformations are merged
+        * transformations shared by every operand of an operation (& colors
+          shared by every operand of a union) are applied once, around the
+          operation
+
+    Args:
+        tree: The root of the tree to optimize; this is not modified
+
+    Returns:
+        The root of the optimized tree
+    """
+    return traversal.evaluate(tree, _optimization)
@@ -0,0 +1,416 @@
+import abc
+import typing
+
+from sccm import affinables, connector
+from sccm.components import component
+
+
+class CyclicDependency(Exception):
+    """Raised when a node's value depends on itself"""
+
+    def __init__(self, node: "Node") -> None:
+        """
+        Args:
+            node: The node whose value depends on itself
+        """
+        self.node = node
+
+
+class Node(abc.ABC):
+    """A value in a parametric model
+
+    Nodes' values are computed from those of the nodes they depend on, & are
+    only recomputed when one of those changes.
+    """
+
+    def __init__(self, *inputs: "Node") -> None:
+        """
+        Args:
+            inputs: The nodes this node's value is computed from
+        """
+        self.inputs = inputs
+
+        self._dependents: typing.List["Node"] = []
+        self._stale = True
+        self._computing = False
+        self._value: typing.Any = None
+
+        for node_input in inputs:
+            node_input._dependents.append(self)
+
+    @abc.abstractmethod
+    def _compute(self) -> typing.Any:
+        """Compute this node's value from those of its inputs"""
+
+    @property
+    def value(self) -> typing.Any:
+        """The node's value, recomputed only if its inputs have changed
+
+        Raises:
+            CyclicDependency: If the value depends on itself
+        """
+        if self._stale:
+            if self._computing:
+                raise CyclicDependency(self)
+
+            self._computing = True
+            try:
+                self._value = self._compute()
+            finally:
+                self._computing = False
+
+            self._stale = False
+
+        return self._value
+
+    def _affected(self) -> typing.List["Node"]:
+        """The nodes directly affected by changes to this node's value"""
+        return self._dependents
+
+    def _invalidate_dependents(self) -> None:
+        """Mark everything depending on this node as needing recomputation"""
+        stack = list(self._dependents)
+        seen: typing.Set[int] = set()
+
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+
+            seen.add(id(node))
+            node._stale = True
+            stack.extend(node._dependents)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: {self._value!r}{'*' if self._stale else ''}>"
+        )
+
+
+def _propagate(changed: Node) -> None:
+    """Re-apply the effects affected by a changed node, in dependency order
+
+    Everything affected by the node, including through the components changed
+    by effects, is marked stale & sorted topologically, so each effect is
+    re-applied once, after every effect it depends on. An effect's changes to
+    its own target don't affect it, even if it depends on (e.g.) its target's
+    anchors.
+
+    Args:
+        changed: The node which changed
+
+    Raises:
+        CyclicDependency: If an effect depends on its own changes, through
+            other effects
+    """
+    # Each node on the path being followed, with the nodes it affects that are
+    # yet to be followed & the number of effects on the path up to it
+    stack: typing.List[typing.Tuple[Node, typing.Iterator[Node], int]] = [
+        (changed, iter(changed._affected()), int(isinstance(changed, Effect)))
+    ]
+    # The depth of each node on the path, by the node's `id`
+    depths: typing.Dict[int, int] = {id(changed): 0}
+    visited: typing.Set[int] = {id(changed)}
+    postorder: typing.List[Node] = []
+
+    while stack:
+        node, affected, effects = stack[-1]
+
+        for affected_node in affected:
+            depth = depths.get(id(affected_node))
+            if depth is not None:
+                # A cycle through a single effect is only its own changes to its
+                # target affecting it
+                first_node, _, first_effects = stack[depth]
+                if effects - first_effects + isinstance(first_node, Effect) > 1:
+                    raise CyclicDependency(affected_node)
+                continue
+
+            if id(affected_node) not in visited:
+                visited.add(id(affected_node))
+                depths[id(affected_node)] = len(stack)
+                affected_node._stale = True
+
+                stack.append(
+                    (
+                        affected_node,
+                        iter(affected_node._affected()),
+                        effects + isinstance(affected_node, Effect),
+                    )
+                )
+                break
+        else:
+            stack.pop()
+            del depths[id(node)]
+            postorder.append(node)
+
+    # The changed node itself is last in postorder
+    for node in reversed(postorder[:-1]):
+        if isinstance(node, Effect):
+            node._apply()
+
+
+class Parameter(Node):
+    """An independent value, such as a dimension, which can be changed"""
+
+    def __init__(self, value: typing.Any) -> None:
+        """
+        Args:
+            value: The initial value
+        """
+        super().__init__()
+
+        self._value = value
+        self._stale = False
+
+    def _compute(self) -> typing.Any:
+        return self._value
+
+    @property
+    def value(self) -> typing.Any:
+        return self._value
+
+    @value.setter
+    def value(self, value: typing.Any) -> None:
+        """Change the parameter, updating everything depending on it
+
+        Args:
+            value: The new value
+        """
+        if value is self._value:
+            return
+
+        self._value = value
+        _propagate(self)
+
+
+class Derived(Node):
+    """A value computed from other nodes' values"""
+
+    def __init__(
+        self, function: typing.Callable[..., typing.Any], *inputs: Node
+    ) -> None:
+        """
+        Args:
+            function: Computes the value, given the values of the inputs, in
+                order
+            inputs: The nodes the value is computed from
+        """
+        super().__init__(*inputs)
+
+        self.function = function
+
+    def _compute(self) -> typing.Any:
+        return self.function(*(node_input.value for node_input in self.inputs))
+
+
+class ComponentState(Node):
+    """A component, as it's changed by effects in a parametric model
+
+    Its value is the component itself; nodes depending on the component's
+    parameters or placement (e.g. its anchors) should depend on this. Changes
+    to a component's placement also affect those depending on its children,
+    at whatever depth.
+    """
+
+    def __init__(self, stateful_component: component.Component) -> None:
+        """
+        Args:
+            stateful_component: The component
+        """
+        super().__init__()
+
+        self.component = stateful_component
+        self._value = stateful_component
+        self._stale = False
+
+    @classmethod
+    def of(cls, stateful_component: component.Component) -> "ComponentState":
+        """The state node of a component, created if necessary
+
+        Args:
+            stateful_component: The component
+        """
+        state = stateful_component._parametric_state
+
+        if state is None:
+            state = cls(stateful_component)
+            # The component keeps its state node alive, with the effects
+            # depending on it, for as long as the component exists itself
+            stateful_component._parametric_state = state
+
+        return state
+
+    def _compute(self) -> component.Component:
+        return self.component
+
+
+class Effect(Node):
+    """A change to a component, re-applied whenever its inputs change"""
+
+    def __init__(self, target: component.Component, *inputs: Node) -> None:
+        """
+        Args:
+            target: The component to change
+            inputs: The nodes the change is computed from
+        """
+        super().__init__(*inputs)
+
+        self.target = target
+
+        # Effects are applied as soon as they're created
+        self._apply()
+        _propagate(self)
+
+    def _target_states(self) -> typing.List[ComponentState]:
+        """The state nodes of the target component & its children, at any depth"""
+        states = []
+        stack = [self.target]
+
+        while stack:
+            changed_component = stack.pop()
+
+            if changed_component._parametric_state is not None:
+                states.append(changed_component._parametric_state)
+
+            stack.extend(changed_component.children)
+
+        return states
+
+    def _affected(self) -> typing.List[Node]:
+        return [*self._dependents, *self._target_states()]
+
+    def _invalidate_target(self) -> None:
+        """Mark everything depending on the target component as stale
+
+        This includes everything depending on the target's children, which
+        inherit its transformations.
+        """
+        for state in self._target_states():
+            state._invalidate_dependents()
+
+    def _apply(self) -> None:
+        """Apply the effect to its target component"""
+        self._stale = True
+        self.value
+
+        self._invalidate_target()
+        # An effect's own changes to its target don't affect it, even if it
+        # depends on (e.g.) its target's anchors
+        self._stale = False
+
+
+class Binding(Effect):
+    """An attribute of a component, set to the value of a node"""
+
+    def __init__(
+        self, target: component.Component, attribute: str, source: Node
+    ) -> None:
+        """
+        Args:
+            target: The component to change
+            attribute: The name of the attribute to set, e.g. `height`
+            source: The node whose value the attribute is set to
+        """
+        self.attribute = attribute
+
+        super().__init__(target, source)
+
+    def _compute(self) -> typing.Any:
+        value = self.inputs[0].value
+        setattr(self.target, self.attribute, value)
+
+        return value
+
+
+class Placement(Effect):
+    """Transformations of a component, computed from the values of nodes"""
+
+    def __init__(
+        self,
+        target: component.Component,
+        function: typing.Callable[
+            ..., typing.Iterable[affinables.AffineTransformation]
+        ],
+        *inputs: Node,
+    ) -> None:
+        """
+        Args:
+            target: The component to transform
+            function: Computes the transformations, given the values of the
+                inputs, in order
+            inputs: The nodes the transformations are computed from
+        """
+        self.function = function
+        self._transformations: typing.List[affinables.AffineTransformation] = []
+
+        super().__init__(target, *inputs)
+
+    def _compute(self) -> typing.List[affinables.AffineTransformation]:
+        position = self.target.remove_transformations(self._transformations)
+
+        # The transformations are computed as though they'd never been applied
+        self._invalidate_target()
+
+        self._transformations = list(
+            self.function(*(node_input.value for node_input in self.inputs))
+        )
+        self.target.insert_transformations(position, self._transformations)
+
+        return self._transformations
+
+
+def state(stateful_component: component.Component) -> ComponentState:
+    """The node of a component, as changed by effects in a parametric model
+
+    Args:
+        stateful_component: The component
+    """
+    return ComponentState.of(stateful_component)
+
+
+def anchor(anchored_component: component.Component, name: str) -> Derived:
+    """A node for one of a component's anchors
+
+    The anchor is recomputed when the component's (or its parents') bound
+    parameters or placements change.
+
+    Args:
+        anchored_component: The component
+        name: The name of the anchor, e.g. `top_anchor`
+    """
+
+    def anchor_of(stateful_component: component.Component) -> connector.Connector:
+        return getattr(stateful_component, name)
+
+    return Derived(anchor_of, state(anchored_component))
+
+
+def bind(target: component.Component, attribute: str, source: Node) -> Binding:
+    """Keep an attribute of a component set to the value of a node
+
+    Args:
+        target: The component to change
+        attribute: The name of the attribute to set, e.g. `height`
+        source: The node whose value the attribute is set to
+    """
+    return Binding(target, attribute, source)
+
+
+def place(
+    target: component.Component,
+    function: typing.Callable[..., typing.Iterable[affinables.AffineTransformation]],
+    *inputs: Node,
+) -> Placement:
+    """Keep a component transformed as computed from the values of nodes
+
+    The transformations are applied when this is called & replaced (in place)
+    whenever any of the inputs change.
+
+    Args:
+        target: The component to transform
+        function: Computes the transformations, given the values of the inputs,
+            in order
+        inputs: The nodes the transformations are computed from
+    """
+    return Placement(target, function, *inputs)
@@ -0,0 +1,228 @@
+import math
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from sccm.components import component
+
+# `OpenSCAD`'s defaults for the special circle-approximation variables
+DEFAULT_FA = 12.0
+DEFAULT_FS = 2.0
+
+# `OpenSCAD` never approximates a circle with fewer fragments than this unless
+# `$fn` is set explicitly
+MINIMUM_FRAGMENTS = 5
+
+# Radii below this are rendered by `OpenSCAD` as triangles
+GRID_FINE = 0.00000095367431640625
+
+# The parameters which set the special circle-approximation variables on an
+# `OpenSCAD` object
+ResolutionParameters = typing.Dict[str, float]
+
+
+class Resolution:
+    """Controls for how finely curved surfaces are approximated
+
+    These correspond to `OpenSCAD`'s special `$fn`, `$fa` & `$fs` variables; any
+    left unset will not be emitted, so `OpenSCAD`'s global values will apply.
+    """
+
+    def __init__(self, fn: int = None, fa: float = None, fs: float = None) -> None:
+        """
+        Args:
+            fn: The fixed number of fragments to use for every circle
+            fa: The minimum angle, in degrees, subtended by a fragment
+            fs: The minimum length of a fragment
+        """
+        self.fn = fn
+        self.fa = fa
+        self.fs = fs
+
+    def fragments(self, radius: float) -> int:
+        """The number of fragments a circle will be approximated with
+
+        This mirrors `OpenSCAD`'s own fragment calculation.
+
+        Args:
+            radius: The world-space radius of the circle
+        """
+        if radius < GRID_FINE:
+            return 3
+
+        if self.fn:
+            return max(self.fn, 3)
+
+        fa = self.fa if self.fa is not None else DEFAULT_FA
+        fs = self.fs if self.fs is not None else DEFAULT_FS
+
+        return int(
+            math.ceil(
+                max(min(360.0 / fa, radius * 2 * math.pi / fs), MINIMUM_FRAGMENTS)
+            )
+        )
+
+    def parameters(self, radius: float) -> ResolutionParameters:
+        """The special variables to set on a curved primitive
+
+        Args:
+            radius: The world-space radius of the primitive's largest circle
+        """
+        return {
+            name: value
+            for name, value in (("$fn", self.fn), ("$fa", self.fa), ("$fs", self.fs))
+            if value is not None
+        }
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            type(self) is type(other)
+            and isinstance(other, Resolution)
+            and (self.fn, self.fa, self.fs) == (other.fn, other.fa, other.fs)
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(fn={self.fn}, fa={self.fa}, fs={self.fs})"
+
+
+class ChordErrorResolution(Resolution):
+    """A resolution derived from each primitive's size & a target chord error
+
+    The chord error (or sagitta) is the largest distance between a true circle
+    and the polygon approximating it; holding it constant gives small features
+    few fragments and large features many.
+    """
+
+    def __init__(
+        self,
+        tolerance: float,
+        minimum_fragments: int = MINIMUM_FRAGMENTS,
+        maximum_fragments: int = None,
+    ) -> None:
+        """
+        Args:
+            tolerance: The largest acceptable world-space chord error
+            minimum_fragments: The fewest fragments any circle may have
+            maximum_fragments: The most fragments any circle may have, if
+                limited
+        """
+        super().__init__()
+
+        self.tolerance = tolerance
+        self.minimum_fragments = minimum_fragments
+        self.maximum_fragments = maximum_fragments
+
+    def fragments(self, radius: float) -> int:
+        """The fewest fragments keeping the chord error within tolerance
+
+        Args:
+            radius: The world-space radius of the circle
+        """
+        if radius <= self.tolerance / 2.0:
+            fragments = self.minimum_fragments
+        else:
+            fragments = int(
+                math.ceil(math.pi / math.acos(1.0 - self.tolerance / radius))
+            )
+
+        fragments = max(fragments, self.minimum_fragments)
+        if self.maximum_fragments is not None:
+            fragments = min(fragments, self.maximum_fragments)
+
+        return fragments
+
+    def parameters(self, radius: float) -> ResolutionParameters:
+        return {"$fn": self.fragments(radius)}
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ChordErrorResolution)
+            and self.tolerance == other.tolerance
+            and self.minimum_fragments == other.minimum_fragments
+            and self.maximum_fragments == other.maximum_fragments
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(tolerance={self.tolerance}, "
+            f"minimum_fragments={self.minimum_fragments}, "
+            f"maximum_fragments={self.maximum_fragments})"
+        )
+
+
+def budget(
+    root: "component.Component",
+    facets: int,
+    minimum_fragments: int = MINIMUM_FRAGMENTS,
+) -> typing.Dict[int, int]:
+    """Fit the curved primitives of an assembly within a total facet budget
+
+    Every adjustable primitive's desired fragment count (as set by its
+    effective resolution) is scaled down by the same factor until the total
+    estimated facet count fits; primitives with fixed faceting (e.g. frustums
+    with explicit segments) count against the budget but are not adjusted.
+    Instances' templates count once for each placement of them.
+
+    Args:
+        root: The component at the root of the assembly
+        facets: The total number of facets the assembly may have
+        minimum_fragments: The fewest fragments any circle may be reduced to
+
+    Returns:
+        The fragment count for each adjustable primitive, keyed by the `id` of
+        that primitive; these are suitable for use as emission overrides
+    """
+    # Instances are components themselves, so can't be imported up front
+    from sccm.components import instance
+
+    # Templates are emitted once, but rendered at every placement, so each of
+    # their primitives counts against the budget once per placement
+    placements: typing.Dict[int, typing.Tuple["component.Component", int]] = {}
+    trees: typing.List[typing.Tuple["component.Component", int]] = [(root, 1)]
+    while trees:
+        tree, count = trees.pop()
+
+        for descendant in tree.subtree:
+            _, placed = placements.get(id(descendant), (descendant, 0))
+            placements[id(descendant)] = (descendant, placed + count)
+
+            if isinstance(descendant, instance.Instance):
+                trees.append((descendant.template, count * descendant.count))
+
+    desired: typing.Dict[int, typing.Tuple["component.Component", int, int]] = {}
+    fixed_facets = 0
+
+    for key, (descendant, placed) in placements.items():
+        fragments = descendant.fragments
+
+        if fragments is None:
+            fixed_facets += placed * descendant.facets(None)
+        else:
+            desired[key] = (descendant, fragments, placed)
+
+    def fit(factor: float) -> typing.Dict[int, int]:
+        return {
+            key: min(fragments, max(int(fragments * factor), minimum_fragments))
+            for key, (_, fragments, _) in desired.items()
+        }
+
+    def total(fragments: typing.Dict[int, int]) -> int:
+        return fixed_facets + sum(
+            placed * primitive.facets(fragments[key])
+            for key, (primitive, _, placed) in desired.items()
+        )
+
+    fitted = fit(1.0)
+    if total(fitted) <= facets:
+        return fitted
+
+    # The total is monotonic in the factor, so bisect for the largest factor
+    # which fits
+    low, high = 0.0, 1.0
+    for _ in range(48):
+        middle = (low + high) / 2.0
+        if total(fit(middle)) <= facets:
+            low = middle
+        else:
+            high = middle
+
+    return fit(low)
@@ -0,0 +1,1037 @@
+import typing
+
+import numpy
+import solid
+
+from sccm import affinables, bounding
+from sccm.components import component, frustum, sphere
+
+# The type codes of the nodes in a scene
+GROUP = 0
+SPHERE = 1
+FRUSTUM = 2
+
+# The type codes of the compositions in a scene, indexing `COMPOSITIONS`
+UNION = 0
+DIFFERENCE = 1
+INTERSECTION = 2
+COMPOSITIONS = (solid.union, solid.difference, solid.intersection)
+
+# The number of parameter columns; each type of node uses the first few:
+# spheres their diameter, & frustums their bottom & top diameters, height &
+# whether they're centered
+PARAMETERS = 4
+
+# The `_body` each type of component must have to be stored in a scene, with
+# the type code it's stored as
+_BODIES = (
+    (component.Component._body, GROUP),
+    (sphere.Sphere._body, SPHERE),
+    (frustum.Frustum._body, FRUSTUM),
+)
+
+
+class UnsupportedComponent(Exception):
+    """Raised when a component can't be stored in a scene"""
+
+    def __init__(self, unsupported_component: component.Component) -> None:
+        """
+        Args:
+            unsupported_component: The component, whose body isn't a group or
+                one of the primitives scenes can store
+        """
+        self.component = unsupported_component
+
+
+class InvalidOperand(Exception):
+    """Raised when composing a node with one which isn't its child"""
+
+    def __init__(self, owner: int, operand: int) -> None:
+        """
+        Args:
+            owner: The index of the node being composed
+            operand: The index of the operand
+        """
+        self.owner = owner
+        self.operand = operand
+
+
+class SceneNode:
+    """A handle on one of the nodes of a scene
+
+    Handles hold nothing but the scene & the node's index, so are created
+    whenever they're asked for; any number may refer to the same node.
+    """
+
+    __slots__ = ("scene", "index")
+
+    def __init__(self, scene: "Scene", index: int) -> None:
+        """
+        Args:
+            scene: The scene the node is part of
+            index: The node's index in the scene
+        """
+        self.scene = scene
+        self.index = index
+
+    @property
+    def kind(self) -> int:
+        """The type code of the node, e.g. `SPHERE`"""
+        return int(self.scene.kinds[self.index])
+
+    @property
+    def parameters(self) -> numpy.ndarray:
+        """The node's parameters; see `PARAMETERS` for their meanings"""
+        return self.scene.parameters[self.index]
+
+    @property
+    def parent(self) -> typing.Optional["SceneNode"]:
+        """The node's parent, if any"""
+        parent = self.scene.parents[self.index]
+
+        return SceneNode(self.scene, int(parent)) if parent >= 0 else None
+
+    @property
+    def children(self) -> typing.List["SceneNode"]:
+        """The node's children, in the order they were added"""
+        return [
+            SceneNode(self.scene, int(child))
+            for child in self.scene.children_of(self.index)
+        ]
+
+    @property
+    def matrix(self) -> numpy.ndarray:
+        """The 4x4 homogeneous matrix of the node's own transformations"""
+        return self.scene.matrices[self.index]
+
+    @matrix.setter
+    def matrix(self, matrix: numpy.ndarray) -> None:
+        """Replace the node's own transformations
+
+        Args:
+            matrix: The 4x4 homogeneous matrix of the new transformations
+        """
+        self.scene.matrices[self.index] = matrix
+        self.scene._changed()
+
+    @property
+    def world_matrix(self) -> numpy.ndarray:
+        """The 4x4 homogeneous matrix of all of the node's transformations"""
+        return self.scene.world_matrices[self.index]
+
+    @property
+    def color(self) -> typing.Optional[component.Color]:
+        """The node's color, if any"""
+        color = self.scene.colors[self.index]
+
+        return tuple(color.tolist()) if not numpy.isnan(color[0]) else None
+
+    @color.setter
+    def color(self, color: typing.Optional[component.Color]) -> None:
+        """Set the node's color
+
+        Args:
+            color: The new color, if any
+        """
+        self.scene.colors[self.index] = _color_row(color)
+        self.scene._changed()
+
+    @property
+    def bounds(self) -> bounding.Bounds:
+        """The world-space bounds of the node's body, as `Component.bounds`"""
+        minimums, maximums = self.scene.bounds
+
+        return bounding.Bounds(minimums[self.index], maximums[self.index])
+
+    def transform(self, transformation: affinables.AffineTransformation) -> "SceneNode":
+        """Apply a transformation to the node, after its existing ones
+
+        Args:
+            transformation: The transformation to apply
+
+        Returns:
+            This node
+        """
+        self.matrix = affinables.matrix(transformation) @ self.matrix
+
+        return self
+
+    def to_component(self) -> component.Component:
+        """Construct a standalone component equivalent to this node's subtree"""
+        return self.scene.to_component(self.index)
+
+    def __eq__(self, other: object) -> bool:
+        """Is this a handle on the same node as another?
+
+        Args:
+            other: The other handle
+
+        Raises:
+            NotImplementedError: If the other object is not a handle
+        """
+        if not isinstance(other, SceneNode):
+            raise NotImplementedError
+
+        return self.scene is other.scene and self.index == other.index
+
+    def __repr__(self) -> str:
+        return f"<SceneNode {self.index}: {self.kind}>"
+
+
+def _color_row(color: typing.Optional[component.Color]) -> typing.List[float]:
+    """A color, as stored in a scene
+
+    Args:
+        color: The color, if any; missing alpha channels are opaque
+    """
+    if color is None:
+        return [numpy.nan] * 4
+
+    return list(color) + [1.0] * (4 - len(color))
+
+
+# `OpenSCAD` source for a transformed primitive, given the 16 elements of its
+# matrix, row by row, & the primitive
+_TRANSFORMED = (
+    "multmatrix(m = [[{!r}, {!r}, {!r}, {!r}], [{!r}, {!r}, {!r}, {!r}], "
+    "[{!r}, {!r}, {!r}, {!r}], [{!r}, {!r}, {!r}, {!r}]]) {}"
+)
+
+
+class Scene:
+    """A compact, columnar store of a very large assembly
+
+    Rather than being objects of their own, the assembly's parts are rows of
+    arrays: their parents, type codes, parameters, transformation matrices &
+    colors. Compositions are stored the same way, & each node records the
+    composition (if any) it's an operand of. Handles on nodes are created on
+    demand, & world matrices, bounds, spatial queries & rendering are all
+    computed directly from the arrays.
+
+    Every node's parent is added before it, & composition operands are always
+    children of the nodes they're composed with.
+
+    Note:
+        Scenes don't store resolutions; curved primitives are emitted with
+        the global settings
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """
+        Args:
+            capacity: The number of nodes to allocate space for; the arrays
+                grow as necessary
+        """
+        self._size = 0
+        self._parents = numpy.empty(capacity, dtype=numpy.int64)
+        self._kinds = numpy.empty(capacity, dtype=numpy.int8)
+        self._parameters = numpy.empty((capacity, PARAMETERS))
+        self._segments = numpy.empty(capacity, dtype=numpy.int32)
+        self._matrices = numpy.empty((capacity, 4, 4))
+        self._colors = numpy.empty((capacity, 4))
+        self._operand_of = numpy.empty(capacity, dtype=numpy.int64)
+
+        self._composition_count = 0
+        self._composition_owners = numpy.empty(capacity, dtype=numpy.int64)
+        self._composition_kinds = numpy.empty(capacity, dtype=numpy.int8)
+
+        # Arrays derived from the others, computed on demand
+        self._derived: typing.Dict[str, typing.Any] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> SceneNode:
+        """A handle on one of the scene's nodes
+
+        Args:
+            index: The node's index
+
+        Raises:
+            IndexError: If there's no such node
+        """
+        if not -self._size <= index < self._size:
+            raise IndexError(index)
+
+        return SceneNode(self, index % self._size)
+
+    @property
+    def parents(self) -> numpy.ndarray:
+        """The index of each node's parent, or -1 for nodes without one"""
+        return self._parents[: self._size]
+
+    @property
+    def kinds(self) -> numpy.ndarray:
+        """The type code of each node"""
+        return self._kinds[: self._size]
+
+    @property
+    def parameters(self) -> numpy.ndarray:
+        """The Nx`PARAMETERS` array of each node's parameters"""
+        return self._parameters[: self._size]
+
+    @property
+    def segments(self) -> numpy.ndarray:
+        """The explicit number of segments of each frustum, or 0 for none"""
+        return self._segments[: self._size]
+
+    @property
+    def matrices(self) -> numpy.ndarray:
+        """The Nx4x4 homogeneous matrices of each node's own transformations"""
+        return self._matrices[: self._size]
+
+    @property
+    def colors(self) -> numpy.ndarray:
+        """The Nx4 RGBA colors of each node, or NaN for uncolored nodes"""
+        return self._colors[: self._size]
+
+    @property
+    def operand_of(self) -> numpy.ndarray:
+        """The index of the composition each node is an operand of, or -1"""
+        return self._operand_of[: self._size]
+
+    @property
+    def composition_owners(self) -> numpy.ndarray:
+        """The index of the node each composition is part of"""
+        return self._composition_owners[: self._composition_count]
+
+    @property
+    def composition_kinds(self) -> numpy.ndarray:
+        """The type code of each composition"""
+        return self._composition_kinds[: self._composition_count]
+
+    def _changed(self) -> None:
+        """Discard everything derived from the scene's arrays"""
+        self._derived.clear()
+
+    def _reserve(self, count: int) -> None:
+        """Make room for more nodes
+
+        Args:
+            count: The number of nodes to make room for
+        """
+        required = self._size + count
+        capacity = len(self._parents)
+        if required <= capacity:
+            return
+
+        capacity = max(required, 2 * capacity)
+        for name in (
+            "_parents",
+            "_kinds",
+            "_parameters",
+            "_segments",
+            "_matrices",
+            "_colors",
+            "_operand_of",
+        ):
+            column = getattr(self, name)
+            grown = numpy.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            setattr(self, name, grown)
+
+    def add_many(
+        self,
+        kind: int,
+        parameters: numpy.ndarray,
+        parents: typing.Union[int, numpy.ndarray] = -1,
+        matrices: numpy.ndarray = None,
+        color: component.Color = None,
+        segments: int = None,
+    ) -> numpy.ndarray:
+        """Add many nodes of the same type at once
+
+        Args:
+            kind: The type code of the nodes, e.g. `SPHERE`
+            parameters: The MxK array of each node's first K parameters
+            parents: The index of the nodes' parent, or of each node's parent;
+                -1 for none
+            matrices: The Mx4x4 homogeneous matrices of each node's own
+                transformations, if any
+            color: The color of the nodes, if any
+            segments: The explicit number of segments of frustums, if any
+
+        Returns:
+            The indices of the new nodes
+
+        Raises:
+            IndexError: If a parent isn't already in the scene
+        """
+        parameters = numpy.atleast_2d(numpy.asarray(parameters, dtype=float))
+        count = len(parameters)
+        parents = numpy.broadcast_to(numpy.asarray(parents, dtype=numpy.int64), count)
+        if numpy.any(parents >= self._size):
+            raise IndexError(int(parents.max()))
+
+        self._reserve(count)
+        indices = numpy.arange(self._size, self._size + count)
+
+        self._parents[indices] = parents
+        self._kinds[indices] = kind
+        self._parameters[indices] = 0.0
+        self._parameters[indices, : parameters.shape[1]] = parameters
+        self._segments[indices] = segments or 0
+        self._matrices[indices] = numpy.identity(4) if matrices is None else matrices
+        self._colors[indices] = _color_row(color)
+        self._operand_of[indices] = -1
+
+        self._size += count
+        self._changed()
+
+        return indices
+
+    def add(
+        self,
+        kind: int,
+        parameters: typing.Sequence[float] = (),
+        parent: int = -1,
+        matrix: numpy.ndarray = None,
+        color: component.Color = None,
+        segments: int = None,
+    ) -> int:
+        """Add a node
+
+        Args:
+            kind: The type code of the node, e.g. `SPHERE`
+            parameters: The node's first few parameters
+            parent: The index of the node's parent, or -1 for none
+            matrix: The 4x4 homogeneous matrix of the node's own
+                transformations, if any
+            color: The node's color, if any
+            segments: The explicit number of segments of a frustum, if any
+
+        Returns:
+            The index of the new node
+        """
+        return int(
+            self.add_many(
+                kind,
+                [list(parameters) or [0.0]],
+                parent,
+                None if matrix is None else matrix[numpy.newaxis],
+                color,
+                segments,
+            )[0]
+        )
+
+    def add_group(
+        self,
+        parent: int = -1,
+        matrix: numpy.ndarray = None,
+        color: component.Color = None,
+    ) -> int:
+        """Add a node without a body of its own, like a bare `Component`
+
+        Args:
+            parent: The index of the node's parent, or -1 for none
+            matrix: The 4x4 homogeneous matrix of the node's own
+                transformations, if any
+            color: The node's color, if any
+
+        Returns:
+            The index of the new node
+        """
+        return self.add(GROUP, (), parent, matrix, color)
+
+    def add_sphere(
+        self,
+        diameter: float,
+        parent: int = -1,
+        matrix: numpy.ndarray = None,
+        color: component.Color = None,
+    ) -> int:
+        """Add a sphere, like a `Sphere`
+
+        Args:
+            diameter: The sphere's diameter
+            parent: The index of the node's parent, or -1 for none
+            matrix: The 4x4 homogeneous matrix of the node's own
+                transformations, if any
+            color: The node's color, if any
+
+        Returns:
+            The index of the new node
+        """
+        return self.add(SPHERE, (diameter,), parent, matrix, color)
+
+    def add_frustum(
+        self,
+        bottom_diameter: float,
+        height: float,
+        top_diameter: float = None,
+        center: bool = False,
+        segments: int = None,
+        parent: int = -1,
+        matrix: numpy.ndarray = None,
+        color: component.Color = None,
+    ) -> int:
+        """Add a frustum, like a `Frustum` (or a `Cylinder` or `Cone`)
+
+        Args:
+            bottom_diameter: The diameter of the circle circumscribing the
+                bottom face
+            height: The frustum's height
+            top_diameter: The diameter of the circle circumscribing the top
+                face; if not provided, it's the same as the bottom diameter
+            center: Whether or not to "center" the frustum's height on the
+                origin
+            segments: The number of segments the top & bottom faces should
+                have, if not approximating circles
+            parent: The index of the node's parent, or -1 for none
+            matrix: The 4x4 homogeneous matrix of the node's own
+                transformations, if any
+            color: The node's color, if any
+
+        Returns:
+            The index of the new node
+        """
+        return self.add(
+            FRUSTUM,
+            (
+                bottom_diameter,
+                top_diameter if top_diameter is not None else bottom_diameter,
+                height,
+                float(center),
+            ),
+            parent,
+            matrix,
+            color,
+            segments,
+        )
+
+    def compose(self, owner: int, kind: int, operands: typing.Sequence[int]) -> int:
+        """Compose a node with some of its children, like `Component.compose`
+
+        The operands are composed in the order of their indices.
+
+        Args:
+            owner: The index of the node to compose
+            kind: The type code of the composition, e.g. `DIFFERENCE`
+            operands: The indices of the operands
+
+        Returns:
+            The index of the composition
+
+        Raises:
+            InvalidOperand: If an operand isn't one of the owner's children, or
+                is already an operand of another composition
+        """
+        operands = numpy.asarray(operands, dtype=numpy.int64)
+        for operand in operands:
+            if self.parents[operand] != owner or self.operand_of[operand] >= 0:
+                raise InvalidOperand(owner, int(operand))
+
+        index = self._composition_count
+        capacity = len(self._composition_owners)
+        if index == capacity:
+            for name in ("_composition_owners", "_composition_kinds"):
+                column = getattr(self, name)
+                grown = numpy.empty(2 * capacity + 1, dtype=column.dtype)
+                grown[:index] = column
+                setattr(self, name, grown)
+
+        self._composition_owners[index] = owner
+        self._composition_kinds[index] = kind
+        self._composition_count += 1
+        self.operand_of[operands] = index
+
+        self._changed()
+
+        return index
+
+    @classmethod
+    def from_component(cls, root: component.Component) -> "Scene":
+        """Construct a scene equivalent to a component & everything it embodies
+
+        Composition operands which aren't children of the component they're
+        composed with are stored as its children, transformed to stay in place.
+
+        Args:
+            root: The component
+
+        Raises:
+            UnsupportedComponent: If any of the components embodied can't be
+                stored in a scene
+        """
+        scene = cls()
+
+        # Components to add, with their parents' indices, the compositions
+        # they're operands of & their matrices, if not their own
+        stack: typing.List[
+            typing.Tuple[component.Component, int, int, typing.Optional[numpy.ndarray]]
+        ] = [(root, -1, -1, None)]
+
+        while stack:
+            added, parent, composition, matrix = stack.pop()
+
+            kind = next(
+                (code for body, code in _BODIES if type(added)._body is body), None
+            )
+            if kind is None:
+                raise UnsupportedComponent(added)
+
+            if matrix is None:
+                matrix = affinables.compose(added.direct_transformations)
+
+            parameters: typing.Tuple[float, ...] = ()
+            segments = None
+            if kind == SPHERE:
+                parameters = (added.diameter,)
+            elif kind == FRUSTUM:
+                parameters = (
+                    added.bottom_circumscribed_circle_diameter,
+                    added.top_circumscribed_circle_diameter,
+                    added.height,
+                    float(added.center),
+                )
+                segments = added.segments
+
+            index = scene.add(kind, parameters, parent, matrix, added.color, segments)
+            scene.operand_of[index] = composition
+
+            embodied: typing.List[
+                typing.Tuple[
+                    component.Component, int, int, typing.Optional[numpy.ndarray]
+                ]
+            ] = []
+            composed: typing.Set[int] = set()
+            children = {id(child) for child in added.children}
+            for composition_type, operands in added.compositions:
+                composition_index = scene.compose(
+                    index, COMPOSITIONS.index(type(composition_type)), []
+                )
+
+                for operand in operands:
+                    composed.add(id(operand))
+                    operand_matrix = None
+                    if id(operand) not in children:
+                        operand_matrix = (
+                            numpy.linalg.inv(added.world_matrix) @ operand.world_matrix
+                        )
+                    embodied.append((operand, index, composition_index, operand_matrix))
+
+            embodied += [
+                (child, index, -1, None)
+                for child in added.children
+                if id(child) not in composed
+            ]
+
+            # Operands are added in order, each before the next
+            stack.extend(reversed(embodied))
+
+        return scene
+
+    def to_component(self, index: int) -> component.Component:
+        """Construct a standalone component equivalent to a node's subtree
+
+        Frustums are constructed as `Frustum`s, whatever they were before
+        being stored, & each node's transformations are restored as a single
+        `multmatrix`, which stretches the component (e.g. for its automatic
+        resolution) as they did.
+
+        Args:
+            index: The index of the node
+        """
+        nodes = self.subtree_of(index)
+        components: typing.Dict[int, component.Component] = {}
+
+        transformed = dict(
+            zip(
+                nodes.tolist(),
+                (
+                    ~numpy.isclose(self.matrices[nodes], numpy.identity(4)).all(
+                        axis=(1, 2)
+                    )
+                ).tolist(),
+            )
+        )
+
+        for node in nodes.tolist():
+            kind = self.kinds[node]
+            parameters = self.parameters[node]
+
+            if kind == SPHERE:
+                created: component.Component = sphere.Sphere(parameters[0])
+            elif kind == FRUSTUM:
+                created = frustum.Frustum(
+                    parameters[0],
+                    parameters[2],
+                    parameters[1],
+                    bool(parameters[3]),
+                    int(self.segments[node]) or None,
+                )
+            else:
+                created = component.Component()
+
+            if transformed[node]:
+                created.transform(solid.multmatrix(self.matrices[node].tolist()))
+
+            created.color = self[node].color
+            if node != index:
+                # Adding the child is quicker than searching the parent's
+                # children for it, as assigning its parent would
+                components[int(self.parents[node])].add_child(created)
+
+            components[node] = created
+
+        for composition in numpy.unique(self.operand_of[nodes]).tolist():
+            if composition < 0:
+                continue
+
+            owner = int(self.composition_owners[composition])
+            if owner in components:
+                components[owner].compose(
+                    COMPOSITIONS[self.composition_kinds[composition]](),
+                    [components[node] for node in self.operands_of(composition)],
+                    make_children=False,
+                )
+
+        return components[index]
+
+    def _child_index(self) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        """The nodes ordered by parent, & where each node's children start"""
+        if "children" not in self._derived:
+            order = numpy.argsort(self.parents, kind="stable")
+            starts = numpy.searchsorted(
+                self.parents[order], numpy.arange(self._size + 1)
+            )
+            self._derived["children"] = (order, starts)
+
+        return self._derived["children"]
+
+    def children_of(self, index: int) -> numpy.ndarray:
+        """The indices of a node's children, in the order they were added
+
+        Args:
+            index: The index of the node
+        """
+        order, starts = self._child_index()
+
+        return order[starts[index] : starts[index + 1]]
+
+    def subtree_of(self, index: int) -> numpy.ndarray:
+        """The indices of a node & all of its descendants, in ascending order
+
+        Args:
+            index: The index of the node
+        """
+        order, starts = self._child_index()
+
+        level = numpy.array([index])
+        levels = [level]
+        while len(level):
+            counts = starts[level + 1] - starts[level]
+            offsets = numpy.repeat(
+                starts[level] - numpy.cumsum(counts) + counts, counts
+            )
+            level = order[offsets + numpy.arange(counts.sum())]
+            levels.append(level)
+
+        return numpy.sort(numpy.concatenate(levels))
+
+    def _operand_index(self) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        """The nodes ordered by composition, & where each one's operands start"""
+        if "operands" not in self._derived:
+            order = numpy.argsort(self.operand_of, kind="stable")
+            starts = numpy.searchsorted(
+                self.operand_of[order], numpy.arange(self._composition_count + 1)
+            )
+            self._derived["operands"] = (order, starts)
+
+        return self._derived["operands"]
+
+    def operands_of(self, composition: int) -> numpy.ndarray:
+        """The indices of a composition's operands, in order
+
+        Args:
+            composition: The index of the composition
+        """
+        order, starts = self._operand_index()
+
+        return order[starts[composition] : starts[composition + 1]]
+
+    @property
+    def depths(self) -> numpy.ndarray:
+        """The number of ancestors each node has"""
+        if "depths" not in self._derived:
+            depths = (self.parents >= 0).astype(numpy.int64)
+            ancestors = self.parents.copy()
+
+            # Pointer jumping: each step doubles the distance to the ancestors
+            # whose depths have been accounted for
+            jumping = numpy.flatnonzero(ancestors >= 0)
+            while len(jumping):
+                depths[jumping] += depths[ancestors[jumping]]
+                ancestors[jumping] = ancestors[ancestors[jumping]]
+                jumping = jumping[ancestors[jumping] >= 0]
+
+            self._derived["depths"] = depths
+
+        return self._derived["depths"]
+
+    @property
+    def world_matrices(self) -> numpy.ndarray:
+        """The Nx4x4 homogeneous matrices of all of each node's transformations"""
+        if "world_matrices" not in self._derived:
+            matrices = self.matrices.copy()
+            ancestors = self.parents.copy()
+
+            # As for depths, each step composes twice as many ancestors'
+            # transformations as the last
+            jumping = numpy.flatnonzero(ancestors >= 0)
+            while len(jumping):
+                matrices[jumping] = matrices[ancestors[jumping]] @ matrices[jumping]
+                ancestors[jumping] = ancestors[ancestors[jumping]]
+                jumping = jumping[ancestors[jumping] >= 0]
+
+            self._derived["world_matrices"] = matrices
+
+        return self._derived["world_matrices"]
+
+    @property
+    def primitive_bounds(self) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        """The Nx3 world-space minimum & maximum corners of each node's own body
+
+        Nodes without bodies of their own (groups) have empty bounds, whose
+        minimums are greater than their maximums.
+        """
+        if "primitive_bounds" not in self._derived:
+            minimums = numpy.full((self._size, 3), numpy.inf)
+            maximums = numpy.full((self._size, 3), -numpy.inf)
+            parameters = self.parameters
+
+            spheres = self.kinds == SPHERE
+            radii = parameters[spheres, 0, numpy.newaxis] / 2.0
+            minimums[spheres] = -radii
+            maximums[spheres] = radii
+
+            frustums = self.kinds == FRUSTUM
+            radii = parameters[frustums, :2].max(axis=1) / 2.0
+            heights = parameters[frustums, 2]
+            bottoms = numpy.where(parameters[frustums, 3] != 0.0, -heights / 2.0, 0.0)
+            minimums[frustums] = numpy.stack([-radii, -radii, bottoms], axis=1)
+            maximums[frustums] = numpy.stack([radii, radii, bottoms + heights], axis=1)
+
+            bodies = numpy.flatnonzero(spheres | frustums)
+            corners = numpy.stack(
+                [
+                    numpy.where(corner, maximums[bodies], minimums[bodies])
+                    for corner in numpy.ndindex(2, 2, 2)
+                ],
+                axis=1,
+            )
+            matrices = self.world_matrices[bodies]
+            corners = (
+                corners @ matrices[:, :3, :3].transpose(0, 2, 1)
+                + matrices[:, numpy.newaxis, :3, 3]
+            )
+            minimums[bodies] = corners.min(axis=1)
+            maximums[bodies] = corners.max(axis=1)
+
+            self._derived["primitive_bounds"] = (minimums, maximums)
+
+        return self._derived["primitive_bounds"]
+
+    @property
+    def bounds(self) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        """The Nx3 world-space minimum & maximum corners of each node's body
+
+        These include children & compositions, as `Component.bounds` does.
+        """
+        if "bounds" not in self._derived:
+            primitive_minimums, primitive_maximums = self.primitive_bounds
+            minimums = primitive_minimums.copy()
+            maximums = primitive_maximums.copy()
+
+            depths = self.depths
+            parents = self.parents
+            uncomposed = self.operand_of < 0
+            compositions_by_owner: typing.Dict[int, typing.List[int]] = {}
+            for composition, owner in enumerate(self.composition_owners.tolist()):
+                compositions_by_owner.setdefault(owner, []).append(composition)
+
+            # Each level of the tree is complete before its nodes are merged
+            # into their parents' bounds, deepest first
+            for depth in range(int(depths.max(initial=0)), 0, -1):
+                level = numpy.flatnonzero((depths == depth) & uncomposed)
+                numpy.minimum.at(minimums, parents[level], minimums[level])
+                numpy.maximum.at(maximums, parents[level], maximums[level])
+
+                for owner in numpy.unique(parents[depths == depth]).tolist():
+                    for position, composition in enumerate(
+                        compositions_by_owner.get(owner, ())
+                    ):
+                        self._compose_bounds(
+                            owner, composition, not position, minimums, maximums
+                        )
+
+            self._derived["bounds"] = (minimums, maximums)
+
+        return self._derived["bounds"]
+
+    def _compose_bounds(
+        self,
+        owner: int,
+        composition: int,
+        first: bool,
+        minimums: numpy.ndarray,
+        maximums: numpy.ndarray,
+    ) -> None:
+        """Apply a composition to the bounds of the node it's part of
+
+        Args:
+            owner: The index of the node
+            composition: The index of the composition
+            first: Is this the node's first composition?
+            minimums: The minimum corners of each node's bounds, updated here
+            maximums: The maximum corners of each node's bounds, updated here
+        """
+        operands = self.operands_of(composition)
+        if not len(operands):
+            return
+
+        kind = self.composition_kinds[composition]
+        empty = numpy.any(minimums[owner] > maximums[owner])
+
+        # As in `Component.bounds`, pure containers use the first operand of
+        # their first composition as the base
+        if first and empty and self.kinds[owner] == GROUP:
+            minimums[owner] = minimums[operands[0]]
+            maximums[owner] = maximums[operands[0]]
+            operands = operands[1:]
+            empty = numpy.any(minimums[owner] > maximums[owner])
+
+        if kind == UNION and len(operands):
+            minimums[owner] = numpy.minimum(
+                minimums[owner], minimums[operands].min(axis=0)
+            )
+            maximums[owner] = numpy.maximum(
+                maximums[owner], maximums[operands].max(axis=0)
+            )
+        elif kind == INTERSECTION and not empty:
+            minimums[owner] = numpy.maximum(
+                minimums[owner], minimums[operands].max(axis=0, initial=-numpy.inf)
+            )
+            maximums[owner] = numpy.minimum(
+                maximums[owner], maximums[operands].min(axis=0, initial=numpy.inf)
+            )
+            if numpy.any(minimums[owner] > maximums[owner]):
+                minimums[owner] = numpy.inf
+                maximums[owner] = -numpy.inf
+
+    def overlapping(self, query: bounding.Bounds) -> numpy.ndarray:
+        """The indices of the primitives whose bodies' bounds overlap a box
+
+        Args:
+            query: The box; bounds which only touch it are considered to
+                overlap it
+        """
+        minimums, maximums = self.primitive_bounds
+
+        return numpy.flatnonzero(
+            numpy.all(minimums <= query.maximum, axis=1)
+            & numpy.all(query.minimum <= maximums, axis=1)
+        )
+
+    def containing(self, point: typing.Sequence[float]) -> numpy.ndarray:
+        """The indices of the primitives whose bodies' bounds contain a point
+
+        Args:
+            point: The point
+        """
+        return self.overlapping(bounding.Bounds(point, point))
+
+    def _primitive_source(
+        self, kind: int, parameters: typing.List[float], segments: int
+    ) -> str:
+        """The `OpenSCAD` source of an untransformed primitive
+
+        Args:
+            kind: The primitive's type code
+            parameters: The primitive's parameters
+            segments: The explicit number of segments of a frustum, or 0
+        """
+        if kind == SPHERE:
+            return f"sphere(d = {parameters[0]!r});"
+
+        return (
+            f"cylinder({f'$fn = {segments}, ' if segments else ''}"
+            f"center = {'true' if parameters[3] else 'false'}, "
+            f"d1 = {parameters[0]!r}, d2 = {parameters[1]!r}, "
+            f"h = {parameters[2]!r});"
+        )
+
+    def scad_source(self, index: int = None, fn: int = None) -> str:
+        """The `OpenSCAD` source code of a node's body, or the whole scene
+
+        Bodies are composed as they are by components.
+
+        Args:
+            index: The index of the node; if not provided, the bodies of every
+                node without a parent are emitted
+            fn: The global number of facets to render curved surfaces with
+        """
+        nodes = (
+            self.subtree_of(index) if index is not None else numpy.arange(self._size)
+        )
+
+        compositions_by_owner: typing.Dict[int, typing.List[int]] = {}
+        for composition, owner in enumerate(self.composition_owners.tolist()):
+            compositions_by_owner.setdefault(owner, []).append(composition)
+
+        # Converting the arrays up front is much faster than indexing them
+        kinds = self.kinds.tolist()
+        parents = self.parents.tolist()
+        operand_of = self.operand_of.tolist()
+        parameters = self.parameters.tolist()
+        segments = self.segments.tolist()
+        matrices = self.world_matrices.reshape(-1, 16).tolist()
+        colors = self.colors.tolist()
+
+        # Every node's children come after it, so are emitted before it
+        sources: typing.Dict[int, str] = {}
+        uncomposed: typing.Dict[int, typing.List[str]] = {}
+        operands: typing.Dict[int, typing.List[str]] = {}
+        for node in reversed(nodes.tolist()):
+            base: typing.Optional[str]
+            if kinds[node] == GROUP:
+                children = uncomposed.pop(node, None)
+                base = (
+                    f"union() {{{''.join(reversed(children))}}}" if children else None
+                )
+            else:
+                uncomposed.pop(node, None)
+                base = _TRANSFORMED.format(
+                    *matrices[node],
+                    self._primitive_source(
+                        kinds[node], parameters[node], segments[node]
+                    ),
+                )
+
+            for composition in compositions_by_owner.get(node, ()):
+                composed = list(reversed(operands.pop(composition, [])))
+                if base is None:
+                    if not composed:
+                        continue
+
+                    base, *composed = composed
+
+                if composed:
+                    name = COMPOSITIONS[self.composition_kinds[composition]].__name__
+                    base = f"{name}() {{{base}{''.join(composed)}}}"
+
+            source = base if base is not None else "union();"
+            if colors[node][0] == colors[node][0]:
+                source = f"color(c = {colors[node]!r}) {{{source}}}"
+
+            if node == index or parents[node] < 0:
+                sources[node] = source
+            elif operand_of[node] >= 0:
+                operands.setdefault(operand_of[node], []).append(source)
+            else:
+                uncomposed.setdefault(parents[node], []).append(source)
+
+        roots = [sources[root] for root in sorted(sources)]
+        body = roots[0] if len(roots) == 1 else f"union() {{{''.join(roots)}}}"
+
+        return f"{f'$fn = {fn};' if fn else ''}\n\n{body}\n"
@@ -0,0 +1,776 @@
+import json
+import math
+import struct
+import typing
+
+import numpy
+import solid
+
+from sccm import affinables, resolution, scene, traversal
+from sccm.components import (
+    component,
+    cone,
+    cylinder,
+    frustum,
+    instance,
+    pattern,
+    sphere,
+)
+
+# Identifies serialized component trees, & the version of their format
+MAGIC = b"SCCMTREE"
+VERSION = 2
+
+# Arrays are aligned to this many bytes within serialized trees, so they can be
+# memory mapped & used in place
+ALIGNMENT = 64
+
+# The type codes of the resolutions nodes may have
+FIXED_RESOLUTION = 1
+CHORD_ERROR_RESOLUTION = 2
+
+# The transformation types that can be serialized, indexed by their type codes
+TRANSFORMATIONS: typing.Tuple[typing.Type[affinables.AffineTransformation], ...] = (
+    solid.translate,
+    solid.rotate,
+    solid.scale,
+    solid.multmatrix,
+)
+
+
+def _optional(value: typing.Optional[float]) -> float:
+    """Store a parameter which may be `None` as `NaN`"""
+    return math.nan if value is None else value
+
+
+def _restored(value: float) -> typing.Optional[float]:
+    """Restore a parameter which may have been `None`"""
+    return None if math.isnan(value) else value
+
+
+def _restored_integer(value: float) -> typing.Optional[int]:
+    """Restore an integer parameter which may have been `None`"""
+    return None if math.isnan(value) else int(value)
+
+
+def _encoded(value: typing.Any) -> typing.Any:
+    """Encode a transformation's parameter as JSON, exactly
+
+    Lists, numbers, strings & `None` are encoded as themselves; tuples & NumPy
+    arrays & scalars, which JSON can't distinguish from them, are wrapped in
+    objects naming their types.
+
+    Args:
+        value: The parameter
+
+    Raises:
+        TypeError: If the parameter is of any other type
+    """
+    if value is None or type(value) in (bool, int, float, str):
+        return value
+    if type(value) is list:
+        return [_encoded(item) for item in value]
+    if type(value) is tuple:
+        return {"tuple": [_encoded(item) for item in value]}
+    if isinstance(value, numpy.ndarray):
+        return {"array": value.tolist(), "dtype": value.dtype.str}
+    if isinstance(value, numpy.generic):
+        return {"scalar": value.item(), "dtype": value.dtype.str}
+
+    raise TypeError(f"{type(value).__qualname__} parameters can't be encoded")
+
+
+def _decoded(value: typing.Any) -> typing.Any:
+    """Decode a transformation's parameter encoded by `_encoded`"""
+    if type(value) is list:
+        return [_decoded(item) for item in value]
+    if type(value) is dict:
+        if "tuple" in value:
+            return tuple(_decoded(item) for item in value["tuple"])
+        if "array" in value:
+            return numpy.array(value["array"], dtype=value["dtype"])
+        return numpy.dtype(value["dtype"]).type(value["scalar"])
+
+    return value
+
+
+# The component types that can be serialized, with their parameters (given a
+# component) & their constructors (given the parameters & the component's
+# template, if it has one); subclasses must be registered separately, since
+# they may have parameters of their own
+TYPES: typing.Tuple[
+    typing.Tuple[
+        typing.Type[component.Component],
+        typing.Callable[[typing.Any], typing.Sequence[float]],
+        typing.Callable[
+            [typing.List[float], typing.Optional[component.Component]],
+            component.Component,
+        ],
+    ],
+    ...,
+] = (
+    (component.Component, lambda _: (), lambda *_: component.Component()),
+    (
+        sphere.Sphere,
+        lambda stored: (stored.diameter,),
+        lambda parameters, _: sphere.Sphere(parameters[0]),
+    ),
+    (
+        frustum.Frustum,
+        lambda stored: (
+            stored.bottom_circumscribed_circle_diameter,
+            stored.height,
+            stored.top_circumscribed_circle_diameter,
+            stored.center,
+            _optional(stored.segments),
+        ),
+        lambda parameters, _: frustum.Frustum(
+            parameters[0],
+            parameters[1],
+            parameters[2],
+            bool(parameters[3]),
+            _restored_integer(parameters[4]),
+        ),
+    ),
+    (
+        frustum.CircularFrustum,
+        lambda stored: (
+            stored.bottom_diameter,
+            stored.height,
+            stored.top_diameter,
+            stored.center,
+        ),
+        lambda parameters, _: frustum.CircularFrustum(
+            parameters[0], parameters[1], parameters[2], bool(parameters[3])
+        ),
+    ),
+    (
+        cylinder.Cylinder,
+        lambda stored: (stored.diameter, stored.height, stored.center),
+        lambda parameters, _: cylinder.Cylinder(
+            parameters[0], parameters[1], bool(parameters[2])
+        ),
+    ),
+    (
+        cone.Cone,
+        lambda stored: (stored.bottom_diameter, stored.height, stored.center),
+        lambda parameters, _: cone.Cone(
+            parameters[0], parameters[1], bool(parameters[2])
+        ),
+    ),
+    (
+        instance.Instance,
+        lambda _: (),
+        lambda _, template: instance.Instance(template),
+    ),
+    (
+        pattern.LinearPattern,
+        lambda stored: (stored.count, *stored.step),
+        lambda parameters, template: pattern.LinearPattern(
+            template, int(parameters[0]), tuple(parameters[1:4])
+        ),
+    ),
+    (
+        pattern.CircularPattern,
+        lambda stored: (stored.count, stored.step, *stored.axis),
+        lambda parameters, template: pattern.CircularPattern(
+            template,
+            int(parameters[0]),
+            parameters[1],
+            tuple(parameters[2:5]),
+        ),
+    ),
+    (
+        pattern.GridPattern,
+        lambda stored: (
+            stored.rows,
+            stored.columns,
+            *stored.row_step,
+            *stored.column_step,
+        ),
+        lambda parameters, template: pattern.GridPattern(
+            template,
+            int(parameters[0]),
+            int(parameters[1]),
+            tuple(parameters[2:5]),
+            tuple(parameters[5:8]),
+        ),
+    ),
+)
+
+
+class UnserializableComponent(Exception):
+    """Raised when a component can't be serialized"""
+
+    def __init__(
+        self, unserializable_component: component.Component, reason: str
+    ) -> None:
+        """
+        Args:
+            unserializable_component: The component
+            reason: Why the component can't be serialized
+        """
+        self.component = unserializable_component
+        self.reason = reason
+
+
+class InvalidTree(Exception):
+    """Raised when loading data which isn't a serialized component tree"""
+
+    def __init__(self, reason: str) -> None:
+        """
+        Args:
+            reason: Why the data isn't a serialized component tree
+        """
+        self.reason = reason
+
+
+class NodeTable:
+    """A component tree, flattened into arrays
+
+    Each component is a node, identified by its index; the root is the first.
+    Nodes' direct transformations are stored as their type codes in
+    `TRANSFORMATIONS` & their exact parameters, encoded as one JSON document,
+    so they're restored as they were; nodes' children,
+    compositions' operands & templates as the indices of other nodes, so
+    components embodied in several places are stored only once. Operands &
+    templates which aren't part of the tree otherwise are stored as extra nodes
+    without parents. Variable-length data is stored consecutively, with the
+    offset at which each node's starts, & the rarely used colors, resolutions
+    & templates only for the nodes which have them.
+
+    Note:
+        Components' parameters & colors are stored as floating-point numbers,
+        & restored as the types' constructors convert them
+    """
+
+    # The name of every array in a table
+    ARRAYS = (
+        "types",
+        "parameter_offsets",
+        "parameters",
+        "instances",
+        "templates",
+        "transformation_offsets",
+        "transformation_kinds",
+        "transformation_parameters",
+        "colored",
+        "colors",
+        "color_channels",
+        "resolved",
+        "resolution_kinds",
+        "resolutions",
+        "child_offsets",
+        "children",
+        "composition_owners",
+        "composition_kinds",
+        "operand_offsets",
+        "operands",
+    )
+
+    def __init__(
+        self, type_names: typing.Sequence[str], arrays: typing.Dict[str, numpy.ndarray]
+    ) -> None:
+        """
+        Args:
+            type_names: The qualified names of the component types the nodes'
+                type codes index
+            arrays: Every one of the table's arrays, by name
+        """
+        self.type_names = list(type_names)
+
+        # The nodes' type codes & parameters
+        self.types = arrays["types"]
+        self.parameter_offsets = arrays["parameter_offsets"]
+        self.parameters = arrays["parameters"]
+        # The nodes which are instances, & their templates
+        self.instances = arrays["instances"]
+        self.templates = arrays["templates"]
+        # The nodes' transformations' type codes, & the UTF-8 JSON list of
+        # their parameters, by name
+        self.transformation_offsets = arrays["transformation_offsets"]
+        self.transformation_kinds = arrays["transformation_kinds"]
+        self.transformation_parameters = arrays["transformation_parameters"]
+        # The nodes which have colors, their colors (padded with `NaN`) & their
+        # colors' numbers of channels
+        self.colored = arrays["colored"]
+        self.colors = arrays["colors"]
+        self.color_channels = arrays["color_channels"]
+        # The nodes which have resolutions, their resolutions' type codes &
+        # parameters
+        self.resolved = arrays["resolved"]
+        self.resolution_kinds = arrays["resolution_kinds"]
+        self.resolutions = arrays["resolutions"]
+        # The nodes' children
+        self.child_offsets = arrays["child_offsets"]
+        self.children = arrays["children"]
+        # Every composition, in order, with the type codes in `scene.COMPOSITIONS`
+        self.composition_owners = arrays["composition_owners"]
+        self.composition_kinds = arrays["composition_kinds"]
+        self.operand_offsets = arrays["operand_offsets"]
+        self.operands = arrays["operands"]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    @classmethod
+    def from_component(cls, root: component.Component) -> "NodeTable":
+        """Flatten a component tree into a table
+
+        Args:
+            root: The component at the root of the tree
+
+        Raises:
+            UnserializableComponent: If any component of the tree is of a type
+                which isn't in `TYPES`, or has transformations of types which
+                aren't in `TRANSFORMATIONS` or with parameters that can't be
+                encoded, or a resolution or composition of an unsupported type
+        """
+        codes = {stored_type: code for code, (stored_type, _, _) in enumerate(TYPES)}
+        transformation_codes = {
+            transformation_type: code
+            for code, transformation_type in enumerate(TRANSFORMATIONS)
+        }
+
+        nodes = list(
+            traversal.preorder(
+                root,
+                lambda node: list(component.Component._embodied(node))
+                + ([node.template] if isinstance(node, instance.Instance) else []),
+            )
+        )
+        indices = {id(node): index for index, node in enumerate(nodes)}
+
+        types: typing.List[int] = []
+        parameter_counts: typing.List[int] = []
+        parameters: typing.List[float] = []
+        instances: typing.List[int] = []
+        templates: typing.List[int] = []
+        transformation_counts: typing.List[int] = []
+        transformation_kinds: typing.List[int] = []
+        transformation_parameters: typing.List[typing.Dict[str, typing.Any]] = []
+        colored: typing.List[int] = []
+        colors: typing.List[typing.List[float]] = []
+        color_channels: typing.List[int] = []
+        resolved: typing.List[int] = []
+        resolution_kinds: typing.List[int] = []
+        resolutions: typing.List[typing.List[float]] = []
+        child_counts: typing.List[int] = []
+        children: typing.List[int] = []
+        composition_owners: typing.List[int] = []
+        composition_kinds: typing.List[int] = []
+        operand_counts: typing.List[int] = []
+        operands: typing.List[int] = []
+
+        for index, node in enumerate(nodes):
+            code = codes.get(type(node))
+            if code is None:
+                raise UnserializableComponent(
+                    node, f"{type(node).__qualname__} isn't a serializable type"
+                )
+
+            types.append(code)
+            node_parameters = TYPES[code][1](node)
+            parameters.extend(node_parameters)
+            parameter_counts.append(len(node_parameters))
+
+            if isinstance(node, instance.Instance):
+                instances.append(index)
+                templates.append(indices[id(node.template)])
+
+            for transformation in node.direct_transformations:
+                transformation_code = transformation_codes.get(type(transformation))
+                if transformation_code is None:
+                    raise UnserializableComponent(
+                        node, "one of its transformations isn't of a serializable type"
+                    )
+
+                try:
+                    transformation_parameters.append(
+                        {
+                            name: _encoded(value)
+                            for name, value in transformation.params.items()
+                        }
+                    )
+                except TypeError:
+                    raise UnserializableComponent(
+                        node, "one of its transformations' parameters can't be stored"
+                    )
+                transformation_kinds.append(transformation_code)
+            transformation_counts.append(len(node.direct_transformations))
+
+            if node.color is not None:
+                colored.append(index)
+                colors.append(list(node.color) + [math.nan] * (4 - len(node.color)))
+                color_channels.append(len(node.color))
+
+            node_resolution = node.resolution
+            if type(node_resolution) is resolution.Resolution:
+                resolution_kinds.append(FIXED_RESOLUTION)
+                resolutions.append(
+                    [
+                        _optional(node_resolution.fn),
+                        _optional(node_resolution.fa),
+                        _optional(node_resolution.fs),
+                    ]
+                )
+            elif type(node_resolution) is resolution.ChordErrorResolution:
+                resolution_kinds.append(CHORD_ERROR_RESOLUTION)
+                resolutions.append(
+                    [
+                        node_resolution.tolerance,
+                        node_resolution.minimum_fragments,
+                        _optional(node_resolution.maximum_fragments),
+                    ]
+                )
+            elif node_resolution is not None:
+                raise UnserializableComponent(
+                    node, "its resolution isn't of a serializable type"
+                )
+            if node_resolution is not None:
+                resolved.append(index)
+
+            children.extend(indices[id(child)] for child in node.children)
+            child_counts.append(len(node.children))
+
+            for composition, composition_operands in node.compositions:
+                if type(composition) not in scene.COMPOSITIONS:
+                    raise UnserializableComponent(
+                        node, "one of its compositions isn't of a serializable type"
+                    )
+
+                composition_owners.append(index)
+                composition_kinds.append(scene.COMPOSITIONS.index(type(composition)))
+                operands.extend(
+                    indices[id(operand)] for operand in composition_operands
+                )
+                operand_counts.append(len(composition_operands))
+
+        # Indices & offsets are only as wide as they need to be
+        index_type = (
+            numpy.int32
+            if max(
+                len(nodes), len(parameters), len(transformation_kinds), len(children)
+            )
+            < 2**31
+            else numpy.int64
+        )
+
+        def indexed(values: typing.Sequence[int]) -> numpy.ndarray:
+            return numpy.array(values, dtype=index_type)
+
+        def offsets(counts: typing.Sequence[int]) -> numpy.ndarray:
+            return numpy.concatenate(
+                [[0], numpy.cumsum(counts, dtype=numpy.int64)]
+            ).astype(index_type)
+
+        return cls(
+            [stored_type.__qualname__ for stored_type, _, _ in TYPES],
+            {
+                "types": numpy.array(types, dtype=numpy.uint8),
+                "parameter_offsets": offsets(parameter_counts),
+                "parameters": numpy.array(parameters, dtype=numpy.float64),
+                "instances": indexed(instances),
+                "templates": indexed(templates),
+                "transformation_offsets": offsets(transformation_counts),
+                "transformation_kinds": numpy.array(
+                    transformation_kinds, dtype=numpy.uint8
+                ),
+                "transformation_parameters": numpy.frombuffer(
+                    json.dumps(
+                        transformation_parameters, separators=(",", ":")
+                    ).encode(),
+                    dtype=numpy.uint8,
+                ),
+                "colored": indexed(colored),
+                "colors": numpy.array(colors, dtype=numpy.float64).reshape(-1, 4),
+                "color_channels": numpy.array(color_channels, dtype=numpy.uint8),
+                "resolved": indexed(resolved),
+                "resolution_kinds": numpy.array(resolution_kinds, dtype=numpy.uint8),
+                "resolutions": numpy.array(resolutions, dtype=numpy.float64).reshape(
+                    -1, 3
+                ),
+                "child_offsets": offsets(child_counts),
+                "children": indexed(children),
+                "composition_owners": indexed(composition_owners),
+                "composition_kinds": numpy.array(composition_kinds, dtype=numpy.uint8),
+                "operand_offsets": offsets(operand_counts),
+                "operands": indexed(operands),
+            },
+        )
+
+    def to_component(self) -> component.Component:
+        """Reconstruct the component tree the table was flattened from
+
+        Raises:
+            InvalidTree: If the table refers to component types which can't be
+                reconstructed
+        """
+        constructors = {
+            stored_type.__qualname__: construct for stored_type, _, construct in TYPES
+        }
+        try:
+            type_constructors = [constructors[name] for name in self.type_names]
+        except KeyError as error:
+            raise InvalidTree(f"{error.args[0]} isn't a serializable type")
+
+        # Reading each array once is much quicker than indexing them repeatedly,
+        # particularly when they're memory mapped
+        types = self.types.tolist()
+        parameter_offsets = self.parameter_offsets.tolist()
+        parameters = self.parameters.tolist()
+        templates = dict(zip(self.instances.tolist(), self.templates.tolist()))
+        transformation_offsets = self.transformation_offsets.tolist()
+        transformations = [
+            TRANSFORMATIONS[kind](
+                **{name: _decoded(value) for name, value in transformation.items()}
+            )
+            for kind, transformation in zip(
+                self.transformation_kinds.tolist(),
+                json.loads(self.transformation_parameters.tobytes()),
+            )
+        ]
+        child_offsets = self.child_offsets.tolist()
+        children = self.children.tolist()
+        operand_offsets = self.operand_offsets.tolist()
+        operands = self.operands.tolist()
+
+        nodes: typing.List[typing.Optional[component.Component]] = [None] * len(types)
+
+        # Nothing refers to the loaded components yet, so their construction
+        # needn't be recorded as changes
+        with component.building(), component._silently():
+            # Templates must be constructed before the instances of them
+            for start in range(len(types)):
+                for index in traversal.postorder(
+                    start,
+                    lambda index: (
+                        [templates[index]]
+                        if index in templates and nodes[templates[index]] is None
+                        else []
+                    ),
+                ):
+                    if nodes[index] is not None:
+                        continue
+
+                    node = type_constructors[types[index]](
+                        parameters[
+                            parameter_offsets[index] : parameter_offsets[index + 1]
+                        ],
+                        nodes[templates[index]] if index in templates else None,
+                    )
+
+                    node.transform(
+                        transformations[
+                            transformation_offsets[index] : transformation_offsets[
+                                index + 1
+                            ]
+                        ]
+                    )
+
+                    nodes[index] = node
+
+            for index, channels, color in zip(
+                self.colored.tolist(),
+                self.color_channels.tolist(),
+                self.colors.tolist(),
+            ):
+                nodes[index].color = tuple(color[:channels])
+
+            for index, kind, (first, second, third) in zip(
+                self.resolved.tolist(),
+                self.resolution_kinds.tolist(),
+                self.resolutions.tolist(),
+            ):
+                if kind == FIXED_RESOLUTION:
+                    nodes[index].resolution = resolution.Resolution(
+                        _restored_integer(first), _restored(second), _restored(third)
+                    )
+                elif kind == CHORD_ERROR_RESOLUTION:
+                    nodes[index].resolution = resolution.ChordErrorResolution(
+                        first, int(second), _restored_integer(third)
+                    )
+
+            for index, node in enumerate(nodes):
+                node_children = children[
+                    child_offsets[index] : child_offsets[index + 1]
+                ]
+                if node_children:
+                    node.add_child([nodes[child] for child in node_children])
+
+            for composition, (owner, kind) in enumerate(
+                zip(self.composition_owners.tolist(), self.composition_kinds.tolist())
+            ):
+                nodes[owner].compose(
+                    scene.COMPOSITIONS[kind](),
+                    [
+                        nodes[operand]
+                        for operand in operands[
+                            operand_offsets[composition] : operand_offsets[
+                                composition + 1
+                            ]
+                        ]
+                    ],
+                    make_children=False,
+                )
+
+        return nodes[0]
+
+    def to_bytes(self) -> bytes:
+        """Serialize the table
+
+        The serialized table starts with `MAGIC`, followed by the length of a
+        JSON header (as a little-endian, 64-bit integer) & the header itself,
+        which lists the component types & where each array is within the data
+        that follows it; each array is stored contiguously, in little-endian
+        order & aligned to `ALIGNMENT` bytes.
+        """
+        arrays = {
+            name: numpy.ascontiguousarray(
+                getattr(self, name),
+                dtype=getattr(self, name).dtype.newbyteorder("<"),
+            )
+            for name in self.ARRAYS
+        }
+
+        layout = {}
+        offset = 0
+        for name, array in arrays.items():
+            layout[name] = {
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+                "offset": offset,
+            }
+            offset += _aligned(array.nbytes)
+
+        header = json.dumps(
+            {"version": VERSION, "types": self.type_names, "arrays": layout},
+            separators=(",", ":"),
+        ).encode()
+        prefix = MAGIC + struct.pack("<Q", len(header)) + header
+
+        data = bytearray(_aligned(len(prefix)) + offset)
+        data[: len(prefix)] = prefix
+        start = _aligned(len(prefix))
+        for name, array in arrays.items():
+            position = start + layout[name]["offset"]
+            data[position : position + array.nbytes] = array.tobytes()
+
+        return bytes(data)
+
+    @classmethod
+    def from_buffer(cls, buffer: typing.Any) -> "NodeTable":
+        """Deserialize a table, without copying its arrays
+
+        Args:
+            buffer: The serialized table, e.g. `bytes` or a memory-mapped file;
+                the table's arrays are views of it
+
+        Raises:
+            InvalidTree: If the buffer isn't a serialized table
+        """
+        data = numpy.frombuffer(buffer, dtype=numpy.uint8)
+
+        if bytes(data[: len(MAGIC)]) != MAGIC:
+            raise InvalidTree("it doesn't start with the serialization's magic bytes")
+
+        (header_length,) = struct.unpack("<Q", bytes(data[len(MAGIC) : len(MAGIC) + 8]))
+        header_end = len(MAGIC) + 8 + header_length
+        header = json.loads(bytes(data[len(MAGIC) + 8 : header_end]))
+
+        if header["version"] != VERSION:
+            raise InvalidTree(f"version {header['version']} isn't supported")
+
+        start = _aligned(header_end)
+        arrays = {}
+        for name, layout in header["arrays"].items():
+            dtype = numpy.dtype(layout["dtype"])
+            count = int(numpy.prod(layout["shape"], dtype=numpy.int64))
+            arrays[name] = numpy.frombuffer(
+                data, dtype=dtype, count=count, offset=start + layout["offset"]
+            ).reshape(layout["shape"])
+
+        return cls(header["types"], arrays)
+
+    def write(self, path: str) -> None:
+        """Write the serialized table to a file
+
+        Args:
+            path: The path of the file
+        """
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def read(cls, path: str, memory_map: bool = True) -> "NodeTable":
+        """Read a serialized table from a file
+
+        Args:
+            path: The path of the file
+            memory_map: Should the file be memory mapped, rather than read? The
+                table's arrays are then only read as they're used, which suits
+                large files
+
+        Raises:
+            InvalidTree: If the file isn't a serialized table
+        """
+        if memory_map:
+            return cls.from_buffer(numpy.memmap(path, dtype=numpy.uint8, mode="r"))
+
+        with open(path, "rb") as file:
+            return cls.from_buffer(file.read())
+
+
+def _aligned(size: int) -> int:
+    """Round a size up to the next multiple of `ALIGNMENT`"""
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def dumps(root: component.Component) -> bytes:
+    """Serialize a component tree
+
+    Args:
+        root: The component at the root of the tree
+
+    Raises:
+        UnserializableComponent: If the tree can't be serialized
+    """
+    return NodeTable.from_component(root).to_bytes()
+
+
+def loads(data: bytes) -> component.Component:
+    """Deserialize a component tree
+
+    Args:
+        data: The serialized tree
+
+    Raises:
+        InvalidTree: If the data isn't a serialized tree
+    """
+    return NodeTable.from_buffer(data).to_component()
+
+
+def save(root: component.Component, path: str) -> None:
+    """Write a component tree to a file
+
+    Args:
+        root: The component at the root of the tree
+        path: The path of the file
+
+    Raises:
+        UnserializableComponent: If the tree can't be serialized
+    """
+    NodeTable.from_component(root).write(path)
+
+
+def load(path: str, memory_map: bool = True) -> component.Component:
+    """Read a component tree from a file
+
+    Args:
+        path: The path of the file
+        memory_map: Should the file be memory mapped, rather than read?
+
+    Raises:
+        InvalidTree: If the file isn't a serialized tree
+    """
+    return NodeTable.read(path, memory_map).to_component()
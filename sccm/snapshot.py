@@ -0,0 +1,183 @@
+import copy
+import typing
+
+import numpy
+import solid
+
+from sccm import bounding, emission, resolution, traversal
+from sccm.components import component, instance
+
+
+def _referenced(original: component.Component) -> typing.Iterator[component.Component]:
+    """The components a component's copy refers to in place of the original's
+
+    These are its embodied components & its template, if it's an instance.
+
+    Args:
+        original: The component
+    """
+    yield from component.Component._embodied(original)
+
+    if isinstance(original, instance.Instance):
+        yield original.template
+
+
+def _frozen(root: component.Component) -> component.Component:
+    """Copy a component tree, independently of it, & freeze the copy
+
+    Every component embodied within the root (including templates) is copied,
+    along with the lists holding its structure & its other attributes; each
+    copy refers to the copies of the other components, so those shared within
+    the tree are still shared within the copy.
+
+    Args:
+        root: The component at the root of the tree
+
+    Returns:
+        The copy of the root
+    """
+    originals = list(traversal.preorder(root, _referenced))
+    copies = {
+        id(original): type(original).__new__(type(original)) for original in originals
+    }
+
+    with component._silently():
+        # References to the copied components are replaced by their copies
+        # rather than copied in turn, so each component's attributes are copied
+        # separately, without recursing through the tree
+        memo: typing.Dict[int, typing.Any] = dict(copies)
+        # Transformations & compositions aren't modified once they're applied,
+        # so they're shared, as they are by copies of components
+        for original in originals:
+            for transformation in original.direct_transformations:
+                memo[id(transformation)] = transformation
+            for composition, _ in original.compositions:
+                memo[id(composition)] = composition
+
+        for original in originals:
+            state = original.__getstate__()
+            parent = state.pop("_parent")
+            # Cached anchors are recomputed as they're needed
+            state["_anchors"] = {}
+
+            copied = copies[id(original)]
+            copied.__setstate__(copy.deepcopy(state, memo))
+
+            if parent is not None and id(parent) in copies:
+                object.__setattr__(copied, "_parent", copies[id(parent)])
+
+        # A component only inherits transformations & a resolution from its
+        # parents, so they're stood in for by bare components with just those
+        stand_ins: typing.List[component.Component] = []
+        for ancestor in reversed(list(root.parents)):
+            stand_ins.append(
+                component.Component(
+                    parent=stand_ins[-1] if stand_ins else None,
+                    resolution=ancestor.resolution,
+                ).transform(list(ancestor.direct_transformations))
+            )
+
+        if stand_ins:
+            stand_ins[-1].add_child(copies[id(root)])
+
+    for frozen_component in [*copies.values(), *stand_ins]:
+        component._frozen_components[id(frozen_component)] = frozen_component
+
+    return copies[id(root)]
+
+
+class Snapshot:
+    """An immutable copy of a component tree, which can be shared between threads
+
+    A snapshot's components are copies of the tree's components as they were
+    when it was taken, independent of them, so the tree can go on changing
+    while the snapshot is read. The copies can't be changed themselves: doing so
+    raises `component.FrozenComponent`. The snapshot's body, bounds & fingerprint
+    are computed when it's taken, so any number of threads can read them, & emit
+    the snapshot, at once & without locking.
+
+    Note:
+        A snapshot of a component with parents inherits the same
+        transformations & resolution, from frozen stand-ins for its parents
+    """
+
+    def __init__(self, root: component.Component) -> None:
+        """
+        Args:
+            root: The component at the root of the tree to take a snapshot of
+        """
+        with component.building():
+            self._component = _frozen(root)
+
+        self._fingerprint = self._component.fingerprint
+        self._bounds = self._component.bounds
+        self._body = self._component.body
+
+        # Rendering an `OpenSCAD` object normalizes its parameters in place, so
+        # each object of the body renders its own call once now; rendering them
+        # again, from any thread, then only reads them
+        for body_object in traversal.preorder(
+            self._body, lambda body_object: body_object.children
+        ):
+            body_object._render_str_no_children()
+
+    @property
+    def component(self) -> component.Component:
+        """The copy of the root of the tree, which can't be changed"""
+        return self._component
+
+    @property
+    def fingerprint(self) -> str:
+        """The fingerprint of the root of the tree"""
+        return self._fingerprint
+
+    @property
+    def bounds(self) -> bounding.Bounds:
+        """The world-space bounds of the root of the tree"""
+        return self._bounds
+
+    @property
+    def world_matrix(self) -> numpy.ndarray:
+        """The 4x4 homogeneous matrix of all of the root's transformations"""
+        return self._component.world_matrix
+
+    @property
+    def body(self) -> solid.OpenSCADObject:
+        """The body of the root of the tree, emitted with the default options
+
+        Note:
+            This is shared by every reader of the snapshot, so mustn't be
+            modified; it can be rendered, or used as part of another body
+        """
+        return self._body
+
+    def scad_source(
+        self,
+        fn: int = None,
+        default_resolution: resolution.Resolution = None,
+        facet_budget: int = None,
+        optimize: bool = True,
+        prune: bool = False,
+        cache: emission.FragmentCache = None,
+    ) -> str:
+        """The OpenSCAD source code that the snapshot corresponds to
+
+        Emission options are specific to each thread, so any number of threads
+        can emit the snapshot at once, with their own options.
+
+        Args:
+            fn: The global number of facets to render curved surfaces with
+            default_resolution: The resolution to use for components that don't
+                have one of their own
+            facet_budget: The total number of facets the emitted model may
+                have, if limited
+            optimize: Should the emitted tree of CSG operations be optimized?
+            prune: Should composition operands which can't contribute to the
+                emitted model be left out?
+            cache: Where to look up & store the rendered source of each
+                component's body, if anywhere; a fragment cache can only be
+                used by one thread at a time
+        """
+        return self._component.scad_source(
+            fn, default_resolution, facet_budget, optimize, prune, cache
+        )
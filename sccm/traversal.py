@@ -0,0 +1,113 @@
+import typing
+
+Node = typing.TypeVar("Node")
+Value = typing.TypeVar("Value")
+
+# The nodes directly beneath a node, in order
+Successors = typing.Callable[[Node], typing.Iterable[Node]]
+
+# Computes a node's value: it yields each node whose value it needs, is sent
+# that node's value in return, & returns the node's own value
+Evaluation = typing.Generator[Node, Value, Value]
+
+
+def preorder(root: Node, successors: Successors) -> typing.Iterator[Node]:
+    """Walk a tree (or DAG) from the top down, without recursion
+
+    Args:
+        root: The node to start from
+        successors: Finds the nodes directly beneath a node
+
+    Yields:
+        Each node reachable from the root, only once (by identity), before any
+        of the nodes beneath it & in the order of its siblings
+    """
+    seen: typing.Set[int] = set()
+    stack: typing.List[Node] = [root]
+
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+
+        seen.add(id(node))
+        yield node
+
+        stack.extend(reversed(list(successors(node))))
+
+
+def postorder(root: Node, successors: Successors) -> typing.Iterator[Node]:
+    """Walk a tree (or DAG) from the bottom up, without recursion
+
+    Args:
+        root: The node to start from
+        successors: Finds the nodes directly beneath a node
+
+    Yields:
+        Each node reachable from the root, only once (by identity), after every
+        node beneath it
+    """
+    seen: typing.Set[int] = {id(root)}
+    stack: typing.List[typing.Tuple[Node, typing.Iterator[Node]]] = [
+        (root, iter(successors(root)))
+    ]
+
+    while stack:
+        node, remaining = stack[-1]
+
+        for successor in remaining:
+            if id(successor) not in seen:
+                seen.add(id(successor))
+                stack.append((successor, iter(successors(successor))))
+                break
+        else:
+            stack.pop()
+            yield node
+
+
+def evaluate(root: Node, evaluation: typing.Callable[[Node], Evaluation]) -> typing.Any:
+    """Compute the value of a node from those of the nodes beneath it, on demand
+
+    This is how a recursive computation would proceed, but with an explicit
+    stack of suspended evaluations instead of nested calls, so the depth of the
+    tree is unlimited. Nodes' values are only computed when requested, so an
+    evaluation can skip the nodes it doesn't need; a node requested more than
+    once is evaluated each time.
+
+    Args:
+        root: The node whose value to compute
+        evaluation: Begins the computation of a node's value
+
+    Returns:
+        The value of the root
+
+    Raises:
+        Exception: Whatever an evaluation raises & doesn't handle; it's raised
+            within each of the evaluations that requested the failed node, in
+            turn, so they can handle it (or clean up)
+    """
+    stack: typing.List[Evaluation] = [evaluation(root)]
+    value: typing.Any = None
+    error: typing.Optional[BaseException] = None
+
+    while True:
+        try:
+            if error is None:
+                requested = stack[-1].send(value)
+            else:
+                requested = stack[-1].throw(error)
+        except StopIteration as stop:
+            stack.pop()
+            if not stack:
+                return stop.value
+
+            value, error = stop.value, None
+        except BaseException as raised:
+            stack.pop()
+            if not stack:
+                raise
+
+            error = raised
+        else:
+            stack.append(evaluation(requested))
+            value, error = None, None
@@ -1,4 +1,6 @@
+import collections
 import functools
+import itertools
 import math
 import typing
 
@@ -8,6 +10,11 @@ import vg
 NumpyVector = typing.Type[numpy.array]
 RawVector = typing.Union[typing.Tuple[float, float, float], typing.Sequence[float]]
 
+# The largest difference in any component between vectors considered equal
+EQUALITY_TOLERANCE = 1e-8
+
+Item = typing.TypeVar("Item")
+
 
 class NaNVector(Exception):
     """Raised when a vector is with a NaN magnitude"""
@@ -81,10 +88,392 @@ class NoArbitraryNormal(Exception):
         self.vector = vector
 
 
+def principal_rotation_matrix(
+    angle: float, axis: typing.Sequence[float]
+) -> typing.Optional[numpy.ndarray]:
+    """The exact matrix of a right-angle rotation about a principal axis
+
+    Rotations through multiples of 90 degrees about the X, Y or Z axes only
+    permute coordinates & flip their signs, so they can be applied without any
+    trigonometry (or the rounding error it introduces).
+
+    Args:
+        angle: The signed angle of the rotation, in degrees
+        axis: The axis of the rotation; this need not be normalized
+
+    Returns:
+        The 3x3 rotation matrix, whose entries are all -1, 0 or 1, if the
+        rotation is a right-angle rotation about a principal axis
+    """
+    quarter_turns, remainder = divmod(angle, 90.0)
+    if remainder:
+        return None
+
+    nonzero = [index for index, component in enumerate(axis) if component]
+    if len(nonzero) != 1:
+        return None
+
+    (index,) = nonzero
+    cosine, sine = ((1, 0), (0, 1), (-1, 0), (0, -1))[int(quarter_turns) % 4]
+    if axis[index] < 0:
+        sine = -sine
+
+    # The rotation acts on the plane of the other two axes, in right-handed
+    # order
+    first, second = (index + 1) % 3, (index + 2) % 3
+
+    rotation = numpy.zeros((3, 3))
+    rotation[index, index] = 1.0
+    rotation[first, first] = rotation[second, second] = cosine
+    rotation[first, second] = -sine
+    rotation[second, first] = sine
+
+    return rotation
+
+
+def _general_rotation_matrix(
+    angle: float, axis: typing.Tuple[float, float, float]
+) -> numpy.ndarray:
+    """The 3x3 matrix of a rotation about an axis through the origin
+
+    Args:
+        angle: The signed angle of the rotation, in degrees
+        axis: The normalized axis of the rotation
+    """
+    x, y, z = axis
+    radians = math.radians(angle)
+    cosine, sine = math.cos(radians), math.sin(radians)
+    versine = 1.0 - cosine
+
+    return numpy.array(
+        [
+            [
+                cosine + x * x * versine,
+                x * y * versine - z * sine,
+                x * z * versine + y * sine,
+            ],
+            [
+                y * x * versine + z * sine,
+                cosine + y * y * versine,
+                y * z * versine - x * sine,
+            ],
+            [
+                z * x * versine - y * sine,
+                z * y * versine + x * sine,
+                cosine + z * z * versine,
+            ],
+        ]
+    )
+
+
+class RotationCache:
+    """Rotation matrices, reused for recurring angles & axes
+
+    Matrices are looked up by the exact angle & axis requested, which is cheap;
+    only when that fails are the angle & (normalized) axis quantized to a
+    tolerance, and each matrix is computed from the quantized values, so
+    rotations within the tolerance of each other share a matrix regardless of
+    which was requested first. The least recently used matrices are discarded
+    once the cache is full.
+    """
+
+    def __init__(self, maximum_size: int = 1024, tolerance: float = 1e-12) -> None:
+        """
+        Args:
+            maximum_size: The most matrices to keep
+            tolerance: The quantum to which angles (in degrees) & axis
+                components are rounded
+        """
+        self.maximum_size = maximum_size
+        self.tolerance = tolerance
+
+        # Matrices by the exact angle & axis they were requested with
+        self._matrices: typing.OrderedDict[typing.Tuple[float, ...], numpy.ndarray] = (
+            collections.OrderedDict()
+        )
+        # The same matrices, by their quantized angle & axis
+        self._quantized: typing.Dict[
+            typing.Tuple[int, int, int, int], numpy.ndarray
+        ] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups which found a cached matrix"""
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def matrix(self, angle: float, axis: typing.Sequence[float]) -> numpy.ndarray:
+        """The 3x3 matrix of a rotation about an axis through the origin
+
+        Args:
+            angle: The signed angle of the rotation, in degrees
+            axis: The axis of the rotation; this need not be normalized
+
+        Returns:
+            The rotation matrix; this is shared, so it's read-only
+        """
+        exact_key = (angle, *axis)
+
+        rotation = self._matrices.get(exact_key)
+        if rotation is not None:
+            self.hits += 1
+            self._matrices.move_to_end(exact_key)
+
+            return rotation
+
+        x, y, z = axis
+        length = math.sqrt(x * x + y * y + z * z)
+        quantum = self.tolerance
+
+        key = (
+            round(angle / quantum),
+            round(x / length / quantum),
+            round(y / length / quantum),
+            round(z / length / quantum),
+        )
+
+        rotation = self._quantized.get(key)
+        if rotation is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+            quantized_angle, x, y, z = (steps * quantum for steps in key)
+            length = math.sqrt(x * x + y * y + z * z)
+            rotation = _general_rotation_matrix(
+                quantized_angle, (x / length, y / length, z / length)
+            )
+            rotation.setflags(write=False)
+
+            self._quantized[key] = rotation
+            # The oldest quantized entries are discarded first
+            while len(self._quantized) > self.maximum_size:
+                del self._quantized[next(iter(self._quantized))]
+
+        self._matrices[exact_key] = rotation
+        while len(self._matrices) > self.maximum_size:
+            self._matrices.popitem(last=False)
+
+        return rotation
+
+    def clear(self) -> None:
+        """Discard every cached matrix & reset the statistics"""
+        self._matrices.clear()
+        self._quantized.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._matrices)
+
+
+# The cache used for every rotation in `sccm`
+rotation_cache = RotationCache()
+
+
+def rotation_matrix(angle: float, axis: typing.Sequence[float]) -> numpy.ndarray:
+    """The 3x3 matrix of a rotation about an axis through the origin
+
+    Right-angle rotations about principal axes are exact; other rotations are
+    looked up in (or added to) `rotation_cache`.
+
+    Args:
+        angle: The signed angle of the rotation, in degrees
+        axis: The axis of the rotation; this need not be normalized
+    """
+    exact_rotation = principal_rotation_matrix(angle, axis)
+    if exact_rotation is not None:
+        return exact_rotation
+
+    return rotation_cache.matrix(angle, axis)
+
+
+class SpatialHash(typing.Generic[Item]):
+    """An index of items by location, for finding those near one another
+
+    Space is divided into cubic cells & each item is filed under the cell
+    containing its point, so a query only examines the items in the few cells
+    it overlaps rather than every item.
+    """
+
+    def __init__(self, cell_size: float = 1.0) -> None:
+        """
+        Args:
+            cell_size: The edge length of the cells; queries are quickest when
+                this is comparable to their radii
+        """
+        self.cell_size = cell_size
+
+        self._points: typing.List[numpy.ndarray] = []
+        self._items: typing.List[Item] = []
+        self._cells: typing.DefaultDict[typing.Tuple[int, ...], typing.List[int]] = (
+            collections.defaultdict(list)
+        )
+
+    def _cell(self, point: numpy.ndarray) -> typing.Tuple[int, ...]:
+        """The cell containing a point
+
+        Args:
+            point: The point's components
+        """
+        return tuple(numpy.floor(point / self.cell_size).astype(int))
+
+    def insert(self, point: "Vector", item: Item) -> None:
+        """Add an item to the index
+
+        Args:
+            point: The location of the item
+            item: The item
+        """
+        self._cells[self._cell(point.array)].append(len(self._items))
+        self._points.append(point.array)
+        self._items.append(item)
+
+    def insert_many(self, points: numpy.ndarray, items: typing.Iterable[Item]) -> None:
+        """Add many items to the index at once
+
+        Args:
+            points: The Nx3 array of the items' locations
+            items: The items, in the same order as their locations
+        """
+        points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+        cells = numpy.floor(points / self.cell_size).astype(int)
+        start = len(self._items)
+
+        for offset, cell in enumerate(map(tuple, cells.tolist())):
+            self._cells[cell].append(start + offset)
+
+        self._points.extend(points)
+        self._items.extend(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def within(self, point: "Vector", radius: float) -> typing.List[Item]:
+        """Find the items no further than a distance from a point
+
+        Args:
+            point: The point to search around
+            radius: The distance to search within
+
+        Returns:
+            The items found, in the order they were inserted
+        """
+        low = self._cell(point.array - radius)
+        high = self._cell(point.array + radius)
+
+        candidates = [
+            index
+            for cell in itertools.product(
+                *(range(start, stop + 1) for start, stop in zip(low, high))
+            )
+            for index in self._cells.get(cell, ())
+        ]
+
+        return [
+            self._items[index]
+            for index in sorted(candidates)
+            if numpy.linalg.norm(self._points[index] - point.array) <= radius
+        ]
+
+    def _coincident_indices(
+        self, tolerance: float
+    ) -> typing.List[typing.Tuple[int, int]]:
+        """Find the indices of every pair of items at equal points
+
+        Args:
+            tolerance: The largest difference in any component of equal points
+        """
+        if not self._items:
+            return []
+
+        points = numpy.array(self._points)
+        cells = numpy.floor(points / tolerance).astype(int)
+
+        grid: typing.DefaultDict[typing.Tuple[int, ...], typing.List[int]] = (
+            collections.defaultdict(list)
+        )
+        for index, cell in enumerate(map(tuple, cells.tolist())):
+            grid[cell].append(index)
+
+        # Points within the tolerance of one another are, at most, in adjacent
+        # cells of a grid with that spacing
+        offsets = list(itertools.product((-1, 0, 1), repeat=3))
+
+        pairs = []
+        for index, cell in enumerate(cells):
+            for offset in offsets:
+                for other_index in grid.get(tuple(cell + offset), ()):
+                    if other_index > index and numpy.all(
+                        numpy.abs(points[other_index] - points[index]) <= tolerance
+                    ):
+                        pairs.append((index, other_index))
+
+        return sorted(pairs)
+
+    def coincident_pairs(
+        self, tolerance: float = EQUALITY_TOLERANCE
+    ) -> typing.List[typing.Tuple[Item, Item]]:
+        """Find every pair of items at equal points
+
+        Points are equal in the same sense as vectors: each of their
+        components is within a tolerance of the other's.
+
+        Args:
+            tolerance: The largest difference in any component of equal points
+
+        Returns:
+            The pairs of items, each in the order they were inserted
+        """
+        return [
+            (self._items[index], self._items[other_index])
+            for index, other_index in self._coincident_indices(tolerance)
+        ]
+
+    def coincident(
+        self, tolerance: float = EQUALITY_TOLERANCE
+    ) -> typing.List[typing.List[Item]]:
+        """Group the items at equal points
+
+        Items are grouped with every item they're coincident with, & with
+        those items' coincident items in turn.
+
+        Args:
+            tolerance: The largest difference in any component of equal points
+
+        Returns:
+            The groups of more than one item, each in the order they were
+            inserted
+        """
+        groups = list(range(len(self._items)))
+
+        def root(index: int) -> int:
+            while groups[index] != index:
+                groups[index] = groups[groups[index]]
+                index = groups[index]
+
+            return index
+
+        for index, other_index in self._coincident_indices(tolerance):
+            groups[root(other_index)] = root(index)
+
+        members: typing.Dict[int, typing.List[Item]] = {}
+        for index, item in enumerate(self._items):
+            members.setdefault(root(index), []).append(item)
+
+        return [group for group in members.values() if len(group) > 1]
+
+
 @functools.total_ordering
 class Vector:
     """A 3-dimensional vector"""
 
+    __slots__ = ("array",)
+
     def __init__(self, components: NumpyVector = numpy.zeros(3)):
         """
         Args:
@@ -96,9 +485,27 @@ class Vector:
         """
         self.array = components.astype(float)
 
-        if math.isnan(self.magnitude):
+        # The magnitude is only undefined if one of the components is
+        if numpy.isnan(self.array).any():
             raise NaNVector(self.array)
 
+    @classmethod
+    def from_valid_components(cls, components: NumpyVector) -> "Vector":
+        """Construct a vector from components already known to be valid
+
+        This skips the copying & checking of the constructor, so is much
+        cheaper.
+
+        Args:
+            components: The components of the vector, as an array of floats,
+                none of which are NaN; the vector uses the array itself, so it
+                must not be modified afterwards
+        """
+        valid = cls.__new__(cls)
+        valid.array = components
+
+        return valid
+
     @property
     def magnitude(self) -> float:
         """This vector's length"""
@@ -162,19 +569,15 @@ class Vector:
     def rotate(self, angle: float, normal: "Vector") -> "Vector":
         """Rotate through an angle in the plane normal to an given vector
 
+        Right-angle rotations about principal axes are applied exactly, and
+        the matrices of other rotations are cached; see `rotation_matrix`.
+
         Args:
             angle: The signed angle through which to rotate this vector
             normal: The normal vector of the plane through which to rotate this
                 vector
         """
-        return self.from_components(
-            vg.rotate(
-                self.array,
-                angle=angle,
-                around_axis=normal.array,
-                assume_normalized=True,
-            )
-        )
+        return self.from_components(rotation_matrix(angle, normal.array) @ self.array)
 
     def rotate_to_alignment(self, inclined: "Vector", reference: "Vector") -> "Vector":
         """Rotate the angle it takes to align an given vector with the reference
@@ -278,7 +681,7 @@ class Vector:
 
     def __neg__(self) -> "Vector":
         """This vector reflected through the origin"""
-        return self.from_components(-self.array)
+        return self.from_valid_components(-self.array)
 
     def __add__(self, other: "Vector") -> "Vector":
         """Add another vector to this one
@@ -308,6 +711,9 @@ class Vector:
     def __eq__(self, other: object) -> bool:
         """Is this vector equal to another?
 
+        Vectors aren't hashable, since no hash can agree with equality to
+        within a tolerance; use a `SpatialHash` to find equal vectors.
+
         Args:
             other: The other vector, to check for equality
 
@@ -317,7 +723,7 @@ class Vector:
         if not isinstance(other, Vector):
             raise NotImplementedError
 
-        return vg.almost_equal(self.array, other.array)
+        return vg.almost_equal(self.array, other.array, atol=EQUALITY_TOLERANCE)
 
     @property
     def x(self) -> float:
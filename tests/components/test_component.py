@@ -1,8 +1,17 @@
+import gc
+import itertools
+import pickle
+import sys
+import typing
 import unittest
+import unittest.mock
+import weakref
 
+import numpy
 import solid
 
-from sccm.components import component
+from sccm import bounding, emission
+from sccm.components import component, sphere
 from tests import utils
 
 
@@ -540,3 +549,664 @@ class TestComponent(unittest.TestCase):
             ),
             msg="Colorless components' bodies should not have colors applied",
         )
+
+    def test_fingerprint(self) -> None:
+        test_component = MockEmbodiedComponent()
+        test_component.add_child(MockEmbodiedComponent())
+
+        copy_component = test_component.copy()
+
+        self.assertEqual(
+            test_component.fingerprint,
+            copy_component.fingerprint,
+            msg="Copies should have the same fingerprint",
+        )
+
+        copy_component.children[0].transform(solid.translate([1.0, 0.0, 0.0]))
+
+        self.assertNotEqual(
+            test_component.fingerprint,
+            copy_component.fingerprint,
+            msg="Changes to children should change the fingerprint",
+        )
+
+    def test_fingerprint_ignores_parent_transformations(self) -> None:
+        parent = component.Component()
+        parent.transform(solid.translate([1.0, 0.0, 0.0]))
+
+        self.assertEqual(
+            component.Component(parent=parent).fingerprint,
+            component.Component().fingerprint,
+            msg="Inherited transformations should not affect the fingerprint",
+        )
+
+    def test_replace_transformations(self) -> None:
+        test_component = component.Component()
+        first, second, third = (
+            solid.translate([float(offset), 0.0, 0.0]) for offset in range(3)
+        )
+        test_component.transform([first, second, third])
+
+        position = test_component.remove_transformations([second])
+        replacement = solid.rotate([90.0, 0.0, 0.0])
+        test_component.insert_transformations(position, [replacement])
+
+        self.assertEqual(
+            test_component.direct_transformations,
+            [first, replacement, third],
+            msg="Transformations should be replaced in place",
+        )
+
+    def test_anchors(self) -> None:
+        test_sphere = sphere.Sphere(diameter=1.0)
+        test_sphere.transform(solid.translate([1.0, 0.0, 0.0]))
+
+        self.assertEqual(
+            test_sphere.anchors,
+            {"center_anchor": test_sphere.center_anchor},
+            msg="Should collect every transformed anchor by name",
+        )
+        self.assertEqual(
+            component.Component().anchors,
+            {},
+            msg="Components without anchor properties should have no anchors",
+        )
+
+
+class TestLayout(unittest.TestCase):
+    def test_slots(self) -> None:
+        self.assertFalse(
+            hasattr(sphere.Sphere(diameter=1.0), "__dict__"),
+            msg="Library components should keep their attributes in slots",
+        )
+
+    def test_unslotted_subclass(self) -> None:
+        test_component = MockEmbodiedComponent(size=2.0)
+
+        self.assertEqual(
+            test_component.copy().size,
+            2.0,
+            msg="Subclasses without slots should still accept any attributes",
+        )
+
+
+class TestDeepTrees(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Deeper than any recursive walk of the tree could go
+        cls.depth = sys.getrecursionlimit()
+
+        cls.root = component.Component().transform(solid.translate([0.0, 0.0, 1.0]))
+        parent = cls.root
+        for _ in range(cls.depth):
+            parent = component.Component(parent=parent)
+
+        cls.leaf = sphere.Sphere(diameter=2.0, parent=parent)
+
+    def test_world_matrix(self) -> None:
+        self.assertEqual(
+            len(list(self.leaf.parents)),
+            self.depth + 1,
+            msg="Every parent of a deep component should be found",
+        )
+        self.assertEqual(
+            self.leaf.world_matrix[2, 3],
+            1.0,
+            msg="A deep component should inherit its parents' transformations",
+        )
+
+    def test_bounds(self) -> None:
+        self.assertEqual(
+            self.root.bounds,
+            bounding.Bounds((-1.0, -1.0, 0.0), (1.0, 1.0, 2.0)),
+            msg="Deep trees should be bounded",
+        )
+
+    def test_scad_source(self) -> None:
+        self.assertEqual(
+            self.root.scad_source(),
+            sphere.Sphere(diameter=2.0)
+            .transform(solid.translate([0.0, 0.0, 1.0]))
+            .scad_source(),
+            msg="Deep trees should be emitted",
+        )
+
+    def test_transformed_scad_source(self) -> None:
+        root = parent = component.Component()
+        for _ in range(self.depth):
+            parent = component.Component(parent=parent).transform(
+                solid.translate([0.0, 0.0, 1.0])
+            )
+        sphere.Sphere(diameter=2.0, parent=parent)
+
+        self.assertEqual(
+            root.scad_source(),
+            sphere.Sphere(diameter=2.0)
+            .transform(solid.translate([0.0, 0.0, float(self.depth)]))
+            .scad_source(),
+            msg="Deep trees transformed at every level should be emitted",
+        )
+
+    def test_copy(self) -> None:
+        copy = self.root.copy()
+
+        self.assertEqual(
+            copy.fingerprint,
+            self.root.fingerprint,
+            msg="Deep trees should be copied",
+        )
+        self.assertEqual(
+            copy.bounds,
+            self.root.bounds,
+            msg="Deep copies should be bounded like their originals",
+        )
+
+    def test_freeze(self) -> None:
+        self.assertEqual(
+            self.root.freeze().fingerprint,
+            self.root.fingerprint,
+            msg="Snapshots of deep trees should be taken",
+        )
+        numpy.testing.assert_array_equal(
+            self.leaf.freeze().world_matrix,
+            self.leaf.world_matrix,
+            err_msg="Snapshots of deep components should inherit transformations",
+        )
+
+
+class TestBuilding(unittest.TestCase):
+    def test_weak_parents(self) -> None:
+        gc.disable()
+        try:
+            with component.building(weak_parents=True):
+                root = component.Component()
+                child = sphere.Sphere(diameter=1.0, parent=root)
+
+            self.assertIs(
+                child.parent,
+                root,
+                msg="Weakly referenced parents should be available while they exist",
+            )
+
+            reference = weakref.ref(root)
+            del root
+
+            self.assertIsNone(
+                reference(),
+                msg="Trees built with weak parents shouldn't need the collector",
+            )
+            self.assertIsNone(
+                child.parent,
+                msg="Discarded parents should no longer be referenced",
+            )
+        finally:
+            gc.enable()
+
+    def test_collector_suspended(self) -> None:
+        with component.building():
+            self.assertFalse(
+                gc.isenabled(), msg="The collector should be suspended while building"
+            )
+
+        self.assertTrue(
+            gc.isenabled(), msg="The collector should be resumed after building"
+        )
+
+
+class TestPickling(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        with component.building(weak_parents=True):
+            root = component.Component()
+            sphere.Sphere(diameter=1.0, parent=root, color=(1.0, 0.0, 0.0))
+            root.compose(solid.difference(), sphere.Sphere(diameter=0.5))
+
+        unpickled = pickle.loads(pickle.dumps(root.copy()))
+
+        self.assertEqual(
+            unpickled.fingerprint,
+            root.fingerprint,
+            msg="Pickled components should have the same structure",
+        )
+        self.assertIs(
+            unpickled.children[0].parent,
+            unpickled,
+            msg="Pickled components should keep their parents",
+        )
+
+        version = unpickled.subtree_version
+        unpickled.compositions[0][1][0].diameter = 2.0
+
+        self.assertGreater(
+            unpickled.subtree_version,
+            version,
+            msg="Pickled components should still track changes to their operands",
+        )
+
+
+class TestVersions(unittest.TestCase):
+    def test_attribute_change(self) -> None:
+        test_sphere = sphere.Sphere(diameter=1.0)
+        version = test_sphere.version
+
+        test_sphere.diameter = 2.0
+
+        self.assertGreater(
+            test_sphere.version,
+            version,
+            msg="Changing a parameter should advance the version",
+        )
+
+    def test_list_change(self) -> None:
+        test_component = component.Component()
+        version = test_component.version
+
+        test_component.direct_transformations.append(solid.translate([1.0, 0.0, 0.0]))
+
+        self.assertGreater(
+            test_component.version,
+            version,
+            msg="Modifying a structural list in place should advance the version",
+        )
+
+    def test_subtree_version(self) -> None:
+        child = sphere.Sphere(diameter=1.0)
+        operand = sphere.Sphere(diameter=1.0)
+        parent = component.Component(children=[child])
+        parent.compose(solid.difference(), operand, make_children=False)
+
+        for changed in (child, operand):
+            version, subtree_version = parent.version, parent.subtree_version
+            changed.transform(solid.translate([1.0, 0.0, 0.0]))
+
+            self.assertEqual(
+                (parent.version, parent.subtree_version > subtree_version),
+                (version, True),
+                msg="Changes within a subtree should only advance its version",
+            )
+
+    def test_observe(self) -> None:
+        changes: typing.List[component.Component] = []
+        child = sphere.Sphere(diameter=1.0)
+        parent = component.Component(children=[child])
+
+        parent.observe(changes.append)
+        child.color = (1.0, 0.0, 0.0)
+        parent.unobserve(changes.append)
+        child.color = None
+
+        self.assertEqual(
+            [id(changed) for changed in changes],
+            [id(child)],
+            msg="Observers should be notified of changes within the subtree",
+        )
+
+    def test_repeated_changes(self) -> None:
+        child = sphere.Sphere(diameter=1.0)
+        parent = component.Component(children=[child])
+        subtree_version = parent.subtree_version
+
+        for diameter in (2.0, 3.0):
+            child.diameter = diameter
+            child.diameter = diameter + 0.5
+
+            self.assertEqual(
+                (parent.subtree_version, child.subtree_version),
+                (child.version, child.version),
+                msg="Subtree versions should follow every change within them",
+            )
+            self.assertGreater(
+                parent.subtree_version,
+                subtree_version,
+                msg="Subtree versions should advance again once they've been read",
+            )
+            subtree_version = parent.subtree_version
+
+    def test_observe_repeated(self) -> None:
+        changes: typing.List[component.Component] = []
+        child = sphere.Sphere(diameter=1.0)
+        parent = component.Component(children=[child])
+
+        parent.observe(changes.append)
+        child.color = (1.0, 0.0, 0.0)
+        child.color = None
+        parent.unobserve(changes.append)
+
+        self.assertEqual(
+            [id(changed) for changed in changes],
+            [id(child), id(child)],
+            msg="Observers should be notified of every change within the subtree",
+        )
+
+    def test_initialization(self) -> None:
+        versions = itertools.count(1)
+
+        with unittest.mock.patch.object(component, "_versions", versions):
+            test_sphere = sphere.Sphere(diameter=1.0)
+
+        self.assertEqual(
+            (test_sphere.version, next(versions)),
+            (1, 2),
+            msg="Initializing a component should be recorded as a single change",
+        )
+
+    def test_untracked_caches(self) -> None:
+        test_sphere = sphere.Sphere(diameter=1.0)
+        version = test_sphere.version
+
+        test_sphere.center_anchor
+
+        self.assertEqual(
+            test_sphere.version,
+            version,
+            msg="Caching derived state should not count as a change",
+        )
+
+
+class TestCopyOnWrite(unittest.TestCase):
+    def test_deferred(self) -> None:
+        test_component = component.Component(children=[sphere.Sphere(diameter=1.0)])
+
+        with unittest.mock.patch.object(sphere.Sphere, "copy") as copy:
+            copy_component = test_component.copy()
+            copy.assert_not_called()
+
+            copy_component.children
+            copy.assert_called_once()
+
+    def test_original_changed(self) -> None:
+        grandchild = sphere.Sphere(diameter=1.0)
+        test_component = component.Component(
+            children=[component.Component(children=[grandchild])]
+        )
+        copy_component = test_component.copy()
+        copy_of_copy = copy_component.copy()
+
+        grandchild.diameter = 2.0
+
+        for copied in (copy_component, copy_of_copy):
+            self.assertEqual(
+                copied.children[0].children[0].diameter,
+                1.0,
+                msg="Copies should not reflect later changes to the original",
+            )
+
+    def test_copy_changed(self) -> None:
+        operand = sphere.Sphere(diameter=1.0)
+        test_component = component.Component().compose(
+            solid.difference(), operand, make_children=False
+        )
+        copy_component = test_component.copy(isolate=True)
+
+        copy_component.compositions[0][1][0].diameter = 2.0
+
+        self.assertEqual(
+            operand.diameter,
+            1.0,
+            msg="Changes to a copy should not affect the original",
+        )
+        self.assertNotEqual(
+            test_component,
+            copy_component,
+            msg="A changed copy should no longer be equal to the original",
+        )
+
+
+class TestBounds(unittest.TestCase):
+    def test_unbounded_custom_body(self) -> None:
+        self.assertFalse(
+            MockEmbodiedComponent().bounds.finite,
+            msg="Bodies without known bounds should be treated as unbounded",
+        )
+
+    def test_container_bounds(self) -> None:
+        container = component.Component(
+            children=[
+                sphere.Sphere(diameter=2.0),
+                sphere.Sphere(diameter=2.0).transform(solid.translate([5, 0, 0])),
+            ]
+        )
+        container.transform(solid.translate([0, 0, 10]))
+
+        self.assertEqual(
+            container.bounds,
+            bounding.Bounds((-1, -1, 9), (6, 1, 11)),
+            msg="Containers should be bounded by their transformed children",
+        )
+
+    def test_difference_bounds(self) -> None:
+        base = sphere.Sphere(diameter=2.0)
+        base.compose(solid.difference(), sphere.Sphere(diameter=10.0))
+
+        self.assertEqual(
+            base.bounds,
+            bounding.Bounds((-1, -1, -1), (1, 1, 1)),
+            msg="Differences should be bounded by the body subtracted from",
+        )
+
+    def test_intersection_bounds(self) -> None:
+        base = sphere.Sphere(diameter=2.0)
+        base.compose(
+            solid.intersection(),
+            sphere.Sphere(diameter=2.0).transform(solid.translate([1, 0, 0])),
+        )
+
+        self.assertEqual(
+            base.bounds,
+            bounding.Bounds((0, -1, -1), (1, 1, 1)),
+            msg="Intersections should be bounded by the shared space",
+        )
+
+    def test_pure_container_bounds(self) -> None:
+        container = component.Component()
+        container.compose(
+            solid.difference(),
+            [sphere.Sphere(diameter=2.0), sphere.Sphere(diameter=20.0)],
+        )
+
+        self.assertEqual(
+            container.bounds,
+            bounding.Bounds((-1, -1, -1), (1, 1, 1)),
+            msg="Pure containers should be bounded by their first operand",
+        )
+
+
+class TestPruning(unittest.TestCase):
+    def far_sphere(self) -> component.Component:
+        return sphere.Sphere(diameter=1.0).transform(solid.translate([10, 0, 0]))
+
+    def test_disjoint_difference_operands_pruned(self) -> None:
+        base = sphere.Sphere(diameter=2.0)
+        near = sphere.Sphere(diameter=1.0)
+        far = self.far_sphere()
+        base.compose(solid.difference(), [near, far])
+
+        with emission.emitting(emission.Emission(prune=True)) as options:
+            body = base.body
+
+        self.assertEqual(
+            len(body.children),
+            2,
+            msg="Only overlapping operands should be subtracted",
+        )
+        self.assertEqual(
+            [pruned.operand for pruned in options.pruned],
+            [far],
+            msg="Pruned operands should be reported",
+        )
+
+    def test_fully_pruned_difference_omitted(self) -> None:
+        base = sphere.Sphere(diameter=2.0)
+        base.compose(solid.difference(), self.far_sphere())
+
+        with emission.emitting(emission.Emission(prune=True)):
+            self.assertTrue(
+                utils.compare_openscad_objects(base.body, solid.sphere(d=2.0)),
+                msg="Differences without operands should be omitted",
+            )
+
+    def test_empty_intersection(self) -> None:
+        base = sphere.Sphere(diameter=2.0, color=(1.0, 0.0, 0.0))
+        base.compose(solid.intersection(), self.far_sphere())
+
+        with emission.emitting(emission.Emission(prune=True)) as options:
+            body = base.body
+
+        self.assertEqual(
+            body.children[0].name,
+            "union",
+            msg="Empty intersections should be emitted as empty bodies",
+        )
+        self.assertEqual(
+            body.children[0].children,
+            [],
+            msg="Empty intersections should be emitted as empty bodies",
+        )
+        self.assertEqual(
+            len(options.pruned), 1, msg="Pruned operands should be reported"
+        )
+
+    def test_union_after_empty_intersection(self) -> None:
+        base = sphere.Sphere(diameter=2.0)
+        base.compose(solid.intersection(), self.far_sphere())
+        base.compose(solid.difference(), sphere.Sphere(diameter=1.0))
+        base.compose(solid.union(), sphere.Sphere(diameter=3.0))
+
+        with emission.emitting(emission.Emission(prune=True)) as options:
+            body = base.body
+
+        self.assertTrue(
+            utils.compare_flattened_openscad_children(
+                body, solid.union()(solid.sphere(d=3.0))
+            ),
+            msg="Only the union's operands should remain",
+        )
+        self.assertEqual(
+            len(options.pruned),
+            2,
+            msg="Operands composed onto an empty body should be pruned",
+        )
+
+    def test_unbounded_operands_kept(self) -> None:
+        base = sphere.Sphere(diameter=2.0)
+        unbounded = MockEmbodiedComponent()
+        unbounded.transform(solid.translate([10, 0, 0]))
+        base.compose(solid.difference(), unbounded)
+
+        with emission.emitting(emission.Emission(prune=True)) as options:
+            base.body
+
+        self.assertEqual(
+            options.pruned, [], msg="Operands with unknown bounds should be kept"
+        )
+
+    def test_no_pruning_by_default(self) -> None:
+        base = sphere.Sphere(diameter=2.0)
+        base.compose(solid.difference(), self.far_sphere())
+
+        self.assertEqual(
+            base.body.name,
+            "difference",
+            msg="Operands should not be pruned unless requested",
+        )
+
+
+class TestFragmentCache(unittest.TestCase):
+    def assembly(self) -> component.Component:
+        assembly = component.Component(
+            children=[
+                sphere.Sphere(diameter=1.0).transform(solid.translate([2, 0, 0])),
+                sphere.Sphere(diameter=2.0, color=(0.0, 1.0, 0.0)),
+            ]
+        )
+        assembly.children[1].compose(solid.difference(), sphere.Sphere(diameter=1.0))
+        assembly.transform(solid.rotate(45))
+
+        return assembly
+
+    def emit(
+        self, root: component.Component, cache: emission.FragmentCache = None
+    ) -> str:
+        with emission.emitting(emission.Emission(cache=cache)):
+            return solid.scad_render(root.body)
+
+    def test_cached_source_unchanged(self) -> None:
+        assembly = self.assembly()
+        cache = emission.FragmentCache()
+
+        self.assertEqual(
+            self.emit(assembly, cache),
+            self.emit(assembly),
+            msg="Cached emission should produce the same source",
+        )
+        self.assertEqual(
+            self.emit(assembly, cache),
+            self.emit(assembly),
+            msg="Emission from a populated cache should produce the same source",
+        )
+
+    def test_unchanged_tree_reused(self) -> None:
+        assembly = self.assembly()
+        cache = emission.FragmentCache()
+
+        self.emit(assembly, cache)
+        misses = cache.misses
+        self.emit(assembly, cache)
+
+        self.assertEqual(
+            (cache.hits, cache.misses),
+            (1, misses),
+            msg="An unchanged tree should be emitted from its root's fragment",
+        )
+
+    def test_changed_subtree_rerendered(self) -> None:
+        assembly = self.assembly()
+        cache = emission.FragmentCache()
+
+        self.emit(assembly, cache)
+        assembly.children[0].transform(solid.translate([0, 1, 0]))
+        misses = cache.misses
+
+        self.assertEqual(
+            self.emit(assembly, cache),
+            self.emit(assembly),
+            msg="Changes should be reflected in cached emission",
+        )
+        self.assertEqual(
+            cache.misses - misses,
+            2,
+            msg="Only the changed component & its ancestors should be rendered",
+        )
+
+    def test_parent_transformations_invalidate(self) -> None:
+        assembly = self.assembly()
+        cache = emission.FragmentCache()
+
+        self.emit(assembly, cache)
+        assembly.transform(solid.translate([0, 0, 1]))
+
+        self.assertEqual(
+            self.emit(assembly, cache),
+            self.emit(assembly),
+            msg="Inherited transformations should be part of each fragment's key",
+        )
+
+    def test_maximum_size(self) -> None:
+        cache = emission.FragmentCache(maximum_size=2)
+        self.emit(self.assembly(), cache)
+
+        self.assertEqual(
+            len(cache), 2, msg="The cache should not grow beyond its limit"
+        )
+
+    def test_not_cached_with_overrides(self) -> None:
+        test_sphere = sphere.Sphere(diameter=1.0)
+        cache = emission.FragmentCache()
+
+        with emission.emitting(
+            emission.Emission(cache=cache, fragments={id(test_sphere): 7})
+        ):
+            test_sphere.body
+
+        self.assertEqual(
+            len(cache), 0, msg="Fragment overrides should bypass the cache"
+        )
@@ -2,7 +2,8 @@ import unittest
 
 import solid
 
-from sccm.components import frustum
+from sccm import connector, vector
+from sccm.components import component, frustum
 from tests import utils
 
 
@@ -200,3 +201,64 @@ class TestCircularFrustum(unittest.TestCase):
             ),
             msg="A circular frustum & equivalent generic frustum should not be equal",
         )
+
+
+class TestAnchorCache(unittest.TestCase):
+    def frustum(self) -> frustum.Frustum:
+        return frustum.Frustum(bottom_circumscribed_circle_diameter=1.0, height=2.0)
+
+    def test_reused(self) -> None:
+        test_frustum = self.frustum()
+
+        self.assertIs(
+            test_frustum.top_anchor,
+            test_frustum.top_anchor,
+            msg="Anchors should be reused while nothing changes",
+        )
+
+    def test_transformation_invalidates(self) -> None:
+        test_frustum = self.frustum()
+        test_frustum.top_anchor
+        test_frustum.transform(solid.translate([1, 0, 0]))
+
+        self.assertEqual(
+            test_frustum.top_anchor,
+            connector.Connector.from_components(point_x=1.0, point_z=2.0),
+            msg="Transformations should invalidate anchors",
+        )
+
+    def test_parent_transformation_invalidates(self) -> None:
+        test_frustum = self.frustum()
+        parent = component.Component(children=[test_frustum])
+        test_frustum.bottom_anchor
+        parent.transform(solid.rotate(a=180, v=[1, 0, 0]))
+
+        self.assertEqual(
+            test_frustum.bottom_anchor,
+            connector.Connector(axis=-vector.AXIS_Z),
+            msg="Parents' transformations should invalidate anchors",
+        )
+
+    def test_parenting_invalidates(self) -> None:
+        test_frustum = self.frustum()
+        test_frustum.center_anchor
+        component.Component(children=[test_frustum]).transform(
+            solid.translate([0, 0, 1])
+        )
+
+        self.assertEqual(
+            test_frustum.center_anchor,
+            connector.Connector.from_components(point_z=2.0),
+            msg="Being given a parent should invalidate anchors",
+        )
+
+    def test_parameters_invalidate(self) -> None:
+        test_frustum = self.frustum()
+        test_frustum.top_anchor
+        test_frustum.height = 4.0
+
+        self.assertEqual(
+            test_frustum.top_anchor,
+            connector.Connector.from_components(point_z=4.0),
+            msg="Parameter changes should invalidate anchors",
+        )
@@ -0,0 +1,137 @@
+import unittest
+
+import numpy
+import solid
+
+from sccm import connector, emission
+from sccm.components import component, cylinder, instance
+
+
+class TestInstance(unittest.TestCase):
+    def setUp(self) -> None:
+        self.template = cylinder.Cylinder(diameter=0.2, height=1.0)
+        self.template.transform(solid.translate([0, 0, 0.5]))
+        self.targets = connector.ConnectorArray.from_components(
+            point_x=numpy.arange(4), axis_x=numpy.arange(4) - 2, axis_z=-1.0
+        )
+
+    def placed(self) -> component.Component:
+        plate = component.Component()
+        plate.place(self.template, self.template.top_anchor, self.targets)
+
+        return plate
+
+    def copied(self) -> component.Component:
+        plate = component.Component()
+
+        for target in self.targets:
+            plate.add_child(
+                self.template.copy(isolate=True).transform(
+                    self.template.top_anchor.align(target)
+                )
+            )
+
+        return plate
+
+    def test_place(self) -> None:
+        placed = self.placed()
+
+        self.assertEqual(
+            len(placed.children), 4, msg="Each target should get an instance"
+        )
+        for placed_instance in placed.children:
+            self.assertIs(
+                placed_instance.template,
+                self.template,
+                msg="Instances should share their template",
+            )
+
+    def test_place_equivalent_to_copies(self) -> None:
+        for placed_instance, copy in zip(
+            self.placed().children, self.copied().children
+        ):
+            self.assertEqual(
+                placed_instance.bounds,
+                copy.bounds,
+                msg="Instances should be placed as aligned copies would be",
+            )
+
+    def test_place_connectors(self) -> None:
+        self.assertEqual(
+            len(
+                component.Component().place(
+                    self.template, self.template.top_anchor, list(self.targets)
+                )
+            ),
+            4,
+            msg="Targets may also be individual connectors",
+        )
+
+    def test_module_calls(self) -> None:
+        placed = self.placed()
+
+        with emission.emitting(emission.Emission(modules={})) as options:
+            source = solid.scad_render(placed.body)
+
+        name = placed.children[0].module_name
+        self.assertEqual(
+            list(options.modules),
+            [name],
+            msg="The template should be defined as a single module",
+        )
+        self.assertEqual(
+            source.count(f"{name}();"),
+            4,
+            msg="Each instance should call the template's module",
+        )
+        self.assertNotIn(
+            "cylinder(", source, msg="The template shouldn't be emitted inline"
+        )
+
+    def test_inline_without_modules(self) -> None:
+        self.assertEqual(
+            solid.scad_render(self.placed().body).count("cylinder("),
+            4,
+            msg="Without module definitions, templates should be emitted inline",
+        )
+
+    def test_modules_from_cache(self) -> None:
+        placed = self.placed()
+        cache = emission.FragmentCache()
+
+        for _ in range(2):
+            with emission.emitting(
+                emission.Emission(cache=cache, modules={})
+            ) as options:
+                placed.body
+
+            self.assertEqual(
+                len(options.modules),
+                1,
+                msg="Modules used by cached fragments should still be defined",
+            )
+
+    def test_template_changes(self) -> None:
+        placed = self.placed()
+        name = placed.children[0].module_name
+        self.template.color = (1.0, 0.0, 0.0)
+
+        self.assertNotEqual(
+            placed.children[0].module_name,
+            name,
+            msg="Changed templates should be given new modules",
+        )
+
+    def test_copy(self) -> None:
+        placed_instance = self.placed().children[0]
+
+        self.assertEqual(
+            placed_instance.copy(),
+            placed_instance,
+            msg="Copies of instances should be equal to the original",
+        )
+        self.assertNotEqual(
+            placed_instance,
+            instance.Instance(cylinder.Cylinder(diameter=0.2, height=2.0)),
+            msg="Instances of different templates should not be equal",
+        )
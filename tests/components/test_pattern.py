@@ -0,0 +1,109 @@
+import unittest
+
+import numpy
+import solid
+
+from sccm import emission
+from sccm.components import component, cylinder, pattern
+
+
+class TestPattern(unittest.TestCase):
+    def setUp(self) -> None:
+        self.template = cylinder.Cylinder(diameter=0.2, height=1.0)
+
+    def copies(self, transformations: list) -> component.Component:
+        return component.Component(
+            children=[
+                self.template.copy(isolate=True).transform(transformation)
+                for transformation in transformations
+            ]
+        )
+
+    def test_linear_bounds(self) -> None:
+        self.assertEqual(
+            pattern.LinearPattern(self.template, 3, (1, 0, 0)).bounds,
+            self.copies([solid.translate([index, 0, 0]) for index in range(3)]).bounds,
+            msg="Linear patterns should be bounded by every instance",
+        )
+
+    def test_circular_placements(self) -> None:
+        circular_pattern = pattern.CircularPattern(self.template, 4)
+        circular_pattern.transform(solid.translate([0, 0, 5]))
+
+        for placed_instance, copy in zip(
+            circular_pattern.instances,
+            self.copies(
+                [
+                    [solid.rotate(a=index * 90.0), solid.translate([0, 0, 5])]
+                    for index in range(4)
+                ]
+            ).children,
+        ):
+            numpy.testing.assert_allclose(
+                placed_instance.world_matrix,
+                copy.world_matrix,
+                atol=1e-12,
+                err_msg="Instances should include the pattern's transformations",
+            )
+
+    def test_grid_connectors(self) -> None:
+        grid_pattern = pattern.GridPattern(self.template, 2, 3, (0, 1, 0), (1, 0, 0))
+
+        numpy.testing.assert_allclose(
+            grid_pattern.connectors(self.template.top_anchor).points,
+            [[column, row, 1] for row in range(2) for column in range(3)],
+            err_msg="Connectors should be placed at each instance, row by row",
+        )
+
+    def test_loop_emitted(self) -> None:
+        grid_pattern = pattern.GridPattern(self.template, 2, 3, (0, 1, 0), (1, 0, 0))
+
+        with emission.emitting(emission.Emission(modules={})) as options:
+            source = solid.scad_render(grid_pattern.body)
+
+        self.assertEqual(
+            source.strip().splitlines()[0],
+            "for (i = [0 : 1], j = [0 : 2]) translate(i * [0, 1, 0] + j * [1, 0, 0]) {",
+            msg="Patterns should be emitted as loops",
+        )
+        self.assertIn(
+            f"{grid_pattern.module_name}();",
+            source,
+            msg="Loops should call the template's module",
+        )
+        self.assertEqual(
+            len(options.modules), 1, msg="The template should be defined once"
+        )
+
+    def test_loop_inline(self) -> None:
+        self.assertEqual(
+            solid.scad_render(
+                pattern.LinearPattern(self.template, 3, (1, 0, 0)).body
+            ).count("cylinder("),
+            1,
+            msg="Without modules, the template should be emitted once, in the loop",
+        )
+
+    def test_empty(self) -> None:
+        self.assertTrue(
+            pattern.LinearPattern(self.template, 0, (1, 0, 0)).bounds.empty,
+            msg="Empty patterns should have empty bounds",
+        )
+        self.assertTrue(
+            pattern.CircularPattern(self.template, 0).bounds.empty,
+            msg="Empty circular patterns shouldn't need a step",
+        )
+
+    def test_copy(self) -> None:
+        circular_pattern = pattern.CircularPattern(self.template, 5, axis=(1, 0, 0))
+
+        self.assertEqual(
+            circular_pattern.copy(),
+            circular_pattern,
+            msg="Copies of patterns should be equal to the original",
+        )
+        self.assertNotEqual(
+            circular_pattern.fingerprint,
+            pattern.CircularPattern(self.template, 6, axis=(1, 0, 0)).fingerprint,
+            msg="Pattern parameters should be part of the fingerprint",
+        )
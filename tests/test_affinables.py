@@ -1,6 +1,7 @@
 import typing
 import unittest
 
+import numpy
 import solid
 
 from sccm import affinables
@@ -165,6 +166,15 @@ class TestHolonomicTransformable(unittest.TestCase):
             msg="Scaling should be correctly dispatched",
         )
 
+    def test_transform_dispatch_multmatrix_unsupported(self) -> None:
+        holonomic_transformable = MockHolonomicTransformable()
+
+        with self.assertRaises(
+            NotImplementedError,
+            msg="Matrix transformations should error out unless supported",
+        ):
+            holonomic_transformable.transform(solid.multmatrix(numpy.identity(4)))
+
     def test_transform_dispatch_unsuported(self) -> None:
         holonomic_transformable = MockHolonomicTransformable()
 
@@ -286,3 +296,73 @@ class TestHistoricalTransformable(unittest.TestCase):
             ),
             msg="The property should be correctly transformed, identically to the parent Affinable",
         )
+
+
+class TestMatrix(unittest.TestCase):
+    point = numpy.array([1.0, 2.0, 3.0, 1.0])
+
+    def test_translate(self) -> None:
+        numpy.testing.assert_allclose(
+            affinables.matrix(solid.translate([1, 2, 3])) @ self.point,
+            [2, 4, 6, 1],
+            err_msg="Translations should offset points",
+        )
+
+    def test_scale(self) -> None:
+        numpy.testing.assert_allclose(
+            affinables.matrix(solid.scale([1, 2, 3])) @ self.point,
+            [1, 4, 9, 1],
+            err_msg="Scalings should scale points",
+        )
+
+    def test_rotate_axis(self) -> None:
+        numpy.testing.assert_allclose(
+            affinables.matrix(solid.rotate(a=90, v=[0, 1, 0])) @ self.point,
+            [3, 2, -1, 1],
+            atol=1e-12,
+            err_msg="Rotations should be about the given axis",
+        )
+
+    def test_rotate_default_axis(self) -> None:
+        numpy.testing.assert_allclose(
+            affinables.matrix(solid.rotate(a=90)) @ self.point,
+            [-2, 1, 3, 1],
+            atol=1e-12,
+            err_msg="Rotations without an axis should be about Z",
+        )
+
+    def test_rotate_successive(self) -> None:
+        numpy.testing.assert_allclose(
+            affinables.matrix(solid.rotate(a=[10, 20, 30])),
+            affinables.compose(
+                [
+                    solid.rotate(a=10, v=[1, 0, 0]),
+                    solid.rotate(a=20, v=[0, 1, 0]),
+                    solid.rotate(a=30, v=[0, 0, 1]),
+                ]
+            ),
+            err_msg="Angle vectors should rotate about X, then Y, then Z",
+        )
+
+    def test_multmatrix(self) -> None:
+        matrix = [[0, -1, 0, 5], [1, 0, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+
+        numpy.testing.assert_allclose(
+            affinables.matrix(solid.multmatrix(matrix)),
+            matrix,
+            err_msg="Matrix transformations should use their own matrix",
+        )
+
+    def test_unsupported(self) -> None:
+        with self.assertRaises(
+            NotImplementedError, msg="Unsupported transformations should error out"
+        ):
+            affinables.matrix(solid.color("red"))
+
+    def test_compose_order(self) -> None:
+        numpy.testing.assert_allclose(
+            affinables.compose([solid.translate([1, 0, 0]), solid.scale([2, 2, 2])])
+            @ self.point,
+            [4, 4, 6, 1],
+            err_msg="Transformations should be composed in order of application",
+        )
@@ -0,0 +1,219 @@
+import collections
+import re
+import unittest
+
+import solid
+
+from sccm import analysis, resolution
+from sccm.components import component, cylinder, instance, pattern, sphere
+
+
+class TestAnalysis(unittest.TestCase):
+    def assembly(self) -> component.Component:
+        body = cylinder.Cylinder(diameter=10.0, height=5.0)
+        hole = cylinder.Cylinder(diameter=1.0, height=5.0)
+        hole.transform(solid.translate([2.0, 0.0, 0.0]))
+        body.compose(solid.difference(), hole)
+
+        knob = sphere.Sphere(diameter=2.0, resolution=resolution.Resolution(fn=8))
+        knob.transform(solid.translate([0.0, 0.0, 5.0]))
+
+        return component.Component(
+            children=[body, knob], resolution=resolution.Resolution(fn=20)
+        )
+
+    def test_node_counts(self) -> None:
+        report = analysis.analyse(self.assembly())
+
+        self.assertEqual(
+            dict(report.node_counts),
+            {
+                "cylinder": 2,
+                "sphere": 1,
+                "translate": 2,
+                "difference": 1,
+                "union": 1,
+            },
+            msg="Emitted nodes should be counted by type",
+        )
+
+    def test_facets(self) -> None:
+        assembly = self.assembly()
+        report = analysis.analyse(assembly)
+
+        self.assertEqual(
+            report.facets,
+            sum(primitive.facets for primitive in report.primitives),
+            msg="The total facets should be those of every primitive",
+        )
+        self.assertEqual(
+            [primitive.fragments for primitive in report.primitives],
+            [20, 20, 8],
+            msg="Fragments should reflect the resolution settings",
+        )
+
+    def test_default_resolution(self) -> None:
+        coarse = analysis.analyse(
+            self.assembly(), default_resolution=resolution.Resolution(fn=8)
+        )
+        fine = analysis.analyse(
+            component.Component(
+                children=[cylinder.Cylinder(diameter=10.0, height=5.0)]
+            ),
+            default_resolution=resolution.Resolution(fn=80),
+        )
+
+        self.assertEqual(
+            coarse.primitives[0].fragments,
+            20,
+            msg="Assigned resolutions should take precedence over the default",
+        )
+        self.assertEqual(
+            fine.primitives[0].fragments,
+            80,
+            msg="The default resolution should apply to unassigned components",
+        )
+
+    def test_depth(self) -> None:
+        self.assertEqual(
+            analysis.analyse(self.assembly()).depth,
+            3,
+            msg="The depth should count nested CSG operations",
+        )
+
+    def test_transformation_chains(self) -> None:
+        assembly = self.assembly()
+        assembly.transform(solid.rotate([0.0, 0.0, 45.0]))
+
+        self.assertEqual(
+            analysis.analyse(assembly, optimize=False).longest_transformation_chain,
+            2,
+            msg="Inherited transformations should count towards chain lengths",
+        )
+        self.assertEqual(
+            analysis.analyse(assembly).longest_transformation_chain,
+            1,
+            msg="Optimization should merge chains of transformations",
+        )
+
+    def test_emitted_node_counts(self) -> None:
+        assembly = self.assembly()
+        assembly.children[0].compose(
+            solid.difference(), cylinder.Cylinder(diameter=1.0, height=5.0)
+        )
+        assembly.transform(solid.rotate([0.0, 0.0, 45.0]))
+        template = sphere.Sphere(diameter=1.0).transform(solid.translate([1.0, 0, 0]))
+        component.Component(
+            children=[
+                instance.Instance(template),
+                pattern.LinearPattern(template, 3, (0.0, 2.0, 0.0)),
+            ],
+            parent=assembly,
+        )
+
+        for optimize in (True, False):
+            # Every node, but not module definitions, starts a line of source
+            emitted = collections.Counter(
+                re.findall(
+                    r"^\s*(?!module\b)(\w+)\s*\(",
+                    assembly.scad_source(optimize=optimize),
+                    re.MULTILINE,
+                )
+            )
+
+            self.assertEqual(
+                dict(analysis.analyse(assembly, optimize=optimize).node_counts),
+                dict(emitted),
+                msg=f"Should count the nodes emitted with optimize={optimize}",
+            )
+
+        self.assertEqual(
+            analysis.analyse(assembly).node_counts["difference"],
+            1,
+            msg="Optimization should flatten chained differences",
+        )
+
+    def test_ranking(self) -> None:
+        report = analysis.analyse(self.assembly())
+
+        self.assertIs(
+            report.ranked[0].component,
+            self.assembly_body(report),
+            msg="The difference should dominate the cost",
+        )
+        self.assertAlmostEqual(
+            report.cost,
+            sum(subtree.own_cost for subtree in report.subtrees),
+            msg="The total cost should be the sum of every subtree's own cost",
+        )
+
+    def assembly_body(self, report: analysis.Report) -> component.Component:
+        return report.root.component.children[0]
+
+    def test_duplicates(self) -> None:
+        original = cylinder.Cylinder(diameter=1.0, height=1.0)
+        copy = original.copy()
+        different = cylinder.Cylinder(diameter=2.0, height=1.0)
+
+        report = analysis.analyse(
+            component.Component(children=[original, copy, different])
+        )
+
+        self.assertEqual(
+            list(report.duplicates.values())[0][0].component,
+            original,
+            msg="Structurally identical subtrees should be reported",
+        )
+        self.assertEqual(
+            len(report.duplicates),
+            1,
+            msg="Only structurally identical subtrees should be reported",
+        )
+
+    def test_instances(self) -> None:
+        template = sphere.Sphere(diameter=2.0, resolution=resolution.Resolution(fn=8))
+        template_facets = template.facets(8)
+
+        report = analysis.analyse(
+            component.Component(
+                children=[
+                    instance.Instance(template),
+                    pattern.LinearPattern(template, 4, (3.0, 0.0, 0.0)),
+                ]
+            )
+        )
+
+        self.assertEqual(
+            report.facets,
+            5 * template_facets,
+            msg="Templates' facets should be counted at every placement",
+        )
+        self.assertEqual(
+            len(report.templates),
+            1,
+            msg="Shared templates should be analysed once",
+        )
+        self.assertFalse(
+            report.duplicates,
+            msg="Instances of a template shouldn't be reported as duplicates",
+        )
+
+    def test_explain(self) -> None:
+        explanation = analysis.analyse(self.assembly()).explain(limit=2)
+
+        self.assertIn(
+            "Component.children[0]",
+            explanation,
+            msg="The explanation should identify expensive subtrees",
+        )
+        self.assertEqual(
+            len(
+                [
+                    line
+                    for line in explanation.splitlines()
+                    if "facets)" in line and "total:" in line
+                ]
+            ),
+            2,
+            msg="The explanation should be limited to the requested subtrees",
+        )
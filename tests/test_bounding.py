@@ -0,0 +1,87 @@
+import unittest
+
+import numpy
+
+from sccm import bounding
+
+
+class TestBounds(unittest.TestCase):
+    unit = bounding.Bounds((0, 0, 0), (1, 1, 1))
+
+    def test_empty(self) -> None:
+        self.assertTrue(bounding.Bounds().empty, msg="Default bounds should be empty")
+        self.assertFalse(self.unit.empty, msg="Ordinary bounds should not be empty")
+
+    def test_from_points(self) -> None:
+        self.assertEqual(
+            bounding.Bounds.from_points(numpy.array([[1, 5, -1], [-2, 0, 3]])),
+            bounding.Bounds((-2, 0, -1), (1, 5, 3)),
+            msg="Bounds should be the smallest containing all of the points",
+        )
+
+    def test_union(self) -> None:
+        self.assertEqual(
+            self.unit.union(bounding.Bounds((2, 2, 2), (3, 3, 3))),
+            bounding.Bounds((0, 0, 0), (3, 3, 3)),
+            msg="Unions should contain both bounds",
+        )
+        self.assertEqual(
+            bounding.Bounds().union(self.unit),
+            self.unit,
+            msg="The union with empty bounds should be the other bounds",
+        )
+
+    def test_intersection(self) -> None:
+        self.assertEqual(
+            self.unit.intersection(bounding.Bounds((0.5, 0.5, 0.5), (3, 3, 3))),
+            bounding.Bounds((0.5, 0.5, 0.5), (1, 1, 1)),
+            msg="Intersections should contain only the shared space",
+        )
+        self.assertTrue(
+            self.unit.intersection(bounding.Bounds((2, 2, 2), (3, 3, 3))).empty,
+            msg="Intersections of disjoint bounds should be empty",
+        )
+
+    def test_overlaps(self) -> None:
+        self.assertTrue(
+            self.unit.overlaps(bounding.Bounds((1, 1, 1), (2, 2, 2))),
+            msg="Touching bounds should overlap",
+        )
+        self.assertFalse(
+            self.unit.overlaps(bounding.Bounds((1.1, 0, 0), (2, 1, 1))),
+            msg="Disjoint bounds should not overlap",
+        )
+
+    def test_contains(self) -> None:
+        self.assertTrue(
+            self.unit.contains(bounding.Bounds((0.2, 0.2, 0.2), (0.8, 0.8, 0.8))),
+            msg="Bounds should contain bounds within them",
+        )
+        self.assertFalse(
+            self.unit.contains(bounding.Bounds((0.2, 0.2, 0.2), (1.8, 0.8, 0.8))),
+            msg="Bounds should not contain bounds extending outside them",
+        )
+
+    def test_transformed(self) -> None:
+        matrix = numpy.identity(4)
+        matrix[:3, :3] = [[0, -1, 0], [1, 0, 0], [0, 0, 1]]
+        matrix[:3, 3] = [10, 0, 0]
+
+        self.assertEqual(
+            self.unit.transformed(matrix),
+            bounding.Bounds((9, 0, 0), (10, 1, 1)),
+            msg="Transformed bounds should contain the transformed box",
+        )
+
+    def test_transformed_unbounded(self) -> None:
+        self.assertFalse(
+            bounding.Bounds.unbounded().transformed(numpy.identity(4)).finite,
+            msg="Unbounded bounds should remain unbounded when transformed",
+        )
+
+    def test_eq_wrong_type(self) -> None:
+        with self.assertRaises(
+            NotImplementedError,
+            msg="Should error out if the comparison value has the wrong type",
+        ):
+            self.unit == "test"
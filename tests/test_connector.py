@@ -1,11 +1,23 @@
+import typing
 import unittest
 
+import numpy
 import solid
 
-from sccm import connector, vector
+from sccm import affinables, connector, vector
 
 
 class TestConnector(unittest.TestCase):
+
+    def test_unhashable(self) -> None:
+        rolled = connector.Connector(normal=vector.AXIS_Y)
+        diagonal = vector.Vector.from_raw((1.0, 1.0, 1.0))
+        round_trip = rolled.rotate_about(120.0, diagonal).rotate_about(-120.0, diagonal)
+        self.assertEqual(rolled, round_trip, msg="Should be equal within tolerance")
+
+        with self.assertRaises(TypeError, msg="Should not be hashable"):
+            hash(rolled)
+
     def test_roll_preserved(self) -> None:
         self.assertAlmostEqual(
             connector.Connector.from_components(roll=45.0).roll,
@@ -360,6 +372,109 @@ class TestConnector(unittest.TestCase):
             msg="Connectors that don't need to be altered for alignment shouldn't be",
         )
 
+    def test_align_as_matrix(self) -> None:
+        original_connector = connector.Connector.from_components(
+            point_x=136, axis_x=-12, axis_y=0.135, axis_z=15, roll=-15
+        )
+        target_connector = connector.Connector.from_components(
+            point_y=631, axis_x=172, axis_z=-125, roll=214
+        )
+
+        transformations = list(
+            original_connector.align(target_connector, as_matrix=True)
+        )
+
+        self.assertEqual(
+            len(transformations), 1, msg="Should emit a single transformation"
+        )
+        self.assertEqual(
+            original_connector.transform(transformations),
+            target_connector,
+            msg="Should align two complex connectors with a matrix",
+        )
+
+    def test_align_single_rotation(self) -> None:
+        transformations = list(
+            connector.Connector.from_components(
+                point_x=1, axis_x=1, axis_y=1, roll=30
+            ).align()
+        )
+
+        self.assertEqual(
+            [type(transformation) for transformation in transformations],
+            [solid.rotate, solid.translate],
+            msg="Alignment should need at most one rotation & one translation",
+        )
+
+    def test_align_antiparallel(self) -> None:
+        original_connector = connector.Connector.from_components(axis_z=-1.0)
+
+        self.assertEqual(
+            original_connector.transform(original_connector.align()),
+            connector.Connector(),
+            msg="Should align connectors with opposing primary axes",
+        )
+
+    def test_roll_preserved_antiparallel(self) -> None:
+        self.assertAlmostEqual(
+            connector.Connector.from_components(axis_z=-1.0, roll=30.0).roll,
+            30.0,
+            msg="The roll should be preserved with a primary axis along -Z",
+        )
+
+    def test_frame_orthonormal(self) -> None:
+        frame = connector.Connector(
+            axis=vector.Vector.from_raw([0, 0, 2]),
+            normal=vector.Vector.from_raw([1, 0, 1]),
+        ).frame
+
+        numpy.testing.assert_allclose(
+            frame.T @ frame,
+            numpy.identity(3),
+            atol=1e-12,
+            err_msg="Connector frames should be orthonormal",
+        )
+
+    def test_multmatrix(self) -> None:
+        rotation = solid.rotate(a=30, v=[1, 2, 3])
+        translation = solid.translate([4, 5, 6])
+        original_connector = connector.Connector.from_components(
+            point_x=1, axis_y=1, roll=10
+        )
+
+        self.assertEqual(
+            original_connector.transform(
+                solid.multmatrix(affinables.compose([rotation, translation]).tolist())
+            ),
+            original_connector.transform([rotation, translation]),
+            msg="Matrix transformations should be equivalent to their sequence",
+        )
+
+    def test_rotate_right_angles_exact(self) -> None:
+        rotated_connector = connector.Connector(
+            point=vector.Vector.from_raw([1, 2, 3])
+        ).rotate(solid.rotate([90, 0, 0]))
+
+        numpy.testing.assert_array_equal(
+            rotated_connector.point.array,
+            [1, -3, 2],
+            err_msg="Right-angle rotations should leave coordinates exact",
+        )
+        numpy.testing.assert_array_equal(
+            rotated_connector.frame,
+            [[1, 0, 0], [0, 0, -1], [0, 1, 0]],
+            err_msg="Right-angle rotations should leave frames exact",
+        )
+
+    def test_align_right_angles_minimal(self) -> None:
+        rotated_connector = connector.Connector().rotate(solid.rotate([90, 0, 0]))
+
+        self.assertEqual(
+            list(rotated_connector.align(rotated_connector)),
+            [],
+            msg="Exactly rotated connectors should align without transformations",
+        )
+
     def test_eq_wrong_type(self) -> None:
         with self.assertRaises(
             NotImplementedError,
@@ -373,3 +488,154 @@ class TestConnector(unittest.TestCase):
             "{<0.0, 0.0, 0.0>; <0.0, 0.0, 1.0>; <1.0, 0.0, 0.0>}",
             msg="Should have the correct string representation",
         )
+
+
+class TestConnectorArray(unittest.TestCase):
+    def connectors(self) -> typing.List[connector.Connector]:
+        return [
+            connector.Connector.from_components(
+                point_x=index,
+                point_y=-index,
+                axis_x=index - 2,
+                axis_y=0.5,
+                axis_z=-1.0,
+                roll=roll,
+            )
+            for index, roll in enumerate([-90.0, -45.0, 0.0, 45.0, 180.0])
+        ]
+
+    def test_from_components(self) -> None:
+        self.assertEqual(
+            connector.ConnectorArray.from_components(
+                point_x=numpy.arange(5),
+                point_y=-numpy.arange(5),
+                axis_x=numpy.arange(5) - 2,
+                axis_y=0.5,
+                axis_z=-1.0,
+                roll=[-90.0, -45.0, 0.0, 45.0, 180.0],
+            ),
+            connector.ConnectorArray.from_connectors(self.connectors()),
+            msg="Component arrays should construct the same connectors as scalars",
+        )
+
+    def test_defaults(self) -> None:
+        self.assertEqual(
+            list(connector.ConnectorArray(numpy.zeros((2, 3)))),
+            [connector.Connector(), connector.Connector()],
+            msg="Axes should default to those of the default connector",
+        )
+
+    def test_rolls(self) -> None:
+        numpy.testing.assert_allclose(
+            connector.ConnectorArray.from_connectors(self.connectors()).rolls,
+            [connector.roll for connector in self.connectors()],
+            err_msg="Rolls should match those of the individual connectors",
+        )
+
+    def test_transform(self) -> None:
+        transformations = [
+            solid.rotate(a=30, v=[1, 2, 3]),
+            solid.translate([1, 2, 3]),
+            solid.rotate(a=[10, 20, 30]),
+            solid.scale([2, 1, 1]),
+            solid.multmatrix(affinables.compose([solid.rotate(a=45)]).tolist()),
+        ]
+
+        self.assertEqual(
+            list(
+                connector.ConnectorArray.from_connectors(self.connectors()).transform(
+                    transformations
+                )
+            ),
+            [
+                original_connector.transform(transformations)
+                for original_connector in self.connectors()
+            ],
+            msg="Every connector should be transformed as it would be alone",
+        )
+
+    def test_rotate_malformed(self) -> None:
+        with self.assertRaises(
+            connector.MalformedRotation,
+            msg="Rotation with a vector parameter but no angle is malformed",
+        ):
+            connector.ConnectorArray(numpy.zeros((1, 3))).rotate(
+                solid.rotate(v=[1, 0, 0])
+            )
+
+    def test_align_one_to_many(self) -> None:
+        connectors = self.connectors()
+        target_connector = connector.Connector.from_components(
+            point_z=5.0, axis_y=1.0, roll=30.0
+        )
+
+        for original_connector, transformations in zip(
+            connectors,
+            connector.ConnectorArray.from_connectors(connectors).align(
+                target_connector
+            ),
+        ):
+            self.assertEqual(
+                original_connector.transform(transformations),
+                target_connector,
+                msg="Every connector should be aligned with the target",
+            )
+
+    def test_align_many_to_one(self) -> None:
+        original_connector = connector.Connector.from_components(point_z=5.0)
+
+        for target_connector, transformations in zip(
+            self.connectors(),
+            connector.ConnectorArray.from_connectors([original_connector]).align(
+                connector.ConnectorArray.from_connectors(self.connectors()),
+                as_matrix=True,
+            ),
+        ):
+            self.assertEqual(
+                original_connector.transform(transformations),
+                target_connector,
+                msg="The connector should be aligned with every target",
+            )
+
+    def test_align_pairwise(self) -> None:
+        connectors = self.connectors()
+        connector_array = connector.ConnectorArray.from_connectors(connectors)
+
+        for original_connector, target_connector, transformations in zip(
+            connectors, connectors[::-1], connector_array.align(connector_array[::-1])
+        ):
+            self.assertEqual(
+                original_connector.transform(transformations),
+                target_connector,
+                msg="Connectors should be aligned pairwise",
+            )
+
+    def test_align_noop(self) -> None:
+        connector_array = connector.ConnectorArray.from_connectors(self.connectors())
+
+        self.assertEqual(
+            connector_array.align(connector_array),
+            [[]] * len(connector_array),
+            msg="Connectors already aligned shouldn't be transformed",
+        )
+
+    def test_indexing(self) -> None:
+        connector_array = connector.ConnectorArray.from_connectors(self.connectors())
+
+        self.assertEqual(
+            connector_array[3],
+            self.connectors()[3],
+            msg="Individual connectors should be extracted by index",
+        )
+        self.assertEqual(
+            connector_array[1:3],
+            connector.ConnectorArray.from_connectors(self.connectors()[1:3]),
+            msg="Slices should extract arrays of connectors",
+        )
+
+    def test_eq_wrong_type(self) -> None:
+        with self.assertRaises(
+            NotImplementedError,
+            msg="Should error out if the comparison value has the wrong type",
+        ):
+            connector.ConnectorArray(numpy.zeros((1, 3))) == "test"
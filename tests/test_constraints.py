@@ -0,0 +1,326 @@
+import time
+import typing
+import unittest
+
+import numpy
+import solid
+
+from sccm import connector, constraints, vector
+from sccm.components import component, cylinder
+
+
+class TestSolve(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base = cylinder.Cylinder(diameter=2.0, height=1.0)
+
+        self.peg = cylinder.Cylinder(diameter=1.0, height=3.0)
+        self.peg.transform(solid.rotate([30.0, 40.0, 10.0]))
+        self.peg.transform(solid.translate([5.0, 2.0, 1.0]))
+
+    def test_coincident_parallel(self) -> None:
+        constraints.solve(
+            [
+                constraints.Coincident(
+                    (self.base, self.base.top_anchor),
+                    (self.peg, self.peg.bottom_anchor),
+                ),
+                constraints.Parallel(
+                    (self.base, self.base.top_anchor),
+                    (self.peg, self.peg.bottom_anchor),
+                ),
+            ],
+            fixed=[self.base],
+        )
+
+        self.assertEqual(
+            self.peg.bottom_anchor.point,
+            self.base.top_anchor.point,
+            msg="Coincident connectors' points should be moved together",
+        )
+        self.assertEqual(
+            self.peg.top_anchor.point,
+            vector.Vector.from_raw((0.0, 0.0, 4.0)),
+            msg="Parallel connectors' axes should be aligned",
+        )
+        self.assertEqual(
+            self.base.top_anchor,
+            connector.Connector(point=vector.Vector.from_raw((0.0, 0.0, 1.0))),
+            msg="Fixed components should not be moved",
+        )
+
+    def test_concentric_offset(self) -> None:
+        constraints.solve(
+            [
+                constraints.Concentric(
+                    (self.base, self.base.top_anchor),
+                    (self.peg, self.peg.bottom_anchor),
+                ),
+                constraints.Offset(
+                    (self.base, self.base.top_anchor),
+                    (self.peg, self.peg.bottom_anchor),
+                    -0.5,
+                ),
+            ],
+            fixed=[self.base],
+        )
+
+        self.assertEqual(
+            self.peg.bottom_anchor.point,
+            vector.Vector.from_raw((0.0, 0.0, 0.5)),
+            msg="Offset connectors should be separated along the first axis",
+        )
+        self.assertEqual(
+            abs(self.peg.bottom_anchor.axis.z),
+            1.0,
+            msg="Concentric connectors' axes should be colinear",
+        )
+
+    def test_angle(self) -> None:
+        constraints.solve(
+            [
+                constraints.Angle(
+                    (self.base, self.base.top_anchor),
+                    (self.peg, self.peg.bottom_anchor),
+                    60.0,
+                )
+            ],
+            fixed=[self.base],
+        )
+
+        self.assertAlmostEqual(
+            self.peg.bottom_anchor.axis.z,
+            0.5,
+            msg="The connectors' axes should be at the given angle",
+        )
+
+    def test_child_of_moved_parent(self) -> None:
+        assembly = component.Component(children=[self.peg])
+        assembly.transform(solid.translate([1.0, 0.0, 0.0]))
+        lid = cylinder.Cylinder(diameter=1.0, height=1.0, parent=self.peg)
+
+        constraints.solve(
+            [
+                constraints.Coincident(
+                    (self.base, self.base.top_anchor),
+                    (self.peg, self.peg.bottom_anchor),
+                ),
+                constraints.Parallel(
+                    (self.base, self.base.top_anchor),
+                    (self.peg, self.peg.bottom_anchor),
+                ),
+                constraints.Coincident(
+                    (self.base, self.base.bottom_anchor), (lid, lid.top_anchor)
+                ),
+                constraints.Parallel(
+                    (self.base, self.base.bottom_anchor), (lid, lid.top_anchor)
+                ),
+            ],
+            fixed=[self.base],
+        )
+
+        self.assertEqual(
+            (self.peg.bottom_anchor.point, lid.top_anchor.point),
+            (self.base.top_anchor.point, self.base.bottom_anchor.point),
+            msg="Children should be placed as solved, despite their parents",
+        )
+
+    def test_unsolvable(self) -> None:
+        with self.assertRaises(
+            constraints.Unsolvable,
+            msg="Should error out if the constraints conflict",
+        ):
+            constraints.solve(
+                [
+                    constraints.Coincident(
+                        (self.base, self.base.top_anchor),
+                        (self.peg, self.peg.bottom_anchor),
+                    ),
+                    constraints.Coincident(
+                        (self.base, self.base.bottom_anchor),
+                        (self.peg, self.peg.bottom_anchor),
+                    ),
+                ],
+                fixed=[self.base],
+            )
+
+        self.assertEqual(
+            len(self.peg.direct_transformations),
+            2,
+            msg="Components should not be moved if the constraints are unsolvable",
+        )
+
+
+class TestLongChain(unittest.TestCase):
+    def setUp(self) -> None:
+        # A stack of pegs, each mated to the one below & slightly misplaced
+        perturbations = numpy.random.default_rng(0)
+
+        self.pegs = [cylinder.Cylinder(diameter=1.0, height=1.0)]
+        self.constraints: typing.List[constraints.Constraint] = []
+        for height in range(1, 1000):
+            peg = cylinder.Cylinder(diameter=1.0, height=1.0)
+            peg.transform(solid.rotate(perturbations.normal(0.0, 2.0, 3).tolist()))
+            peg.transform(
+                solid.translate(
+                    (perturbations.normal(0.0, 0.05, 3) + [0.0, 0.0, height]).tolist()
+                )
+            )
+
+            below = self.pegs[-1]
+            self.constraints.extend(
+                [
+                    constraints.Coincident(
+                        (below, below.top_anchor), (peg, peg.bottom_anchor)
+                    ),
+                    constraints.Parallel(
+                        (below, below.top_anchor), (peg, peg.bottom_anchor)
+                    ),
+                ]
+            )
+            self.pegs.append(peg)
+
+    def test_solve(self) -> None:
+        start = time.perf_counter()
+        solution = constraints.solve(self.constraints, fixed=[self.pegs[0]])
+        elapsed = time.perf_counter() - start
+
+        self.assertLessEqual(
+            solution.residual,
+            1e-9,
+            msg="Long chains of constraints should be solved",
+        )
+        self.assertTrue(
+            numpy.allclose(
+                self.pegs[-1].top_anchor.point.array, [0.0, 0.0, 1000.0], atol=1e-3
+            ),
+            msg="Long chains of constraints should be stacked as constrained",
+        )
+        self.assertLess(
+            elapsed, 10.0, msg="Long chains of constraints should be solved quickly"
+        )
+
+    def test_analyse(self) -> None:
+        start = time.perf_counter()
+        analysis = constraints.analyse(self.constraints, fixed=[self.pegs[0]])
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(
+            [freedom.free for freedom in analysis.components],
+            [1] * 999,
+            msg="Each peg of a long chain should only be free to spin",
+        )
+        self.assertEqual(
+            analysis.redundant,
+            [],
+            msg="Long chains of constraints shouldn't be redundant",
+        )
+        self.assertLess(
+            elapsed, 10.0, msg="Long chains of constraints should be analysed quickly"
+        )
+
+    def test_analyse_redundant(self) -> None:
+        repeated = [
+            type(constraint)(constraint.first, constraint.second)
+            for constraint in self.constraints
+        ]
+
+        start = time.perf_counter()
+        analysis = constraints.analyse(
+            self.constraints + repeated, fixed=[self.pegs[0]]
+        )
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(
+            analysis.free,
+            999,
+            msg="Repeated constraints shouldn't change a long chain's free motions",
+        )
+        self.assertEqual(
+            len(analysis.redundant),
+            2 * len(self.constraints),
+            msg="Every repeated constraint of a long chain should be redundant",
+        )
+        self.assertLess(
+            elapsed,
+            10.0,
+            msg="Long chains of redundant constraints should be analysed quickly",
+        )
+
+
+class TestAnalyse(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base = cylinder.Cylinder(diameter=2.0, height=1.0)
+        self.peg = cylinder.Cylinder(diameter=1.0, height=3.0)
+        self.peg.transform(solid.translate([0.0, 0.0, 1.0]))
+
+        self.coincident = constraints.Coincident(
+            (self.base, self.base.top_anchor), (self.peg, self.peg.bottom_anchor)
+        )
+        self.parallel = constraints.Parallel(
+            (self.base, self.base.top_anchor), (self.peg, self.peg.bottom_anchor)
+        )
+
+    def test_under_constrained(self) -> None:
+        analysis = constraints.analyse([self.coincident], fixed=[self.base])
+
+        self.assertEqual(
+            [freedom.free for freedom in analysis.under_constrained],
+            [3],
+            msg="A coincident point should leave only rotations free",
+        )
+
+    def test_fully_constrained(self) -> None:
+        analysis = constraints.analyse(
+            [self.coincident, self.parallel], fixed=[self.base]
+        )
+
+        self.assertEqual(
+            (analysis.free, analysis.redundant),
+            (1, []),
+            msg="Only the spin about the aligned axes should be free",
+        )
+
+    def test_over_constrained(self) -> None:
+        concentric = constraints.Concentric(
+            (self.base, self.base.top_anchor), (self.peg, self.peg.bottom_anchor)
+        )
+        analysis = constraints.analyse(
+            [self.coincident, self.parallel, concentric], fixed=[self.base]
+        )
+
+        self.assertEqual(
+            [len(freedom.redundant) for freedom in analysis.over_constrained],
+            [3],
+            msg="Constraints duplicating one another should be redundant",
+        )
+
+    def test_after_solving(self) -> None:
+        self.peg.transform(solid.rotate([20.0, 0.0, 0.0]))
+        constraints.solve([self.coincident, self.parallel], fixed=[self.base])
+
+        self.assertEqual(
+            constraints.analyse(
+                [self.coincident, self.parallel], fixed=[self.base]
+            ).free,
+            1,
+            msg="Constraints should follow their components once solved",
+        )
+
+    def test_independent_blocks(self) -> None:
+        other_peg = cylinder.Cylinder(diameter=1.0, height=3.0)
+        analysis = constraints.analyse(
+            [
+                self.coincident,
+                constraints.Parallel(
+                    (self.base, self.base.top_anchor),
+                    (other_peg, other_peg.bottom_anchor),
+                ),
+            ],
+            fixed=[self.base],
+        )
+
+        self.assertEqual(
+            [freedom.free for freedom in analysis.components],
+            [3, 4],
+            msg="Separately constrained components should be analysed apart",
+        )
@@ -0,0 +1,66 @@
+import unittest
+
+import solid
+
+from sccm import mating
+from sccm.components import component, cylinder, sphere
+
+
+class TestMates(unittest.TestCase):
+    def test_stacked(self) -> None:
+        lower = cylinder.Cylinder(diameter=1.0, height=2.0)
+        upper = cylinder.Cylinder(diameter=1.0, height=1.0)
+        upper.transform(solid.translate([0.0, 0.0, 2.0]))
+
+        found = mating.mates(component.Component(children=[lower, upper]))
+
+        self.assertEqual(
+            [(mate.first_anchor, mate.second_anchor, mate.opposed) for mate in found],
+            [("top_anchor", "bottom_anchor", False)],
+            msg="Should find the coincident anchors of stacked components",
+        )
+        self.assertIs(
+            found[0].first_component,
+            lower,
+            msg="Should identify the components of the anchors",
+        )
+
+    def test_opposed(self) -> None:
+        lower = cylinder.Cylinder(diameter=1.0, height=2.0)
+        upper = cylinder.Cylinder(diameter=1.0, height=1.0)
+        upper.transform(solid.rotate([180.0, 0.0, 0.0]))
+        upper.transform(solid.translate([0.0, 0.0, 3.0]))
+
+        found = mating.mates(component.Component(children=[lower, upper]))
+
+        self.assertEqual(
+            [(mate.first_anchor, mate.second_anchor, mate.opposed) for mate in found],
+            [("top_anchor", "top_anchor", True)],
+            msg="Should find anchors with anti-aligned axes",
+        )
+
+    def test_misaligned(self) -> None:
+        lower = cylinder.Cylinder(diameter=1.0, height=2.0)
+        tilted = cylinder.Cylinder(diameter=1.0, height=1.0)
+        tilted.transform(solid.rotate([30.0, 0.0, 0.0]))
+        tilted.transform(solid.translate([0.0, 0.0, 2.0]))
+
+        self.assertEqual(
+            mating.mates(component.Component(children=[lower, tilted])),
+            [],
+            msg="Coincident anchors with misaligned axes should not mate",
+        )
+
+    def test_apart(self) -> None:
+        ball = sphere.Sphere(diameter=1.0)
+        ball.transform(solid.translate([0.0, 0.0, 1e-3]))
+
+        self.assertEqual(
+            mating.mates(
+                component.Component(
+                    children=[cylinder.Cylinder(diameter=1.0, height=1.0), ball]
+                )
+            ),
+            [],
+            msg="Separated anchors should not mate",
+        )
@@ -0,0 +1,165 @@
+import unittest
+
+import solid
+
+from sccm import optimization
+from tests import utils
+
+
+class TestOptimize(unittest.TestCase):
+    def assertOptimizedTo(
+        self, tree: solid.OpenSCADObject, expected: solid.OpenSCADObject, msg: str
+    ) -> None:
+        self.assertTrue(
+            utils.compare_flattened_openscad_children(
+                optimization.optimize(tree), expected
+            ),
+            msg=msg,
+        )
+
+    def test_flatten_unions(self) -> None:
+        self.assertOptimizedTo(
+            solid.union()(
+                solid.union()(solid.cube(1), solid.sphere(1)), solid.cylinder(1)
+            ),
+            solid.union()(solid.cube(1), solid.sphere(1), solid.cylinder(1)),
+            msg="Nested unions should be flattened",
+        )
+
+    def test_merge_differences(self) -> None:
+        self.assertOptimizedTo(
+            solid.difference()(
+                solid.difference()(solid.cube(3), solid.sphere(1)), solid.cylinder(1)
+            ),
+            solid.difference()(solid.cube(3), solid.sphere(1), solid.cylinder(1)),
+            msg="Chained differences should be merged",
+        )
+
+    def test_subtracted_differences_kept(self) -> None:
+        tree = solid.difference()(
+            solid.cube(3), solid.difference()(solid.sphere(2), solid.cylinder(1))
+        )
+
+        self.assertOptimizedTo(
+            tree,
+            solid.difference()(
+                solid.cube(3), solid.difference()(solid.sphere(2), solid.cylinder(1))
+            ),
+            msg="Subtracted differences should not be merged",
+        )
+
+    def test_remove_single_child_unions(self) -> None:
+        self.assertOptimizedTo(
+            solid.union()(solid.union()(solid.cube(1))),
+            solid.cube(1),
+            msg="Single-child unions should be removed",
+        )
+
+    def test_hoist_transformations(self) -> None:
+        self.assertOptimizedTo(
+            solid.difference()(
+                solid.translate([1, 2, 3])(solid.cube(3)),
+                solid.translate([1, 2, 3])(solid.sphere(1)),
+            ),
+            solid.translate([1, 2, 3])(
+                solid.difference()(solid.cube(3), solid.sphere(1))
+            ),
+            msg="Shared transformations should be hoisted",
+        )
+
+    def test_distinct_transformations_kept(self) -> None:
+        self.assertOptimizedTo(
+            solid.union()(
+                solid.translate([1, 2, 3])(solid.cube(3)),
+                solid.translate([3, 2, 1])(solid.sphere(1)),
+            ),
+            solid.union()(
+                solid.translate([1, 2, 3])(solid.cube(3)),
+                solid.translate([3, 2, 1])(solid.sphere(1)),
+            ),
+            msg="Distinct transformations should not be hoisted",
+        )
+
+    def test_merge_translations(self) -> None:
+        self.assertOptimizedTo(
+            solid.translate([1, 2, 3])(solid.translate([3, 2, 1])(solid.cube(3))),
+            solid.translate([4, 4, 4])(solid.cube(3)),
+            msg="Nested translations should be merged into one",
+        )
+
+    def test_merge_transformations(self) -> None:
+        self.assertOptimizedTo(
+            solid.translate([1, 2, 3])(solid.scale(2)(solid.cube(3))),
+            solid.multmatrix([[2, 0, 0, 1], [0, 2, 0, 2], [0, 0, 2, 3], [0, 0, 0, 1]])(
+                solid.cube(3)
+            ),
+            msg="Nested transformations should be merged into one matrix",
+        )
+
+    def test_expressions_kept(self) -> None:
+        self.assertOptimizedTo(
+            solid.translate(["x", 0, 0])(solid.translate([1, 0, 0])(solid.cube(3))),
+            solid.translate(["x", 0, 0])(solid.translate([1, 0, 0])(solid.cube(3))),
+            msg="Transformations by expressions should not be merged",
+        )
+
+    def test_hoist_colors_from_unions(self) -> None:
+        self.assertOptimizedTo(
+            solid.union()(
+                solid.color((1, 0, 0))(solid.translate([1, 0, 0])(solid.cube(3))),
+                solid.color((1, 0, 0))(solid.translate([1, 0, 0])(solid.sphere(1))),
+            ),
+            solid.color((1, 0, 0))(
+                solid.translate([1, 0, 0])(
+                    solid.union()(solid.cube(3), solid.sphere(1))
+                )
+            ),
+            msg="Colors & transformations shared in unions should be hoisted",
+        )
+
+    def test_colors_kept_in_differences(self) -> None:
+        self.assertOptimizedTo(
+            solid.difference()(
+                solid.color((1, 0, 0))(solid.cube(3)),
+                solid.color((1, 0, 0))(solid.sphere(1)),
+            ),
+            solid.difference()(
+                solid.color((1, 0, 0))(solid.cube(3)),
+                solid.color((1, 0, 0))(solid.sphere(1)),
+            ),
+            msg="Colors should not be hoisted from differences",
+        )
+
+    def test_hoisting_exposes_flattening(self) -> None:
+        self.assertOptimizedTo(
+            solid.union()(
+                solid.translate([1, 0, 0])(solid.union()(solid.cube(1), solid.cube(2))),
+                solid.translate([1, 0, 0])(solid.cube(3)),
+            ),
+            solid.translate([1, 0, 0])(
+                solid.union()(solid.cube(1), solid.cube(2), solid.cube(3))
+            ),
+            msg="Unions revealed by hoisting should be flattened",
+        )
+
+    def test_modifiers_kept(self) -> None:
+        debugged = solid.union()(solid.cube(1))
+        debugged.set_modifier("#")
+
+        self.assertEqual(
+            optimization.optimize(solid.union()(debugged, solid.cube(2)))
+            .children[0]
+            .modifier,
+            "#",
+            msg="Nodes with modifiers should not be restructured",
+        )
+
+    def test_original_unmodified(self) -> None:
+        tree = solid.union()(solid.union()(solid.cube(1)), solid.cube(2))
+        optimization.optimize(tree)
+
+        self.assertEqual(
+            tree.children[0].name,
+            "union",
+            msg="The original tree should not be modified",
+        )
@@ -0,0 +1,174 @@
+import gc
+import typing
+import unittest
+
+import solid
+
+from sccm import parametric, vector
+from sccm.components import component, cylinder, sphere
+
+
+class TestNodes(unittest.TestCase):
+    def test_derived(self) -> None:
+        width = parametric.Parameter(2.0)
+        area = parametric.Derived(lambda value: value**2, width)
+
+        self.assertEqual(area.value, 4.0, msg="Should compute derived values")
+
+        width.value = 3.0
+        self.assertEqual(area.value, 9.0, msg="Should recompute changed values")
+
+    def test_only_affected_recomputed(self) -> None:
+        calls: typing.List[str] = []
+
+        def recorded(name: str) -> typing.Callable[[float], float]:
+            def function(value: float) -> float:
+                calls.append(name)
+                return value
+
+            return function
+
+        changed = parametric.Parameter(1.0)
+        unchanged = parametric.Parameter(1.0)
+        affected = parametric.Derived(recorded("affected"), changed)
+        unaffected = parametric.Derived(recorded("unaffected"), unchanged)
+        affected.value, unaffected.value
+
+        changed.value = 2.0
+        affected.value, unaffected.value
+
+        self.assertEqual(
+            calls,
+            ["affected", "unaffected", "affected"],
+            msg="Only values depending on changed parameters should be recomputed",
+        )
+
+    def test_cyclic(self) -> None:
+        cyclic = parametric.Derived(lambda: cyclic.value)
+
+        with self.assertRaises(
+            parametric.CyclicDependency,
+            msg="Should error out if a value depends on itself",
+        ):
+            cyclic.value
+
+
+class TestEffects(unittest.TestCase):
+    def setUp(self) -> None:
+        self.height = parametric.Parameter(1.0)
+
+        self.body = cylinder.Cylinder(diameter=1.0, height=1.0)
+        parametric.bind(self.body, "height", self.height)
+
+        self.knob = sphere.Sphere(diameter=0.5)
+        self.knob.transform(solid.translate([1.0, 0.0, 0.0]))
+        parametric.place(
+            self.knob,
+            lambda own, top: own.align(top),
+            parametric.anchor(self.knob, "center_anchor"),
+            parametric.anchor(self.body, "top_anchor"),
+        )
+
+    def test_bind(self) -> None:
+        self.height.value = 2.0
+
+        self.assertEqual(
+            self.body.top_anchor.point,
+            vector.Vector.from_raw((0.0, 0.0, 2.0)),
+            msg="Bound attributes should follow their parameters",
+        )
+
+    def test_place(self) -> None:
+        self.height.value = 2.0
+
+        self.assertEqual(
+            self.knob.center_anchor.point,
+            vector.Vector.from_raw((0.0, 0.0, 2.0)),
+            msg="Placements should follow the anchors they depend on",
+        )
+        self.assertEqual(
+            len(self.knob.direct_transformations),
+            2,
+            msg="Placements should replace their previous transformations",
+        )
+
+    def test_children_follow_parents(self) -> None:
+        offset = parametric.Parameter(1.0)
+        child = sphere.Sphere(diameter=0.5)
+        child_anchor = parametric.anchor(child, "center_anchor")
+        child_anchor.value
+
+        assembly = component.Component(children=[child])
+        parametric.place(
+            assembly, lambda value: [solid.translate([value, 0.0, 0.0])], offset
+        )
+        offset.value = 2.0
+
+        self.assertEqual(
+            child_anchor.value.point,
+            vector.Vector.from_raw((2.0, 0.0, 0.0)),
+            msg="Children's anchors should follow their parents' placements",
+        )
+
+    def test_placements_follow_parents(self) -> None:
+        assembly = component.Component(children=[self.knob])
+        parametric.place(assembly, lambda: [solid.translate([1.0, 0.0, 0.0])])
+
+        self.assertEqual(
+            self.knob.center_anchor.point,
+            vector.Vector.from_raw((0.0, 0.0, 1.0)),
+            msg="Placements should be reapplied when their parents are moved",
+        )
+
+    def test_effects_kept_alive(self) -> None:
+        # Nothing but the components refers to the knob's placement
+        gc.collect()
+        self.height.value = 2.0
+
+        self.assertEqual(
+            self.knob.center_anchor.point,
+            vector.Vector.from_raw((0.0, 0.0, 2.0)),
+            msg="Effects should last as long as the components they depend on",
+        )
+
+    def test_dependency_order(self) -> None:
+        height = parametric.Parameter(1.0)
+        body = cylinder.Cylinder(diameter=1.0, height=1.0)
+        knob = sphere.Sphere(diameter=0.5)
+
+        # The placement depends on the binding's changes, but is created first
+        parametric.place(
+            knob,
+            lambda top, _: [solid.translate(top.point.array.tolist())],
+            parametric.anchor(body, "top_anchor"),
+            height,
+        )
+        parametric.bind(body, "height", height)
+        height.value = 3.0
+
+        self.assertEqual(
+            knob.center_anchor.point,
+            vector.Vector.from_raw((0.0, 0.0, 3.0)),
+            msg="Effects should be re-applied after the effects they depend on",
+        )
+
+    def test_cyclic_effects(self) -> None:
+        first = sphere.Sphere(diameter=0.5)
+        second = sphere.Sphere(diameter=0.5)
+        parametric.place(
+            first,
+            lambda own, other: own.align(other),
+            parametric.anchor(first, "center_anchor"),
+            parametric.anchor(second, "center_anchor"),
+        )
+
+        with self.assertRaises(
+            parametric.CyclicDependency,
+            msg="Should error out if an effect depends on its own changes",
+        ):
+            parametric.place(
+                second,
+                lambda own, other: own.align(other),
+                parametric.anchor(second, "center_anchor"),
+                parametric.anchor(first, "center_anchor"),
+            )
@@ -0,0 +1,286 @@
+import math
+import unittest
+
+import numpy
+import solid
+
+from sccm import emission, resolution
+from sccm.components import component, cylinder, frustum, pattern, sphere
+
+
+class TestResolution(unittest.TestCase):
+    def test_fragments_fn(self) -> None:
+        self.assertEqual(
+            resolution.Resolution(fn=17).fragments(100.0),
+            17,
+            msg="A fixed fragment count should ignore the radius",
+        )
+
+    def test_fragments_defaults(self) -> None:
+        self.assertEqual(
+            resolution.Resolution().fragments(1.0),
+            5,
+            msg="Small circles should get OpenSCAD's minimum fragment count",
+        )
+
+        self.assertEqual(
+            resolution.Resolution().fragments(1000.0),
+            30,
+            msg="Large circles should be limited by OpenSCAD's default angle",
+        )
+
+    def test_fragments_fa_fs(self) -> None:
+        self.assertEqual(
+            resolution.Resolution(fa=1.0, fs=0.1).fragments(1.0),
+            math.ceil(2 * math.pi / 0.1),
+            msg="Fragment length should limit the fragment count",
+        )
+
+    def test_parameters(self) -> None:
+        self.assertEqual(
+            resolution.Resolution(fa=6.0, fs=0.5).parameters(1.0),
+            {"$fa": 6.0, "$fs": 0.5},
+            msg="Only the special variables which are set should be emitted",
+        )
+
+    def test_chord_error_fragments(self) -> None:
+        chord_error = resolution.ChordErrorResolution(tolerance=0.001)
+
+        for radius in (0.055, 0.375, 10.0):
+            fragments = chord_error.fragments(radius)
+
+            self.assertLessEqual(
+                radius * (1 - math.cos(math.pi / fragments)),
+                0.001,
+                msg="The chord error should be within tolerance",
+            )
+            self.assertGreater(
+                radius * (1 - math.cos(math.pi / (fragments - 1))),
+                0.001,
+                msg="The fragment count should be the smallest within tolerance",
+            )
+
+    def test_chord_error_scales_with_size(self) -> None:
+        chord_error = resolution.ChordErrorResolution(tolerance=0.001)
+
+        self.assertLess(
+            chord_error.fragments(0.055),
+            chord_error.fragments(0.375),
+            msg="Larger circles should get more fragments",
+        )
+
+    def test_chord_error_limits(self) -> None:
+        chord_error = resolution.ChordErrorResolution(
+            tolerance=0.001, minimum_fragments=8, maximum_fragments=64
+        )
+
+        self.assertEqual(
+            chord_error.fragments(0.0001),
+            8,
+            msg="Fragment counts should be no lower than the minimum",
+        )
+        self.assertEqual(
+            chord_error.fragments(1000.0),
+            64,
+            msg="Fragment counts should be no higher than the maximum",
+        )
+
+    def test_eq(self) -> None:
+        self.assertEqual(
+            resolution.Resolution(fn=10),
+            resolution.Resolution(fn=10),
+            msg="Equivalent resolutions should be equal",
+        )
+        self.assertNotEqual(
+            resolution.Resolution(fn=10),
+            resolution.ChordErrorResolution(tolerance=0.1),
+            msg="Different kinds of resolution should not be equal",
+        )
+
+
+class TestComponentResolution(unittest.TestCase):
+    def test_inherited_resolution(self) -> None:
+        parent_resolution = resolution.Resolution(fn=12)
+        parent = component.Component(resolution=parent_resolution)
+        child = cylinder.Cylinder(diameter=1.0, height=1.0, parent=parent)
+
+        self.assertEqual(
+            child.effective_resolution,
+            parent_resolution,
+            msg="Resolutions should be inherited from parents",
+        )
+        self.assertEqual(
+            child.body.params["segments"],
+            12,
+            msg="Inherited resolutions should be emitted on primitives",
+        )
+
+    def test_own_resolution_overrides_parent(self) -> None:
+        parent = component.Component(resolution=resolution.Resolution(fn=12))
+        child = sphere.Sphere(
+            diameter=1.0, parent=parent, resolution=resolution.Resolution(fn=20)
+        )
+
+        self.assertEqual(
+            child.fragments,
+            20,
+            msg="A component's own resolution should take precedence",
+        )
+
+    def test_unassigned_resolution_not_emitted(self) -> None:
+        self.assertNotIn(
+            "$fn",
+            sphere.Sphere(diameter=1.0).body.params,
+            msg="Without a resolution, no special variables should be emitted",
+        )
+
+    def test_world_scale(self) -> None:
+        chord_error = resolution.ChordErrorResolution(tolerance=0.001)
+        small = sphere.Sphere(diameter=1.0, resolution=chord_error)
+        large = sphere.Sphere(diameter=1.0, resolution=chord_error)
+        large.transform(solid.scale([10.0, 1.0, 1.0]))
+
+        self.assertEqual(
+            large.fragments,
+            chord_error.fragments(5.0),
+            msg="Fragment counts should be derived from world-space size",
+        )
+        self.assertLess(
+            small.fragments,
+            large.fragments,
+            msg="Scaling a component up should increase its fragment count",
+        )
+
+    def test_world_scale_multmatrix(self) -> None:
+        chord_error = resolution.ChordErrorResolution(tolerance=0.001)
+        scaled = sphere.Sphere(diameter=1.0, resolution=chord_error)
+        scaled.transform(solid.scale(10.0))
+        multiplied = sphere.Sphere(diameter=1.0, resolution=chord_error)
+        multiplied.transform(solid.multmatrix((10.0 * numpy.identity(4)[:3]).tolist()))
+
+        self.assertAlmostEqual(
+            multiplied.world_scale,
+            scaled.world_scale,
+            msg="Matrices should stretch components as the equivalent scaling",
+        )
+        self.assertEqual(
+            multiplied.fragments,
+            scaled.fragments,
+            msg="Matrices should resolve components as the equivalent scaling",
+        )
+        self.assertIn(
+            f"$fn = {chord_error.fragments(5.0)}",
+            multiplied.scad_source(),
+            msg="Matrices should be emitted with the equivalent scaling's facets",
+        )
+
+    def test_emission_default_resolution(self) -> None:
+        with emission.emitting(
+            emission.Emission(default_resolution=resolution.Resolution(fn=9))
+        ):
+            self.assertEqual(
+                cylinder.Cylinder(diameter=1.0, height=1.0).body.params["segments"],
+                9,
+                msg="The emission default should apply to unassigned components",
+            )
+
+    def test_emission_fragment_override(self) -> None:
+        test_sphere = sphere.Sphere(
+            diameter=1.0, resolution=resolution.Resolution(fn=30)
+        )
+
+        with emission.emitting(emission.Emission(fragments={id(test_sphere): 7})):
+            self.assertEqual(
+                test_sphere.body.params["segments"],
+                7,
+                msg="Per-primitive overrides should take precedence",
+            )
+
+    def test_copy_keeps_resolution(self) -> None:
+        chord_error = resolution.ChordErrorResolution(tolerance=0.01)
+
+        self.assertEqual(
+            sphere.Sphere(diameter=1.0, resolution=chord_error).copy().resolution,
+            chord_error,
+            msg="Copies should keep the original's resolution",
+        )
+
+
+class TestBudget(unittest.TestCase):
+    def assembly(self) -> component.Component:
+        chord_error = resolution.ChordErrorResolution(tolerance=0.0001)
+
+        return component.Component(
+            children=[
+                cylinder.Cylinder(diameter=0.11, height=0.1),
+                cylinder.Cylinder(diameter=0.75, height=1.0),
+                sphere.Sphere(diameter=2.0),
+            ],
+            resolution=chord_error,
+        )
+
+    def total_facets(self, root: component.Component, fragments: dict) -> int:
+        return sum(
+            descendant.facets(fragments.get(id(descendant)))
+            for descendant in root.subtree
+        )
+
+    def test_within_budget(self) -> None:
+        assembly = self.assembly()
+        fragments = resolution.budget(assembly, 10**9)
+
+        self.assertEqual(
+            fragments,
+            {id(child): child.fragments for child in assembly.children},
+            msg="Within budget, every primitive should keep its desired resolution",
+        )
+
+    def test_over_budget(self) -> None:
+        assembly = self.assembly()
+        fragments = resolution.budget(assembly, 5000)
+
+        self.assertLessEqual(
+            self.total_facets(assembly, fragments),
+            5000,
+            msg="The total facet count should fit within the budget",
+        )
+        self.assertLess(
+            fragments[id(assembly.children[0])],
+            fragments[id(assembly.children[2])],
+            msg="Relative resolutions should be preserved",
+        )
+
+    def test_fixed_segments_count(self) -> None:
+        assembly = self.assembly()
+        assembly.add_child(
+            frustum.Frustum(
+                bottom_circumscribed_circle_diameter=1.0, height=1.0, segments=6
+            )
+        )
+
+        fragments = resolution.budget(assembly, 5000)
+
+        self.assertLessEqual(
+            self.total_facets(assembly, fragments),
+            5000,
+            msg="Primitives with fixed faceting should count against the budget",
+        )
+        self.assertEqual(
+            len(fragments), 3, msg="Fixed faceting should not be overridden"
+        )
+
+    def test_instances_count(self) -> None:
+        template = sphere.Sphere(
+            diameter=2.0, resolution=resolution.ChordErrorResolution(0.0001)
+        )
+        assembly = component.Component(
+            children=[pattern.LinearPattern(template, 10, (3.0, 0.0, 0.0))]
+        )
+
+        fragments = resolution.budget(assembly, 5000)
+
+        self.assertLessEqual(
+            10 * template.facets(fragments[id(template)]),
+            5000,
+            msg="Templates should count against the budget once per placement",
+        )
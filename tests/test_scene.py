@@ -0,0 +1,154 @@
+import re
+import unittest
+
+import numpy
+import solid
+
+from sccm import bounding, resolution, scene
+from sccm.components import instance, sphere
+from tests import utils
+
+
+class TestScene(unittest.TestCase):
+    def test_from_component(self) -> None:
+        root = utils.scene_assembly()
+        test_scene = scene.Scene.from_component(root)
+
+        components = list(root.subtree)
+        self.assertEqual(
+            test_scene.kinds.tolist(),
+            [scene.GROUP, scene.FRUSTUM, scene.FRUSTUM, scene.GROUP]
+            + [scene.SPHERE] * 2,
+            msg="Each component should be stored as a node, in pre-order",
+        )
+        self.assertTrue(
+            numpy.allclose(
+                test_scene.world_matrices,
+                [embodied.world_matrix for embodied in components],
+            ),
+            msg="Nodes should have the same world matrices as their components",
+        )
+        self.assertEqual(
+            [test_scene[index].bounds for index in range(len(test_scene))],
+            [embodied.bounds for embodied in components],
+            msg="Nodes should have the same bounds as their components",
+        )
+
+    def test_unsupported_component(self) -> None:
+        with self.assertRaises(
+            scene.UnsupportedComponent,
+            msg="Components without storable bodies can't be stored",
+        ):
+            scene.Scene.from_component(instance.Instance(sphere.Sphere(diameter=1.0)))
+
+    def test_to_component(self) -> None:
+        root = utils.scene_assembly()
+        rebuilt = scene.Scene.from_component(root).to_component(0)
+
+        self.assertEqual(
+            rebuilt.bounds,
+            root.bounds,
+            msg="Nodes should be convertible back into equivalent components",
+        )
+
+    def test_to_component_resolution(self) -> None:
+        # Scenes don't store resolutions, so both are resolved by the emission's
+        chord_error = resolution.ChordErrorResolution(tolerance=0.001)
+        scaled = sphere.Sphere(diameter=1.0).transform(solid.scale(10.0))
+        rebuilt = scene.Scene.from_component(scaled).to_component(0)
+
+        facets = re.findall(
+            r"\$fn = (\d+)", rebuilt.scad_source(default_resolution=chord_error)
+        )
+        self.assertEqual(
+            facets,
+            re.findall(
+                r"\$fn = (\d+)", scaled.scad_source(default_resolution=chord_error)
+            ),
+            msg="Scaled parts should be resolved as they were before being stored",
+        )
+        self.assertEqual(
+            facets,
+            [str(chord_error.fragments(5.0))],
+            msg="Scaled parts should be resolved by their world-space size",
+        )
+
+    def test_invalid_operand(self) -> None:
+        test_scene = scene.Scene()
+        first = test_scene.add_group()
+        second = test_scene.add_sphere(1.0)
+
+        with self.assertRaises(
+            scene.InvalidOperand, msg="Operands must be children of their composer"
+        ):
+            test_scene.compose(first, scene.UNION, [second])
+
+    def test_operands(self) -> None:
+        test_scene = scene.Scene(capacity=1)
+        group = test_scene.add_group()
+        spheres = test_scene.add_many(scene.SPHERE, numpy.ones((6, 1)), group)
+
+        test_scene.compose(group, scene.UNION, spheres[[4, 1]])
+        test_scene.compose(group, scene.DIFFERENCE, spheres[[0, 5]])
+        test_scene.compose(group, scene.INTERSECTION, [])
+
+        self.assertEqual(
+            [test_scene.operands_of(composition).tolist() for composition in range(3)],
+            [spheres[[1, 4]].tolist(), spheres[[0, 5]].tolist(), []],
+            msg="Each composition's operands should be found, in order",
+        )
+        self.assertEqual(
+            test_scene.composition_kinds.tolist(),
+            [scene.UNION, scene.DIFFERENCE, scene.INTERSECTION],
+            msg="Compositions should be stored as they're added",
+        )
+
+    def test_transform(self) -> None:
+        test_scene = scene.Scene(capacity=1)
+        group = test_scene.add_group()
+        spheres = test_scene.add_many(scene.SPHERE, [[1.0], [2.0]], group)
+
+        test_scene[group].transform(solid.translate([0.0, 0.0, 5.0]))
+
+        self.assertEqual(
+            test_scene[int(spheres[1])].bounds,
+            bounding.Bounds((-1.0, -1.0, 4.0), (1.0, 1.0, 6.0)),
+            msg="Transforming a node should transform its descendants",
+        )
+
+    def test_overlapping(self) -> None:
+        test_scene = scene.Scene()
+        matrices = numpy.tile(numpy.identity(4), (10, 1, 1))
+        matrices[:, 0, 3] = numpy.arange(10) * 2.0
+        test_scene.add_many(scene.SPHERE, numpy.ones((10, 1)), matrices=matrices)
+
+        self.assertEqual(
+            test_scene.overlapping(
+                bounding.Bounds((3.0, -1.0, -1.0), (6.0, 1.0, 1.0))
+            ).tolist(),
+            [2, 3],
+            msg="Should find the primitives whose bounds overlap the query",
+        )
+        self.assertEqual(
+            test_scene.containing((8.2, 0.0, 0.0)).tolist(),
+            [4],
+            msg="Should find the primitives whose bounds contain the point",
+        )
+
+    def test_scad_source(self) -> None:
+        test_scene = scene.Scene()
+        group = test_scene.add_group(color=(0.0, 1.0, 0.0))
+        test_scene.add_frustum(2.0, 1.0, parent=group)
+        hole = test_scene.add_sphere(1.0, parent=group)
+        test_scene.compose(group, scene.DIFFERENCE, [hole])
+
+        self.assertEqual(
+            test_scene.scad_source(),
+            "\n\ncolor(c = [0.0, 1.0, 0.0, 1.0]) {difference() {union() {"
+            "multmatrix(m = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], "
+            "[0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]) "
+            "cylinder(center = false, d1 = 2.0, d2 = 2.0, h = 1.0);}"
+            "multmatrix(m = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], "
+            "[0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]) sphere(d = 1.0);}}\n",
+            msg="Bodies should be composed & colored as components' are",
+        )
@@ -0,0 +1,163 @@
+import os
+import tempfile
+import unittest
+
+import numpy
+import solid
+
+from sccm import resolution, serialization
+from sccm.components import (
+    component,
+    frustum,
+    instance,
+    pattern,
+    reference_frame,
+    sphere,
+)
+from tests import utils
+
+
+def tree() -> component.Component:
+    """A tree with every kind of data a serialized tree can store"""
+    root = utils.scene_assembly()
+    root.resolution = resolution.ChordErrorResolution(0.1)
+
+    template = sphere.Sphere(diameter=1.0, color=(0.1, 0.2, 0.3, 0.5))
+    pattern.GridPattern(template, 2, 3, (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), parent=root)
+    instance.Instance(template, parent=root).transform(solid.rotate([10, 20, 30]))
+    sphere.Sphere(diameter=2.0, parent=root).transform(
+        [
+            solid.translate((1, 2, 3)),
+            solid.scale(numpy.array([1.0, 2.0, 3.0])),
+            solid.multmatrix([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0.5]]),
+        ]
+    )
+    frustum.Frustum(
+        1.0, 2.0, segments=6, parent=root, resolution=resolution.Resolution(fn=12)
+    )
+
+    return root
+
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = tree()
+        self.data = serialization.dumps(self.root)
+        self.loaded = serialization.loads(self.data)
+
+    def test_geometry(self) -> None:
+        self.assertEqual(
+            self.loaded.bounds,
+            self.root.bounds,
+            msg="Loaded trees should have the same bounds",
+        )
+
+        for original, loaded in zip(self.root.subtree, self.loaded.subtree):
+            numpy.testing.assert_array_equal(
+                loaded.world_matrix,
+                original.world_matrix,
+                err_msg="Loaded components should be where they were",
+            )
+
+    def test_exact(self) -> None:
+        self.assertEqual(
+            self.loaded.scad_source(),
+            self.root.scad_source(),
+            msg="Loaded trees should be emitted identically",
+        )
+        self.assertEqual(
+            self.loaded.scad_source(optimize=False),
+            self.root.scad_source(optimize=False),
+            msg="Loaded trees should be emitted identically, without optimization",
+        )
+        self.assertEqual(
+            self.loaded.fingerprint,
+            self.root.fingerprint,
+            msg="Loaded trees should have the same fingerprints",
+        )
+
+    def test_attributes(self) -> None:
+        self.assertEqual(
+            [(type(node), node.color) for node in self.loaded.subtree],
+            [(type(node), node.color) for node in self.root.subtree],
+            msg="Loaded components should have the same types & colors",
+        )
+        self.assertEqual(
+            [node.resolution for node in self.loaded.subtree],
+            [node.resolution for node in self.root.subtree],
+            msg="Loaded components should have the same resolutions",
+        )
+
+    def test_compositions(self) -> None:
+        self.assertEqual(
+            [
+                (type(composition), len(operands))
+                for node in self.loaded.subtree
+                for composition, operands in node.compositions
+            ],
+            [
+                (type(composition), len(operands))
+                for node in self.root.subtree
+                for composition, operands in node.compositions
+            ],
+            msg="Loaded components should have the same compositions",
+        )
+
+    def test_shared_templates(self) -> None:
+        instances = [
+            node for node in self.loaded.subtree if isinstance(node, instance.Instance)
+        ]
+
+        self.assertIs(
+            instances[-2].template,
+            instances[-1].template,
+            msg="Shared templates should be loaded once",
+        )
+
+    def test_stable(self) -> None:
+        self.assertEqual(
+            serialization.dumps(self.loaded),
+            self.data,
+            msg="Loaded trees should serialize identically",
+        )
+
+    def test_unchanged(self) -> None:
+        self.assertEqual(
+            {node.subtree_version for node in self.loaded.subtree},
+            {0},
+            msg="Loading shouldn't record any changes",
+        )
+
+    def test_memory_mapped(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tree.sccm")
+            serialization.save(self.root, path)
+
+            self.assertEqual(
+                serialization.dumps(serialization.load(path)),
+                self.data,
+                msg="Memory-mapped trees should load identically",
+            )
+
+    def test_unserializable(self) -> None:
+        with self.assertRaises(
+            serialization.UnserializableComponent,
+            msg="Unregistered component types shouldn't be serialized",
+        ):
+            serialization.dumps(reference_frame.ReferenceFrame())
+
+    def test_unserializable_transformation(self) -> None:
+        with self.assertRaises(
+            serialization.UnserializableComponent,
+            msg="Transformations of unregistered types shouldn't be serialized",
+        ):
+            serialization.dumps(
+                sphere.Sphere(diameter=1.0).transform(solid.mirror([1, 0, 0]))
+            )
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(
+            serialization.InvalidTree,
+            msg="Data without the magic bytes shouldn't be loaded",
+        ):
+            serialization.loads(b"not a tree")
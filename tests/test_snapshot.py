@@ -0,0 +1,138 @@
+import concurrent.futures
+import threading
+import unittest
+
+import numpy
+import solid
+
+from sccm.components import component, cylinder, instance, sphere
+from tests import utils
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parent = component.Component().transform(solid.translate([5.0, 0.0, 0.0]))
+        self.root = utils.scene_assembly()
+        self.root.parent = self.parent
+
+        self.template = sphere.Sphere(diameter=1.0)
+        for offset in (1.0, 2.0):
+            instance.Instance(self.template, parent=self.root).transform(
+                solid.translate([0.0, offset, 0.0])
+            )
+
+        self.snapshot = self.root.freeze()
+
+    def test_cached(self) -> None:
+        self.assertEqual(
+            self.snapshot.fingerprint,
+            self.root.fingerprint,
+            msg="Snapshots should have their originals' fingerprints",
+        )
+        self.assertEqual(
+            self.snapshot.bounds,
+            self.root.bounds,
+            msg="Snapshots should have their originals' bounds",
+        )
+        self.assertEqual(
+            solid.scad_render(self.snapshot.body),
+            solid.scad_render(self.root.body),
+            msg="Snapshots should have their originals' bodies",
+        )
+
+    def test_inherited(self) -> None:
+        numpy.testing.assert_array_equal(
+            self.snapshot.world_matrix,
+            self.root.world_matrix,
+            err_msg="Snapshots should inherit their originals' transformations",
+        )
+
+    def test_independent(self) -> None:
+        source = self.snapshot.scad_source()
+
+        self.root.transform(solid.translate([1.0, 0.0, 0.0]))
+        self.root.add_child(cylinder.Cylinder(diameter=1.0, height=1.0))
+        self.template.color = (1.0, 0.0, 0.0)
+
+        self.assertEqual(
+            self.snapshot.scad_source(),
+            source,
+            msg="Snapshots shouldn't be affected by changes to their originals",
+        )
+        self.assertEqual(
+            self.snapshot.component.fingerprint,
+            self.snapshot.fingerprint,
+            msg="Snapshots' components shouldn't be affected by changes",
+        )
+
+    def test_shared_templates(self) -> None:
+        first, second = [
+            child
+            for child in self.snapshot.component.children
+            if isinstance(child, instance.Instance)
+        ]
+
+        self.assertIs(
+            first.template,
+            second.template,
+            msg="Templates shared within a tree should be shared within snapshots",
+        )
+        self.assertIsNot(
+            first.template,
+            self.template,
+            msg="Snapshots shouldn't share templates with their originals",
+        )
+
+    def test_frozen(self) -> None:
+        frozen = self.snapshot.component
+
+        with self.assertRaises(
+            component.FrozenComponent, msg="Snapshots shouldn't be transformed"
+        ):
+            frozen.transform(solid.translate([1.0, 0.0, 0.0]))
+
+        with self.assertRaises(
+            component.FrozenComponent, msg="Snapshots' structure shouldn't change"
+        ):
+            frozen.children[0].add_child(sphere.Sphere(diameter=1.0))
+
+        with self.assertRaises(
+            component.FrozenComponent, msg="Snapshots' attributes shouldn't change"
+        ):
+            frozen.color = (1.0, 0.0, 0.0)
+
+        self.assertEqual(
+            frozen.copy(isolate=True).fingerprint,
+            self.snapshot.fingerprint,
+            msg="Snapshots' components should be copied into changeable components",
+        )
+
+    def test_concurrent(self) -> None:
+        def emit(index: int) -> str:
+            return self.snapshot.scad_source(fn=index % 2 * 12) + solid.scad_render(
+                self.snapshot.body
+            )
+
+        expected = [emit(0), emit(1)]
+
+        # The original is changed throughout
+        editing = True
+
+        def edit() -> None:
+            while editing:
+                self.root.transform(solid.translate([1.0, 0.0, 0.0]))
+
+        editor = threading.Thread(target=edit)
+        editor.start()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(8) as executor:
+                emitted = list(executor.map(emit, range(32)))
+        finally:
+            editing = False
+            editor.join()
+
+        self.assertEqual(
+            emitted,
+            [expected[index % 2] for index in range(32)],
+            msg="Snapshots should be emitted from many threads at once",
+        )
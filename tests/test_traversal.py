@@ -0,0 +1,72 @@
+import typing
+import unittest
+
+from sccm import traversal
+
+# A small DAG, by node: 1 & 2 share 3
+SUCCESSORS: typing.Dict[int, typing.List[int]] = {0: [1, 2], 1: [3], 2: [3], 3: []}
+
+
+class TestTraversal(unittest.TestCase):
+    def test_preorder(self) -> None:
+        self.assertEqual(
+            list(traversal.preorder(0, SUCCESSORS.__getitem__)),
+            [0, 1, 3, 2],
+            msg="Nodes should be visited top-down, once each",
+        )
+
+    def test_postorder(self) -> None:
+        self.assertEqual(
+            list(traversal.postorder(0, SUCCESSORS.__getitem__)),
+            [3, 1, 2, 0],
+            msg="Nodes should be visited bottom-up, once each",
+        )
+
+    def test_evaluate(self) -> None:
+        def count_paths(node: int) -> traversal.Evaluation[int, int]:
+            paths = 0 if SUCCESSORS[node] else 1
+            for successor in SUCCESSORS[node]:
+                paths += yield successor
+
+            return paths
+
+        self.assertEqual(
+            traversal.evaluate(0, count_paths),
+            2,
+            msg="Values should be computed from those of the requested nodes",
+        )
+
+    def test_evaluate_deep(self) -> None:
+        def depth(node: int) -> traversal.Evaluation[int, int]:
+            if not node:
+                return 0
+
+            return (yield node - 1) + 1
+
+        self.assertEqual(
+            traversal.evaluate(10000, depth),
+            10000,
+            msg="Evaluation shouldn't be limited by the recursion limit",
+        )
+
+    def test_evaluate_error(self) -> None:
+        handled = []
+
+        def failing(node: int) -> traversal.Evaluation[int, int]:
+            if not node:
+                raise ValueError(node)
+
+            try:
+                return (yield node - 1)
+            except ValueError:
+                handled.append(node)
+                raise
+
+        with self.assertRaises(ValueError, msg="Errors should be propagated"):
+            traversal.evaluate(3, failing)
+
+        self.assertEqual(
+            handled,
+            [1, 2, 3],
+            msg="Errors should be raised within each requesting evaluation",
+        )
@@ -18,6 +18,21 @@ class TestVector(unittest.TestCase):
         with self.assertRaises(vector.NaNVector, msg="All-NaN components should fail"):
             vector.Vector(numpy.array([numpy.nan, numpy.nan, numpy.nan]))
 
+    def test_from_valid_components(self) -> None:
+        components = numpy.array([1.0, 2.0, 3.0])
+        valid = vector.Vector.from_valid_components(components)
+
+        self.assertEqual(
+            valid,
+            vector.Vector(components),
+            msg="Trusted construction should give the same vector",
+        )
+        self.assertIs(
+            valid.array,
+            components,
+            msg="Trusted construction should use the components without copying",
+        )
+
     def test_zero_magnitude(self) -> None:
         self.assertAlmostEqual(
             vector.Vector.from_raw((0, 0, 0)).magnitude,
@@ -114,6 +129,39 @@ class TestVector(unittest.TestCase):
             msg="Rotating a vector about its reverse should result in no change",
         )
 
+    def test_rotate_right_angle_exact(self) -> None:
+        numpy.testing.assert_array_equal(
+            vector.Vector.from_raw([1.0, 2.0, 3.0]).rotate(-90.0, -vector.AXIS_Y).array,
+            [3.0, 2.0, -1.0],
+            err_msg="Right-angle rotations about principal axes should be exact",
+        )
+
+    def test_principal_rotation_matrix(self) -> None:
+        for angle in (-270.0, -90.0, 0.0, 90.0, 180.0, 450.0):
+            for axis in ((1, 0, 0), (0, -2, 0), (0, 0, 1)):
+                radians = math.radians(angle)
+                direction = numpy.array(axis) / numpy.linalg.norm(axis)
+                cross = numpy.cross(numpy.identity(3), direction)
+
+                numpy.testing.assert_allclose(
+                    vector.principal_rotation_matrix(angle, axis),
+                    math.cos(radians) * numpy.identity(3)
+                    + math.sin(radians) * cross
+                    + (1 - math.cos(radians)) * numpy.outer(direction, direction),
+                    atol=1e-12,
+                    err_msg="Exact rotations should match the general formula",
+                )
+
+    def test_principal_rotation_matrix_general(self) -> None:
+        self.assertIsNone(
+            vector.principal_rotation_matrix(45.0, (0, 0, 1)),
+            msg="Other angles should not have exact matrices",
+        )
+        self.assertIsNone(
+            vector.principal_rotation_matrix(90.0, (1, 1, 0)),
+            msg="Other axes should not have exact matrices",
+        )
+
     def test_rotate_to_alignment(self) -> None:
         self.assertEqual(
             vector.AXIS_X.rotate_to_alignment(self.xy_45, vector.AXIS_Z),
@@ -205,9 +253,145 @@ class TestVector(unittest.TestCase):
         ):
             vector.ORIGIN == "test"
 
+    def test_unhashable(self) -> None:
+        # Either side of a boundary of the tolerance grid
+        below = vector.Vector.from_raw((0.999e-8, 0.0, 0.0))
+        above = vector.Vector.from_raw((1.001e-8, 0.0, 0.0))
+        self.assertEqual(below, above, msg="Should be equal within tolerance")
+
+        with self.assertRaises(TypeError, msg="Should not be hashable"):
+            hash(below)
+
+        index: vector.SpatialHash[str] = vector.SpatialHash()
+        index.insert(below, "below")
+        index.insert(above, "above")
+        self.assertEqual(
+            index.coincident(),
+            [["below", "above"]],
+            msg="Should be deduplicated by a spatial hash",
+        )
+
     def test_string_repr(self) -> None:
         self.assertEqual(
             repr(vector.Vector.from_raw((1.0000001, 2.2, 30003.0))),
             "<1.0, 2.2, 3e+04>",
             msg="Should have the correct string representation",
         )
+
+
+class TestRotationCache(unittest.TestCase):
+    def test_reuse(self) -> None:
+        cache = vector.RotationCache()
+        first = cache.matrix(30.0, (1.0, 1.0, 0.0))
+
+        self.assertIs(
+            cache.matrix(30.0, (2.0, 2.0, 0.0)),
+            first,
+            msg="Rotations about the same axis should share a matrix",
+        )
+        self.assertEqual(
+            (cache.hits, cache.misses, cache.hit_rate),
+            (1, 1, 0.5),
+            msg="Should record cache hits & misses",
+        )
+
+    def test_exact_reuse(self) -> None:
+        cache = vector.RotationCache()
+        cache.matrix(30.0, (1.0, 1.0, 0.0))
+
+        with mock.patch.object(vector.math, "sqrt", side_effect=AssertionError):
+            cache.matrix(30.0, (1.0, 1.0, 0.0))
+
+        self.assertEqual(
+            cache.hits,
+            1,
+            msg="Repeated rotations should be found without normalizing them",
+        )
+
+    def test_quantization(self) -> None:
+        cache = vector.RotationCache(tolerance=1e-6)
+
+        self.assertIs(
+            cache.matrix(30.0 + 1e-8, (1.0, 1e-8, 0.0)),
+            cache.matrix(30.0, (1.0, 0.0, 0.0)),
+            msg="Rotations within tolerance of each other should share a matrix",
+        )
+
+    def test_matrix(self) -> None:
+        numpy.testing.assert_allclose(
+            vector.RotationCache().matrix(120.0, (1.0, 1.0, 1.0)) @ vector.AXIS_X.array,
+            vector.AXIS_Y.array,
+            atol=1e-12,
+            err_msg="Should compute the correct rotation matrix",
+        )
+
+    def test_eviction(self) -> None:
+        cache = vector.RotationCache(maximum_size=2)
+        cache.matrix(10.0, (1.0, 1.0, 0.0))
+        cache.matrix(20.0, (1.0, 1.0, 0.0))
+        cache.matrix(10.0, (1.0, 1.0, 0.0))
+        cache.matrix(30.0, (1.0, 1.0, 0.0))
+
+        self.assertEqual(len(cache), 2, msg="Should be limited to its maximum size")
+
+        cache.matrix(10.0, (1.0, 1.0, 0.0))
+        self.assertEqual(
+            cache.hits, 2, msg="Should keep the most recently used matrices"
+        )
+
+
+class TestSpatialHash(unittest.TestCase):
+    def index(self) -> vector.SpatialHash[str]:
+        index: vector.SpatialHash[str] = vector.SpatialHash(cell_size=0.5)
+        index.insert(vector.ORIGIN, "origin")
+        index.insert_many(
+            numpy.array([[1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [1.0, 1e-9, 0.0]]),
+            ["x", "y", "nearly x"],
+        )
+
+        return index
+
+    def test_within(self) -> None:
+        self.assertEqual(
+            self.index().within(vector.AXIS_X, 1.0),
+            ["origin", "x", "nearly x"],
+            msg="Should find the items within the radius",
+        )
+
+    def test_within_empty(self) -> None:
+        self.assertEqual(
+            self.index().within(vector.Vector.from_raw((5.0, 5.0, 5.0)), 1.0),
+            [],
+            msg="Should find nothing far from every item",
+        )
+
+    def test_coincident_pairs(self) -> None:
+        self.assertEqual(
+            self.index().coincident_pairs(),
+            [("x", "nearly x")],
+            msg="Should find the pairs of items at equal points",
+        )
+
+    def test_coincident_across_cells(self) -> None:
+        index: vector.SpatialHash[int] = vector.SpatialHash()
+        # Either side of a boundary of the tolerance grid
+        index.insert_many(
+            numpy.array([[1e-8 - 1e-10, 0.0, 0.0], [1e-8 + 1e-10, 0.0, 0.0]]),
+            [0, 1],
+        )
+
+        self.assertEqual(
+            index.coincident_pairs(),
+            [(0, 1)],
+            msg="Should find equal points in neighbouring cells",
+        )
+
+    def test_coincident(self) -> None:
+        index = self.index()
+        index.insert(vector.AXIS_X, "also x")
+
+        self.assertEqual(
+            index.coincident(),
+            [["x", "nearly x", "also x"]],
+            msg="Should group the items at equal points",
+        )
@@ -3,6 +3,8 @@ import typing
 
 import solid
 
+from sccm.components import component, cone, cylinder, sphere
+
 
 def flatten_openscad_children(
     parent: solid.OpenSCADObject
@@ -54,3 +56,32 @@ def compare_flattened_openscad_children(
             flatten_openscad_children(left), flatten_openscad_children(right)
         )
     )
+
+
+def scene_assembly() -> component.Component:
+    """An assembly using each of the features scenes can store"""
+    root = component.Component().transform(solid.translate([1.0, 2.0, 3.0]))
+
+    body = cylinder.Cylinder(
+        diameter=2.0, height=4.0, parent=root, color=(1.0, 0.0, 0.0)
+    )
+    body.transform(solid.rotate([10.0, 20.0, 30.0]))
+    # An operand which isn't a child of the component it's composed with
+    body.compose(
+        solid.difference(),
+        cone.Cone(bottom_diameter=1.0, height=2.0).transform(
+            solid.translate([0.0, 0.0, 3.0])
+        ),
+        make_children=False,
+    )
+
+    container = component.Component(parent=root).transform(solid.scale(2.0))
+    container.compose(
+        solid.union(),
+        [
+            sphere.Sphere(diameter=1.0),
+            sphere.Sphere(diameter=1.0).transform(solid.translate([3.0, 0.0, 0.0])),
+        ],
+    )
+
+    return root